@@ -0,0 +1,73 @@
+"""
+Size and round-trip time of the binary format against JSON.
+
+A model holding a synthetic ADH, in which every component carries a list of points and a few coefficient arrays, is
+written and read back with ``model_dump_json``/``model_validate_json`` and with `dump_binary`/`load_binary`. Reading
+a single subtree with `read_binary_path` is timed as well.
+
+Usage:
+    python benchmarks/binary_format.py [--components 5000] [--samples 64] [--rounds 3]
+"""
+
+import argparse
+import math
+import time
+
+from aircraft_data_hierarchy.binary import dump_binary, load_binary, read_binary_path
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+
+
+def build_model(components: int, samples: int) -> CommonBaseModel:
+    alphas = [math.radians(0.5 * sample) for sample in range(samples)]
+    root = {
+        f"component{component}": {
+            "type": "panel",
+            "units": "ft",
+            "points": [{"x": component / 7.0, "y": math.cos(point), "z": math.sin(point)} for point in range(8)],
+            "aerodynamics": {
+                "alphas": alphas,
+                "CL": [0.1 + 2 * math.pi * alpha for alpha in alphas],
+                "CD": [0.01 + 0.05 * alpha ** 2 for alpha in alphas],
+                "CM": [None if sample % 16 == 0 else -0.3 * alpha for sample, alpha in enumerate(alphas)],
+            },
+        }
+        for component in range(components)
+    }
+    return CommonBaseModel(adh_root=root)
+
+
+def best_time(function, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, default=5000)
+    parser.add_argument("--samples", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=3)
+    arguments = parser.parse_args()
+
+    model = build_model(arguments.components, arguments.samples)
+    text = model.model_dump_json()
+    data = dump_binary(model)
+    assert load_binary(data, CommonBaseModel).adh_root == model.adh_root
+    last = f"adh_root.component{arguments.components - 1}.aerodynamics"
+
+    print(f"JSON: {len(text) / 1e6:.1f} MB, binary: {len(data) / 1e6:.1f} MB ({len(data) / len(text):.0%})")
+    for label, encode, decode in (
+        ("JSON", model.model_dump_json, lambda: CommonBaseModel.model_validate_json(text)),
+        ("binary", lambda: dump_binary(model), lambda: load_binary(data, CommonBaseModel)),
+    ):
+        encoding = best_time(encode, arguments.rounds)
+        decoding = best_time(decode, arguments.rounds)
+        print(f"{label}: dump {encoding * 1000:.0f} ms, load {decoding * 1000:.0f} ms")
+    print(f"read_binary_path of the last component: {best_time(lambda: read_binary_path(data, last), arguments.rounds) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
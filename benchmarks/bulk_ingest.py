@@ -0,0 +1,59 @@
+"""
+Populating an ADH from a part list, row by row and in bulk.
+
+A CSV part list is generated with rows in a shuffled order, as exports often are. It is loaded with one
+`create_node` call per row, and with `CommonBaseModel.ingest_csv`.
+
+Usage:
+    python benchmarks/bulk_ingest.py [--rows 1000000] [--chunk-size 10000]
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+
+
+def write_part_list(path: str, rows: int) -> None:
+    indexes = list(range(rows))
+    random.Random(0).shuffle(indexes)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["path", "part_no", "mass", "material"])
+        for index in indexes:
+            writer.writerow([f"aircraft.section{index % 20}.assembly{index // 20 % 500}.part{index}", f"P{index:07d}",
+                             index * 0.01, "Al 7075-T6"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    arguments = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        write_part_list(path, arguments.rows)
+
+        model = CommonBaseModel()
+        start = time.perf_counter()
+        with open(path, newline="") as file:
+            for row in csv.DictReader(file):
+                model.create_node(row.pop("path"), {**row, "mass": float(row["mass"])})
+        print(f"create_node per row: {time.perf_counter() - start:.2f} s")
+
+        model = CommonBaseModel()
+        start = time.perf_counter()
+        model.ingest_csv(path, converters={"mass": float}, chunk_size=arguments.chunk_size)
+        print(f"ingest_csv: {time.perf_counter() - start:.2f} s")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
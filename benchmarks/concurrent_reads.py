@@ -0,0 +1,91 @@
+"""
+Read throughput of a shared ADH under concurrent access mode.
+
+Each worker repeatedly reads a component of its own branch of the aircraft under a subtree read lock, and runs an
+analysis on it while holding the lock. The analysis is modelled by a short sleep, standing in for numerical code
+that releases the GIL. A writer keeps updating a separate branch throughout. The same workload is then run with a
+single model-wide lock for comparison.
+
+Usage:
+    python benchmarks/concurrent_reads.py [--workers 1 2 4 8] [--seconds 2]
+"""
+
+import argparse
+import threading
+import time
+from contextlib import contextmanager
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+
+BRANCHES = 16
+COMPONENTS = 50
+ANALYSIS_SECONDS = 0.001
+
+
+def build_model() -> CommonBaseModel:
+    model = CommonBaseModel()
+    for branch in range(BRANCHES):
+        for component in range(COMPONENTS):
+            model.create_node(f"branch{branch}.component{component}", {"mass": component, "type": "part"})
+    model.create_node("systems.status", {"revision": 0})
+    model.enable_concurrent_access()
+    return model
+
+
+def run(model: CommonBaseModel, workers: int, seconds: float, global_lock: threading.Lock = None) -> float:
+    stop = threading.Event()
+    counts = [0] * workers
+
+    @contextmanager
+    def locked(path: str, write: bool):
+        if global_lock is not None:
+            with global_lock:
+                yield
+        else:
+            with (model.write_lock(path) if write else model.read_lock(path)):
+                yield
+
+    def reader(worker: int) -> None:
+        branch = f"branch{worker % BRANCHES}"
+        while not stop.is_set():
+            with locked(branch, write=False):
+                for component in range(0, COMPONENTS, 10):
+                    model.get_node(f"{branch}.component{component}")
+                time.sleep(ANALYSIS_SECONDS)
+            counts[worker] += 1
+
+    def writer() -> None:
+        revision = 0
+        while not stop.is_set():
+            revision += 1
+            with locked("systems", write=True):
+                model.update_node("systems.status", {"revision": revision})
+            time.sleep(ANALYSIS_SECONDS / 10)
+
+    threads = [threading.Thread(target=reader, args=(worker,)) for worker in range(workers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    model = build_model()
+    print(f"{'workers':>8} {'subtree locks (reads/s)':>24} {'global lock (reads/s)':>22}")
+    for workers in args.workers:
+        subtree = run(model, workers, args.seconds)
+        coarse = run(model, workers, args.seconds, global_lock=threading.Lock())
+        print(f"{workers:>8} {subtree:>24.0f} {coarse:>22.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Overhead of the node API on models which use none of its optional features.
+
+Point reads with `get_node` are timed against a plain walk of the ``adh_root`` dictionaries, which is all they need
+on a model without aliases, indexes, locks or metrics. The reads are timed again once another model has enabled
+concurrent access and instrumentation, which installs the guarded node methods for every model. The script fails if
+the reads of a model using no feature cost more than ``--max-ratio`` times the plain walk.
+
+Usage:
+    python benchmarks/default_path.py [--calls 200000] [--rounds 5] [--max-ratio 2.0]
+"""
+
+import argparse
+import functools
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+
+
+def build_model() -> CommonBaseModel:
+    root = {
+        f"section{section}": {f"part{part}": {"mass": part, "material": "CFRP"} for part in range(100)}
+        for section in range(10)
+    }
+    return CommonBaseModel(adh_root=root)
+
+
+def plain_walk(root: Dict[str, Any], path: str) -> Any:
+    node = root
+    for component in path.split("."):
+        if component not in node:
+            return None
+        node = node[component]
+    return node
+
+
+def best_time(read: Callable[[str], Any], paths: List[str], calls: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for index in range(calls):
+            read(paths[index % 1000])
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--max-ratio", type=float, default=2.0)
+    arguments = parser.parse_args()
+
+    model = build_model()
+    paths = [f"section{index // 100}.part{index % 100}.material" for index in range(1000)]
+    walk = best_time(functools.partial(plain_walk, model.adh_root), paths, arguments.calls, arguments.rounds)
+    default = best_time(model.get_node, paths, arguments.calls, arguments.rounds)
+    print(f"plain walk: {walk:.0f} ns per read")
+    print(f"get_node, no feature enabled: {default:.0f} ns per read ({default / walk:.2f}x)")
+
+    other = build_model()
+    other.enable_concurrent_access()
+    other.enable_instrumentation()
+    guarded = best_time(model.get_node, paths, arguments.calls, arguments.rounds)
+    print(f"get_node, after another model enabled locks and metrics: {guarded:.0f} ns per read ({guarded / walk:.2f}x)")
+
+    if default > arguments.max_ratio * walk:
+        sys.exit(f"get_node costs {default / walk:.2f}x a plain walk on a model using no feature, above {arguments.max_ratio}x")
+
+
+if __name__ == "__main__":
+    main()
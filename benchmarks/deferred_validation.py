@@ -0,0 +1,74 @@
+"""
+Cost of updating many fields of many models, with and without deferred validation.
+
+Every numeric field of a set of ConfigurationLayout and LiftingSurface parameter models is updated, as an optimizer
+does on each iteration: by plain validated assignments, in one deferred_validation block per model, and in a single
+block over all the models.
+
+Usage:
+    python benchmarks/deferred_validation.py [--models 1000] [--repeat 3]
+"""
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.deferral import deferred_validation
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe_parameters import ConfigurationLayout, LiftingSurface
+
+
+def float_fields(model_class: type) -> List[str]:
+    return [name for name, field in model_class.model_fields.items() if field.annotation == Optional[float]]
+
+
+def best_of(repeat: int, function: Callable[[int], None]) -> float:
+    best = float("inf")
+    for iteration in range(repeat):
+        start = time.perf_counter()
+        function(iteration)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    models: List[CommonBaseModel] = []
+    for index in range(arguments.models):
+        models.append(ConfigurationLayout() if index % 2 else LiftingSurface())
+    fields = {model_class: [name for name in float_fields(model_class) if name != "reference_chord_fraction"]
+              for model_class in (ConfigurationLayout, LiftingSurface)}
+    assignments = sum(len(fields[type(model)]) for model in models)
+
+    def update(model: CommonBaseModel, iteration: int) -> None:
+        for offset, name in enumerate(fields[type(model)]):
+            setattr(model, name, float(iteration + offset))
+
+    def immediate(iteration: int) -> None:
+        for model in models:
+            update(model, iteration)
+
+    def per_model(iteration: int) -> None:
+        for model in models:
+            with model.deferred_validation():
+                update(model, iteration)
+
+    def all_models(iteration: int) -> None:
+        with deferred_validation(*models):
+            for model in models:
+                update(model, iteration)
+
+    print(f"{arguments.models} models, {assignments} assignments")
+    baseline = best_of(arguments.repeat, immediate)
+    print(f"validated assignments: {baseline * 1000:.1f} ms")
+    for label, function in (("deferred per model", per_model), ("deferred over all models", all_models)):
+        elapsed = best_of(arguments.repeat, function)
+        print(f"{label}: {elapsed * 1000:.1f} ms ({baseline / elapsed:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Cold import time of the package.
+
+Each statement runs in a fresh interpreter, and the time of an interpreter doing nothing is subtracted, so that the
+figures are the cost of the import alone: the bare package, a single model class, and every name the package exports.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 5]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    "import aircraft_data_hierarchy",
+    "from aircraft_data_hierarchy import CommonBaseModel",
+    "from aircraft_data_hierarchy import Component",
+    "from aircraft_data_hierarchy import *",
+]
+
+
+def best_of(repeat: int, statement: str) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    baseline = best_of(arguments.repeat, "pass")
+    print(f"interpreter start-up: {baseline * 1000:.0f} ms")
+    for statement in STATEMENTS:
+        print(f"{statement}: {(best_of(arguments.repeat, statement) - baseline) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Saving a large model after a small change, in full and incrementally.
+
+A synthetic ADH is saved once, then one node is updated before each timed save. The benchmark compares
+``model_dump_json``, a full save by `ModelWriter` reusing the encoded clean subtrees, and a save appending a segment.
+
+Usage:
+    python benchmarks/incremental_save.py [--branches 20] [--components 20000] [--saves 5]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.writer import ModelWriter
+
+
+def build_model(branches: int, components: int) -> CommonBaseModel:
+    root = {
+        f"branch{branch}": {f"component{component}": {"mass": component, "type": "part", "loads": [1.0, 2.0, 3.0]} for component in range(components)}
+        for branch in range(branches)
+    }
+    return CommonBaseModel(adh_root=root)
+
+
+def time_saves(model: CommonBaseModel, save, saves: int) -> float:
+    start = time.perf_counter()
+    for revision in range(saves):
+        model.update_node("branch0.component0", {"mass": revision, "type": "part", "loads": []})
+        save()
+    return (time.perf_counter() - start) / saves
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--branches", type=int, default=20)
+    parser.add_argument("--components", type=int, default=20000)
+    parser.add_argument("--saves", type=int, default=5)
+    arguments = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "model.json")
+    model = build_model(arguments.branches, arguments.components)
+
+    def dump() -> None:
+        with open(path, "w") as file:
+            file.write(model.model_dump_json())
+
+    try:
+        print(f"model_dump_json: {time_saves(model, dump, arguments.saves) * 1000:.1f} ms per save")
+        writer = ModelWriter(model, path)
+        writer.save()
+        print(f"ModelWriter, full file: {time_saves(model, writer.save, arguments.saves) * 1000:.1f} ms per save")
+        writer = ModelWriter(model, path, segments=True)
+        writer.save()
+        print(f"ModelWriter, segments: {time_saves(model, writer.save, arguments.saves) * 1000:.1f} ms per save")
+    finally:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Cost of the instrumentation of the node API.
+
+Point reads and small updates, the cheapest node operations, are timed on a model that never enabled
+instrumentation, with instrumentation enabled, and after it is disabled again. The hot spots recorded are printed.
+
+Usage:
+    python benchmarks/instrumentation.py [--calls 200000]
+"""
+
+import argparse
+import time
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+
+
+def build_model() -> CommonBaseModel:
+    root = {
+        f"section{section}": {f"part{part}": {"mass": part, "material": "CFRP"} for part in range(100)}
+        for section in range(10)
+    }
+    model = CommonBaseModel(adh_root=root)
+    model.enable_path_index()
+    return model
+
+
+def run(model: CommonBaseModel, calls: int) -> float:
+    paths = [f"section{index // 100}.part{index % 100}" for index in range(1000)]
+    start = time.perf_counter()
+    for index in range(calls):
+        path = paths[index % 1000]
+        if index % 10:
+            model.get_node(path)
+        else:
+            model.update_node(path, {"mass": index})
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200000)
+    arguments = parser.parse_args()
+
+    model = build_model()
+    print(f"never enabled: {run(model, arguments.calls):.0f} ns per call")
+    metrics = model.enable_instrumentation()
+    print(f"enabled: {run(model, arguments.calls):.0f} ns per call")
+    model.disable_instrumentation()
+    print(f"disabled: {run(model, arguments.calls):.0f} ns per call")
+
+    for operation, prefix, count, total in metrics.hot_spots(limit=5):
+        print(f"  {operation} {prefix}: {count} calls, {total * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Memory held by an ADH before and after interning its keys and strings.
+
+A synthetic ADH is built from components parsed one by one, as when they are loaded or imported, so that each
+repeated key and string is a separate object. The memory allocated for the model is measured with tracemalloc
+before and after `CommonBaseModel.enable_interning`.
+
+Usage:
+    python benchmarks/interning.py [--components 100000]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+
+STATUSES = ["released", "in work", "frozen", "obsolete"]
+MATERIALS = ["Al 7075-T6", "Ti-6Al-4V", "CFRP", "Al 2024-T3"]
+
+
+def build_model(components: int) -> CommonBaseModel:
+    root = {}
+    for component in range(components):
+        root[f"component{component}"] = json.loads(json.dumps({
+            "type": "structural part",
+            "status": STATUSES[component % len(STATUSES)],
+            "material": MATERIALS[component % len(MATERIALS)],
+            "mass": {"value": component * 0.1, "units": "lbm"},
+            "station": {"value": component * 0.5, "units": "in"},
+            "owner": f"team{component % 10}",
+        }))
+    return CommonBaseModel(adh_root=root)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, default=100000)
+    arguments = parser.parse_args()
+
+    tracemalloc.start()
+    model = build_model(arguments.components)
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    table = model.enable_interning()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    model = build_model(arguments.components)
+    start = time.perf_counter()
+    model.enable_interning()
+    elapsed = time.perf_counter() - start
+
+    print(f"Before interning: {before / 1e6:.1f} MB")
+    print(f"After interning: {after / 1e6:.1f} MB ({1 - after / before:.0%} less)")
+    print(f"Interning without tracing: {elapsed * 1000:.0f} ms")
+    print(f"{table.replaced} duplicates replaced by {len(table)} strings, {table.bytes_saved / 1e6:.1f} MB estimated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Opening a large ADH saved as JSON, eagerly and with `load_lazy`.
+
+A synthetic ADH of several top-level branches is written to a temporary file. The benchmark reports the time taken
+to open it with ``model_validate_json`` and with `load_lazy`, and the time the lazy model takes to read one value.
+
+Usage:
+    python benchmarks/lazy_load.py [--branches 20] [--components 20000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.loader import load_lazy
+
+
+def write_model(path: str, branches: int, components: int) -> None:
+    root = {
+        f"branch{branch}": {f"component{component}": {"mass": component, "type": "part", "loads": [1.0, 2.0, 3.0]} for component in range(components)}
+        for branch in range(branches)
+    }
+    with open(path, "w") as file:
+        file.write(CommonBaseModel(adh_root=root).model_dump_json())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--branches", type=int, default=20)
+    parser.add_argument("--components", type=int, default=20000)
+    arguments = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    try:
+        write_model(path, arguments.branches, arguments.components)
+        print(f"File size: {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        with open(path) as file:
+            CommonBaseModel.model_validate_json(file.read())
+        print(f"model_validate_json: {time.perf_counter() - start:.3f} s")
+
+        start = time.perf_counter()
+        model = load_lazy(path, CommonBaseModel)
+        opened = time.perf_counter()
+        model.get_node("branch0.component0.mass")
+        read = time.perf_counter()
+        print(f"load_lazy: {opened - start:.3f} s, first read of one branch: {read - opened:.3f} s")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Cost of opening a Component hierarchy with lazy validation.
+
+A hierarchy of components, each with requirements, disciplines and metadata, is validated fully with
+``model_validate`` and lazily with ``model_validate_lazy``. The lazy model is then used for a narrow query, reading
+the names of the first two levels of subcomponents, and finally validated completely with ``validate_all``.
+
+Usage:
+    python benchmarks/lazy_validation.py [--depth 4] [--fanout 6] [--repeat 3]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe import Component
+
+
+def build_data(depth: int, fanout: int, name: str = "aircraft") -> Dict[str, Any]:
+    data = {
+        "name": name,
+        "description": f"Component {name}",
+        "metadata": {"key": "source", "value": "CAD"},
+        "requirements": [
+            {"name": f"{name}-req{index}", "description": "Carry the design loads", "priority": "high",
+             "verification_method": "test", "status": "open", "acceptance_criteria": "No yield at limit load"}
+            for index in range(3)
+        ],
+        "performance": [{"name": "structures", "tools": [{"model_name": "fem", "version": "2.1"}]}],
+    }
+    if depth > 1:
+        data["subcomponents"] = [build_data(depth - 1, fanout, f"{name}.{index}") for index in range(fanout)]
+    return data
+
+
+def best_of(repeat: int, function: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    data = build_data(arguments.depth, arguments.fanout)
+    count = sum(arguments.fanout ** level for level in range(arguments.depth))
+
+    def narrow_query() -> None:
+        model = Component.model_validate_lazy(data)
+        [[child.name for child in component.subcomponents or ()] for component in model.subcomponents or ()]
+
+    def lazy_then_all() -> None:
+        Component.model_validate_lazy(data).validate_all()
+
+    eager = best_of(arguments.repeat, lambda: Component.model_validate(data))
+    lazy = best_of(arguments.repeat, lambda: Component.model_validate_lazy(data))
+    query = best_of(arguments.repeat, narrow_query)
+    complete = best_of(arguments.repeat, lazy_then_all)
+    print(f"{count} components")
+    print(f"model_validate: {eager * 1000:.1f} ms")
+    print(f"model_validate_lazy: {lazy * 1000:.3f} ms ({eager / lazy:.0f}x faster)")
+    print(f"lazy open and narrow query: {query * 1000:.2f} ms ({eager / query:.0f}x faster)")
+    print(f"lazy open and validate_all: {complete * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Exhaustive search of a large ADH, serially and in parallel processes.
+
+A synthetic ADH is searched with a query matching few nodes, with `search_nodes` and with
+`CommonBaseModel.parallel_search_nodes` for an increasing number of processes, up to the number of CPUs.
+
+Usage:
+    python benchmarks/parallel_search.py [--sections 40] [--assemblies 250] [--parts 50] [--depth 2]
+"""
+
+import argparse
+import os
+import time
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+
+QUERY = 'material == "CFRP" and mass == 98'
+
+
+def build_model(sections: int, assemblies: int, parts: int) -> CommonBaseModel:
+    materials = ["Al 7075-T6", "Ti-6Al-4V", "CFRP"]
+    root = {
+        f"section{section}": {
+            f"assembly{assembly}": {
+                f"part{part}": {"mass": (section * assembly * part) % 100, "material": materials[part % 3]}
+                for part in range(parts)
+            }
+            for assembly in range(assemblies)
+        }
+        for section in range(sections)
+    }
+    return CommonBaseModel(adh_root=root)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=40)
+    parser.add_argument("--assemblies", type=int, default=250)
+    parser.add_argument("--parts", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=2)
+    arguments = parser.parse_args()
+
+    model = build_model(arguments.sections, arguments.assemblies, arguments.parts)
+    start = time.perf_counter()
+    expected = model.search_nodes(QUERY)
+    serial = time.perf_counter() - start
+    print(f"search_nodes: {serial * 1000:.0f} ms, {len(expected)} matches")
+
+    processes = 1
+    while processes <= max(os.cpu_count() or 1, 2):
+        start = time.perf_counter()
+        results = model.parallel_search_nodes(QUERY, processes=processes, partition_depth=arguments.depth)
+        elapsed = time.perf_counter() - start
+        assert results == expected
+        print(f"parallel_search_nodes, {processes} processes: {elapsed * 1000:.0f} ms ({serial / elapsed:.1f}x)")
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Reloading models written by the package, with and without validation.
+
+Two models are written with `dump_trusted`: a mesh of polylines made of points, and a table of parameters, each a
+`Float` with its metadata. Each is read back with ``model_validate_json`` and with `load_trusted`, which builds the
+models without validation once the checksum of the file is verified.
+
+Usage:
+    python benchmarks/trusted_load.py [--polylines 4000] [--parameters 50000] [--rounds 3]
+"""
+
+import argparse
+import math
+import os
+import tempfile
+import time
+from typing import List
+
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata
+from aircraft_data_hierarchy.trusted import dump_trusted, load_trusted
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe_geometry import Float, Mesh, Point, Polyline
+
+
+class ParameterTable(CommonBaseModel):
+    parameters: List[Float] = []
+
+
+def build_mesh(polylines: int) -> Mesh:
+    return Mesh(polylines=[
+        Polyline(points=[Point(x=line / 7.0, y=math.cos(point), z=math.sin(point)) for point in range(50)],
+                 metadata=Metadata(key="id", value=f"line{line}"))
+        for line in range(polylines)
+    ])
+
+
+def build_table(parameters: int) -> ParameterTable:
+    return ParameterTable(parameters=[
+        Float(value=index * 0.5, units="kg", description=f"mass of part {index}", metadata=Metadata(key="source", value="CAD"))
+        for index in range(parameters)
+    ])
+
+
+def best_time(function, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--polylines", type=int, default=4000)
+    parser.add_argument("--parameters", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=3)
+    arguments = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    try:
+        for label, model in (("mesh", build_mesh(arguments.polylines)), ("parameter table", build_table(arguments.parameters))):
+            size = dump_trusted(model, path)
+            with open(path, "rb") as file:
+                text = file.read().partition(b"\n")[2]
+            model_class = type(model)
+            assert load_trusted(path, model_class) == model
+            validated = best_time(lambda: model_class.model_validate_json(text), arguments.rounds)
+            trusted = best_time(lambda: load_trusted(path, model_class), arguments.rounds)
+            print(f"{label} ({size / 1e6:.1f} MB): model_validate_json {validated * 1000:.0f} ms, "
+                  f"load_trusted {trusted * 1000:.0f} ms ({validated / trusted:.1f}x)")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
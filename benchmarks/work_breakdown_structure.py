@@ -0,0 +1,61 @@
+"""
+Cost of loading the work breakdown structure and of using its element classes.
+
+Each step runs in a fresh interpreter, after the package's dependencies are imported so that only the work breakdown
+structure itself is measured: importing the module, reading the class of one deep element, and generating every one
+of the elements. Time and memory allocated by the Python heap (tracemalloc) are reported.
+
+Usage:
+    python benchmarks/work_breakdown_structure.py [--repeat 5]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+SETUP = "import pydantic, aircraft_data_hierarchy.common_base_model"
+STEPS = {
+    "import": "from aircraft_data_hierarchy.work_breakdown_structure.work_breakdown_structure import AircraftSystem",
+    "one element": "AircraftSystem.AirVehicle.Airframe.Empennage.Stabilizer.SecondaryStructure.AccessPanels()",
+    "all elements": """
+def walk(element_class):
+    element_class()
+    for name in dir(element_class):
+        child = getattr(element_class, name)
+        if isinstance(child, type) and child.__qualname__.startswith(element_class.__qualname__ + "."):
+            walk(child)
+walk(AircraftSystem)
+""",
+}
+SCRIPT = """
+import json, time, tracemalloc
+{setup}
+results = {{}}
+tracemalloc.start()
+for label, statement in {steps!r}.items():
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    exec(statement)
+    results[label] = (time.perf_counter() - start, tracemalloc.get_traced_memory()[0] - before)
+print(json.dumps(results))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    script = SCRIPT.format(setup=SETUP, steps=STEPS)
+    runs = [json.loads(subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                                      check=True).stdout) for _ in range(arguments.repeat)]
+    for label in STEPS:
+        elapsed = min(run[label][0] for run in runs)
+        memory = min(run[label][1] for run in runs)
+        print(f"{label}: {elapsed * 1000:.1f} ms, {memory / 2 ** 20:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,104 @@
 """ A Python module for Aircraft Data Hierarchy """
 
-from .behavior import *
-from .performance import *
-from .requirements import *
-from .common_base_model import *
-from .work_breakdown_structure import *
+from typing import TYPE_CHECKING
+from .lazy_import import lazy_exports, subpackage_names
+
+if TYPE_CHECKING:
+    from .behavior import *
+    from .performance import *
+    from .requirements import *
+    from .binary import *
+    from .common_base_model import *
+    from .concurrency import *
+    from .deferral import *
+    from .ingest import *
+    from .instrumentation import *
+    from .interning import *
+    from .journal import *
+    from .lazy_validation import *
+    from .loader import *
+    from .memory import *
+    from .merge import *
+    from .merkle import *
+    from .parallel import *
+    from .persistent import *
+    from .query import *
+    from .storage import *
+    from .trusted import *
+    from .work_breakdown_structure import *
+    from .writer import *
+
+# The modules formerly star-imported, in order, and the names exported, by the module defining them, including those
+# of the subpackages. Generic names, such as the predicate classes of the query module, are only exported by their
+# module
+_SUBMODULES = [
+    "behavior", "performance", "requirements", "binary", "common_base_model", "concurrency", "deferral",
+    "ingest", "instrumentation", "interning", "journal", "lazy_validation", "loader", "memory", "merge", "merkle",
+    "parallel", "persistent", "query", "storage", "trusted", "work_breakdown_structure", "writer",
+]
+_EXPORTS, _LEGACY = subpackage_names(__name__, ["work_breakdown_structure"])
+_EXPORTS.update({
+    "behavior": (
+        "Activity", "ActivityState", "Author", "Behavior", "Bounds", "BpRef", "BreakpointDef", "Calculation",
+        "CheckData", "CheckInputs", "CheckOutputs", "ConfidenceBound", "ContactInfo", "ContactInfoType",
+        "ContactLocation", "CorrelatesWith", "Correlation", "CreationDate", "DAVEfunc", "DataPoint", "DataTable",
+        "DependentVarPts", "DependentVarRef", "Description", "DocumentRef", "ExtraDocRef", "ExtrapolateEnum",
+        "FileHeader", "FileVersion", "Function", "FunctionDefn", "GriddedTable", "GriddedTableDef", "GriddedTableRef",
+        "IndependentVarPts", "IndependentVarRef", "InternalValues", "InterpolateEnum", "ModificationRecord",
+        "ModificationRef", "NormalPDF", "Provenance", "ProvenanceRef", "Reference", "Signal", "StaticShot",
+        "Uncertainty", "UncertaintyEffect", "UngriddedTable", "UngriddedTableDef", "UngriddedTableRef", "UniformPDF",
+        "VariableDef", "VariableRef"
+    ),
+    "binary": ("BinaryFormatError", "dump_binary", "load_binary", "read_binary_path"),
+    "common_base_model": (
+        "AliasCycleError", "CommonBaseModel", "Metadata", "NodeNotFoundError", "PathAlreadyExistsError"
+    ),
+    "concurrency": ("LockUpgradeError", "PathLockManager"),
+    "deferral": ("DEFERRED_KEY", "DeferredAssignments", "deferred_validation"),
+    "ingest": ("INGEST_CHUNK_SIZE", "csv_rows"),
+    "instrumentation": ("LATENCY_BUCKETS", "LatencyHistogram", "OperationMetrics"),
+    "interning": ("InternTable",),
+    "journal": ("ChangeJournal", "ChangeRecord", "Subscription"),
+    "lazy_validation": ("PENDING_KEY", "validate_all", "validate_lazy", "validate_pending"),
+    "loader": ("LazyNode", "Unparsed", "load_lazy"),
+    "memory": ("subtree_sizes",),
+    "merge": ("MergeConflict", "MergeConflictError", "MergePolicy", "merge_into"),
+    "merkle": ("DIGEST_SIZE", "HashEntry", "NodeChange", "diff_trees", "empty_entry", "subtree_digest", "value_digest"),
+    "parallel": ("parallel_matches",),
+    "performance": ("DataExchange", "Discipline", "ModelDescription"),
+    "persistent": ("PersistentNode", "freeze_node", "thaw_node"),
+    "query": ("AttributeIndexes", "Criteria", "PATH_FIELD", "Predicate", "QueryError", "as_predicate", "compile_query"),
+    "requirements": ("Requirement", "Requirements"),
+    "storage": ("DiskNodeStore",),
+    "trusted": ("construct_trusted", "dump_trusted", "load_trusted"),
+    "writer": ("ModelWriter", "SEGMENTS_SUFFIX", "load_saved", "mark_dirty"),
+})
+# The other names the former star imports provided, by the module they are read from
+_LEGACY.update({
+    "behavior": ("ValidationInfo", "date"),
+    "binary": ("array", "to_jsonable_python"),
+    "common_base_model": (
+        "ConfigDict", "ContextManager", "Field", "field_serializer", "field_validator", "nullcontext"
+    ),
+    "concurrency": ("IS", "IX", "S", "X"),
+    "ingest": ("Mapping", "chunked", "islice", "itemgetter"),
+    "instrumentation": ("perf_counter",),
+    "interning": ("Hashable", "Iterable"),
+    "journal": ("Deque",),
+    "lazy_validation": ("ValidationError",),
+    "loader": ("bisect_left",),
+    "merge": ("Enum", "Set"),
+    "merkle": ("NamedTuple", "blake2b", "invalidate"),
+    "performance": ("annotations", "datetime"),
+    "persistent": ("NoReturn",),
+    "query": ("And", "Candidates", "Comparison", "Exists", "Membership", "Not", "Or", "Pattern", "lru_cache"),
+    "requirements": ("sqrt",),
+    "storage": ("Iterator", "OrderedDict", "Row", "Sequence", "contextmanager", "deque"),
+    "trusted": ("Callable", "Union", "from_json", "get_args", "get_origin"),
+    "writer": (
+        "Annotated", "Any", "BaseModel", "Dict", "List", "ModelType", "Optional", "SerialEntry",
+        "TYPE_CHECKING", "Tuple", "Type", "TypeAdapter", "TypeVar", "to_json"
+    ),
+})
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _SUBMODULES, _EXPORTS, _LEGACY)
@@ -0,0 +1,421 @@
+"""
+Compact binary serialization of ADH models and data.
+
+The format is self-describing: a document holds a header, a table of the strings it uses, and one encoded value.
+
+* The header is the magic bytes ``ADHB`` followed by a format version byte.
+* The string table lists every dictionary key and string value once, as a count followed by length-prefixed UTF-8
+  strings. Values refer to strings by their index in the table, so repeated keys and units cost a few bytes.
+* Each value starts with a tag byte. Integers are zigzag variable-length integers and floats are float64. Lists made
+  only of floats, possibly with missing values, are stored as packed little-endian float64 arrays, with a bitmap of
+  the missing values, and lists of points, or of any dictionaries or models with the same keys and float values, as
+  their keys followed by a packed array of rows. Other lists and dictionaries are prefixed with the byte length of
+  their content, so that a reader can skip them without decoding them (see `read_binary_path`).
+
+Models are encoded as dictionaries of their fields, nested models included, and values that are neither JSON types
+nor models (dates, enumerations and so on) are converted as pydantic converts them to JSON. `load_binary` validates
+the decoded data against the model class, as ``model_validate_json`` does.
+"""
+
+import struct
+import sys
+from array import array
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+_MAGIC = b"ADHB"
+_VERSION = 1
+
+(_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STRING, _LIST, _DICT,
+ _FLOAT_ARRAY, _OPTIONAL_FLOAT_ARRAY, _FLOAT_RECORDS) = range(11)
+
+_FLOAT64 = struct.Struct("<d")
+_LENGTH = struct.Struct("<I")
+_SWAP_BYTES = sys.byteorder == "big"
+
+
+class BinaryFormatError(ValueError):
+    """Exception raised when binary data is not a valid ADH document."""
+    pass
+
+
+def _write_uvarint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_uvarint(view: memoryview, position: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = view[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _packed_floats(values: List[Any]) -> bytes:
+    packed = array("d", values)
+    if _SWAP_BYTES:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpacked_floats(view: memoryview, position: int, count: int) -> List[float]:
+    values = array("d")
+    values.frombytes(view[position:position + 8 * count])
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values.tolist()
+
+
+class _Encoder:
+    """Encodes values into a body, collecting the string table as it goes."""
+
+    def __init__(self, exclude_unset: bool) -> None:
+        self.exclude_unset = exclude_unset
+        self.strings: Dict[str, int] = {}
+        self.body = bytearray()
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def encode(self, value: Any) -> None:
+        """Encode a value without recursion, patching the length of each container once its content is written."""
+        body = self.body
+        strings = self.strings
+        stack: List[Tuple[Any, int, bool]] = []
+        self._write(value, stack)
+        while stack:
+            depth = len(stack)
+            items, offset, mapping = stack[-1]
+            for item in items:
+                if mapping:
+                    key, item = item
+                    index = strings.get(key)
+                    if index is None:
+                        index = self.string(key if type(key) is str else str(key))
+                    _write_uvarint(body, index)
+                # The common scalars are written inline, as they make up most of a tree
+                kind = type(item)
+                if kind is float:
+                    body.append(_FLOAT)
+                    body += _FLOAT64.pack(item)
+                elif kind is str:
+                    index = strings.get(item)
+                    body.append(_STRING)
+                    _write_uvarint(body, index if index is not None else self.string(item))
+                else:
+                    self._write(item, stack)
+                    if len(stack) > depth:
+                        break  # Encode the new container first, then resume this one
+            else:
+                stack.pop()
+                length = len(body) - offset - _LENGTH.size
+                if length > 0xFFFFFFFF:
+                    raise BinaryFormatError("A list or dictionary is larger than 4 GiB once encoded.")
+                _LENGTH.pack_into(body, offset, length)
+
+    def _write(self, value: Any, stack: List[Tuple[Any, int, bool]]) -> None:
+        body = self.body
+        kind = type(value)
+        if value is None:
+            body.append(_NONE)
+        elif kind is bool:
+            body.append(_TRUE if value else _FALSE)
+        elif kind is int:
+            body.append(_INT)
+            _write_uvarint(body, value * 2 if value >= 0 else -value * 2 - 1)
+        elif kind is float:
+            body.append(_FLOAT)
+            body += _FLOAT64.pack(value)
+        elif kind is str:
+            body.append(_STRING)
+            _write_uvarint(body, self.string(value))
+        elif isinstance(value, (list, tuple)):
+            self._write_list(value, stack)
+        elif isinstance(value, dict):
+            self._start(value.items(), len(value), True, stack)
+        elif isinstance(value, BaseModel):
+            fields = self._fields(value)
+            self._start(fields, len(fields), True, stack)
+        elif isinstance(value, Enum):
+            self._write(value.value, stack)
+        elif isinstance(value, int):
+            self._write(int(value), stack)
+        elif isinstance(value, float):
+            self._write(float(value), stack)
+        elif isinstance(value, str):
+            self._write(str(value), stack)
+        else:
+            self._write(to_jsonable_python(value), stack)
+
+    def _start(self, items: Any, count: int, mapping: bool, stack: List[Tuple[Any, int, bool]]) -> None:
+        """Write the header of a list or dictionary, leaving its length to be patched once its items are written."""
+        body = self.body
+        body.append(_DICT if mapping else _LIST)
+        stack.append((iter(items), len(body), mapping))
+        body += bytes(_LENGTH.size)
+        _write_uvarint(body, count)
+
+    def _fields(self, model: BaseModel) -> List[Tuple[str, Any]]:
+        """Return the keys, aliases taking precedence, and the values of the fields of a model."""
+        fields = [(field.alias or name, getattr(model, name)) for name, field in type(model).model_fields.items()
+                  if not self.exclude_unset or name in model.model_fields_set]
+        fields.extend((model.__pydantic_extra__ or {}).items())
+        return fields
+
+    def _write_list(self, values: Any, stack: List[Tuple[Any, int, bool]]) -> None:
+        body = self.body
+        kinds = set(map(type, values))
+        if kinds == {float}:
+            body.append(_FLOAT_ARRAY)
+            _write_uvarint(body, len(values))
+            body += _packed_floats(values)
+        elif kinds == {float, type(None)}:
+            body.append(_OPTIONAL_FLOAT_ARRAY)
+            _write_uvarint(body, len(values))
+            bitmap = bytearray((len(values) + 7) // 8)
+            for index, item in enumerate(values):
+                if item is None:
+                    bitmap[index // 8] |= 1 << (index % 8)
+            body += bitmap
+            body += _packed_floats([0.0 if item is None else item for item in values])
+        elif len(kinds) != 1 or not self._write_records(values, kinds.pop()):
+            self._start(values, len(values), False, stack)
+
+    def _write_records(self, values: Any, kind: type) -> bool:
+        """
+        Write a list of dictionaries or models with the same keys and only float values, such as points, as a packed
+        array of rows. Return False, having written nothing, if the list doesn't qualify.
+        """
+        if kind is dict:
+            keys = tuple(values[0])
+            if not keys or any(type(key) is not str for key in keys) or any(tuple(item) != keys for item in values):
+                return False
+            rows = [item.values() for item in values]
+        elif issubclass(kind, BaseModel) and kind.model_config.get("extra") != "allow" and not self.exclude_unset:
+            names = list(kind.model_fields)
+            keys = tuple(field.alias or name for name, field in kind.model_fields.items())
+            if not keys:
+                return False
+            rows = [[getattr(item, name) for name in names] for item in values]
+        else:
+            return False
+        floats = [value for row in rows for value in row]
+        if set(map(type, floats)) != {float}:
+            return False
+        body = self.body
+        body.append(_FLOAT_RECORDS)
+        _write_uvarint(body, len(values))
+        _write_uvarint(body, len(keys))
+        for key in keys:
+            _write_uvarint(body, self.string(key))
+        body += _packed_floats(floats)
+        return True
+
+
+def _read_header(data: bytes) -> Tuple[memoryview, List[str], int]:
+    """Check the header of a document and read its string table."""
+    view = memoryview(data)
+    if bytes(view[:len(_MAGIC)]) != _MAGIC:
+        raise BinaryFormatError("The data is not an ADH binary document.")
+    if view[len(_MAGIC)] != _VERSION:
+        raise BinaryFormatError(f"Unsupported ADH binary format version: {view[len(_MAGIC)]}")
+    count, position = _read_uvarint(view, len(_MAGIC) + 1)
+    strings = []
+    for _ in range(count):
+        length, position = _read_uvarint(view, position)
+        strings.append(str(view[position:position + length], "utf-8"))
+        position += length
+    return view, strings, position
+
+
+def _decode(view: memoryview, position: int, strings: List[str]) -> Tuple[Any, int]:
+    """Decode the value at a position without recursion, returning it with the position following it."""
+    stack: List[List[Any]] = []  # Containers being filled, with their remaining item count
+    root = None
+    while True:
+        key = None
+        if stack and type(stack[-1][0]) is dict:
+            index, position = _read_uvarint(view, position)
+            key = strings[index]
+        tag = view[position]
+        position += 1
+        count = 0
+        if tag == _NONE:
+            value = None
+        elif tag == _FALSE or tag == _TRUE:
+            value = tag == _TRUE
+        elif tag == _INT:
+            encoded, position = _read_uvarint(view, position)
+            value = encoded >> 1 if not encoded & 1 else -((encoded + 1) >> 1)
+        elif tag == _FLOAT:
+            value = _FLOAT64.unpack_from(view, position)[0]
+            position += 8
+        elif tag == _STRING:
+            index, position = _read_uvarint(view, position)
+            value = strings[index]
+        elif tag == _LIST or tag == _DICT:
+            count, position = _read_uvarint(view, position + _LENGTH.size)
+            value = [] if tag == _LIST else {}
+        elif tag == _FLOAT_ARRAY:
+            length, position = _read_uvarint(view, position)
+            value = _unpacked_floats(view, position, length)
+            position += 8 * length
+        elif tag == _OPTIONAL_FLOAT_ARRAY:
+            length, position = _read_uvarint(view, position)
+            bitmap = view[position:position + (length + 7) // 8]
+            position += len(bitmap)
+            value = _unpacked_floats(view, position, length)
+            position += 8 * length
+            for index in range(length):
+                if bitmap[index // 8] & (1 << (index % 8)):
+                    value[index] = None
+        elif tag == _FLOAT_RECORDS:
+            length, position = _read_uvarint(view, position)
+            width, position = _read_uvarint(view, position)
+            keys = []
+            for _ in range(width):
+                index, position = _read_uvarint(view, position)
+                keys.append(strings[index])
+            values = _unpacked_floats(view, position, length * width)
+            position += 8 * length * width
+            value = [dict(zip(keys, values[start:start + width])) for start in range(0, length * width, width)]
+        else:
+            raise BinaryFormatError(f"Unknown value tag {tag} at offset {position - 1}.")
+
+        if not stack:
+            root = value
+        else:
+            parent = stack[-1]
+            if key is None:
+                parent[0].append(value)
+            else:
+                parent[0][key] = value
+            parent[1] -= 1
+        if count:
+            stack.append([value, count])
+            continue
+        while stack and not stack[-1][1]:
+            stack.pop()
+        if not stack:
+            return root, position
+
+
+def _skip(view: memoryview, position: int) -> int:
+    """Return the position following the value at a position, without decoding it."""
+    tag = view[position]
+    position += 1
+    if tag in (_NONE, _FALSE, _TRUE):
+        return position
+    if tag == _INT or tag == _STRING:
+        return _read_uvarint(view, position)[1]
+    if tag == _FLOAT:
+        return position + 8
+    if tag == _LIST or tag == _DICT:
+        return position + _LENGTH.size + _LENGTH.unpack_from(view, position)[0]
+    if tag == _FLOAT_ARRAY or tag == _OPTIONAL_FLOAT_ARRAY:
+        length, position = _read_uvarint(view, position)
+        return position + 8 * length + ((length + 7) // 8 if tag == _OPTIONAL_FLOAT_ARRAY else 0)
+    if tag == _FLOAT_RECORDS:
+        length, position = _read_uvarint(view, position)
+        width, position = _read_uvarint(view, position)
+        for _ in range(width):
+            position = _read_uvarint(view, position)[1]
+        return position + 8 * length * width
+    raise BinaryFormatError(f"Unknown value tag {tag} at offset {position - 1}.")
+
+
+def read_binary_path(data: bytes, path: str) -> Any:
+    """
+    Decode the value at a dotted path of a binary document, skipping over the rest of the document.
+
+    Args:
+        data (bytes): The binary document.
+        path (str): The dotted path of the value, for example ``"adh_root.airframe.wing"``.
+
+    Returns:
+        Any: The decoded value, or None if the path doesn't exist.
+
+    Raises:
+        BinaryFormatError: If the data is not a valid document.
+    """
+    try:
+        view, strings, position = _read_header(data)
+        for component in path.split(".") if path else ():
+            if view[position] != _DICT:
+                return None
+            count, position = _read_uvarint(view, position + 1 + _LENGTH.size)
+            for _ in range(count):
+                index, position = _read_uvarint(view, position)
+                if strings[index] == component:
+                    break
+                position = _skip(view, position)
+            else:
+                return None
+        return _decode(view, position, strings)[0]
+    except (IndexError, struct.error) as error:
+        raise BinaryFormatError("The ADH binary document is truncated or corrupted.") from error
+
+
+def dump_binary(value: Any, exclude_unset: bool = False) -> bytes:
+    """
+    Encode a model, or plain data, as a binary document.
+
+    Args:
+        value (Any): The model, or the JSON-like data, to encode.
+        exclude_unset (bool): Whether to leave out the fields of models which were not explicitly set, as
+            ``model_dump_json`` does.
+
+    Returns:
+        bytes: The binary document.
+
+    Raises:
+        BinaryFormatError: If a list or dictionary is larger than 4 GiB once encoded.
+    """
+    encoder = _Encoder(exclude_unset)
+    encoder.encode(value)
+    header = bytearray(_MAGIC)
+    header.append(_VERSION)
+    _write_uvarint(header, len(encoder.strings))
+    for string in encoder.strings:
+        encoded = string.encode("utf-8")
+        _write_uvarint(header, len(encoded))
+        header += encoded
+    return bytes(header + encoder.body)
+
+
+def load_binary(data: bytes, model_class: Optional[Type[ModelType]] = None) -> Any:
+    """
+    Decode a binary document, validating it as a model if a model class is given.
+
+    Args:
+        data (bytes): The binary document, as written by `dump_binary`.
+        model_class (Optional[Type[ModelType]]): The model class to validate the data against, or None to return
+            the plain data, in which models are dictionaries.
+
+    Returns:
+        Any: The model, or the plain data.
+
+    Raises:
+        BinaryFormatError: If the data is not a valid document.
+        pydantic.ValidationError: If the data is not valid for the model.
+    """
+    try:
+        view, strings, position = _read_header(data)
+        value = _decode(view, position, strings)[0]
+    except (IndexError, struct.error) as error:
+        raise BinaryFormatError("The ADH binary document is truncated or corrupted.") from error
+    return value if model_class is None else model_class.model_validate(value)
@@ -1,5 +1,29 @@
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+import functools
+import gc
+import inspect
+from time import perf_counter
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer, field_validator, ConfigDict
+
+from .concurrency import PathLockManager
+from .deferral import DEFERRED_KEY, deferred_validation
+from .ingest import INGEST_CHUNK_SIZE, chunked, csv_rows
+from .instrumentation import OperationMetrics
+from .interning import InternTable
+from .journal import ChangeJournal
+from .lazy_validation import PENDING_KEY, validate_all, validate_lazy, validate_pending
+from .loader import LazyNode
+from .memory import subtree_sizes
+from .merge import MergeConflict, MergeConflictError, MergePolicy, merge_into
+from .merkle import HashEntry, NodeChange, diff_trees, empty_entry, invalidate, subtree_digest
+from .parallel import parallel_matches
+from .persistent import PersistentNode, freeze_node, thaw_node
+from .query import Predicate, as_predicate
+from .writer import SerialEntry, mark_dirty
+
+if TYPE_CHECKING:
+    from .storage import DiskNodeStore
 
 class NodeNotFoundError(Exception):
     """Exception raised when a node is not found in the ADH."""
@@ -9,6 +33,283 @@ class PathAlreadyExistsError(Exception):
     """Exception raised when a path already exists in the ADH."""
     pass
 
+class AliasCycleError(Exception):
+    """Exception raised when resolving an alias in the ADH leads back to itself."""
+    pass
+
+# Marker passed to _replace_child to remove a key rather than store a value
+_REMOVED = object()
+
+# The context guarding the shared structures of models without path locks
+_UNGUARDED = nullcontext()
+
+class _AliasMap(dict):
+    """
+    The ``aliases`` dictionary of a model, counting its changes.
+
+    The paths resolved through the aliases are cached, and the count tells when the cache is stale, including after
+    the dictionary has been edited directly rather than through `CommonBaseModel.link_nodes`.
+
+    Attributes:
+        version (int): The number of changes made to the dictionary.
+    """
+
+    # A class default rather than an __init__ assignment, since unpickling sets the items before any attribute
+    version = 0
+
+    def _changing(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: "_AliasMap", *args: Any, **kwargs: Any) -> Any:
+            self.version += 1
+            return method(self, *args, **kwargs)
+        return wrapper
+
+    __setitem__ = _changing(dict.__setitem__)
+    __delitem__ = _changing(dict.__delitem__)
+    if hasattr(dict, "__ior__"):  # Python 3.9 and later
+        __ior__ = _changing(dict.__ior__)
+    clear = _changing(dict.clear)
+    pop = _changing(dict.pop)
+    popitem = _changing(dict.popitem)
+    setdefault = _changing(dict.setdefault)
+    update = _changing(dict.update)
+    del _changing
+
+class _NodeState:
+    """
+    Auxiliary lookup structures for a model's ADH.
+
+    The state is created on first use and kept in a private attribute of the model so that the many models which
+    never use the node API do not pay for it. It belongs to a single model: copies of the model start without one,
+    and it never makes two models unequal.
+
+    Attributes:
+        root (Dict[str, Any]): The ``adh_root`` dictionary the structures were built for.
+        path_index (Optional[Dict[str, Dict[str, Any]]]): Flat mapping from dotted path to node, if enabled.
+        aliases (Dict[str, str]): The ``aliases`` dictionary the alias cache was built for.
+        alias_cache (Dict[str, str]): Memoized mapping from a requested path to its alias-resolved path.
+        alias_version (int): The `_AliasMap.version` of ``aliases`` the alias cache was built for.
+        attribute_indexes (Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]]): Secondary indexes mapping an indexed
+            key to each of its hashable values, and each value to the nodes (by path) holding it.
+        undo_log (Optional[List[Tuple[str, str, Any]]]): While a batch is open, the parent path, key and previous
+            value (or `_REMOVED`) of every change made to the ADH, in order.
+        journal (Optional[ChangeJournal]): The change journal, if enabled.
+        hash_cache (Optional[HashEntry]): The cached subtree digests, once `CommonBaseModel.subtree_hash` or
+            `CommonBaseModel.diff` has been used.
+        locks (Optional[PathLockManager]): The path locks taken by the node methods, in concurrent access mode.
+        store (Optional[DiskNodeStore]): The disk store serving the node methods in place of ``adh_root``, if attached.
+        serial_root (Optional[SerialEntry]): The encoded ADH kept by `ModelWriter`, once the model has been saved.
+        serial_fields (Optional[Dict[str, Any]]): The encoded fields kept by `ModelWriter`, by field name.
+        interner (Optional[InternTable]): The table interning the keys and strings stored in the ADH, if enabled.
+        metrics (Optional[OperationMetrics]): The durations of the node method calls, if instrumentation is enabled.
+    """
+
+    __slots__ = ("root", "path_index", "aliases", "alias_cache", "alias_version", "attribute_indexes", "undo_log", "journal", "hash_cache", "locks", "store", "serial_root", "serial_fields", "interner", "metrics")
+
+    def __init__(self, root: Dict[str, Any], aliases: Dict[str, str]) -> None:
+        self.root = root
+        self.path_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self.aliases = aliases
+        self.alias_cache: Dict[str, str] = {}
+        self.alias_version = 0
+        self.attribute_indexes: Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]] = {}
+        self.undo_log: Optional[List[Tuple[str, str, Any]]] = None
+        self.journal: Optional[ChangeJournal] = None
+        self.hash_cache: Optional[HashEntry] = None
+        self.locks: Optional[PathLockManager] = None
+        self.store: Optional["DiskNodeStore"] = None
+        self.serial_root: Optional[SerialEntry] = None
+        self.serial_fields: Optional[Dict[str, Any]] = None
+        self.interner: Optional[InternTable] = None
+        self.metrics: Optional[OperationMetrics] = None
+
+    def __eq__(self, other: Any) -> bool:
+        # Models compare their private attributes, and the state is derived from the fields already compared
+        return other is None or isinstance(other, _NodeState)
+
+    __hash__ = object.__hash__
+
+    @property
+    def indexing(self) -> bool:
+        """bool: Whether any structure needs to follow changes to the ADH."""
+        return self.path_index is not None or bool(self.attribute_indexes)
+
+    def invalidate(self, parent_path: str, key: str) -> None:
+        """
+        Drop the cached digests and encoded bytes affected by a change to a key of a node.
+
+        Args:
+            parent_path (str): The dotted path of the changed node, or an empty string for the root.
+            key (str): The key that was set or removed.
+        """
+        invalidate(self.hash_cache, parent_path, key)
+        mark_dirty(self.serial_root, parent_path, key)
+
+    def shared_structures(self) -> ContextManager:
+        """
+        Guard the structures shared by every path: the indexes and the alias and hash caches.
+
+        In concurrent access mode, threads only hold locks on the paths they work on, so they read and update the
+        indexes, the caches and the journal under the writer mutex, each time for the few steps doing so. Without
+        path locks there is nothing to guard against.
+
+        Returns:
+            ContextManager: The writer mutex in concurrent access mode, a no-op context otherwise.
+        """
+        return self.locks.write_mutex if self.locks is not None else _UNGUARDED
+
+# The guarded version of each node method, which `_install_guards` puts in its place
+_GUARDS: Dict[Callable, Callable] = {}
+
+def _install_guards(model_class: type) -> None:
+    """
+    Replace the node methods of a model class and of its bases by their guarded versions.
+
+    The node methods are left as written until a model first enables concurrent access or instrumentation, so that
+    the calls to the models using neither go straight to the methods. The guarded versions check the node state of
+    each model they are called on, and only lock or time the calls of the models which enabled them.
+
+    Args:
+        model_class (type): The class of the model enabling concurrent access or instrumentation.
+    """
+    for cls in model_class.__mro__:
+        for name, value in list(vars(cls).items()):
+            if inspect.isfunction(value) and value in _GUARDS:
+                setattr(cls, name, _GUARDS.pop(value))
+
+def _synchronized(read: Tuple[str, ...] = (), write: Tuple[str, ...] = (), resolve: bool = False,
+                  whole_tree: bool = False, widen_with_aliases: bool = False,
+                  instrument: Union[bool, str] = False) -> Callable:
+    """
+    Lock the paths passed to a node method while concurrent access is enabled.
+
+    The calls can also be timed while instrumentation is enabled, as by `_instrumented`, so that the node methods
+    which are called the most only check the node state once when neither is enabled. The method itself is left
+    unchanged, and its guarded version installed by `_install_guards`.
+
+    Args:
+        read (Tuple[str, ...]): The names of the arguments holding paths (or sequences of paths) to lock for reading.
+        write (Tuple[str, ...]): The names of the arguments holding paths to lock for writing.
+        resolve (bool): Whether the method follows aliases, so that the resolved paths must be locked.
+        whole_tree (bool): Lock the whole ADH for writing instead.
+        widen_with_aliases (bool): Lock the whole ADH, in the same mode, when the model holds aliases, for methods
+            whose effects then reach beyond their paths.
+        instrument (Union[bool, str]): Whether to time the calls, or the name of the argument holding the path
+            they are recorded under.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(method: Callable) -> Callable:
+        # Position of each path argument after self, to read it without binding the whole signature on every call
+        parameters = list(inspect.signature(method).parameters)[1:]
+        arguments = [(name, parameters.index(name), False) for name in read] + [(name, parameters.index(name), True) for name in write]
+
+        def locked_paths(self: "CommonBaseModel", args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Tuple[str, bool]]:
+            if whole_tree:
+                return [("", True)]
+            paths = []
+            for name, position, writes in arguments:
+                value = (args[position] if position < len(args) else kwargs.get(name)) or ""
+                for path in [value] if isinstance(value, str) else value:
+                    paths.append(("" if widen_with_aliases and self.aliases else path, writes))
+            return paths
+
+        if inspect.isgeneratorfunction(method):
+            @functools.wraps(method)
+            def locked(self: "CommonBaseModel", *args: Any, **kwargs: Any) -> Any:
+                state = self.__pydantic_private__["_adh_state"]
+                if state is None or state.locks is None:
+                    return (yield from method(self, *args, **kwargs))
+                with self._hold_paths(state.locks, locked_paths(self, args, kwargs), resolve):
+                    return (yield from method(self, *args, **kwargs))
+        else:
+            @functools.wraps(method)
+            def locked(self: "CommonBaseModel", *args: Any, **kwargs: Any) -> Any:
+                state = self.__pydantic_private__["_adh_state"]
+                if state is None or state.locks is None:
+                    return method(self, *args, **kwargs)
+                with self._hold_paths(state.locks, locked_paths(self, args, kwargs), resolve):
+                    return method(self, *args, **kwargs)
+        if not instrument:
+            _GUARDS[method] = locked
+            return method
+        timed = _timed(locked, instrument if isinstance(instrument, str) else None)
+
+        if inspect.isgeneratorfunction(method):
+            @functools.wraps(method)
+            def wrapper(self: "CommonBaseModel", *args: Any, **kwargs: Any) -> Any:
+                state = self.__pydantic_private__["_adh_state"]
+                if state is None or (state.locks is None and state.metrics is None):
+                    return (yield from method(self, *args, **kwargs))
+                return (yield from (locked if state.metrics is None else timed)(self, *args, **kwargs))
+        else:
+            @functools.wraps(method)
+            def wrapper(self: "CommonBaseModel", *args: Any, **kwargs: Any) -> Any:
+                state = self.__pydantic_private__["_adh_state"]
+                if state is None or (state.locks is None and state.metrics is None):
+                    return method(self, *args, **kwargs)
+                return (locked if state.metrics is None else timed)(self, *args, **kwargs)
+        _GUARDS[method] = wrapper
+        return method
+    return decorator
+
+def _instrumented(path: Optional[str] = None) -> Callable:
+    """
+    Time the calls to a node method while instrumentation is enabled.
+
+    The method itself is left unchanged, and its timed version installed by `_install_guards`.
+
+    Args:
+        path (Optional[str]): The name of the argument holding the path the method works on, which gives the prefix
+            the calls are recorded under. The calls are recorded for the whole ADH if omitted.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(method: Callable) -> Callable:
+        _GUARDS[method] = _timed(method, path)
+        return method
+    return decorator
+
+def _timed(method: Callable, path: Optional[str]) -> Callable:
+    """
+    Wrap a node method to time its calls while instrumentation is enabled, for `_instrumented`.
+
+    Args:
+        method (Callable): The node method.
+        path (Optional[str]): The name of the argument holding the path the method works on, if any.
+
+    Returns:
+        Callable: The timed method.
+    """
+    operation = method.__name__
+    position = list(inspect.signature(method).parameters)[1:].index(path) if path else None
+    iterates = inspect.isgeneratorfunction(method)
+
+    def target_path(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[str]:
+        if position is None:
+            return None
+        value = args[position] if position < len(args) else kwargs.get(path)
+        return value if isinstance(value, str) else None
+
+    @functools.wraps(method)
+    def wrapper(self: "CommonBaseModel", *args: Any, **kwargs: Any) -> Any:
+        state = self.__pydantic_private__["_adh_state"]
+        if state is None or state.metrics is None:
+            return method(self, *args, **kwargs)
+        metrics = state.metrics
+        if iterates:
+            # Only the time spent producing the nodes is counted, not the time the caller holds the iterator
+            return metrics.time_iteration(operation, target_path(args, kwargs), method(self, *args, **kwargs))
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            metrics.observe(operation, target_path(args, kwargs), perf_counter() - start)
+    return wrapper
+
+
 class CommonBaseModel(BaseModel):
     """
     A base model providing common validation logic for all derived models.
@@ -23,6 +324,9 @@ class CommonBaseModel(BaseModel):
     adh_root: Optional[Dict[str, Any]] = Field(default_factory=dict)
     aliases: Optional[Dict[str, str]] = Field(default_factory=dict)
 
+    # The auxiliary structures of the node methods, built on first use
+    _adh_state: Optional[_NodeState] = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         validate_assignment=True,
         arbitrary_types_allowed=True,
@@ -53,10 +357,845 @@ class CommonBaseModel(BaseModel):
             return stripped_value
         return value
 
+    @field_validator("aliases")
+    @classmethod
+    def track_alias_changes(cls, value: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Store the aliases in an `_AliasMap`, so that direct edits to them are noticed by the alias cache.
+
+        Args:
+            value (Optional[Dict[str, str]]): The validated aliases.
+
+        Returns:
+            Optional[Dict[str, str]]: The same aliases, in an `_AliasMap`.
+        """
+        return _AliasMap(value) if value is not None else value
+
+    @field_serializer("adh_data", "adh_root")
+    def serialize_lazy_nodes(self, value: Any) -> Any:
+        """
+        Parse the pending values of a dictionary opened with `load_lazy` before serializing it.
+
+        A plain serializer is used, since wrapping the default one slows the serialization of large dictionaries.
+
+        Args:
+            value (Any): The field value.
+
+        Returns:
+            Any: The value, left to pydantic to serialize.
+        """
+        if isinstance(value, LazyNode):
+            value.materialize()
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Assign a field, as validated by pydantic, and mark it as changed for `ModelWriter`.
+
+        Inside a `deferred_validation` block, the value of a field is stored as given and validated on exit.
+
+        Args:
+            name (str): The field name.
+            value (Any): The new value.
+        """
+        values = self.__dict__
+        state = self.__pydantic_private__["_adh_state"]
+        if DEFERRED_KEY in values and name in self.__pydantic_fields__:
+            values[DEFERRED_KEY].assign(self, name, value)
+        else:
+            super().__setattr__(name, value)
+        if state is None or state.serial_fields is None:
+            return
+        state.serial_fields.pop(name, None)
+
+    @classmethod
+    def model_validate_lazy(cls, obj: Any) -> "CommonBaseModel":
+        """
+        Validate a model, leaving the fields holding nested models to be validated when they are first read.
+
+        Fields with a default whose annotation holds models, such as the geometry, requirements and subcomponents of
+        a `Component`, keep their raw value until they are read, and the models they hold are validated lazily in
+        turn. Opening a large hierarchy for a narrow query then only validates the parts it visits. The other fields
+        are validated at once, and classes with model validators are validated fully (see `validate_lazy`).
+
+        Args:
+            obj (Any): The fields of the model, as for ``model_validate``.
+
+        Returns:
+            CommonBaseModel: The model.
+
+        Raises:
+            pydantic.ValidationError: If a field validated at once is invalid. Errors in the other fields are
+                raised when they are first read.
+        """
+        return validate_lazy(cls, obj)
+
+    def validate_all(self) -> int:
+        """
+        Validate the fields left pending by `model_validate_lazy`, in this model and in the models it holds.
+
+        Serializing and comparing models does this first, so it is only needed to check a model completely.
+
+        Returns:
+            int: The number of fields validated.
+
+        Raises:
+            pydantic.ValidationError: At the first invalid field.
+        """
+        return validate_all(self)
+
+    def deferred_validation(self, *others: "CommonBaseModel") -> ContextManager[None]:
+        """
+        Defer the validation of the assignments made to this model, and to other models, until the end of a block.
+
+        Each model assigned is validated once on exit, running its model validators once rather than after every
+        assignment, which also allows fields that depend on each other to be updated in any order. If a model is
+        invalid on exit, or if the block raises, all the assignments are undone (see `deferred_validation`).
+
+        Args:
+            *others (CommonBaseModel): Other models whose assignments are deferred in the same block.
+
+        Returns:
+            ContextManager[None]: The block.
+
+        Raises:
+            pydantic.ValidationError: If a model is invalid on exit.
+        """
+        return deferred_validation(self, *others)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for the fields left pending by `model_validate_lazy`, which are not in the instance dictionary
+        if name in self.__dict__.get(PENDING_KEY, ()):
+            return validate_pending(self, name)
+        return super().__getattr__(name)
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Validate the fields left pending by `model_validate_lazy`, then dump the model as pydantic does."""
+        if PENDING_KEY in self.__dict__:
+            validate_all(self)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Validate the fields left pending by `model_validate_lazy`, then dump the model as pydantic does."""
+        if PENDING_KEY in self.__dict__:
+            validate_all(self)
+        return super().model_dump_json(**kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BaseModel):
+            if PENDING_KEY in self.__dict__:
+                validate_all(self)
+            if PENDING_KEY in other.__dict__:
+                validate_all(other)
+        return super().__eq__(other)
+
+    def __copy__(self) -> "CommonBaseModel":
+        """Copy the model as pydantic does, without the node state, which the copy builds for itself on first use."""
+        copy = super().__copy__()
+        copy.__pydantic_private__["_adh_state"] = None
+        return copy
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "CommonBaseModel":
+        """Copy the model deeply as pydantic does, without the node state, which holds locks in concurrent mode."""
+        memo = {} if memo is None else memo
+        state = self.__pydantic_private__["_adh_state"]
+        if state is not None:
+            memo[id(state)] = None
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        """Return the pickled state of the model as pydantic does, without the node state."""
+        pickled = super().__getstate__()
+        if pickled["__pydantic_private__"] is not None:
+            pickled["__pydantic_private__"] = {**pickled["__pydantic_private__"], "_adh_state": None}
+        return pickled
+
+    def _node_state(self) -> Optional[_NodeState]:
+        """
+        Return the auxiliary node state, rebuilding it if ``adh_root`` or ``aliases`` have been reassigned since it was
+        built.
+
+        Returns:
+            Optional[_NodeState]: The node state, or None if no auxiliary structure has been enabled.
+        """
+        state = self.__pydantic_private__["_adh_state"]
+        if state is not None and (state.root is not self.adh_root or state.aliases is not self.aliases):
+            with state.shared_structures():
+                if state.root is not self.adh_root:
+                    state.root = self.adh_root
+                    if state.path_index is not None:
+                        state.path_index = {}
+                    for key in state.attribute_indexes:
+                        state.attribute_indexes[key] = {}
+                    state.hash_cache = state.serial_root = None
+                    if state.interner is not None:
+                        state.interner.intern_value(self.adh_root)
+                    self._register_subtree(state, "", self.adh_root)
+                if state.aliases is not self.aliases:
+                    state.aliases = self.aliases
+                    state.alias_cache.clear()
+        return state
+
+    def _ensure_node_state(self) -> _NodeState:
+        """
+        Return the auxiliary node state, creating it on first use.
+
+        Returns:
+            _NodeState: The node state for this model.
+        """
+        state = self._node_state()
+        if state is None:
+            state = _NodeState(self.adh_root, self.aliases)
+            self.__pydantic_private__["_adh_state"] = state
+        return state
+
+    @_synchronized(whole_tree=True)
+    def enable_path_index(self) -> None:
+        """
+        Build a flat index from every dotted path in the ADH to its node.
+
+        While the index is enabled, node lookups and existence checks cost a single dictionary access whatever the
+        depth of the path. The node methods keep the index current; edits made directly to nested dictionaries of
+        ``adh_root`` bypass it, so call this method again to rebuild the index after such edits.
+        """
+        state = self._ensure_node_state()
+        state.path_index = {}
+        self._index_subtree("", self.adh_root, state.path_index, {})
+
+    def disable_path_index(self) -> None:
+        """Drop the path index and return to walking the ADH on every lookup."""
+        state = self._node_state()
+        if state is not None:
+            state.path_index = None
+
+    @_synchronized(whole_tree=True)
+    def add_search_index(self, *keys: str) -> None:
+        """
+        Maintain a secondary index on one or more node keys for `search_nodes`.
+
+        Each index maps a key to each hashable value it takes in the ADH, and each value to the paths of the nodes
+        holding it. Searches whose criteria include an indexed key read the candidate nodes from the index instead
+        of scanning the whole ADH. Like the path index, the secondary indexes follow the node methods; call this
+        method again to rebuild them after editing ``adh_root`` directly.
+
+        Args:
+            *keys (str): The node keys to index, for example ``"type"`` or ``"wbs_no"``.
+        """
+        state = self._ensure_node_state()
+        new_indexes = {key: {} for key in keys}
+        state.attribute_indexes.update(new_indexes)
+        self._index_subtree("", self.adh_root, None, new_indexes)
+
+    @_synchronized(whole_tree=True)
+    def drop_search_index(self, *keys: str) -> None:
+        """
+        Stop maintaining the secondary indexes on the given keys.
+
+        Args:
+            *keys (str): The indexed node keys to drop.
+        """
+        state = self._node_state()
+        if state is not None:
+            for key in keys:
+                state.attribute_indexes.pop(key, None)
+
+    def enable_journal(self, maxlen: Optional[int] = None) -> ChangeJournal:
+        """
+        Record every node operation in a change journal.
+
+        Each successful call to a node method appends a `ChangeRecord` holding the operation, the changed path, and
+        references to the old and new values. Changes made inside `batch` are published when the outermost batch
+        completes, and are never published if it is rolled back. Tools can subscribe to a path prefix on the
+        returned journal instead of polling ``adh_root`` for differences.
+
+        Args:
+            maxlen (Optional[int]): The number of most recent records to keep. All records are kept if omitted.
+
+        Returns:
+            ChangeJournal: The journal of this model, which is reused if it is already enabled.
+        """
+        state = self._ensure_node_state()
+        if state.journal is None:
+            state.journal = ChangeJournal(maxlen)
+        return state.journal
+
+    def disable_journal(self) -> None:
+        """Stop recording node operations and drop the change journal with its subscribers."""
+        state = self._node_state()
+        if state is not None:
+            state.journal = None
+
+    def enable_instrumentation(self, prefix_depth: int = 1) -> OperationMetrics:
+        """
+        Time every call to the node methods of this model.
+
+        The call counts, cumulative times and latency histograms are kept by method and by path prefix, such as
+        ``("get_node", "airframe")`` for the reads of the airframe subtree, in the returned `OperationMetrics`,
+        which can export them to a dictionary or a Prometheus text file. Calls are not timed while instrumentation
+        is disabled, which costs a single check per call once any model has enabled it, and nothing before.
+
+        Args:
+            prefix_depth (int): The number of path keys under which the calls are recorded. Ignored if
+                instrumentation is already enabled.
+
+        Returns:
+            OperationMetrics: The metrics of this model, which are reused if instrumentation is already enabled.
+
+        Raises:
+            ValueError: If ``prefix_depth`` is negative.
+        """
+        _install_guards(type(self))
+        state = self._ensure_node_state()
+        if state.metrics is None:
+            state.metrics = OperationMetrics(prefix_depth)
+        return state.metrics
+
+    def disable_instrumentation(self) -> None:
+        """Stop timing the node methods. The metrics returned by `enable_instrumentation` are left as they are."""
+        state = self._node_state()
+        if state is not None:
+            state.metrics = None
+
+    def enable_concurrent_access(self) -> None:
+        """
+        Make the node methods safe to call from several threads at once.
+
+        Each node method locks the paths it works on: reads take a shared lock on their path, writes an exclusive
+        one, and both take intention locks on the ancestors. Readers never block each other, and a writer only
+        blocks the readers and writers of its own subtree and of the ancestors read or written as a whole, so
+        workers analysing the airframe carry on while another updates the systems. Writers are serialized with each
+        other while they update the shared indexes and journal. Links, index changes and batches lock the whole ADH,
+        as do moves, deletes and searches while the model holds aliases.
+
+        Use `read_lock` and `write_lock` to keep a subtree consistent across several calls. `iter_nodes` holds its
+        read lock until the iteration finishes or the iterator is closed.
+        """
+        _install_guards(type(self))
+        state = self._ensure_node_state()
+        if state.locks is None:
+            state.locks = PathLockManager()
+
+    def disable_concurrent_access(self) -> None:
+        """Stop locking paths in the node methods. No thread may be using the model when this is called."""
+        state = self._node_state()
+        if state is not None:
+            state.locks = None
+
+    @contextmanager
+    def read_lock(self, path: str = "") -> Iterator[None]:
+        """
+        Hold a shared lock on a subtree, so that no other thread changes it until the block ends.
+
+        Does nothing unless concurrent access is enabled.
+
+        Args:
+            path (str): The path of the subtree, or an empty string for the whole ADH. Aliases are followed.
+        """
+        state = self._node_state()
+        if state is None or state.locks is None:
+            yield
+            return
+        with self._hold_paths(state.locks, [(path, False)], resolve=True):
+            yield
+
+    @contextmanager
+    def write_lock(self, path: str = "") -> Iterator[None]:
+        """
+        Hold an exclusive lock on a subtree, so that no other thread reads or changes it until the block ends.
+
+        Does nothing unless concurrent access is enabled.
+
+        Args:
+            path (str): The path of the subtree, or an empty string for the whole ADH. Aliases are followed.
+        """
+        state = self._node_state()
+        if state is None or state.locks is None:
+            yield
+            return
+        with self._hold_paths(state.locks, [(path, True)], resolve=True):
+            yield
+
+    @contextmanager
+    def _hold_paths(self, locks: PathLockManager, paths: List[Tuple[str, bool]], resolve: bool) -> Iterator[None]:
+        """
+        Hold the path locks of a node method.
+
+        When the paths follow aliases they are resolved before locking and checked again once the locks are held,
+        since the aliases may have changed in the meantime.
+
+        Args:
+            locks (PathLockManager): The lock manager of this model.
+            paths (List[Tuple[str, bool]]): The paths to lock, each with True to write or False to read.
+            resolve (bool): Whether the paths must be resolved through the aliases.
+        """
+        while True:
+            resolved = [(self._resolve_path(path) if resolve and path else path, writes) for path, writes in paths]
+            with locks.hold(resolved):
+                if resolve and self.aliases and resolved != [(self._resolve_path(path) if path else path, writes) for path, writes in paths]:
+                    continue
+                yield
+                return
+
+    @staticmethod
+    def _record_change(state: Optional[_NodeState], op: str, path: str, old: Any = None, new: Any = None, source: Optional[str] = None) -> None:
+        """
+        Append a change to the journal, if it is enabled.
+
+        Args:
+            state (Optional[_NodeState]): The node state of this model.
+            op (str): The name of the node operation.
+            path (str): The changed path.
+            old (Any): The value at the path before the change.
+            new (Any): The value at the path after the change.
+            source (Optional[str]): The source path of the operation, if any.
+        """
+        if state is not None and state.journal is not None:
+            with state.shared_structures():
+                state.journal.append(op, path, old, new, source)
+
+    @_synchronized(whole_tree=True)
+    def attach_store(self, store: "DiskNodeStore", import_root: bool = False) -> None:
+        """
+        Serve the node methods from a disk store instead of ``adh_root``.
+
+        While a `DiskNodeStore` is attached, the node methods keep their signatures but read and write the store:
+        `get_node` pages the requested subtree in from disk, the changes are written back as they are made, and
+        `search_nodes` and `iter_nodes` stream the stored nodes in path order. Aliases, the journal and `batch` keep
+        working, a batch becoming a database transaction. The path and secondary indexes, persistent nodes and
+        subtree hashes only apply to ``adh_root`` and are not used while the store is attached.
+
+        Args:
+            store (DiskNodeStore): The store to attach.
+            import_root (bool): Copy the nodes of ``adh_root`` into the store and empty ``adh_root``.
+        """
+        if import_root:
+            store.import_tree(self.adh_root)
+            self.__dict__["adh_root"] = {}
+        self._ensure_node_state().store = store
+
+    @_synchronized(whole_tree=True)
+    def detach_store(self) -> None:
+        """Serve the node methods from ``adh_root`` again. The store is left open and unchanged."""
+        state = self._node_state()
+        if state is not None:
+            state.store = None
+
+    @_synchronized(whole_tree=True)
+    def enable_persistent_tree(self) -> None:
+        """
+        Switch the ADH to immutable, structurally shared nodes.
+
+        Once enabled, every node of ``adh_root`` is a `PersistentNode`. The node methods never modify a node in
+        place: they rebuild the changed node and its ancestors and install the new root, sharing every other subtree
+        with the previous version. `copy_node` and `snapshot` then only share the copied subtree, whatever its size.
+        The nodes returned by `get_node` and `search_nodes` cannot be modified directly.
+        """
+        if not isinstance(self.adh_root, PersistentNode):
+            self.__dict__["adh_root"] = freeze_node(self.adh_root)
+
+    @_synchronized(whole_tree=True)
+    def disable_persistent_tree(self) -> None:
+        """Convert the ADH back into plain, mutable dictionaries."""
+        if isinstance(self.adh_root, PersistentNode):
+            self.__dict__["adh_root"] = thaw_node(self.adh_root)
+
+    @_synchronized(whole_tree=True)
+    def enable_interning(self) -> InternTable:
+        """
+        Share a single object between the equal keys and strings of the model.
+
+        The keys and string values of ``adh_root`` and of the other fields, nested models included, are replaced by
+        the canonical objects of a per-model `InternTable`, and equal `Metadata` instances nested in the model by a
+        single shared instance. From then on, the values stored by the node methods are interned as they are
+        created, and the subtrees of a model opened with `load_lazy` as they are parsed. The table reports the
+        number of duplicates replaced and an estimate of the memory they held.
+
+        Shared `Metadata` instances must be replaced rather than modified in place.
+
+        Returns:
+            InternTable: The intern table of this model, which is reused if interning is already enabled.
+        """
+        state = self._ensure_node_state()
+        if state.interner is None:
+            state.interner = InternTable((Metadata,))
+            if isinstance(self.adh_root, PersistentNode):
+                self.__dict__["adh_root"] = freeze_node(state.interner.intern_value(thaw_node(self.adh_root)))
+            state.interner.intern_model(self)
+        return state.interner
+
+    def disable_interning(self) -> None:
+        """Stop interning the values stored in the ADH. The values already interned stay shared."""
+        state = self._node_state()
+        if state is not None:
+            state.interner = None
+        for value in self.__dict__.values():
+            if isinstance(value, LazyNode):
+                value.set_interner(None)
+
+    def snapshot(self) -> "CommonBaseModel":
+        """
+        Return an independent copy of the model which shares the ADH with this one.
+
+        The ADH is switched to persistent nodes first (see `enable_persistent_tree`), after which taking a snapshot
+        does not copy any node, and later changes to either model leave the other untouched. The path index and the
+        secondary indexes are not carried over to the snapshot.
+
+        Returns:
+            CommonBaseModel: A model of the same class holding the current version of the ADH.
+        """
+        self.enable_persistent_tree()
+        copy = self.model_copy()
+        copy.__dict__["adh_data"] = dict(self.adh_data) if self.adh_data is not None else None
+        copy.__dict__["aliases"] = _AliasMap(self.aliases) if self.aliases is not None else None
+        return copy
+
+    @staticmethod
+    def _index_attributes(attribute_indexes: Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]], path: str, node: Dict[str, Any], add: bool) -> None:
+        """
+        Add or remove a single node's values in the secondary indexes.
+
+        Args:
+            attribute_indexes (Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]]): The secondary indexes to update.
+            path (str): The dotted path of the node.
+            node (Dict[str, Any]): The node whose indexed keys should be recorded.
+            add (bool): True to record the node, False to forget it.
+        """
+        for key, index in attribute_indexes.items():
+            if key not in node:
+                continue
+            value = node[key]
+            try:
+                if add:
+                    index.setdefault(value, {})[path] = node
+                else:
+                    holders = index.get(value)
+                    if holders is not None:
+                        holders.pop(path, None)
+                        if not holders:
+                            del index[value]
+            except TypeError:
+                continue  # Unhashable values are not indexed
+
+    @classmethod
+    def _register_subtree(cls, state: Optional[_NodeState], path: str, node: Any) -> None:
+        """
+        Add a node and all of its dictionary descendants to the auxiliary structures.
+
+        Args:
+            state (Optional[_NodeState]): The node state to update.
+            path (str): The dotted path of the node, or an empty string for the root.
+            node (Any): The node stored at the path.
+        """
+        if state is not None and state.indexing:
+            cls._index_subtree(path, node, state.path_index, state.attribute_indexes)
+
+    @classmethod
+    def _index_subtree(cls, path: str, node: Any, index: Optional[Dict[str, Dict[str, Any]]], attributes: Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]]) -> None:
+        """
+        Record a node and all of its dictionary descendants in the given path index and secondary indexes.
+
+        Args:
+            path (str): The dotted path of the node, or an empty string for the root.
+            node (Any): The node stored at the path.
+            index (Optional[Dict[str, Dict[str, Any]]]): The path index to fill, if any.
+            attributes (Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]]): The secondary indexes to fill.
+        """
+        if not isinstance(node, dict):
+            return
+        stack = [(path, node)]
+        while stack:
+            current_path, current_node = stack.pop()
+            if index is not None and current_path:
+                index[current_path] = current_node
+            if attributes:
+                cls._index_attributes(attributes, current_path, current_node, add=True)
+            prefix = f"{current_path}." if current_path else ""
+            for key, value in current_node.items():
+                if isinstance(value, dict):
+                    stack.append((prefix + key, value))
+
+    @classmethod
+    def _unregister_subtree(cls, state: Optional[_NodeState], path: str, node: Any) -> None:
+        """
+        Remove a node and all of its dictionary descendants from the auxiliary structures.
+
+        Args:
+            state (Optional[_NodeState]): The node state to update.
+            path (str): The dotted path of the node.
+            node (Any): The node stored at the path.
+        """
+        if state is None or not state.indexing or not isinstance(node, dict):
+            return
+        index = state.path_index
+        attributes = state.attribute_indexes
+        stack = [(path, node)]
+        while stack:
+            current_path, current_node = stack.pop()
+            if index is not None:
+                index.pop(current_path, None)
+            if attributes:
+                cls._index_attributes(attributes, current_path, current_node, add=False)
+            for key, value in current_node.items():
+                if isinstance(value, dict):
+                    stack.append((f"{current_path}.{key}", value))
+
+    def _assign_child(self, state: Optional[_NodeState], parent_path: str, parent: Dict[str, Any], key: str, value: Any) -> Dict[str, Any]:
+        """
+        Store a value under a key of a node, keeping the auxiliary structures current.
+
+        Args:
+            state (Optional[_NodeState]): The node state of this model.
+            parent_path (str): The dotted path of the parent node, or an empty string for the root.
+            parent (Dict[str, Any]): The node receiving the value.
+            key (str): The key to store the value under.
+            value (Any): The value to store.
+
+        Returns:
+            Dict[str, Any]: The node now holding the value, which replaces ``parent`` in a persistent ADH.
+        """
+        with state.shared_structures() if state is not None else _UNGUARDED:
+            if state is not None:
+                if state.interner is not None:
+                    key = state.interner.intern(key)
+                    value = state.interner.intern_value(value)
+                if state.undo_log is not None:
+                    state.undo_log.append((parent_path, key, parent.get(key, _REMOVED)))
+                state.invalidate(parent_path, key)
+            if isinstance(self.adh_root, PersistentNode):
+                return self._replace_child(state, parent_path, key, freeze_node(value))
+            if state is None or not state.indexing:
+                parent[key] = value
+                return parent
+            path = f"{parent_path}.{key}" if parent_path else key
+            attributes = state.attribute_indexes
+            if key in parent:
+                self._unregister_subtree(state, path, parent[key])
+                if key in attributes:
+                    self._index_attributes({key: attributes[key]}, parent_path, parent, add=False)
+            parent[key] = value
+            if key in attributes:
+                self._index_attributes({key: attributes[key]}, parent_path, parent, add=True)
+            self._register_subtree(state, path, value)
+            return parent
+
+    def _remove_child(self, state: Optional[_NodeState], parent_path: str, parent: Dict[str, Any], key: str) -> None:
+        """
+        Remove a key from a node, keeping the auxiliary structures current.
+
+        Args:
+            state (Optional[_NodeState]): The node state of this model.
+            parent_path (str): The dotted path of the parent node, or an empty string for the root.
+            parent (Dict[str, Any]): The node losing the key.
+            key (str): The key to remove.
+        """
+        with state.shared_structures() if state is not None else _UNGUARDED:
+            if state is not None:
+                if state.undo_log is not None:
+                    state.undo_log.append((parent_path, key, parent[key]))
+                state.invalidate(parent_path, key)
+            if isinstance(self.adh_root, PersistentNode):
+                self._replace_child(state, parent_path, key, _REMOVED)
+                return
+            if state is not None and state.indexing:
+                path = f"{parent_path}.{key}" if parent_path else key
+                self._unregister_subtree(state, path, parent[key])
+                if key in state.attribute_indexes:
+                    self._index_attributes({key: state.attribute_indexes[key]}, parent_path, parent, add=False)
+            del parent[key]
+
+    def _replace_child(self, state: Optional[_NodeState], parent_path: str, key: str, value: Any) -> PersistentNode:
+        """
+        Install a new persistent root in which the value under a key of a node is replaced or removed.
+
+        The parent node and each of its ancestors are copied with the one changed entry, and all other subtrees are
+        shared with the previous root.
+
+        Args:
+            state (Optional[_NodeState]): The node state of this model.
+            parent_path (str): The dotted path of the parent node, or an empty string for the root.
+            key (str): The key to store the value under or remove.
+            value (Any): The frozen value to store, or `_REMOVED` to remove the key.
+
+        Returns:
+            PersistentNode: The copy of the parent node holding the change.
+        """
+        components = parent_path.split(".") if parent_path else []
+        chain = [self.adh_root]
+        for component in components:
+            chain.append(chain[-1][component])
+        parent = chain[-1]
+        path = f"{parent_path}.{key}" if parent_path else key
+        indexing = state is not None and state.indexing
+        if indexing and key in parent:
+            self._unregister_subtree(state, path, parent[key])
+
+        node = PersistentNode(parent)
+        if value is _REMOVED:
+            dict.__delitem__(node, key)
+        else:
+            dict.__setitem__(node, key, value)
+        new_parent = node
+        replaced = [(parent_path, parent, node)]
+        for depth in range(len(components) - 1, -1, -1):
+            node = PersistentNode(chain[depth])
+            dict.__setitem__(node, components[depth], replaced[-1][2])
+            replaced.append((".".join(components[:depth]), chain[depth], node))
+
+        self.__dict__["adh_root"] = node
+        if state is not None:
+            state.root = node
+            if indexing:
+                for replaced_path, old_node, new_node in replaced:
+                    if state.path_index is not None and replaced_path:
+                        state.path_index[replaced_path] = new_node
+                    if state.attribute_indexes:
+                        self._index_attributes(state.attribute_indexes, replaced_path, old_node, add=False)
+                        self._index_attributes(state.attribute_indexes, replaced_path, new_node, add=True)
+                if value is not _REMOVED:
+                    self._register_subtree(state, path, value)
+        return new_parent
+
+    def _resolve_path(self, path: str) -> str:
+        """
+        Rewrite a path through the aliases recorded by `link_nodes`.
+
+        The longest aliased prefix of the path is replaced by its target, and the rewrite is repeated until no
+        aliased prefix remains, so aliases may point at intermediate nodes and at other aliases. Resolved paths are
+        memoized until the aliases change, whether through the node methods or by editing ``aliases`` directly.
+
+        Args:
+            path (str): The dotted path to resolve.
+
+        Returns:
+            str: The path with every alias replaced by its target.
+
+        Raises:
+            AliasCycleError: If the aliases involved in the path form a cycle.
+        """
+        aliases = self.aliases
+        if not aliases:
+            return path
+        state = self._ensure_node_state()
+        cache = state.alias_cache
+        if type(aliases) is _AliasMap and state.alias_version == aliases.version:
+            resolved = cache.get(path)
+            if resolved is not None:
+                return resolved
+
+        resolved = path
+        visited = set()
+        while True:
+            end = len(resolved)
+            while end > 0 and resolved[:end] not in aliases:
+                end = resolved.rfind(".", 0, end)
+            if end <= 0:
+                break
+            prefix = resolved[:end]
+            if prefix in visited:
+                raise AliasCycleError(f"The aliases for the specified path form a cycle: {path}")
+            visited.add(prefix)
+            resolved = aliases[prefix] + resolved[end:]
+
+        with state.shared_structures():
+            if type(self.aliases) is not _AliasMap:
+                # Aliases set without validation, as by model_construct
+                self.__dict__["aliases"] = state.aliases = _AliasMap(self.aliases)
+                state.alias_version = -1
+            if state.alias_version != self.aliases.version:
+                cache.clear()
+                state.alias_version = self.aliases.version
+            cache[path] = resolved
+        return resolved
+
+    def _relink_aliases(self, source_path: str, target_path: Optional[str]) -> None:
+        """
+        Keep the aliases consistent after the node at a path has been moved or deleted.
+
+        Aliases located inside the subtree follow it to its new location, and aliases pointing into it are
+        retargeted. When the subtree is deleted, both kinds of alias are removed.
+
+        Args:
+            source_path (str): The path of the moved or deleted node.
+            target_path (Optional[str]): The new path of the node, or None if it was deleted.
+        """
+        aliases = self.aliases
+        if not aliases:
+            return
+        prefix = f"{source_path}."
+
+        def relocate(path: str) -> Optional[str]:
+            if path == source_path or path.startswith(prefix):
+                return None if target_path is None else target_path + path[len(source_path):]
+            return path
+
+        relinked = {}
+        for alias, target in aliases.items():
+            new_alias, new_target = relocate(alias), relocate(target)
+            if new_alias is not None and new_target is not None:
+                relinked[new_alias] = new_target
+        if relinked != aliases:
+            aliases.clear()
+            aliases.update(relinked)
+
+    def _lookup_node(self, path: str, state: Optional[_NodeState]) -> Optional[Any]:
+        """
+        Retrieve the value stored at a path, using the path index when it is enabled.
+
+        Args:
+            path (str): The dotted path to look up.
+            state (Optional[_NodeState]): The node state of this model.
+
+        Returns:
+            Optional[Any]: The value at the path, or None if the path doesn't exist.
+        """
+        if state is not None and state.path_index is not None:
+            node = state.path_index.get(path)
+            if node is not None:
+                return node
+            parent_path, _, key = path.rpartition(".")
+            parent = state.path_index.get(parent_path) if parent_path else self.adh_root
+            return parent.get(key) if isinstance(parent, dict) else None
+
+        current_node = self.adh_root
+        for component in path.split("."):
+            if not isinstance(current_node, dict) or component not in current_node:
+                return None
+            current_node = current_node[component]
+        return current_node
+
+    def _parent_node(self, path: str, state: Optional[_NodeState]) -> Dict[str, Any]:
+        """
+        Retrieve the parent node of an existing path.
+
+        Args:
+            path (str): The dotted path whose parent should be returned.
+            state (Optional[_NodeState]): The node state of this model.
+
+        Returns:
+            Dict[str, Any]: The node containing the last component of the path.
+
+        Raises:
+            NodeNotFoundError: If the path doesn't exist in the ADH.
+        """
+        parent_path, _, key = path.rpartition(".")
+        if not parent_path:
+            parent = self.adh_root
+        elif state is not None and state.path_index is not None:
+            parent = state.path_index.get(parent_path)
+        else:
+            parent = self._lookup_node(parent_path, None)
+
+        if not isinstance(parent, dict) or key not in parent:
+            raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
+        return parent
+
+    @_synchronized(write=("path",), resolve=True, instrument="path")
     def create_node(self, path: str, data: Dict[str, Any]) -> None:
         """
         Create a new node in the ADH at the specified path with the provided data.
 
+        Aliases are followed, so creating a node under a linked path creates it under the node it is linked to.
+
         Args:
             path (str): The path where the new node should be created in the ADH.
             data (Dict[str, Any]): A dictionary containing the data to be stored in the new node.
@@ -64,73 +1203,259 @@ class CommonBaseModel(BaseModel):
         Raises:
             PathAlreadyExistsError: If the specified path already exists in the ADH.
             TypeError: If the provided data is not a valid dictionary.
+            AliasCycleError: If the aliases involved in the path form a cycle.
         """
         if not isinstance(data, dict):
             raise TypeError("The provided data must be a dictionary.")
 
-        if self.get_node(path) is not None:
-            raise PathAlreadyExistsError(f"A node already exists at the specified path: {path}")
+        path = self._resolve_path(path)
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            state.store.create_node(path, data)
+            self._record_change(state, "create", path, new=data)
+            return
+        self._record_change(state, "create", path, new=self._create_node(state, path, data))
 
-        path_components = path.split(".")
-        current_node = self.adh_root
+    def _create_node(self, state: Optional[_NodeState], path: str, data: Any) -> Any:
+        """
+        Store a value at a new path, creating the missing intermediate nodes.
 
-        for component in path_components[:-1]:
-            if component not in current_node:
-                current_node[component] = {}
-            current_node = current_node[component]
+        Args:
+            state (Optional[_NodeState]): The node state of this model.
+            path (str): The path where the value should be stored.
+            data (Any): The value to store.
 
-        current_node[path_components[-1]] = data
+        Returns:
+            Any: The value as stored in the ADH.
 
+        Raises:
+            PathAlreadyExistsError: If the specified path already exists in the ADH.
+        """
+        # Threads creating nodes below the same missing parent must create it once
+        with state.shared_structures() if state is not None else _UNGUARDED:
+            parent_path, _, key = path.rpartition(".")
+            current_node = None
+            if state is not None and state.path_index is not None:
+                current_node = state.path_index.get(parent_path) if parent_path else self.adh_root
+
+            if current_node is None:
+                # Walk from the root once, creating missing intermediate nodes on the way down
+                current_node = self.adh_root
+                current_path = parent_of_current = ""
+                for component in path.split(".")[:-1]:
+                    current_path = f"{current_path}.{component}" if current_path else component
+                    if component not in current_node:
+                        current_node = self._assign_child(state, parent_of_current, current_node, component, {})
+                    current_node = current_node[component]
+                    parent_of_current = current_path
+
+            if current_node.get(key) is not None:
+                raise PathAlreadyExistsError(f"A node already exists at the specified path: {path}")
+
+            return self._assign_child(state, parent_path, current_node, key, data)[key]
+
+    @_synchronized(read=("path",), resolve=True, instrument="path")
     def get_node(self, path: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a node from the ADH at the specified path.
 
+        Aliases recorded with `link_nodes` are followed, including aliases of intermediate nodes of the path.
+
         Args:
             path (str): The path of the node to retrieve from the ADH.
 
         Returns:
             Optional[Dict[str, Any]]: The node data as a dictionary if found, or None if the node doesn't exist.
+
+        Raises:
+            AliasCycleError: If the aliases involved in the path form a cycle.
         """
-        path_components = path.split(".")
-        current_node = self.adh_root
+        if self.__pydantic_private__["_adh_state"] is None and not self.aliases:
+            # Nothing to follow or consult: walk the ADH directly, as _lookup_node does
+            node = self.adh_root
+            for component in path.split("."):
+                if not isinstance(node, dict) or component not in node:
+                    return None
+                node = node[component]
+            return node
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            return state.store.get_node(self._resolve_path(path))
+        return self._lookup_node(self._resolve_path(path), state)
 
-        for component in path_components:
-            if component not in current_node:
-                return None
-            current_node = current_node[component]
+    @_instrumented()
+    def search_nodes(self, filter_criteria: Union[str, Dict[str, Any], Predicate]) -> List[Dict[str, Any]]:
+        """
+        Search for nodes in the ADH that match the provided filter criteria.
 
-        return current_node
+        The criteria are either a dictionary of key/value pairs a node must hold, or a query such as
+        ``'type == "surface" and span >= 10'`` (see `aircraft_data_hierarchy.query` for the syntax).
+
+        Linked nodes are searched through their alias, so a node reachable under an aliased path is reported under
+        that path as well. Links leading back to one of their own ancestors are not followed.
+
+        When the criteria test a key indexed with `add_search_index` for equality and the ADH holds no aliases, the
+        candidate nodes are read from the index instead of scanning the ADH, and the results are returned in path order.
 
-    def search_nodes(self, filter_criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+        Args:
+            filter_criteria (Union[str, Dict[str, Any], Predicate]): The dictionary criteria, query text or compiled
+                query to search for.
+
+        Returns:
+            List[Dict[str, Any]]: A list of nodes (as dictionaries) that match the filter criteria.
+
+        Raises:
+            QueryError: If the criteria are query text that cannot be parsed.
+            AliasCycleError: If the aliases in the ADH form a cycle.
         """
-        Search for nodes in the ADH that match the provided filter criteria.
+        return [{**node, "_path": f".{path}" if path else path} for path, node in self.iter_nodes(filter_criteria)]
+
+    @_instrumented()
+    def parallel_search_nodes(self, filter_criteria: Union[str, Dict[str, Any], Predicate], processes: Optional[int] = None,
+                              partition_depth: int = 2) -> List[Dict[str, Any]]:
+        """
+        Search for nodes like `search_nodes`, scanning the subtrees of the ADH in parallel processes.
+
+        The ADH is split into the subtrees found at ``partition_depth``, which a pool of forked worker processes
+        searches while this process checks the nodes above them. The workers inherit the ADH and the criteria
+        instead of receiving a pickled copy, and only send back the paths of the matching nodes. The results are the
+        same, and in the same order, as those of `search_nodes`.
+
+        Starting the workers costs some milliseconds, so this only pays off for exhaustive scans of large trees. The
+        search runs serially where it would not: with a single process, for queries answered from a secondary index
+        or pinned to a path, when the ADH holds aliases or is served from a disk store, and on platforms which can't
+        fork processes. The ADH must not be changed by other threads during the search, which holds a read lock on
+        it in concurrent access mode.
 
         Args:
-            filter_criteria (Dict[str, Any]): A dictionary specifying the filter criteria for the search.
+            filter_criteria (Union[str, Dict[str, Any], Predicate]): The dictionary criteria, query text or compiled
+                query to search for.
+            processes (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+            partition_depth (int): The depth of the subtrees searched by the workers, the top-level nodes being at
+                depth 1. Deeper partitions balance the work better when a few top-level subtrees hold most nodes.
 
         Returns:
             List[Dict[str, Any]]: A list of nodes (as dictionaries) that match the filter criteria.
+
+        Raises:
+            QueryError: If the criteria are query text that cannot be parsed.
+            ValueError: If ``processes`` or ``partition_depth`` is lower than 1.
+        """
+        predicate = as_predicate(filter_criteria)
+        with self.read_lock():
+            state = self._node_state()
+            serial = bool(self.aliases) or predicate.scope() is not None or (state is not None and (
+                state.store is not None or (state.attribute_indexes and predicate.candidates(state.attribute_indexes) is not None)))
+            if serial:
+                return self.search_nodes(predicate)
+            matches = parallel_matches(self.adh_root, predicate, processes, partition_depth)
+        return [{**node, "_path": f".{path}" if path else path} for path, node in matches]
+
+    @_synchronized(read=("under",), resolve=True, widen_with_aliases=True, instrument="under")
+    def iter_nodes(self, criteria: Union[None, str, Dict[str, Any], Predicate] = None, limit: Optional[int] = None, under: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        def match_node(node: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
-            return all(node.get(key) == value for key, value in criteria.items())
+        Lazily iterate over the nodes of the ADH that match the provided criteria.
 
-        def search_recursive(current_node: Dict[str, Any], criteria: Dict[str, Any], path: str, results: List[Dict[str, Any]]) -> None:
-            if match_node(current_node, criteria):
-                result = current_node.copy()
-                result["_path"] = path
-                results.append(result)
-            for key, value in current_node.items():
-                if isinstance(value, dict):
-                    search_recursive(value, criteria, f"{path}.{key}", results)
+        The ADH is walked depth first without recursion, so arbitrarily deep trees can be searched, and the matching
+        nodes are yielded as they are found rather than copied into a result list. Stopping the iteration early, or
+        passing a limit, ends the walk at that point. Aliases and secondary indexes are used as in `search_nodes`,
+        and a query that pins the node path, such as ``@path like "airframe.*.wing"``, only walks that subtree.
+        While a disk store is attached, the nodes are iterated by `DiskNodeStore.iter_nodes`, which does not
+        follow aliases.
+
+        Args:
+            criteria (Union[None, str, Dict[str, Any], Predicate]): The dictionary criteria, query text or compiled
+                query a node must satisfy. Every node matches if omitted.
+            limit (Optional[int]): The maximum number of nodes to yield.
+            under (Optional[str]): Restrict the walk to the subtree at this path, including the node itself.
 
-        results: List[Dict[str, Any]] = []
-        search_recursive(self.adh_root, filter_criteria, "", results)
-        return results
+        Yields:
+            Tuple[str, Dict[str, Any]]: The dotted path of each matching node (an empty string for the root) and the
+            node itself, which is not copied.
 
+        Raises:
+            QueryError: If the criteria are query text that cannot be parsed.
+            NodeNotFoundError: If the ``under`` path doesn't exist in the ADH.
+            AliasCycleError: If the aliases in the ADH form a cycle.
+        """
+        predicate = as_predicate(criteria)
+        if limit is not None and limit <= 0:
+            return
+        aliases = self.aliases
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            yield from state.store.iter_nodes(predicate, limit, self._resolve_path(under) if under else None)
+            return
+
+        if under:
+            start_node = self._lookup_node(self._resolve_path(under), state)
+            if not isinstance(start_node, dict):
+                raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {under}")
+        else:
+            under, start_node = "", self.adh_root
+
+        scope = predicate.scope()
+        if scope and scope != under:
+            if under and not scope.startswith(f"{under}."):
+                if not under.startswith(f"{scope}."):
+                    return  # The query and the walk cover disjoint subtrees
+            else:
+                start_node = self._lookup_node(self._resolve_path(scope), state)
+                if not isinstance(start_node, dict):
+                    return
+                under = scope
+
+        count = 0
+        indexed = None
+        if not aliases and state is not None and state.attribute_indexes:
+            # The candidates are copied while writers are excluded, since the indexes are shared with other branches
+            with state.shared_structures():
+                candidates = predicate.candidates(state.attribute_indexes)
+                if candidates is not None:
+                    prefix = f"{under}." if under else ""
+                    indexed = sorted(item for item in candidates.items() if not under or item[0] == under or item[0].startswith(prefix))
+        if indexed is not None:
+            for path, node in indexed:
+                if predicate.matches(path, node):
+                    yield path, node
+                    count += 1
+                    if count == limit:
+                        return
+            return
+
+        # Each stack entry carries its depth so that the chain of ancestors can be kept for cycle detection
+        stack = [(under, start_node, 0)]
+        ancestors: List[int] = []
+        while stack:
+            path, node, depth = stack.pop()
+            if predicate.matches(path, node):
+                yield path, node
+                count += 1
+                if count == limit:
+                    return
+
+            if aliases:
+                del ancestors[depth:]
+                ancestors.append(id(node))
+            prefix = f"{path}." if path else ""
+            children = []
+            for key, value in node.items():
+                child_path = prefix + key
+                if aliases and child_path in aliases:
+                    value = self.get_node(child_path)
+                    if id(value) in ancestors:
+                        continue
+                if isinstance(value, dict):
+                    children.append((child_path, value, depth + 1))
+            stack.extend(reversed(children))
+
+    @_synchronized(write=("path",), resolve=True, instrument="path")
     def update_node(self, path: str, data: Dict[str, Any]) -> None:
         """
         Update a node in the ADH at the specified path with the provided data.
 
+        Aliases are followed, so updating a linked path updates the node it is linked to.
+
         Args:
             path (str): The path of the node to update in the ADH.
             data (Dict[str, Any]): A dictionary containing the updated data for the node.
@@ -138,27 +1463,29 @@ class CommonBaseModel(BaseModel):
         Raises:
             NodeNotFoundError: If the specified path doesn't exist in the ADH.
             TypeError: If the provided data is not a valid dictionary.
+            AliasCycleError: If the aliases involved in the path form a cycle.
         """
         if not isinstance(data, dict):
             raise TypeError("The provided data must be a dictionary.")
 
-        path_components = path.split(".")
-        current_node = self.adh_root
-
-        for component in path_components[:-1]:
-            if component not in current_node:
-                raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
-            current_node = current_node[component]
-
-        if path_components[-1] not in current_node:
-            raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
-
-        current_node[path_components[-1]] = data
-
+        path = self._resolve_path(path)
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            state.store.update_node(path, data)
+            self._record_change(state, "update", path, new=data)
+            return
+        parent = self._parent_node(path, state)
+        parent_path, _, key = path.rpartition(".")
+        old = parent[key]
+        self._record_change(state, "update", path, old, self._assign_child(state, parent_path, parent, key, data)[key])
+
+    @_synchronized(write=("source_path", "target_path"), widen_with_aliases=True, instrument="target_path")
     def move_node(self, source_path: str, target_path: str) -> None:
         """
         Move a node from one path to another in the ADH.
 
+        Aliases located inside the moved node, or pointing into it, are moved along with it.
+
         Args:
             source_path (str): The path of the node to be moved.
             target_path (str): The path where the node should be moved to.
@@ -167,71 +1494,150 @@ class CommonBaseModel(BaseModel):
             NodeNotFoundError: If the source path doesn't exist.
             PathAlreadyExistsError: If the target path already exists in the ADH.
         """
-        source_node = self.get_node(source_path)
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            state.store.move_node(source_path, target_path)
+            self._relink_aliases(source_path, target_path)
+            self._record_change(state, "move", target_path, source=source_path)
+            return
+        source_node = self._lookup_node(source_path, state)
         if source_node is None:
             raise NodeNotFoundError(f"The source path doesn't exist in the ADH: {source_path}")
-        if self.get_node(target_path) is not None:
-            raise PathAlreadyExistsError(f"The target path already exists in the ADH: {target_path}")
 
-        self.create_node(target_path, source_node)
-        self.delete_node(source_path)
+        # _create_node performs the target existence check as part of its own walk
+        moved_node = self._create_node(state, target_path, source_node)
+        self._detach_node(source_path)
+        self._relink_aliases(source_path, target_path)
+        self._record_change(state, "move", target_path, new=moved_node, source=source_path)
 
+    @_synchronized(write=("path",), widen_with_aliases=True, instrument="path")
     def delete_node(self, path: str) -> None:
         """
         Delete a node from the ADH at the specified path.
 
+        Aliases of the intermediate nodes of the path are followed. A path which is itself linked names the source
+        node of the link, which is deleted along with the link rather than the node it is linked to. Aliases located
+        inside the deleted node, or pointing into it, are removed as well.
+
         Args:
             path (str): The path of the node to delete from the ADH.
 
         Raises:
             NodeNotFoundError: If the specified path doesn't exist in the ADH.
+            AliasCycleError: If the aliases involved in the path form a cycle.
         """
-        path_components = path.split(".")
-        current_node = self.adh_root
-
-        for component in path_components[:-1]:
-            if component not in current_node:
-                raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
-            current_node = current_node[component]
+        parent_path, _, key = path.rpartition(".")
+        if parent_path:
+            path = f"{self._resolve_path(parent_path)}.{key}"
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            state.store.delete_node(path)
+            deleted_node = None
+        else:
+            deleted_node = self._detach_node(path)
+        self._relink_aliases(path, None)
+        self._record_change(state, "delete", path, old=deleted_node)
+
+    def _detach_node(self, path: str) -> Any:
+        """
+        Remove the node at a path from the ADH without touching the aliases.
 
-        if path_components[-1] not in current_node:
-            raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
+        Args:
+            path (str): The path of the node to remove.
 
-        del current_node[path_components[-1]]
+        Returns:
+            Any: The removed node.
 
-    def merge_nodes(self, source_path: str, target_path: str) -> None:
+        Raises:
+            NodeNotFoundError: If the specified path doesn't exist in the ADH.
         """
-        Merge the data of a source node into a target node in the ADH.
+        state = self._node_state()
+        parent = self._parent_node(path, state)
+        parent_path, _, key = path.rpartition(".")
+        node = parent[key]
+        self._remove_child(state, parent_path, parent, key)
+        return node
+
+    @_synchronized(read=("source_path",), write=("target_path",), instrument="target_path")
+    def merge_nodes(self, source_path: Union[str, Sequence[str]], target_path: str, policy: Union[MergePolicy, str] = MergePolicy.KEEP_SOURCE, list_key: Optional[str] = None) -> List[MergeConflict]:
+        """
+        Merge the data of one or more source nodes into a target node in the ADH.
+
+        Nested nodes are merged key by key, and the sources are merged in order in a single walk, so that merging
+        many discipline outputs into one tree updates the indexes of the target once rather than once per source.
+        Keys holding different values on both sides are resolved by the policy and reported as conflicts:
+
+        * ``keep-source`` (the default) overwrites the target value, ``keep-target`` keeps it.
+        * ``error`` raises a `MergeConflictError` listing every conflict, and leaves the ADH unchanged.
+        * ``list-concat`` appends source lists to target lists, and ``list-by-key`` merges the dictionary items of
+          both lists that share the same ``list_key`` value. Other conflicts are resolved as with ``keep-source``.
 
         Args:
-            source_path (str): The path of the source node to merge from.
+            source_path (Union[str, Sequence[str]]): The path of the source node to merge from, or several paths.
             target_path (str): The path of the target node to merge into.
+            policy (Union[MergePolicy, str]): How to resolve conflicting values.
+            list_key (Optional[str]): The key identifying list items, required by ``list-by-key``.
+
+        Returns:
+            List[MergeConflict]: The conflicting values found, in the order they were met.
 
         Raises:
             NodeNotFoundError: If either the source or target path doesn't exist in the ADH.
+            MergeConflictError: If the policy is ``error`` and conflicting values were found.
+            ValueError: If the policy is unknown, or ``list-by-key`` is used without a ``list_key``.
         """
-        source_node = self.get_node(source_path)
-        target_node = self.get_node(target_path)
-
-        if source_node is None:
-            raise NodeNotFoundError(f"The source path doesn't exist in the ADH: {source_path}")
+        policy = MergePolicy(policy)
+        if policy is MergePolicy.LIST_BY_KEY and list_key is None:
+            raise ValueError("The list-by-key merge policy requires a list_key.")
+        source_paths = [source_path] if isinstance(source_path, str) else list(source_path)
+
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            conflicts = state.store.merge_nodes(source_paths, target_path, policy, list_key)
+            for path in source_paths:
+                self._record_change(state, "merge", target_path, source=path)
+            return conflicts
+        sources = []
+        for path in source_paths:
+            source_node = self._lookup_node(path, state)
+            if source_node is None:
+                raise NodeNotFoundError(f"The source path doesn't exist in the ADH: {path}")
+            sources.append((path, source_node))
+        target_node = self._lookup_node(target_path, state)
         if target_node is None:
             raise NodeNotFoundError(f"The target path doesn't exist in the ADH: {target_path}")
 
-        def merge_dicts(target, source):
-            for key, value in source.items():
-                if isinstance(value, dict):
-                    target[key] = merge_dicts(target.get(key, {}), value)
-                else:
-                    target[key] = value
-            return target
-
-        merge_dicts(target_node, source_node)
-
+        persistent = isinstance(self.adh_root, PersistentNode)
+        in_place = not persistent and policy is not MergePolicy.ERROR
+        parent_path, _, key = target_path.rpartition(".")
+        if not in_place:
+            merged_node, conflicts = merge_into(target_node, sources, policy, list_key, in_place=False, share=persistent, path=target_path)
+            if conflicts and policy is MergePolicy.ERROR:
+                raise MergeConflictError(conflicts)
+            merged_node = self._assign_child(state, parent_path, self._parent_node(target_path, state), key, merged_node)[key]
+        else:
+            with state.shared_structures() if state is not None else _UNGUARDED:
+                if state is not None:
+                    if state.undo_log is not None:
+                        state.undo_log.append((parent_path, key, thaw_node(target_node)))
+                    state.invalidate(parent_path, key)
+                self._unregister_subtree(state, target_path, target_node)
+            merged_node, conflicts = merge_into(target_node, sources, policy, list_key, path=target_path)
+            with state.shared_structures() if state is not None else _UNGUARDED:
+                self._register_subtree(state, target_path, target_node)
+
+        for path, _ in sources:
+            self._record_change(state, "merge", target_path, target_node, merged_node, path)
+        return conflicts
+
+    @_synchronized(read=("source_path",), write=("target_path",), instrument="target_path")
     def copy_node(self, source_path: str, target_path: str) -> None:
         """
         Copy a node from a source path to a target path in the ADH.
 
+        In a persistent ADH (see `enable_persistent_tree`) the copy shares the source subtree instead of duplicating
+        it, since neither can be modified in place.
+
         Args:
             source_path (str): The path of the node to be copied.
             target_path (str): The path where the node should be copied to.
@@ -240,10 +1646,15 @@ class CommonBaseModel(BaseModel):
             NodeNotFoundError: If the source path doesn't exist.
             PathAlreadyExistsError: If the target path already exists in the ADH.
         """
-        source_node = self.get_node(source_path)
+        state = self._node_state()
+        if state is not None and state.store is not None:
+            state.store.copy_node(source_path, target_path)
+            self._record_change(state, "copy", target_path, source=source_path)
+            return
+        source_node = self._lookup_node(source_path, state)
         if source_node is None:
             raise NodeNotFoundError(f"The source path doesn't exist in the ADH: {source_path}")
-        if self.get_node(target_path) is not None:
+        if self._lookup_node(target_path, state) is not None:
             raise PathAlreadyExistsError(f"The target path already exists in the ADH: {target_path}")
 
         def deep_copy(node):
@@ -251,9 +1662,10 @@ class CommonBaseModel(BaseModel):
                 return {key: deep_copy(value) for key, value in node.items()}
             return node
 
-        copied_node = deep_copy(source_node)
-        self.create_node(target_path, copied_node)
+        copied_node = source_node if isinstance(source_node, PersistentNode) else deep_copy(source_node)
+        self._record_change(state, "copy", target_path, new=self._create_node(state, target_path, copied_node), source=source_path)
 
+    @_synchronized(whole_tree=True, instrument="source_path")
     def link_nodes(self, source_path: str, target_path: str) -> None:
         """
         Create a link between a source node and a target node in the ADH.
@@ -264,6 +1676,7 @@ class CommonBaseModel(BaseModel):
 
         Raises:
             NodeNotFoundError: If either the source or target path doesn't exist in the ADH.
+            AliasCycleError: If the link would make the aliases form a cycle.
         """
         source_node = self.get_node(source_path)
         target_node = self.get_node(target_path)
@@ -273,8 +1686,19 @@ class CommonBaseModel(BaseModel):
         if target_node is None:
             raise NodeNotFoundError(f"The target path doesn't exist in the ADH: {target_path}")
 
+        previous_target = self.aliases.get(source_path)
         self.aliases[source_path] = target_path
-
+        try:
+            self._resolve_path(source_path)
+        except AliasCycleError:
+            if previous_target is None:
+                del self.aliases[source_path]
+            else:
+                self.aliases[source_path] = previous_target
+            raise
+        self._record_change(self._node_state(), "link", source_path, previous_target, target_path)
+
+    @_synchronized(whole_tree=True, instrument="source_path")
     def unlink_nodes(self, source_path: str) -> None:
         """
         Remove the link between a source node and its target node in the ADH.
@@ -288,7 +1712,400 @@ class CommonBaseModel(BaseModel):
         if source_path not in self.aliases:
             raise NodeNotFoundError(f"The specified path is not linked to any other node: {source_path}")
 
-        del self.aliases[source_path]
+        target_path = self.aliases.pop(source_path)
+        self._record_change(self._node_state(), "unlink", source_path, old=target_path)
+
+    @_synchronized(read=("path",), resolve=True, instrument="path")
+    def subtree_hash(self, path: str = "") -> str:
+        """
+        Return a content hash of the subtree at a path.
+
+        Two subtrees have the same hash exactly when they hold the same keys and values, whatever their location or
+        key order, and the hash is stable across processes, so it can key caches of analyses run on a component.
+        Hashes are computed lazily and cached per node. The node methods clear the cached hashes along the path they
+        change, so rehashing after a change only visits that path; call `clear_hash_cache` after editing
+        ``adh_root`` directly.
+
+        Args:
+            path (str): The path of the subtree, or an empty string for the whole ADH. Aliases are followed.
+
+        Returns:
+            str: The hexadecimal hash of the subtree.
+
+        Raises:
+            NodeNotFoundError: If the specified path doesn't exist in the ADH.
+            AliasCycleError: If the aliases involved in the path form a cycle.
+        """
+        state = self._ensure_node_state()
+        with state.shared_structures():
+            node, entry = self._hash_entry(path)
+            return subtree_digest(node, entry).hex()
+
+    @_synchronized(read=("path",), resolve=True, instrument="path")
+    def diff(self, other: "CommonBaseModel", path: str = "") -> List[NodeChange]:
+        """
+        List the path-level changes turning the ADH of this model into the ADH of another.
+
+        Subtrees whose hashes match are skipped without being walked, so comparing two design iterations costs in
+        proportion to what changed between them. Added and removed subtrees are reported once at their root.
+
+        Args:
+            other (CommonBaseModel): The model holding the new version of the ADH.
+            path (str): Restrict the comparison to the subtree at this path, which must exist in both models.
+
+        Returns:
+            List[NodeChange]: The ``added``, ``removed`` and ``changed`` values, ordered by path.
+
+        Raises:
+            NodeNotFoundError: If the specified path doesn't exist in either ADH.
+            AliasCycleError: If the aliases involved in the path form a cycle.
+        """
+        # The hash caches of both models are filled, under their mutexes taken in a fixed order
+        first, second = sorted((self._ensure_node_state(), other._ensure_node_state()), key=id)
+        with other.read_lock(path), first.shared_structures(), second.shared_structures():
+            old_node, old_entry = self._hash_entry(path)
+            new_node, new_entry = other._hash_entry(path)
+            return diff_trees(old_node, new_node, old_entry, new_entry, self._resolve_path(path) if path else "")
+
+    @_synchronized(whole_tree=True)
+    def clear_hash_cache(self) -> None:
+        """Forget every cached subtree hash."""
+        state = self._node_state()
+        if state is not None:
+            state.hash_cache = None
+
+    def _hash_entry(self, path: str) -> Tuple[Any, HashEntry]:
+        """
+        Look up a value and its entry in the hash cache, creating the entries on the way down.
+
+        Args:
+            path (str): The path of the value, or an empty string for the whole ADH.
+
+        Returns:
+            Tuple[Any, HashEntry]: The value and its cache entry.
+
+        Raises:
+            NodeNotFoundError: If the specified path doesn't exist in the ADH.
+        """
+        state = self._ensure_node_state()
+        if state.hash_cache is None:
+            state.hash_cache = empty_entry()
+        node, entry = self.adh_root, state.hash_cache
+        for component in self._resolve_path(path).split(".") if path else ():
+            if not isinstance(node, dict) or component not in node:
+                raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
+            node = node[component]
+            entry = entry[1].get(component) or entry[1].setdefault(component, empty_entry())
+        return node, entry
+
+    @contextmanager
+    def batch(self) -> Iterator["CommonBaseModel"]:
+        """
+        Group node operations into a single all-or-nothing change of the ADH.
+
+        Every change made through the node methods inside the block is recorded. If the block raises, for example a
+        `NodeNotFoundError` or `PathAlreadyExistsError` halfway through a bulk import, the recorded changes are
+        undone in reverse order and the aliases are restored before the exception propagates. Batches may be
+        nested; a failing inner batch only undoes its own changes.
+
+        Edits made directly to the dictionaries of ``adh_root`` are not recorded and are not undone.
+
+        Yields:
+            CommonBaseModel: This model.
+        """
+        with self.write_lock():
+            state = self._ensure_node_state()
+            outermost = state.undo_log is None
+            if outermost:
+                state.undo_log = []
+            savepoint = len(state.undo_log)
+            aliases = dict(self.aliases) if self.aliases else {}
+            journal = state.journal
+            owns_journal = journal is not None and not journal.holding
+            journal_savepoint = journal.begin() if journal is not None else 0
+            transaction = state.store.transaction() if state.store is not None else nullcontext()
+            try:
+                with transaction:
+                    yield self
+            except BaseException:
+                self._rollback(state, savepoint, aliases)
+                if journal is not None:
+                    journal.discard(journal_savepoint)
+                raise
+            finally:
+                if outermost:
+                    state.undo_log = None
+                if owns_journal:
+                    journal.commit()
+
+    def _rollback(self, state: _NodeState, savepoint: int, aliases: Dict[str, str]) -> None:
+        """
+        Undo the changes recorded in the undo log since a savepoint.
+
+        Args:
+            state (_NodeState): The node state holding the undo log.
+            savepoint (int): The length of the undo log when the batch was opened.
+            aliases (Dict[str, str]): The aliases to restore.
+        """
+        undo_log = state.undo_log
+        changes = undo_log[savepoint:]
+        del undo_log[savepoint:]
+        state.undo_log = None  # The undo steps themselves must not be recorded
+        try:
+            for parent_path, key, value in reversed(changes):
+                parent = self._lookup_node(parent_path, state) if parent_path else self.adh_root
+                if value is _REMOVED:
+                    self._remove_child(state, parent_path, parent, key)
+                else:
+                    self._assign_child(state, parent_path, parent, key, value)
+        finally:
+            state.undo_log = undo_log
+        if self.aliases is not None and self.aliases != aliases:
+            self.aliases.clear()
+            self.aliases.update(aliases)
+
+    @_instrumented()
+    def apply_ops(self, operations: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        Apply a sequence of node operations as a single batch.
+
+        Each operation is a tuple naming the node method and its arguments:
+
+        * ``("create", path, data)`` and ``("update", path, data)``
+        * ``("delete", path)``
+        * ``("move", source_path, target_path)`` and ``("merge", source_path, target_path)``
+
+        The operations are applied in order and atomically, as in `batch`, and follow aliases as the node methods
+        they name do. Consecutive creates and updates sharing a parent node look that parent up once for the whole
+        run instead of walking the ADH for each operation, so bulk imports emitted in tree order avoid most of the
+        traversal cost.
+
+        Args:
+            operations (Iterable[Tuple[Any, ...]]): The operations to apply.
+
+        Raises:
+            ValueError: If an operation is not one of the supported ones.
+            NodeNotFoundError: If an operation refers to a path that doesn't exist; no operation is applied.
+            PathAlreadyExistsError: If an operation would overwrite an existing path; no operation is applied.
+            TypeError: If the data of a create or update is not a dictionary; no operation is applied.
+        """
+        structural = {"delete": self.delete_node, "move": self.move_node, "merge": self.merge_nodes}
+        with self.batch():
+            state = self._node_state()
+            if state.store is not None:
+                # There is no resident parent to reuse; the store applies each operation itself
+                structural.update(create=self.create_node, update=self.update_node)
+            parent_path = parent = None
+            for operation in operations:
+                name, *arguments = operation
+                if name in structural:
+                    structural[name](*arguments)
+                    parent_path = parent = None
+                    continue
+                if name not in ("create", "update"):
+                    raise ValueError(f"Unsupported ADH operation: {name!r}")
+
+                path, data = arguments
+                if not isinstance(data, dict):
+                    raise TypeError("The provided data must be a dictionary.")
+                # Aliases are followed, as by create_node and update_node
+                path = self._resolve_path(path)
+                current_parent_path, _, key = path.rpartition(".")
+                if parent is None or current_parent_path != parent_path:
+                    parent_path = current_parent_path
+                    parent = self._lookup_node(parent_path, state) if parent_path else self.adh_root
+                    if not isinstance(parent, dict):
+                        parent = None
+                        if name == "update":
+                            raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
+                        self.create_node(path, data)  # Creates the missing intermediate nodes
+                        continue
+
+                if name == "create" and parent.get(key) is not None:
+                    raise PathAlreadyExistsError(f"A node already exists at the specified path: {path}")
+                if name == "update" and key not in parent:
+                    raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
+                old = parent.get(key)
+                parent = self._assign_child(state, parent_path, parent, key, data)
+                self._record_change(state, name, path, old, parent[key])
+
+    @_instrumented()
+    def ingest_nodes(self, rows: Iterable[Tuple[str, Dict[str, Any]]], chunk_size: int = INGEST_CHUNK_SIZE) -> int:
+        """
+        Create many nodes at once, as a single batch.
+
+        The rows are read ``chunk_size`` at a time, so the input can be a generator streaming a large export. Each
+        chunk is sorted by path, which groups the rows sharing a parent and puts each node before its descendants,
+        so nodes are created in path order within each chunk. Instead of splitting and walking each path from the
+        root, a row reuses the parent of the previous row, or the parent nodes already found during the ingestion,
+        and only walks down from its nearest known ancestor, creating the missing intermediate nodes on the way.
+
+        Like `create_node`, each row follows aliases and must not overwrite an existing path, and the whole
+        ingestion is undone if one of them fails, as in `batch`. The cyclic garbage collector is paused meanwhile,
+        as the new nodes hold no reference cycles and collections would repeatedly traverse the growing ADH.
+
+        Args:
+            rows (Iterable[Tuple[str, Dict[str, Any]]]): The dotted path and the data of each new node.
+            chunk_size (int): The number of rows read and sorted at once.
+
+        Returns:
+            int: The number of nodes created from the rows, not counting the intermediate nodes.
+
+        Raises:
+            PathAlreadyExistsError: If a row would overwrite an existing path; no node is created.
+            TypeError: If the data of a row is not a dictionary, or a row is below a value which is not a node; no
+                node is created.
+            ValueError: If ``chunk_size`` is not positive.
+        """
+        count = 0
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            with self.batch():
+                state = self._node_state()
+                count = self._ingest_chunks(state, chunked(rows, chunk_size))
+        finally:
+            if collecting:
+                gc.enable()
+        return count
+
+    def _ingest_chunks(self, state: _NodeState, chunks: Iterable[List[Tuple[str, Dict[str, Any]]]]) -> int:
+        """
+        Create the nodes of sorted chunks of rows, as described in `ingest_nodes`.
+
+        Args:
+            state (_NodeState): The node state of this model.
+            chunks (Iterable[List[Tuple[str, Dict[str, Any]]]]): The rows, in chunks sorted by path.
+
+        Returns:
+            int: The number of nodes created from the rows.
+        """
+        count = 0
+        parents: Dict[str, Dict[str, Any]] = {}  # The nodes which received rows so far, by path
+        for chunk in chunks:
+            if state.store is not None or isinstance(self.adh_root, PersistentNode):
+                # Nodes can't be reused across rows; create each one on its own, in path order
+                for path, data in chunk:
+                    self.create_node(path, data)
+                count += len(chunk)
+                continue
+            # Trees without indexes or caches to maintain skip the bookkeeping of _assign_child: the undo step is
+            # recorded directly
+            direct = not state.indexing and state.interner is None and state.hash_cache is None and state.serial_root is None
+            undo_log = state.undo_log
+            journal = state.journal
+            parents[""] = self.adh_root
+            row_parent_path = None
+            for path, data in chunk:
+                if not isinstance(data, dict):
+                    raise TypeError("The provided data must be a dictionary.")
+                requested_parent_path, _, key = path.rpartition(".")
+                if requested_parent_path != row_parent_path:
+                    # Aliases are followed as by create_node, once for each parent
+                    row_parent_path = requested_parent_path
+                    parent_path = self._resolve_path(row_parent_path) if row_parent_path else row_parent_path
+                    aliased = parent_path != row_parent_path
+                    node = parents.get(parent_path)
+                    if node is None:
+                        node = self._ingest_parent(state, parents, parent_path, path)
+                if aliased:
+                    path = f"{parent_path}.{key}" if parent_path else key
+                old = node.get(key, _REMOVED)
+                if old is not _REMOVED and old is not None:
+                    raise PathAlreadyExistsError(f"A node already exists at the specified path: {path}")
+                if direct:
+                    undo_log.append((parent_path, key, old))
+                    node[key] = data
+                else:
+                    node = self._assign_child(state, parent_path, node, key, data)
+                if journal is not None:
+                    journal.append("create", path, None, node[key])
+                count += 1
+        return count
+
+    def _ingest_parent(self, state: _NodeState, parents: Dict[str, Dict[str, Any]], parent_path: str, path: str) -> Dict[str, Any]:
+        """
+        Find the parent node of an ingested row from its nearest known ancestor, creating the missing nodes.
+
+        Args:
+            state (_NodeState): The node state of this model.
+            parents (Dict[str, Dict[str, Any]]): The known nodes by path, which receives the nodes on the way.
+            parent_path (str): The path of the parent node.
+            path (str): The path of the row.
+
+        Returns:
+            Dict[str, Any]: The parent node.
+
+        Raises:
+            TypeError: If an ancestor of the row is a value which is not a node.
+        """
+        components = []
+        ancestor_path, node = parent_path, None
+        while node is None:
+            ancestor_path, _, component = ancestor_path.rpartition(".")
+            components.append(component)
+            node = parents.get(ancestor_path)
+        for component in reversed(components):
+            child = node.get(component)
+            if child is None and component not in node:
+                node = self._assign_child(state, ancestor_path, node, component, {})
+                child = node[component]
+            elif not isinstance(child, dict):
+                raise TypeError(f"The value at {ancestor_path + '.' if ancestor_path else ''}{component} is not a node: {path}")
+            ancestor_path = f"{ancestor_path}.{component}" if ancestor_path else component
+            parents[ancestor_path] = node = child
+        return node
+
+    def ingest_csv(self, path: str, path_column: str = "path", delimiter: Optional[str] = None,
+                   converters: Optional[Mapping[str, Callable[[str], Any]]] = None, chunk_size: int = INGEST_CHUNK_SIZE) -> int:
+        """
+        Create a node for each row of a CSV or TSV file, as a single batch.
+
+        One column of the file holds the dotted path of each node and the other columns its data; empty cells are
+        left out. The file is streamed and ingested as with `ingest_nodes`.
+
+        Args:
+            path (str): The path of the file, which must start with a header row naming the columns.
+            path_column (str): The column holding the node paths.
+            delimiter (Optional[str]): The column delimiter. Defaults to a tab for ``.tsv`` and ``.tab`` files and to
+                a comma otherwise.
+            converters (Optional[Mapping[str, Callable[[str], Any]]]): Functions converting the text of the cells of
+                some columns, for example ``{"mass": float}``. The other cells are kept as strings.
+            chunk_size (int): The number of rows read and sorted at once.
+
+        Returns:
+            int: The number of nodes created from the rows.
+
+        Raises:
+            ValueError: If the file has no path column, or a row has no path or a cell can't be converted; no node is
+                created.
+            PathAlreadyExistsError: If a row would overwrite an existing path; no node is created.
+        """
+        return self.ingest_nodes(csv_rows(path, path_column, delimiter, converters), chunk_size)
+
+    def memory_report(self, depth: int = 2) -> Dict[str, int]:
+        """
+        Measure the memory used by the model and by each of its branches.
+
+        The model is walked once, and the size of every object reachable from it is attributed to the branch it is
+        found in, named by the dotted path of field names and ADH keys: with the default depth, ``adh_root`` and
+        each top-level node of the ADH, such as ``adh_root.airframe``, as well as the fields of nested models. The
+        auxiliary structures built by the node methods, such as indexes and caches, are reported under
+        ``_adh_state``. Objects shared between branches are counted once, in the first branch reaching them, and the
+        nodes of a file loaded lazily are measured without being parsed.
+
+        Args:
+            depth (int): The number of levels of branches to report.
+
+        Returns:
+            Dict[str, int]: The deep size in bytes of the model, under an empty path, and of each branch down to
+            ``depth``, by dotted path. Sort the items by size to find the heaviest branches.
+
+        Raises:
+            ValueError: If ``depth`` is negative.
+        """
+        with self.read_lock():
+            return subtree_sizes(self, depth)
 
 
 class Metadata(CommonBaseModel):
@@ -0,0 +1,135 @@
+"""
+Subtree-scoped reader-writer locking for the ADH.
+
+`PathLockManager` implements multiple granularity locking over dotted paths. Reading a subtree takes a shared lock
+on its path and an intention-shared lock on each ancestor; writing takes an exclusive lock on the path and an
+intention-exclusive lock on each ancestor. As a result:
+
+* readers never block each other, wherever they read;
+* a writer only blocks the readers and writers of its own path, of the nodes below it, and of the ancestors that
+  are read or written as a whole; work on other branches proceeds;
+* all the locks needed by an operation are granted together, so operations locking several paths cannot deadlock.
+
+Locks are reentrant per thread: a thread holding a lock on a subtree may lock anything below it in the same or a
+weaker mode without waiting.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# Lock modes: intention shared, intention exclusive, shared and exclusive
+IS, IX, S, X = range(4)
+
+_CONFLICTS = {
+    IS: (X,),
+    IX: (S, X),
+    S: (IX, X),
+    X: (IS, IX, S, X),
+}
+
+
+class LockUpgradeError(RuntimeError):
+    """Exception raised when a thread requests a lock that conflicts with a lock it already holds."""
+    pass
+
+
+def _covers(held_path: str, path: str) -> bool:
+    """Return whether a path lies at or below another."""
+    return not held_path or path == held_path or path.startswith(f"{held_path}.")
+
+
+class PathLockManager:
+    """
+    Hierarchical reader-writer locks over the dotted paths of an ADH.
+
+    Attributes:
+        write_mutex (threading.RLock): Serializes the updates of the structures shared by all paths (indexes,
+            caches, journal, undo log), taken for each update after the path locks have been granted.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._counts: Dict[str, List[int]] = {}
+        self._local = threading.local()
+        self.write_mutex = threading.RLock()
+
+    def _held(self) -> List[Tuple[str, int]]:
+        held = getattr(self._local, "held", None)
+        if held is None:
+            held = self._local.held = []
+        return held
+
+    @staticmethod
+    def _requests(path: str, write: bool) -> List[Tuple[str, int]]:
+        """Return the locks needed on a path and its ancestors."""
+        intention = IX if write else IS
+        requests = [("", intention)] if path else []
+        end = path.find(".")
+        while end != -1:
+            requests.append((path[:end], intention))
+            end = path.find(".", end + 1)
+        requests.append((path, X if write else S))
+        return requests
+
+    def _needed(self, paths: Sequence[Tuple[str, bool]]) -> List[Tuple[str, int]]:
+        """Return the locks the current thread still has to acquire for a set of paths."""
+        held = self._held()
+        needed = []
+        for path, write in paths:
+            mode = X if write else S
+            if any(_covers(held_path, path) and (held_mode == X or held_mode == mode) for held_path, held_mode in held):
+                continue
+            for request in self._requests(path, write):
+                request_path, request_mode = request
+                for held_path, held_mode in held:
+                    if held_path == request_path and held_mode in _CONFLICTS[request_mode]:
+                        raise LockUpgradeError(f"The current thread cannot lock {path or 'the ADH root'} for writing while reading it.")
+                needed.append(request)
+        return needed
+
+    def _grantable(self, needed: List[Tuple[str, int]]) -> bool:
+        for path, mode in needed:
+            counts = self._counts.get(path)
+            if counts is not None and any(counts[conflict] for conflict in _CONFLICTS[mode]):
+                return False
+        return True
+
+    @contextmanager
+    def hold(self, paths: Sequence[Tuple[str, bool]]) -> Iterator[None]:
+        """
+        Hold read or write locks on several paths, waiting until all of them can be granted together.
+
+        Args:
+            paths (Sequence[Tuple[str, bool]]): The dotted paths to lock, each with True to write or False to read.
+                An empty path stands for the whole ADH.
+
+        Raises:
+            LockUpgradeError: If the current thread already holds a lock which conflicts with the request, as when
+                writing under a subtree it is reading.
+        """
+        needed = self._needed(paths)
+        if needed:
+            with self._condition:
+                while not self._grantable(needed):
+                    self._condition.wait()
+                for path, mode in needed:
+                    counts = self._counts.get(path)
+                    if counts is None:
+                        counts = self._counts[path] = [0, 0, 0, 0]
+                    counts[mode] += 1
+        held = self._held()
+        held.extend(needed)
+        try:
+            yield
+        finally:
+            if needed:
+                for request in needed:
+                    held.remove(request)
+                with self._condition:
+                    for path, mode in needed:
+                        counts = self._counts[path]
+                        counts[mode] -= 1
+                        if not any(counts):
+                            del self._counts[path]
+                    self._condition.notify_all()
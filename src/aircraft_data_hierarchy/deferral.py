@@ -0,0 +1,169 @@
+"""
+Deferred validation of field assignments.
+
+The models validate every assignment: each one runs the validators of the field and then all the model validators,
+which check the fields together. Updating many fields of many models, as an optimizer does on every iteration, pays
+for the model validators once per field, and fields which are only consistent once all of them are updated, such as
+a count and the lists it sizes, can't be assigned one at a time.
+
+`deferred_validation` buffers the assignments made to the fields of a group of models: they are stored as given, and
+each model changed is validated once when the block exits. A model with model validators is validated as a whole,
+as on construction, since they may read and change any field: they run once, at about the cost of building the
+model, whatever the number of assignments. A model without model validators which has few of its fields assigned
+only has those validated, each with its own validators, so that the cost follows the number of assignments rather
+than the size of the model. If any model is invalid, or if the block raises, the assignments to every model of the
+group are undone before the exception propagates.
+"""
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from .common_base_model import CommonBaseModel
+
+# The key of the instance dictionary holding the assignments deferred for a model
+DEFERRED_KEY = "_adh_deferred"
+
+# Marker of a field without a previous value
+_MISSING = object()
+
+# The fields assigned to a model without model validators are validated one at a time when they are at most one in
+# this many of the fields set, and with the whole model otherwise
+_ASSIGNED_SHARE = 4
+
+
+class DeferredAssignments:
+    """
+    The assignments deferred for a model inside a `deferred_validation` block.
+
+    Attributes:
+        originals (Dict[str, Any]): The value of each field assigned before its first assignment in the block.
+        fields_set (Set[str]): The fields set on the model before the block.
+    """
+
+    __slots__ = ("originals", "fields_set")
+
+    def __init__(self, fields_set: Set[str]) -> None:
+        self.originals: Dict[str, Any] = {}
+        self.fields_set = set(fields_set)
+
+    def assign(self, model: "CommonBaseModel", name: str, value: Any) -> None:
+        """Store the value of a field without validating it."""
+        values = model.__dict__
+        if name not in self.originals:
+            self.originals[name] = values.get(name, _MISSING)
+        values[name] = value
+        model.__pydantic_fields_set__.add(name)
+
+    def validate(self, model: "CommonBaseModel") -> Dict[str, Any]:
+        """
+        Validate the fields assigned, and the model as a whole if it has model validators.
+
+        The fields set on the model are validated together into a new instance, so that the model validators see
+        the assigned values alongside the current values of the other fields. The fields never set keep their
+        defaults and are not validated, as on construction.
+
+        Without model validators, when at most a quarter of the fields set were assigned, only the fields
+        assigned are validated instead, one at a time in the order they are declared, on a copy of the model
+        holding the values of the other fields before the block, so that the validators of a field see the values
+        validated so far. Past that share, validating them one at a time costs more than validating the model.
+
+        Returns:
+            Dict[str, Any]: The validated values of the fields assigned, and of the other fields whose value the
+            model validators changed, by name. The fields left as they were are not returned, so that they keep
+            their current value rather than a validated copy of it.
+
+        Raises:
+            pydantic.ValidationError: If the model is invalid.
+        """
+        model_class = type(model)
+        values = model.__dict__
+        if (not model_class.__pydantic_decorators__.model_validators
+                and _ASSIGNED_SHARE * len(self.originals) <= len(model.__pydantic_fields_set__)):
+            return self._validate_assigned(model)
+        data = {}
+        for name in model.__pydantic_fields_set__:
+            field = model_class.__pydantic_fields__.get(name)
+            if field is not None:
+                # A field left pending by lazy validation is validated before it is read
+                data[field.alias or name] = values[name] if name in values else getattr(model, name)
+        if model.__pydantic_extra__:
+            data.update(model.__pydantic_extra__)
+        validated = model_class.__pydantic_validator__.validate_python(data).__dict__
+        changed = {name: validated[name] for name in self.originals}
+        for name in model_class.__pydantic_fields__:
+            if name not in changed and validated[name] != values.get(name, _MISSING):
+                changed[name] = validated[name]
+        return changed
+
+    def _validate_assigned(self, model: "CommonBaseModel") -> Dict[str, Any]:
+        model_class = type(model)
+        scratch = dict(model.__dict__)
+        for name, value in self.originals.items():
+            if value is _MISSING:
+                del scratch[name]
+            else:
+                scratch[name] = value
+        draft = model_class.__new__(model_class)
+        object.__setattr__(draft, "__dict__", scratch)
+        extra = model.__pydantic_extra__
+        object.__setattr__(draft, "__pydantic_extra__", None if extra is None else dict(extra))
+        object.__setattr__(draft, "__pydantic_fields_set__", set(self.fields_set))
+        object.__setattr__(draft, "__pydantic_private__", None)
+        for name in model_class.__pydantic_fields__:
+            if name in self.originals:
+                # Each assignment replaces the instance dictionary of the copy with an updated one
+                model_class.__pydantic_validator__.validate_assignment(draft, name, model.__dict__[name])
+        return {name: draft.__dict__[name] for name in self.originals}
+
+    def restore(self, model: "CommonBaseModel") -> None:
+        """Undo the assignments, restoring the fields assigned and the fields set."""
+        values = model.__dict__
+        for name, value in self.originals.items():
+            if value is _MISSING:
+                values.pop(name, None)
+            else:
+                values[name] = value
+        object.__setattr__(model, "__pydantic_fields_set__", self.fields_set)
+
+
+@contextmanager
+def deferred_validation(*models: "CommonBaseModel") -> Iterator[None]:
+    """
+    Defer the validation of the assignments made to the fields of models until the end of a block.
+
+    Inside the block, assigning a field of one of the models stores the value as given, and reading it returns that
+    value. On exit, each model assigned is validated once: all its fields set together with its model validators,
+    or only its assigned fields if it has no model validators and few fields assigned (see
+    `DeferredAssignments.validate`). The assigned fields then take their validated values. Models already in an
+    enclosing block are validated when that block exits.
+
+    Args:
+        *models (CommonBaseModel): The models whose assignments are deferred.
+
+    Yields:
+        None
+
+    Raises:
+        pydantic.ValidationError: If a model is invalid on exit, after the assignments to all the models have been
+            undone.
+    """
+    started: List[Tuple["CommonBaseModel", DeferredAssignments]] = []
+    for model in models:
+        if DEFERRED_KEY not in model.__dict__:
+            assignments = DeferredAssignments(model.__pydantic_fields_set__)
+            model.__dict__[DEFERRED_KEY] = assignments
+            started.append((model, assignments))
+    try:
+        yield
+        validated = [(model, assignments.validate(model)) for model, assignments in started if assignments.originals]
+    except BaseException:
+        for model, assignments in started:
+            assignments.restore(model)
+        raise
+    finally:
+        for model, _ in started:
+            model.__dict__.pop(DEFERRED_KEY, None)
+    for model, values in validated:
+        model.__dict__.update(values)
+        model.__pydantic_fields_set__.update(values)
@@ -0,0 +1,94 @@
+"""
+Reading of tabular sources for bulk node ingestion.
+
+`CommonBaseModel.ingest_nodes` creates nodes from ``(path, data)`` rows, and `CommonBaseModel.ingest_csv` from
+the rows of a CSV or TSV file, such as a part list or a loads table, in which one column holds the dotted path of
+each node and the other columns its data. The rows are read in chunks of fixed size, and each chunk is sorted by
+path so that the nodes sharing a parent are created in a single walk of the ADH.
+"""
+
+import csv
+import os
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+# The number of rows read and sorted at once by default
+INGEST_CHUNK_SIZE = 10_000
+
+
+def chunked(rows: Iterable[Tuple[str, Dict[str, Any]]], chunk_size: int) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+    """
+    Split rows into lists of at most ``chunk_size`` rows, each sorted by path.
+
+    Sorting brings together the rows sharing a path prefix, and puts each node before its descendants.
+
+    Args:
+        rows (Iterable[Tuple[str, Dict[str, Any]]]): The rows, as ``(path, data)`` pairs.
+        chunk_size (int): The maximum number of rows in a chunk.
+
+    Yields:
+        List[Tuple[str, Dict[str, Any]]]: The rows of each chunk, in path order.
+
+    Raises:
+        ValueError: If ``chunk_size`` is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive.")
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        chunk.sort(key=itemgetter(0))
+        yield chunk
+
+
+def csv_rows(path: str, path_column: str = "path", delimiter: Optional[str] = None,
+             converters: Optional[Mapping[str, Callable[[str], Any]]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Read the nodes of a CSV or TSV file, one per row.
+
+    The file must start with a header row naming the columns. Empty cells are left out of the node data.
+
+    Args:
+        path (str): The path of the file.
+        path_column (str): The column holding the dotted path of each node.
+        delimiter (Optional[str]): The column delimiter. Defaults to a tab for ``.tsv`` and ``.tab`` files and to a
+            comma otherwise.
+        converters (Optional[Mapping[str, Callable[[str], Any]]]): Functions converting the text of the cells of
+            some columns, for example ``{"mass": float}``. The other cells are kept as strings.
+
+    Yields:
+        Tuple[str, Dict[str, Any]]: The path and the data of each node.
+
+    Raises:
+        ValueError: If the file has no path column, or a row has no path or a cell can't be converted.
+    """
+    if delimiter is None:
+        delimiter = "\t" if os.path.splitext(path)[1].lower() in (".tsv", ".tab") else ","
+    converters = converters or {}
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None or path_column not in header:
+            raise ValueError(f"The file has no {path_column!r} column: {path}")
+        path_index = header.index(path_column)
+        names = header[:path_index] + header[path_index + 1:]
+        conversions = [(name, converter) for name, converter in converters.items() if name in names]
+        for row in reader:
+            if not row:
+                continue
+            node_path = row.pop(path_index) if path_index < len(row) else ""
+            if not node_path:
+                raise ValueError(f"Missing node path on line {reader.line_num} of {path}")
+            data = dict(zip(names, row))
+            if "" in data.values():
+                data = {name: value for name, value in data.items() if value != ""}
+            for name, converter in conversions:
+                if name in data:
+                    try:
+                        data[name] = converter(data[name])
+                    except (TypeError, ValueError) as error:
+                        raise ValueError(f"Invalid {name!r} value on line {reader.line_num} of {path}: {error}") from error
+            yield node_path, data
@@ -0,0 +1,322 @@
+"""
+Per-operation instrumentation of the ADH node API.
+
+When enabled with `CommonBaseModel.enable_instrumentation`, every call to a node method of the model is timed, and
+its duration recorded in the `OperationMetrics` of the model under the name of the method and the prefix of the path
+it worked on, such as ``("get_node", "airframe")``. Each pair keeps a call count, the cumulative time and a latency
+histogram with fixed bucket bounds, so that hot operations and hot subtrees can be found in production without a
+profiler. The metrics can be exported to a dictionary or to a file in the Prometheus text exposition format.
+
+Models without instrumentation only pay for one check of their node state per call.
+"""
+
+import math
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Upper bounds in seconds of the latency buckets, from ten microseconds to ten seconds
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """
+    The distribution of the durations of an operation.
+
+    Attributes:
+        bounds (Tuple[float, ...]): The upper bounds of the buckets in seconds, in increasing order. A last bucket
+            holds the durations above the highest bound.
+        counts (List[int]): The number of durations falling in each bucket.
+        count (int): The number of durations recorded.
+        total (float): The sum of the durations recorded, in seconds.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record a duration.
+
+        Args:
+            seconds (float): The duration, in seconds.
+        """
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the durations of another histogram with the same bounds to this one.
+
+        Args:
+            other (LatencyHistogram): The histogram to add.
+        """
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        Return the number of durations up to each bound, as in Prometheus histograms.
+
+        Returns:
+            List[Tuple[float, int]]: Each upper bound with the number of durations lower than or equal to it, the
+            last bound being infinity.
+        """
+        buckets = []
+        running = 0
+        for bound, count in zip(self.bounds + (math.inf,), self.counts):
+            running += count
+            buckets.append((bound, running))
+        return buckets
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the durations from the buckets.
+
+        The quantile is interpolated linearly within the bucket holding it. Quantiles falling above the highest
+        bound are reported as that bound.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated duration in seconds, or 0 if no duration was recorded.
+
+        Raises:
+            ValueError: If ``q`` is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("The quantile must be between 0 and 1.")
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower = 0.0
+        below = 0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and below + count >= rank:
+                return lower + (bound - lower) * (rank - below) / count
+            lower = bound
+            below += count
+        return lower
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the histogram as plain data.
+
+        Returns:
+            Dict[str, Any]: The ``count``, the ``total_seconds``, and the cumulative ``buckets`` mapping each upper
+            bound in seconds to the number of durations up to it.
+        """
+        return {"count": self.count, "total_seconds": self.total, "buckets": dict(self.cumulative())}
+
+
+class OperationMetrics:
+    """
+    The call counts, cumulative times and latency histograms of the node methods of a model.
+
+    The durations are recorded by operation and by path prefix: the first ``prefix_depth`` keys of the path the
+    operation worked on, or an empty string for the operations on the whole ADH. Durations are inclusive: an
+    operation calling other node methods, such as `CommonBaseModel.apply_ops` or `CommonBaseModel.search_nodes`,
+    also counts their time, which is recorded for them too. In concurrent access mode they include the time spent
+    waiting for path locks. The time `CommonBaseModel.iter_nodes` spends suspended between two nodes is not counted.
+
+    The metrics can be recorded from several threads at once.
+
+    Attributes:
+        prefix_depth (int): The number of path keys identifying a subtree.
+        bounds (Tuple[float, ...]): The upper bounds of the latency buckets, in seconds.
+        histograms (Dict[Tuple[str, str], LatencyHistogram]): The histogram of each operation and path prefix.
+    """
+
+    def __init__(self, prefix_depth: int = 1, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """
+        Args:
+            prefix_depth (int): The number of path keys identifying a subtree. 0 records the operations without
+                their paths.
+            bounds (Sequence[float]): The upper bounds of the latency buckets, in seconds.
+
+        Raises:
+            ValueError: If ``prefix_depth`` is negative or the bounds are not increasing.
+        """
+        if prefix_depth < 0:
+            raise ValueError("The prefix depth must not be negative.")
+        if any(lower >= upper for lower, upper in zip(bounds, bounds[1:])):
+            raise ValueError("The bucket bounds must be increasing.")
+        self.prefix_depth = prefix_depth
+        self.bounds = tuple(bounds)
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def prefix(self, path: Optional[str]) -> str:
+        """
+        Return the prefix under which an operation on a path is recorded.
+
+        Args:
+            path (Optional[str]): The dotted path, or None for the whole ADH.
+
+        Returns:
+            str: The first ``prefix_depth`` keys of the path.
+        """
+        if not path or not self.prefix_depth:
+            return ""
+        return ".".join(path.split(".", self.prefix_depth)[:self.prefix_depth])
+
+    def observe(self, operation: str, path: Optional[str], seconds: float) -> None:
+        """
+        Record the duration of an operation.
+
+        Args:
+            operation (str): The name of the operation.
+            path (Optional[str]): The dotted path it worked on, or None for the whole ADH.
+            seconds (float): The duration, in seconds.
+        """
+        key = (operation, self.prefix(path))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram(self.bounds)
+            histogram.observe(seconds)
+
+    def time_iteration(self, operation: str, path: Optional[str], iterator: Iterator[Any]) -> Iterator[Any]:
+        """
+        Wrap an iterator so as to record the time spent producing its items, once it is exhausted or closed.
+
+        Args:
+            operation (str): The name of the operation.
+            path (Optional[str]): The dotted path it works on, or None for the whole ADH.
+            iterator (Iterator[Any]): The iterator to time.
+
+        Yields:
+            Any: The items of the iterator.
+        """
+        elapsed = 0.0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    elapsed += perf_counter() - start
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            self.observe(operation, path, elapsed)
+
+    def operations(self) -> Dict[str, LatencyHistogram]:
+        """
+        Return the histogram of each operation over all path prefixes.
+
+        Returns:
+            Dict[str, LatencyHistogram]: The merged histograms, by operation name.
+        """
+        totals: Dict[str, LatencyHistogram] = {}
+        with self._lock:
+            for (operation, _), histogram in self.histograms.items():
+                if operation not in totals:
+                    totals[operation] = LatencyHistogram(self.bounds)
+                totals[operation].merge(histogram)
+        return totals
+
+    def hot_spots(self, limit: Optional[int] = 10) -> List[Tuple[str, str, int, float]]:
+        """
+        Return the operations and path prefixes that took the most time.
+
+        Args:
+            limit (Optional[int]): The number of entries to return, or None for all of them.
+
+        Returns:
+            List[Tuple[str, str, int, float]]: The operation, path prefix, call count and cumulative time in
+            seconds of each entry, by decreasing cumulative time.
+        """
+        with self._lock:
+            entries = [(operation, prefix, histogram.count, histogram.total)
+                       for (operation, prefix), histogram in self.histograms.items()]
+        entries.sort(key=lambda entry: entry[3], reverse=True)
+        return entries if limit is None else entries[:limit]
+
+    def reset(self) -> None:
+        """Forget all the recorded durations."""
+        with self._lock:
+            self.histograms.clear()
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the metrics as plain data.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each operation, the ``count``, ``total_seconds`` and cumulative
+            ``buckets`` of `LatencyHistogram.as_dict` over all prefixes, and the same figures for each path prefix
+            under ``prefixes``.
+        """
+        metrics = {operation: histogram.as_dict() for operation, histogram in sorted(self.operations().items())}
+        for operation in metrics:
+            metrics[operation]["prefixes"] = {}
+        with self._lock:
+            for (operation, prefix), histogram in sorted(self.histograms.items()):
+                metrics[operation]["prefixes"][prefix] = histogram.as_dict()
+        return metrics
+
+    def to_prometheus(self, name: str = "adh_operation_duration_seconds") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Each operation and path prefix is a series of a histogram, labelled with ``operation`` and ``prefix``.
+
+        Args:
+            name (str): The name of the histogram metric.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = [f"# HELP {name} Duration of the ADH node operations, by operation and path prefix.",
+                 f"# TYPE {name} histogram"]
+        with self._lock:
+            series = [(key, histogram.cumulative(), histogram.count, histogram.total)
+                      for key, histogram in sorted(self.histograms.items())]
+        for (operation, prefix), buckets, count, total in series:
+            labels = f'operation="{_escape(operation)}",prefix="{_escape(prefix)}"'
+            for bound, cumulative in buckets:
+                lines.append(f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {total!r}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, name: str = "adh_operation_duration_seconds") -> None:
+        """
+        Write the metrics to a file in the Prometheus text exposition format, for example for the textfile
+        collector of the node exporter.
+
+        The file is replaced at once, so that a collector never reads a partial file.
+
+        Args:
+            path (str): The path of the file.
+            name (str): The name of the histogram metric.
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus(name))
+        os.replace(temporary_path, path)
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    """Format a bucket bound as a Prometheus ``le`` label."""
+    return "+Inf" if math.isinf(bound) else repr(bound)
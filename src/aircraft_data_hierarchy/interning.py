@@ -0,0 +1,205 @@
+"""
+Interning of the repeated keys and strings of an ADH.
+
+Large ADHs repeat the same keys and string values over and over: units, types, statuses, component names. Parsing
+or building the tree creates a separate string object for each occurrence. An `InternTable`, enabled with
+`CommonBaseModel.enable_interning`, keeps one canonical object per distinct string and replaces the others with it,
+so that the duplicates can be freed. It can also share equal instances of small models, such as `Metadata`.
+"""
+
+import sys
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .loader import LazyNode
+
+
+class InternTable:
+    """
+    The canonical strings, and shared model instances, of a model.
+
+    The table only ever grows: strings dropped from the ADH stay in it until the table is discarded.
+
+    Attributes:
+        shared_types (Tuple[Type[BaseModel], ...]): The model classes whose equal instances are shared. Shared
+            instances must be replaced rather than modified, as a change would show everywhere they are used.
+        replaced (int): The number of duplicate strings and model instances replaced by their canonical object.
+        bytes_saved (int): An estimate of the memory held by the replaced duplicates, in bytes. It is freed once
+            nothing else refers to them.
+    """
+
+    def __init__(self, shared_types: Iterable[Type[BaseModel]] = ()) -> None:
+        self.shared_types = tuple(shared_types)
+        self.replaced = 0
+        self.bytes_saved = 0
+        self._strings: Dict[str, str] = {}
+        self._models: Dict[Hashable, BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: str) -> str:
+        """
+        Return the canonical object of a string.
+
+        Args:
+            value (str): The string.
+
+        Returns:
+            str: The equal string kept by the table, which is ``value`` itself the first time it is seen.
+        """
+        canonical = self._strings.setdefault(value, value)
+        if canonical is not value:
+            self.replaced += 1
+            self.bytes_saved += sys.getsizeof(value)
+        return canonical
+
+    def intern_value(self, value: Any) -> Any:
+        """
+        Intern the keys and strings of a value.
+
+        Dictionaries and lists are interned in place, without recursion. Persistent and other special
+        dictionaries are left as they are, except `LazyNode` dictionaries, whose values are interned as they are
+        parsed. Models are interned with `intern_model`.
+
+        Args:
+            value (Any): The value to intern.
+
+        Returns:
+            Any: The interned value: the canonical string for a string, and ``value`` itself otherwise.
+        """
+        if type(value) is str:
+            return self.intern(value)
+        # The hot loop works on locals and counts the replacements once at the end
+        strings = self._strings
+        canonical_of = strings.setdefault
+        replaced = saved = 0
+        stack = [value]
+        while stack:
+            container = stack.pop()
+            kind = type(container)
+            if kind is dict:
+                rebuild = any(strings.get(key) is not key for key in container)
+                items = list(container.items())
+                if rebuild:
+                    container.clear()
+                for key, item in items:
+                    if rebuild and type(key) is str:
+                        canonical = canonical_of(key, key)
+                        if canonical is not key:
+                            replaced += 1
+                            saved += sys.getsizeof(key)
+                            key = canonical
+                    if type(item) is str:
+                        canonical = canonical_of(item, item)
+                        if canonical is not item:
+                            replaced += 1
+                            saved += sys.getsizeof(item)
+                            item = canonical
+                            if not rebuild:
+                                container[key] = item
+                    elif type(item) in (dict, list) or isinstance(item, (LazyNode, BaseModel)):
+                        stack.append(item)
+                    if rebuild:
+                        container[key] = item
+            elif kind is list:
+                for index, item in enumerate(container):
+                    if type(item) is str:
+                        canonical = canonical_of(item, item)
+                        if canonical is not item:
+                            replaced += 1
+                            saved += sys.getsizeof(item)
+                            container[index] = canonical
+                    elif type(item) in (dict, list) or isinstance(item, (LazyNode, BaseModel)):
+                        stack.append(item)
+            elif isinstance(container, LazyNode):
+                container.set_interner(self)
+            elif isinstance(container, BaseModel):
+                self.intern_model(container)
+        self.replaced += replaced
+        self.bytes_saved += saved
+        return value
+
+    def intern_model(self, model: BaseModel) -> BaseModel:
+        """
+        Intern the strings of the fields of a model and of its nested models.
+
+        Nested instances of the shared types are replaced by the first equal instance seen. Fields are updated
+        directly, bypassing validation, as the new values are equal to the old ones.
+
+        Args:
+            model (BaseModel): The model to intern.
+
+        Returns:
+            BaseModel: The canonical instance of ``model`` if it is of a shared type, and ``model`` otherwise.
+        """
+        stack = [model]
+        while stack:
+            current = stack.pop()
+            fields = current.__dict__
+            for name in type(current).model_fields:
+                value = fields.get(name)
+                if isinstance(value, BaseModel):
+                    shared = self._shared(value)
+                    if shared is not value:
+                        fields[name] = shared
+                    else:
+                        stack.append(value)
+                elif type(value) is list and any(isinstance(item, BaseModel) for item in value):
+                    for index, item in enumerate(value):
+                        if isinstance(item, BaseModel):
+                            shared = self._shared(item)
+                            if shared is not item:
+                                value[index] = shared
+                            else:
+                                stack.append(item)
+                        else:
+                            value[index] = self.intern_value(item)
+                elif value is not None:
+                    fields[name] = self.intern_value(value)
+        return self._shared(model)
+
+    def _shared(self, model: BaseModel) -> BaseModel:
+        """Return the canonical instance of a model of a shared type, registering it if it is the first one."""
+        if not isinstance(model, self.shared_types):
+            return model
+        key = self._model_key(model)
+        if key is None:
+            return model
+        canonical = self._models.get(key)
+        if canonical is None:
+            self._intern_fields(model)
+            self._models[key] = model
+            return model
+        self.replaced += 1
+        self.bytes_saved += sys.getsizeof(model) + sys.getsizeof(model.__dict__)
+        return canonical
+
+    def _intern_fields(self, model: BaseModel) -> None:
+        """Intern the string fields of a shared model instance, which holds no nested models."""
+        fields = model.__dict__
+        for name in type(model).model_fields:
+            if type(fields.get(name)) is str:
+                fields[name] = self.intern(fields[name])
+
+    @staticmethod
+    def _model_key(model: BaseModel) -> Optional[Hashable]:
+        """
+        Return a key identifying the instances equal to a model, or None if it can't be shared: when it holds
+        values other than hashable scalars and empty containers, or has extra fields or auxiliary state.
+        """
+        if model.__pydantic_extra__ or set(model.__dict__) - set(type(model).model_fields):
+            return None
+        values: List[Tuple[str, type, Any]] = []
+        for name, value in model.__dict__.items():
+            if isinstance(value, (dict, list)) and not value:
+                value = type(value)
+            elif isinstance(value, (dict, list, set, BaseModel)):
+                return None
+            try:
+                hash(value)
+            except TypeError:
+                return None
+            values.append((name, type(value), value))
+        return type(model), frozenset(model.model_fields_set), tuple(values)
@@ -0,0 +1,232 @@
+"""
+Change journal for the ADH.
+
+When enabled with `CommonBaseModel.enable_journal`, every node operation of the model appends a `ChangeRecord` to
+the model's `ChangeJournal`. Tools can read the records appended since the last sequence number they saw, or
+subscribe to a path prefix and receive the relevant records as they are published, either through a callback or
+through an asyncio queue.
+"""
+
+import itertools
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class ChangeRecord(NamedTuple):
+    """
+    A single change of the ADH.
+
+    The old and new values are references to the nodes involved, not copies. A node changed in place, as by
+    `CommonBaseModel.merge_nodes` on a plain ADH, is therefore both the old and the new value.
+
+    Attributes:
+        seq (int): The sequence number of the change, increasing by one for each published record.
+        op (str): The operation: ``create``, ``update``, ``delete``, ``move``, ``merge``, ``copy``, ``link`` or
+            ``unlink``.
+        path (str): The dotted path that was changed. For ``link`` and ``unlink`` this is the alias.
+        old (Any): The value at the path before the change, or None.
+        new (Any): The value at the path after the change, or None. For ``link`` this is the alias target.
+        source (Optional[str]): The source path of a ``move``, ``merge`` or ``copy``.
+    """
+
+    seq: int
+    op: str
+    path: str
+    old: Any
+    new: Any
+    source: Optional[str] = None
+
+
+class Subscription:
+    """
+    A registration for the changes under a path prefix.
+
+    Attributes:
+        prefix (str): The dotted path prefix, or an empty string for every change.
+        callback (Callable[[ChangeRecord], None]): The function receiving the relevant records.
+    """
+
+    __slots__ = ("prefix", "callback")
+
+    def __init__(self, prefix: str, callback: Callable[[ChangeRecord], None]) -> None:
+        self.prefix = prefix
+        self.callback = callback
+
+    def is_relevant(self, record: ChangeRecord) -> bool:
+        """
+        Check whether a change touches the subtree at the prefix.
+
+        A change is relevant when its path, or its source path, lies at or below the prefix, or is an ancestor of
+        the prefix and so replaced the subtree as a whole.
+
+        Args:
+            record (ChangeRecord): The change to check.
+
+        Returns:
+            bool: True if the subscriber should receive the record.
+        """
+        return _overlaps(self.prefix, record.path) or (record.source is not None and _overlaps(self.prefix, record.source))
+
+
+def _overlaps(prefix: str, path: str) -> bool:
+    """Return whether one of two dotted paths is the other or one of its ancestors."""
+    if not prefix or prefix == path:
+        return True
+    if len(path) > len(prefix):
+        return path.startswith(prefix) and path[len(prefix)] == "."
+    return prefix.startswith(path) and prefix[len(path)] == "."
+
+
+class ChangeJournal:
+    """
+    An append-only log of the changes made to an ADH, with path-scoped subscribers.
+
+    Attributes:
+        records (Deque[ChangeRecord]): The published records, oldest first. Only the most recent ``maxlen`` records
+            are kept when a maximum length was given.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        self.records: Deque[ChangeRecord] = deque(maxlen=maxlen)
+        self._sequence = itertools.count(1)
+        self._subscriptions: List[Subscription] = []
+        self._pending: Optional[List[tuple]] = None
+
+    @property
+    def last_seq(self) -> int:
+        """int: The sequence number of the most recent record, or 0 if none has been published."""
+        return self.records[-1].seq if self.records else 0
+
+    @property
+    def holding(self) -> bool:
+        """bool: Whether records are being held back until `commit`."""
+        return self._pending is not None
+
+    def since(self, seq: int) -> List[ChangeRecord]:
+        """
+        Return the records published after a sequence number.
+
+        Args:
+            seq (int): The last sequence number already processed, or 0 for all the records kept.
+
+        Returns:
+            List[ChangeRecord]: The newer records, oldest first.
+        """
+        if not self.records or seq >= self.records[-1].seq:
+            return []
+        start = max(seq + 1 - self.records[0].seq, 0)
+        return list(itertools.islice(self.records, start, None))
+
+    def subscribe(self, prefix: str, callback: Callable[[ChangeRecord], None]) -> Subscription:
+        """
+        Call a function with each published record relevant to a path prefix.
+
+        Callbacks run synchronously, after the change has been applied, in the thread that made it. An exception
+        raised by a callback propagates to the caller of the node operation.
+
+        Args:
+            prefix (str): The dotted path prefix to watch, or an empty string for every change.
+            callback (Callable[[ChangeRecord], None]): The function receiving the records.
+
+        Returns:
+            Subscription: The subscription, to be passed to `unsubscribe`.
+        """
+        subscription = Subscription(prefix, callback)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def subscribe_queue(self, prefix: str, maxsize: int = 0) -> "asyncio.Queue[ChangeRecord]":
+        """
+        Deliver each published record relevant to a path prefix to an asyncio queue.
+
+        When called from a running event loop, records are handed to the loop thread safely, so the ADH may be
+        changed from other threads while a coroutine awaits the queue.
+
+        Args:
+            prefix (str): The dotted path prefix to watch, or an empty string for every change.
+            maxsize (int): The maximum size of the queue; records that do not fit are dropped. Zero means unbounded.
+
+        Returns:
+            asyncio.Queue[ChangeRecord]: The queue receiving the records. Its subscription is available as the
+            queue's ``subscription`` attribute.
+        """
+        # Imported here, since asyncio is slow to import and only queues need it
+        import asyncio
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        def put(record: ChangeRecord) -> None:
+            if not queue.full():
+                queue.put_nowait(record)
+
+        callback = put if loop is None else lambda record: loop.call_soon_threadsafe(put, record)
+        queue.subscription = self.subscribe(prefix, callback)
+        return queue
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Stop delivering records to a subscriber.
+
+        Args:
+            subscription (Subscription): The subscription returned by `subscribe`, or the ``subscription``
+                attribute of a queue returned by `subscribe_queue`.
+        """
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def append(self, op: str, path: str, old: Any = None, new: Any = None, source: Optional[str] = None) -> None:
+        """
+        Record a change, publishing it at once unless a batch is open.
+
+        Args:
+            op (str): The operation.
+            path (str): The changed path.
+            old (Any): The value before the change.
+            new (Any): The value after the change.
+            source (Optional[str]): The source path of the operation, if any.
+        """
+        if self._pending is not None:
+            self._pending.append((op, path, old, new, source))
+        else:
+            self._publish(op, path, old, new, source)
+
+    def _publish(self, op: str, path: str, old: Any, new: Any, source: Optional[str]) -> None:
+        record = ChangeRecord(next(self._sequence), op, path, old, new, source)
+        self.records.append(record)
+        for subscription in list(self._subscriptions):
+            if subscription.is_relevant(record):
+                subscription.callback(record)
+
+    def begin(self) -> int:
+        """
+        Hold back the records until `commit`, for `CommonBaseModel.batch`.
+
+        Returns:
+            int: A savepoint to pass to `discard`.
+        """
+        if self._pending is None:
+            self._pending = []
+        return len(self._pending)
+
+    def discard(self, savepoint: int) -> None:
+        """
+        Drop the records held back since a savepoint, because their changes were rolled back.
+
+        Args:
+            savepoint (int): The value returned by `begin`.
+        """
+        if self._pending is not None:
+            del self._pending[savepoint:]
+
+    def commit(self) -> None:
+        """Publish the records held back since the outermost `begin`."""
+        pending, self._pending = self._pending, None
+        for change in pending or ():
+            self._publish(*change)
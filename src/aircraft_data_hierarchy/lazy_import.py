@@ -0,0 +1,90 @@
+"""
+Lazy loading of the modules of a package.
+
+The packages of aircraft_data_hierarchy used to star-import all of their modules, so importing any of them built every
+model class and its pydantic schema, and imported the libraries used for diagrams. `lazy_exports` gives a package a
+module ``__getattr__`` (PEP 562) which imports the module defining a name the first time the name is read instead,
+so that importing the package costs almost nothing and using one of its classes only loads the modules it needs.
+
+The names a package exports are listed, with the module defining each, in its ``__init__`` module, and a package
+includes the names exported by its subpackages with `subpackage_names`. The other names the star imports used to
+bring in, such as the typing helpers imported by the modules, are listed apart, with the module each was read from:
+they are still found, but are not part of ``__all__``. Any other name raises `AttributeError` without importing
+anything.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def subpackage_names(package: str,
+                     subpackages: Sequence[str]) -> Tuple[Dict[str, Sequence[str]], Dict[str, Sequence[str]]]:
+    """
+    Return the names exported by subpackages, and their legacy names, by module relative to the package.
+
+    Only the ``__init__`` modules of the subpackages are run, which do not import their modules.
+
+    Args:
+        package (str): The name of the package.
+        subpackages (Sequence[str]): The names of the subpackages, relative to the package.
+
+    Returns:
+        Tuple[Dict[str, Sequence[str]], Dict[str, Sequence[str]]]: The exported names and the legacy names, as given
+        to `lazy_exports` by the subpackages, with their modules prefixed by the name of their subpackage.
+    """
+    exports: Dict[str, Sequence[str]] = {}
+    legacy: Dict[str, Sequence[str]] = {}
+    for subpackage in subpackages:
+        module = importlib.import_module(f"{package}.{subpackage}")
+        exports.update({f"{subpackage}.{name}": names for name, names in module._EXPORTS.items()})
+        legacy.update({f"{subpackage}.{name}": names for name, names in module._LEGACY.items()})
+    return exports, legacy
+
+
+def lazy_exports(package: str, submodules: Sequence[str], exports: Dict[str, Sequence[str]],
+                 legacy: Optional[Dict[str, Sequence[str]]] = None
+                 ) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Build the module attributes loading the names exported by a package on first access.
+
+    Args:
+        package (str): The name of the package, ``__name__`` in its ``__init__`` module.
+        submodules (Sequence[str]): The modules and subpackages the package used to star-import, in order.
+        exports (Dict[str, Sequence[str]]): The names exported by the package, by the module defining them, relative
+            to the package.
+        legacy (Optional[Dict[str, Sequence[str]]]): The other names the former star imports provided, by the module
+            they are read from, relative to the package. They are found like the exported names, but are left out
+            of ``__all__`` and ``dir()``.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]: The ``__getattr__``, ``__dir__`` and
+        ``__all__`` attributes of the package.
+
+    Raises:
+        ValueError: If an exported name is also the name of a module of the package.
+    """
+    exported = {name: module for module, names in exports.items() for name in names}
+    owners = {name: module for module, names in (legacy or {}).items() for name in names}
+    owners.update(exported)
+    # Importing a module binds its name in the package, which would hide an exported name equal to it
+    clashes = set(owners) & ({module.split(".")[0] for module in owners.values()} | set(submodules))
+    if clashes:
+        raise ValueError(f"Names exported by {package} clash with its modules: {', '.join(sorted(clashes))}")
+
+    def __getattr__(name: str) -> Any:
+        module = owners.get(name)
+        if module is not None:
+            value = getattr(importlib.import_module(f"{package}.{module}"), name)
+        elif name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Later reads find the name in the package without calling this function
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exported) | set(submodules))
+
+    return __getattr__, __dir__, sorted(exported)
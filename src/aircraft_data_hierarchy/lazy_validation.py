@@ -0,0 +1,233 @@
+"""
+Lazy validation of nested models.
+
+Validating a model validates all of its nested models at once: opening a `Component` validates its geometry,
+parameters, requirements, performance and behavior, and those of every subcomponent below it, even when only the
+names of a few components are read. `validate_lazy` validates the fields holding nested models only when they are
+first read instead. The other fields are validated at once, as usual.
+
+A field is left unvalidated when it has a default and its annotation holds models, such as ``Optional[Geometry]`` or
+``Optional[List[Component]]``. Its raw value is kept apart from the values of the model, under `PENDING_KEY` in its
+``__dict__``, so that reading the field falls through to the ``__getattr__`` of the class, which calls
+`validate_pending` to validate it with the validators of the field, raising the `pydantic.ValidationError` at that
+point if it is invalid. Only the classes providing ``model_validate_lazy`` and such a ``__getattr__``, as
+`CommonBaseModel` does, are validated lazily: neither the class nor the models validated eagerly are changed, and
+reading their fields costs nothing more. The models held by a pending field are themselves validated lazily, so
+reading ``component.subcomponents[0].name`` only validates the scalar fields of the first level of subcomponents.
+
+Classes with model validators or frozen instances are validated at once, since their validators read the values of
+several fields together. `validate_all` validates every field left pending in a model and in the models it holds,
+as serializing or comparing a lazily validated `CommonBaseModel` does first. A model validated eagerly but given
+lazily validated models, as in ``Component(subcomponents=[lazy])``, must be completed with `validate_all` before it
+is serialized, since the pending fields of the models it holds would otherwise be left out.
+"""
+
+import inspect
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Annotated, get_args, get_origin
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# The fields validated on first access, by class, with the keys of their value and the function validating the
+# models it holds lazily
+_lazy_fields: Dict[type, Dict[str, Tuple[Tuple[str, ...], Optional[Callable[[Any], Any]]]]] = {}
+
+# The fields which may hold models, by class
+_nested_fields: Dict[type, Tuple[str, ...]] = {}
+
+# Marker of a field missing from the data
+_MISSING = object()
+
+# The origins of union annotations: ``X | Y`` unions only exist from Python 3.10
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+# Key of the raw values of the fields left pending, by name, in the ``__dict__`` of a lazily validated model. It is
+# kept, possibly empty, until `validate_all` has validated the models the model holds as well
+PENDING_KEY = "_adh_pending"
+
+
+def _holds_models(annotation: Any) -> bool:
+    """Return whether values of a type may hold pydantic models."""
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return True
+    return any(_holds_models(argument) for argument in get_args(annotation))
+
+
+def _lazy_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the function validating lazily the models held by the raw value of a field.
+
+    Returns:
+        Optional[Callable[[Any], Any]]: The function, or None if the value is left to the validator of the field.
+        Values which are not of the expected shape are left as they are, for the validator of the field to report.
+    """
+    origin = get_origin(annotation)
+    arguments = get_args(annotation)
+    if origin is Annotated:
+        return _lazy_converter(arguments[0])
+    if origin in _UNION_TYPES:
+        options = [argument for argument in arguments if argument is not type(None)]
+        if len(options) == 1:
+            return _lazy_converter(options[0])
+    elif inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        validate = getattr(annotation, "model_validate_lazy", None)
+        if validate is not None:
+            return lambda value: validate(value) if isinstance(value, dict) else value
+    elif origin is list and arguments:
+        convert = _lazy_converter(arguments[0])
+        if convert is not None:
+            return lambda value: list(map(convert, value)) if isinstance(value, list) else value
+    elif origin is dict and len(arguments) == 2:
+        convert = _lazy_converter(arguments[1])
+        if convert is not None:
+            return lambda value: {key: convert(item) for key, item in value.items()} if isinstance(value, dict) else value
+    return None
+
+
+def _fields_of(model_class: type) -> Dict[str, Tuple[Tuple[str, ...], Optional[Callable[[Any], Any]]]]:
+    """Return the fields of a class validated on first access."""
+    fields = _lazy_fields.get(model_class)
+    if fields is not None:
+        return fields
+    fields = {}
+    config = model_class.model_config
+    if (hasattr(model_class, "model_validate_lazy") and not config.get("frozen")
+            and not model_class.__pydantic_decorators__.model_validators):
+        by_name = config.get("populate_by_name") or config.get("validate_by_name")
+        for name, field in model_class.model_fields.items():
+            if field.is_required() or not _holds_models(field.annotation):
+                continue
+            keys = (field.alias, name) if field.alias and by_name else (field.alias or name,)
+            fields[name] = (keys, None)
+    _lazy_fields[model_class] = fields
+    # Converters are built last, since building them may reach this class again through a nested field
+    for name, (keys, _) in fields.items():
+        fields[name] = (keys, _lazy_converter(model_class.model_fields[name].annotation))
+    return fields
+
+
+def validate_lazy(model_class: Type[ModelType], data: Any) -> ModelType:
+    """
+    Validate a model, leaving the fields holding nested models to be validated when they are first read.
+
+    Args:
+        model_class (Type[ModelType]): The model class.
+        data (Any): The fields of the model, as for ``model_validate``. Values other than dictionaries are validated
+            at once.
+
+    Returns:
+        ModelType: The model.
+
+    Raises:
+        pydantic.ValidationError: If a field validated at once is invalid. Errors in the other fields are raised
+            when they are read.
+    """
+    fields = _fields_of(model_class)
+    if not fields or not isinstance(data, dict):
+        return model_class.model_validate(data)
+    eager = dict(data)
+    pending = []
+    for name, (keys, _) in fields.items():
+        for key in keys:
+            value = eager.pop(key, _MISSING)
+            if value is not _MISSING:
+                pending.append((name, value))
+                break
+    model = model_class.model_validate(eager)
+    values = model.__dict__
+    for name, _ in pending:
+        # Dropping the default makes reads of the field fall through to ``__getattr__``
+        del values[name]
+        model.__pydantic_fields_set__.add(name)
+    values[PENDING_KEY] = dict(pending)
+    return model
+
+
+def validate_pending(model: BaseModel, name: str) -> Any:
+    """
+    Validate a field left pending by `validate_lazy`, with its validators, and return its value.
+
+    Args:
+        model (BaseModel): The model.
+        name (str): The field name, which must be pending.
+
+    Returns:
+        Any: The value of the field.
+
+    Raises:
+        pydantic.ValidationError: If the field is invalid, in which case it is left pending.
+    """
+    _, convert = _fields_of(type(model))[name]
+    data = model.__dict__[PENDING_KEY][name]
+    value = data
+    if convert is not None:
+        try:
+            value = convert(value)
+        except ValidationError:
+            # Validated again below, for the error to be reported at the location of the field
+            value = data
+    model.__pydantic_validator__.validate_assignment(model, name, value)
+    # Replaced rather than changed, since shallow copies of the model share it
+    values = model.__dict__
+    values[PENDING_KEY] = {key: item for key, item in values[PENDING_KEY].items() if key != name}
+    # The fields are dumped in the order of the instance dictionary: the fields declared after it are moved behind it
+    following = False
+    for key in model.__pydantic_fields__:
+        if following and key in values:
+            values[key] = values.pop(key)
+        following = following or key == name
+    return values[name]
+
+
+def _nested_fields_of(model_class: type) -> Tuple[str, ...]:
+    """Return the fields of a class which may hold models."""
+    names = _nested_fields.get(model_class)
+    if names is None:
+        names = _nested_fields[model_class] = tuple(
+            name for name, field in model_class.model_fields.items() if _holds_models(field.annotation))
+    return names
+
+
+def validate_all(model: BaseModel) -> int:
+    """
+    Validate the fields left pending by `validate_lazy` in a model and in every model it holds.
+
+    The models are then no longer marked as validated lazily, so that serializing them does not walk them again.
+
+    Args:
+        model (BaseModel): The model.
+
+    Returns:
+        int: The number of fields validated.
+
+    Raises:
+        pydantic.ValidationError: At the first invalid field.
+    """
+    validated = 0
+    seen: Dict[int, BaseModel] = {}
+    stack: List[Any] = [model]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, BaseModel):
+            if id(value) in seen:
+                continue
+            seen[id(value)] = value
+            values = value.__dict__
+            for name in _nested_fields_of(type(value)):
+                # A field assigned since it was left pending keeps its assigned value
+                if name not in values and name in values.get(PENDING_KEY, ()):
+                    validate_pending(value, name)
+                    values = value.__dict__
+                    validated += 1
+                stack.append(values.get(name))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+    # Only once every pending field below them is valid, for serializing them to keep completing the others
+    for value in seen.values():
+        value.__dict__.pop(PENDING_KEY, None)
+    return validated
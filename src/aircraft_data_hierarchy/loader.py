@@ -0,0 +1,343 @@
+"""
+Lazy loading of models saved as JSON.
+
+`load_lazy` opens a JSON file holding a model, as written by ``model_dump_json``, without parsing all of it. The
+file is memory-mapped and scanned once to record the byte range of each model field and of each child of the
+dictionary fields holding the ADH. The children of the ADH are only parsed when they are first read, so opening a
+large ADH is quick and the memory used grows with the parts of it that are actually visited. The other fields are
+parsed when the file is opened, and validated with ``model_validate_lazy`` when the model class provides it, as
+`CommonBaseModel` does: the fields holding nested models, such as the geometry and subcomponents of a `Component`,
+are then only validated when they are first read (see `validate_lazy`).
+"""
+
+import json
+import mmap
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .interning import InternTable
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# The file is scanned in chunks of this many bytes, bounding the memory used by the scan
+_CHUNK_SIZE = 1 << 24
+
+_QUOTE, _BACKSLASH, _COMMA, _COLON = b'"\\,:'
+_OPENING_BRACE, _CLOSING_BRACE, _OPENING_BRACKET, _CLOSING_BRACKET = b"{}[]"
+# Whether each byte is structural, and how it changes the nesting depth, built on first use so that numpy is only
+# imported once a file is opened
+_byte_tables: Optional[Tuple["np.ndarray", "np.ndarray"]] = None
+
+
+class Unparsed:
+    """
+    The placeholder of a value of a `LazyNode` which has not been parsed yet.
+
+    Attributes:
+        start (int): The offset of the first byte of the JSON value in the file.
+        end (int): The offset following its last byte.
+    """
+
+    __slots__ = ("start", "end")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        return f"Unparsed({self.start}, {self.end})"
+
+
+class LazyNode(dict):
+    """
+    A dictionary whose values are parsed from a JSON file when they are first read.
+
+    Keys are known from the start. Reading a value through indexing, `get`, `items`, `values`, iteration-based
+    copies or comparisons parses it and stores the result in place of its `Unparsed` placeholder; setting or
+    deleting keys works as for any dictionary. Code reading the dictionary at the C level, such as pydantic
+    serialization, sees the placeholders: call `materialize` first.
+
+    With an intern table set through `set_interner`, the keys and strings of each value are interned as it is
+    parsed.
+    """
+
+    __slots__ = ("_buffer", "_lock", "_interner")
+
+    def __init__(self, buffer: Any, offsets: Dict[str, Tuple[int, int]]) -> None:
+        super().__init__((key, Unparsed(start, end)) for key, (start, end) in offsets.items())
+        self._buffer = buffer
+        self._lock = threading.Lock()
+        self._interner: Optional["InternTable"] = None
+
+    def _parse(self, key: Any, value: Any) -> Any:
+        if type(value) is not Unparsed:
+            return value
+        with self._lock:
+            value = dict.get(self, key)
+            if type(value) is Unparsed:
+                value = json.loads(self._buffer[value.start:value.end])
+                if self._interner is not None:
+                    value = self._interner.intern_value(value)
+                dict.__setitem__(self, key, value)
+        return value
+
+    def set_interner(self, interner: Optional["InternTable"]) -> None:
+        """
+        Intern the values parsed from now on, and the keys and values already parsed.
+
+        Args:
+            interner (Optional[InternTable]): The intern table, or None to stop interning.
+        """
+        self._interner = interner
+        if interner is not None:
+            with self._lock:
+                for key in list(dict.keys(self)):
+                    value = dict.pop(self, key)
+                    dict.__setitem__(self, interner.intern(key),
+                                     value if type(value) is Unparsed else interner.intern_value(value))
+
+    @property
+    def pending(self) -> int:
+        """int: The number of values not parsed yet."""
+        return sum(1 for value in dict.values(self) if type(value) is Unparsed)
+
+    def raw(self, key: str) -> Optional[bytes]:
+        """
+        Return the JSON text of a value which has not been parsed yet.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            Optional[bytes]: The JSON text as stored in the file, or None if the value has been parsed or replaced.
+        """
+        value = dict.get(self, key)
+        return self._buffer[value.start:value.end] if type(value) is Unparsed else None
+
+    def materialize(self) -> "LazyNode":
+        """
+        Parse every value not parsed yet.
+
+        Returns:
+            LazyNode: This node, now holding only parsed values.
+        """
+        for key, value in list(dict.items(self)):
+            self._parse(key, value)
+        return self
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._parse(key, dict.__getitem__(self, key))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            return default
+        return self[key]
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def __iter__(self) -> Iterator[Any]:
+        # Overriding iteration makes dict(node) and dict.update go through __getitem__
+        return dict.__iter__(self)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            self[key]
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        self.materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return dict.setdefault(self, key, default)
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.materialize())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyNode):
+            other.materialize()
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return dict, (dict(self.materialize()),)
+
+
+def _structure(buffer: Any, max_level: int) -> List[Tuple[int, int, int]]:
+    """
+    Find the structural characters of a JSON text down to a nesting level.
+
+    The text is processed in chunks with numpy: the unescaped quotes give the parity telling whether a character is
+    inside a string, and the brackets outside of strings give the nesting level of each character.
+
+    Args:
+        buffer (Any): The JSON text.
+        max_level (int): The deepest container to report, the outermost being level 1.
+
+    Returns:
+        List[Tuple[int, int, int]]: The offset, character and level of each bracket, comma and colon outside of
+        strings that belongs to a container of level at most ``max_level``.
+
+    Raises:
+        ValueError: If the brackets are not balanced.
+    """
+    import numpy as np
+
+    global _byte_tables
+    if _byte_tables is None:
+        structural = np.zeros(256, dtype=bool)
+        structural[list(b"{}[],:")] = True
+        changes = np.zeros(256, dtype=np.int64)
+        changes[[_OPENING_BRACE, _OPENING_BRACKET]] = 1
+        changes[[_CLOSING_BRACE, _CLOSING_BRACKET]] = -1
+        _byte_tables = structural, changes
+    structural_bytes, depth_changes = _byte_tables
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    marks = []
+    quotes_before = depth = 0
+    for offset in range(0, len(data), _CHUNK_SIZE):
+        chunk = data[offset:offset + _CHUNK_SIZE]
+        quotes = np.flatnonzero(chunk == _QUOTE)
+        preceded = np.flatnonzero(data[np.maximum(quotes + offset - 1, 0)] == _BACKSLASH)
+        escaped = [index for index in preceded.tolist() if _escaped(data, int(quotes[index]) + offset)]
+        if escaped:
+            quotes = np.delete(quotes, escaped)
+        # The running count of quotes, modulo 256, is odd inside strings
+        quote_counts = np.zeros(len(chunk), dtype=np.uint8)
+        quote_counts[quotes] = 1
+        np.cumsum(quote_counts, dtype=np.uint8, out=quote_counts)
+        outside = (quote_counts & 1) == quotes_before % 2
+        positions = np.flatnonzero(structural_bytes[chunk] & outside)
+        characters = chunk[positions]
+        deltas = depth_changes[characters]
+        levels = depth + np.cumsum(deltas) - np.minimum(deltas, 0)
+        kept = levels <= max_level
+        marks.extend(zip((positions[kept] + offset).tolist(), characters[kept].tolist(), levels[kept].tolist()))
+        quotes_before += len(quotes)
+        depth += int(deltas.sum())
+    if depth != 0 or quotes_before % 2:
+        raise ValueError("Unexpected end of the JSON file.")
+    return marks
+
+
+def _escaped(data: "np.ndarray", position: int) -> bool:
+    """Return whether the quote at a position is preceded by an odd number of backslashes."""
+    count = 0
+    while position > count and data[position - count - 1] == _BACKSLASH:
+        count += 1
+    return count % 2 == 1
+
+
+def _stripped(buffer: Any, start: int, end: int) -> Tuple[int, int]:
+    """Return the range of a slice of the text without its surrounding whitespace."""
+    while start < end and buffer[start:start + 1].isspace():
+        start += 1
+    while end > start and buffer[end - 1:end].isspace():
+        end -= 1
+    return start, end
+
+
+def _entries(buffer: Any, marks: List[Tuple[int, int, int]], level: int) -> Dict[str, Tuple[int, int]]:
+    """
+    Find the keys and value ranges of a JSON object.
+
+    Args:
+        buffer (Any): The JSON text.
+        marks (List[Tuple[int, int, int]]): The structural characters of the object, from its opening brace to its
+            closing brace, as returned by `_structure`.
+        level (int): The nesting level of the object.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The start and end offsets of each value by key.
+
+    Raises:
+        ValueError: If the text is not a valid JSON object.
+    """
+    if not marks or marks[0][1] != _OPENING_BRACE:
+        raise ValueError(f"Expected a JSON object at offset {marks[0][0] if marks else 0}.")
+    entries = {}
+    separator = marks[0][0]
+    colon = None
+    for position, character, mark_level in marks[1:]:
+        if mark_level != level:
+            continue
+        if character == _COLON:
+            key_start, key_end = _stripped(buffer, separator + 1, position)
+            key = json.loads(buffer[key_start:key_end])
+            if not isinstance(key, str):
+                raise ValueError(f"Expected an object key at offset {key_start}.")
+            colon = position
+        elif character in (_COMMA, _CLOSING_BRACE):
+            if colon is None:
+                key_start, key_end = _stripped(buffer, separator + 1, position)
+                if character == _CLOSING_BRACE and not entries and key_start == key_end:
+                    break  # An empty object
+                raise ValueError(f"Expected an object key at offset {key_start}.")
+            entries[key] = _stripped(buffer, colon + 1, position)
+            separator, colon = position, None
+            if character == _CLOSING_BRACE:
+                break
+        else:
+            raise ValueError(f"Unexpected character at offset {position}.")
+    return entries
+
+
+def load_lazy(path: str, model_class: Type[ModelType], lazy_fields: Sequence[str] = ("adh_root", "adh_data")) -> ModelType:
+    """
+    Open a model saved as JSON, deferring the parsing of its ADH and the validation of its nested models.
+
+    The file stays memory-mapped for as long as parts of it have not been parsed, and must not be modified in the
+    meantime.
+
+    Args:
+        path (str): The path of the JSON file.
+        model_class (Type[ModelType]): The model class to validate the file against.
+        lazy_fields (Sequence[str]): The dictionary fields whose children are parsed on first access. The other
+            fields are parsed immediately, and validated with ``model_validate_lazy`` if the class provides it, or
+            with ``model_validate`` otherwise.
+
+    Returns:
+        ModelType: The model, whose lazy fields hold `LazyNode` dictionaries.
+
+    Raises:
+        ValueError: If the file is not a JSON object.
+        pydantic.ValidationError: If the fields validated immediately are not valid for the model. Errors in the
+            fields validated lazily are raised when they are first read.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if file.seek(0, 2) else b""
+    if not buffer:
+        raise ValueError(f"The file is empty: {path}")
+
+    marks = _structure(buffer, 2)
+    positions = [position for position, _, _ in marks]
+    fields = _entries(buffer, marks, 1)
+    eager, lazy = {}, {}
+    for key, (start, end) in fields.items():
+        if key in lazy_fields and key in model_class.model_fields and buffer[start:start + 1] == b"{":
+            lazy[key] = _entries(buffer, marks[bisect_left(positions, start):bisect_left(positions, end)], 2)
+        else:
+            eager[key] = json.loads(buffer[start:end])
+    validate = getattr(model_class, "model_validate_lazy", model_class.model_validate)
+    model = validate(eager)
+    for key, offsets in lazy.items():
+        model.__dict__[key] = LazyNode(buffer, offsets)
+        model.__pydantic_fields_set__.add(key)
+    return model
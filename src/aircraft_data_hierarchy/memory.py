@@ -0,0 +1,169 @@
+"""
+Memory accounting of the subtrees of a model.
+
+`subtree_sizes` measures the deep size of an object graph in a single walk, attributing the size of each object to
+the subtree it is found in: the keys of the dictionaries and the fields of the pydantic models name the subtrees, down
+to a given depth. The sizes of the deeper objects, and of the items of lists, are added to the subtree holding them.
+`CommonBaseModel.memory_report` applies it to a model, so that the heaviest branches, such as geometry or
+aerodynamic tables, can be compacted or offloaded first.
+
+The sizes are those reported by `sys.getsizeof`, so they include the object headers and the spare capacity of the
+containers but not the allocator overhead. An object reachable from several places, such as a string shared by
+interning or a node linked twice, is counted once, in the first subtree reaching it in depth-first order.
+"""
+
+import sys
+import types
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Tuple
+from pydantic import BaseModel
+
+# Objects which belong to the program rather than to the data, and are never counted
+_SKIPPED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, Enum, bool,
+            type(None))
+
+# Objects holding no reference to other objects, by exact type
+_LEAVES = frozenset((str, bytes, int, float, complex))
+
+# The attributes held in the slots of each class, by class
+_slot_names: Dict[type, Tuple[str, ...]] = {}
+
+
+def _slots(cls: type) -> Tuple[str, ...]:
+    """Return the names of the slots declared by a class and its bases, other than ``__dict__`` and ``__weakref__``."""
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+            for name in [slots] if isinstance(slots, str) else slots:
+                if name not in ("__dict__", "__weakref__"):
+                    # Private slot names are mangled with the name of the declaring class
+                    if name.startswith("__") and not name.endswith("__"):
+                        name = f"_{base.__name__.lstrip('_')}{name}"
+                    names.append(name)
+        names = _slot_names[cls] = tuple(names)
+    return names
+
+
+def _referents(value: Any) -> Tuple[List[Tuple[Any, Any]], List[Any], List[Any]]:
+    """
+    Return the objects referenced by a value.
+
+    Returns:
+        Tuple[List[Tuple[Any, Any]], List[Any], List[Any]]: The values of a dictionary, as ``(key, value)`` pairs;
+        the attributes of a pydantic model, including the ``__dict__`` holding its fields; and the other referents,
+        such as the keys of a dictionary, the items of a sequence or the attributes of other objects.
+    """
+    if isinstance(value, dict):
+        # Read through dict itself, so that lazily loaded nodes are not parsed
+        return list(dict.items(value)), [], list(dict.keys(value))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [], [], list(value)
+    if isinstance(value, (str, bytes, int, float, complex)):
+        return [], [], []
+    # The instance dictionary comes first, so that the fields of a model are walked before its private attributes
+    instance_dict = getattr(value, "__dict__", None)
+    attributes = [instance_dict] if isinstance(instance_dict, dict) else []
+    for name in _slots(type(value)):
+        attribute = getattr(value, name, None)
+        if attribute is not None:
+            attributes.append(attribute)
+    if isinstance(value, BaseModel):
+        return [], attributes, []
+    return [], [], attributes
+
+
+def subtree_sizes(value: Any, depth: int = 2) -> Dict[str, int]:
+    """
+    Measure the deep size of an object and of its subtrees, in a single walk.
+
+    The values of dictionaries, including the fields held in the ``__dict__`` of pydantic models, are the subtrees,
+    named by their key. The objects below ``depth`` named levels, and everything held in lists, tuples, sets and
+    objects other than models, are counted in the subtree holding them. Lazily loaded nodes are measured as they are,
+    without parsing them.
+
+    Args:
+        value (Any): The object to measure.
+        depth (int): The number of levels of subtrees to report.
+
+    Returns:
+        Dict[str, int]: The deep size in bytes of the object, under an empty path, and of each subtree down to
+        ``depth``, by dotted path, in depth-first order.
+
+    Raises:
+        ValueError: If ``depth`` is negative.
+    """
+    if depth < 0:
+        raise ValueError("The depth must not be negative.")
+    sizes: Dict[str, int] = {"": 0}
+    parents: Dict[str, Optional[str]] = {"": None}
+    seen: Set[int] = set()
+    # Each entry holds the path and level of the subtree an object is counted in, and the level at which its
+    # subtrees are no longer reported, which is the level itself once inside a list
+    stack: List[Tuple[str, int, int, Any]] = [("", 0, depth, value)]
+    while stack:
+        path, level, limit, value = stack.pop()
+        if level >= limit:
+            sizes[path] += _deep_size(value, seen)
+            continue
+        if id(value) in seen or isinstance(value, _SKIPPED):
+            continue
+        seen.add(id(value))
+        sizes[path] += sys.getsizeof(value)
+        values, attributes, others = _referents(value)
+        children = []
+        for key, child in values:
+            child_path = f"{path}.{key}" if path else str(key)
+            if child_path not in sizes:
+                sizes[child_path] = 0
+                parents[child_path] = path
+            children.append((child_path, level + 1, limit, child))
+        stack.extend(reversed(children))
+        stack.extend((path, level, limit, child) for child in reversed(attributes))
+        stack.extend((path, level, level, child) for child in reversed(others))
+
+    # Each path was added after its parent, so walking them backwards adds every subtree to its parent once complete
+    for path in reversed(list(sizes)):
+        parent = parents[path]
+        if parent is not None:
+            sizes[parent] += sizes[path]
+    return sizes
+
+
+def _deep_size(value: Any, seen: Set[int]) -> int:
+    """
+    Return the size of the objects reachable from a value which are not in ``seen``, adding them to it.
+
+    This is the bulk of the walk, so the scalars are counted without going through the stack.
+    """
+    getsizeof = sys.getsizeof
+    leaves = _LEAVES
+    counted = seen.add
+    total = 0
+    stack = [value]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        value = pop()
+        if id(value) in seen or isinstance(value, _SKIPPED):
+            continue
+        counted(id(value))
+        total += getsizeof(value)
+        if type(value) in leaves:
+            continue
+        if isinstance(value, dict):
+            children = [item for pair in dict.items(value) for item in pair]
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            children = value
+        else:
+            values, attributes, others = _referents(value)
+            children = [child for _, child in values] + attributes + others
+        for child in children:
+            if type(child) in leaves:
+                if id(child) not in seen:
+                    counted(id(child))
+                    total += getsizeof(child)
+            else:
+                push(child)
+    return total
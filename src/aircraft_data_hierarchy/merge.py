@@ -0,0 +1,168 @@
+"""
+Policy-driven merging of ADH nodes.
+
+`merge_into` merges any number of source nodes into a target node in a single walk of the sources, without
+recursion. Values present on both sides are resolved by a `MergePolicy`, and every conflict is reported instead of
+stopping the merge at the first one.
+"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .persistent import PersistentNode, thaw_node
+
+
+class MergePolicy(str, Enum):
+    """
+    How `merge_into` resolves a key holding different plain values in the target and a source.
+
+    Nested nodes are always merged key by key. ``error`` keeps the target value, so that the caller can reject the
+    whole merge. Under the list policies, values which are not both lists are resolved as with ``keep-source``.
+    """
+
+    KEEP_TARGET = "keep-target"
+    KEEP_SOURCE = "keep-source"
+    ERROR = "error"
+    LIST_CONCAT = "list-concat"
+    LIST_BY_KEY = "list-by-key"
+
+
+class MergeConflict(NamedTuple):
+    """
+    A key holding different values in the target and in a source of a merge.
+
+    Attributes:
+        path (str): The dotted path of the conflicting value. Items of lists merged by key are written ``list[index]``.
+        target (Any): The value held by the target when the source was merged.
+        source (Any): The value held by the source.
+        source_path (str): The path of the source node.
+    """
+
+    path: str
+    target: Any
+    source: Any
+    source_path: str
+
+
+class MergeConflictError(Exception):
+    """Exception raised when a merge with the ``error`` policy finds conflicting values."""
+
+    def __init__(self, conflicts: List[MergeConflict]) -> None:
+        self.conflicts = conflicts
+        paths = ", ".join(conflict.path for conflict in conflicts[:5])
+        more = f" and {len(conflicts) - 5} more" if len(conflicts) > 5 else ""
+        super().__init__(f"The merge found {len(conflicts)} conflicting values: {paths}{more}")
+
+
+def _differs(first: Any, second: Any) -> bool:
+    """Return whether two plain values are different, telling apart equal values of different types."""
+    return type(first) is not type(second) or first != second
+
+
+def merge_into(target: Dict[str, Any], sources: Sequence[Tuple[str, Dict[str, Any]]], policy: MergePolicy = MergePolicy.KEEP_SOURCE,
+               list_key: Optional[str] = None, in_place: bool = True, share: bool = False, path: str = "") -> Tuple[Dict[str, Any], List[MergeConflict]]:
+    """
+    Merge source nodes into a target node, one after the other, resolving conflicts by policy.
+
+    Args:
+        target (Dict[str, Any]): The node merged into.
+        sources (Sequence[Tuple[str, Dict[str, Any]]]): The path and node of each source, in merge order. Later
+            sources are merged into the result of the earlier ones.
+        policy (MergePolicy): How to resolve conflicting values.
+        list_key (Optional[str]): For ``list-by-key``, the key identifying the dictionary items of a list. Items of
+            the source whose identifier matches an item of the target are merged into it; others are appended.
+        in_place (bool): Modify the target and its descendants directly. Otherwise the nodes on the changed paths
+            are copied and the target is left untouched. Merged lists are new lists either way, holding copies of
+            the items merged into.
+        share (bool): Insert the subtrees found only in the sources as they are instead of copying them, which is
+            only safe for persistent nodes.
+        path (str): The path of the target, used to report conflicts.
+
+    Returns:
+        Tuple[Dict[str, Any], List[MergeConflict]]: The merged node, which is the target itself when merging in
+        place, and the conflicts found.
+    """
+    conflicts: List[MergeConflict] = []
+    owned: Set[int] = set()
+
+    def writable(node: Dict[str, Any]) -> Dict[str, Any]:
+        if isinstance(node, PersistentNode) or not (in_place or id(node) in owned):
+            node = dict(node)
+            owned.add(id(node))
+        return node
+
+    def insert(value: Any) -> Any:
+        return value if share or not isinstance(value, dict) else thaw_node(value)
+
+    def writable_item(node: Dict[str, Any]) -> Dict[str, Any]:
+        # Merged lists are new lists even in place, so their items are copied rather than changed, which leaves
+        # the previous list as it was for the undo log of a batch
+        return thaw_node(node) if in_place else writable(node)
+
+    root = writable(target)
+    for source_path, source in sources:
+        stack = [(path, root, source)]
+        while stack:
+            current_path, into, merged_from = stack.pop()
+            prefix = f"{current_path}." if current_path else ""
+            for key, value in list(merged_from.items()):
+                if key not in into:
+                    into[key] = insert(value)
+                    continue
+                existing = into[key]
+                child_path = prefix + str(key)
+                if isinstance(value, dict) and isinstance(existing, dict):
+                    child = into[key] = writable(existing)
+                    stack.append((child_path, child, value))
+                elif isinstance(value, list) and isinstance(existing, list) and policy is MergePolicy.LIST_CONCAT:
+                    into[key] = existing + value
+                elif isinstance(value, list) and isinstance(existing, list) and policy is MergePolicy.LIST_BY_KEY:
+                    into[key] = _merge_list_by_key(existing, value, list_key, child_path, stack, writable_item, insert)
+                elif _differs(existing, value):
+                    conflicts.append(MergeConflict(child_path, existing, value, source_path))
+                    if policy is not MergePolicy.KEEP_TARGET and policy is not MergePolicy.ERROR:
+                        into[key] = insert(value)
+    return root, conflicts
+
+
+def _merge_list_by_key(existing: List[Any], incoming: List[Any], list_key: Optional[str], path: str, stack: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+                       writable: Callable[[Dict[str, Any]], Dict[str, Any]], insert: Callable[[Any], Any]) -> List[Any]:
+    """
+    Merge two lists whose dictionary items are identified by a key.
+
+    Matching items are queued on the merge stack so that they are merged like nodes; the other source items are
+    appended.
+
+    Args:
+        existing (List[Any]): The list held by the target.
+        incoming (List[Any]): The list held by the source.
+        list_key (Optional[str]): The key identifying the items.
+        path (str): The path of the list.
+        stack (List[Tuple[str, Dict[str, Any], Dict[str, Any]]]): The pending merges of the walk.
+        writable (Callable[[Dict[str, Any]], Dict[str, Any]]): Returns a modifiable version of a target node.
+        insert (Callable[[Any], Any]): Prepares a source value for insertion.
+
+    Returns:
+        List[Any]: The merged list.
+    """
+    merged = list(existing)
+    positions = {}
+    for index, item in enumerate(merged):
+        if isinstance(item, dict) and list_key in item:
+            try:
+                positions.setdefault(item[list_key], index)
+            except TypeError:
+                continue
+    for item in incoming:
+        index = None
+        if isinstance(item, dict) and list_key in item:
+            try:
+                index = positions.get(item[list_key])
+            except TypeError:
+                pass
+        if index is None:
+            merged.append(insert(item))
+            continue
+        target_item = merged[index] = writable(merged[index])
+        stack.append((f"{path}[{index}]", target_item, item))
+    return merged
@@ -0,0 +1,176 @@
+"""
+Content hashing and comparison of ADH subtrees.
+
+Each node is given a digest computed from its sorted keys, the canonical JSON encoding of its plain values and the
+digests of its child nodes, so two subtrees have the same digest exactly when they hold the same content, wherever
+they are and in whatever order their keys were inserted. Digests are stable across processes and can be used as
+cache keys.
+
+Digests are cached in a tree of `HashEntry` lists mirroring the ADH. Changing a node only has to clear the cached
+digests of its ancestors and drop the entry of the changed key, so the next digest of the root only rehashes the
+nodes along the changed path.
+"""
+
+import json
+from hashlib import blake2b
+from typing import Any, List, NamedTuple, Optional
+
+# A cached digest, or None if it must be recomputed, and the entries of the child nodes by key
+HashEntry = List[Any]
+
+DIGEST_SIZE = 16
+
+
+class NodeChange(NamedTuple):
+    """
+    A difference between two versions of an ADH.
+
+    Attributes:
+        kind (str): ``added``, ``removed`` or ``changed``.
+        path (str): The dotted path of the added, removed or changed value.
+        old (Any): The value in the old version, or None if it was added.
+        new (Any): The value in the new version, or None if it was removed.
+    """
+
+    kind: str
+    path: str
+    old: Any
+    new: Any
+
+
+def empty_entry() -> HashEntry:
+    """
+    Create an empty cache entry.
+
+    Returns:
+        HashEntry: An entry with no digest and no child entries.
+    """
+    return [None, {}]
+
+
+def invalidate(entry: Optional[HashEntry], parent_path: str, key: str) -> None:
+    """
+    Clear the cached digests affected by a change to a key of a node.
+
+    Args:
+        entry (Optional[HashEntry]): The cache entry of the root, if any digest has been computed.
+        parent_path (str): The dotted path of the changed node, or an empty string for the root.
+        key (str): The key that was set or removed.
+    """
+    if entry is None:
+        return
+    for component in parent_path.split(".") if parent_path else ():
+        entry[0] = None
+        entry = entry[1].get(component)
+        if entry is None:
+            return
+    entry[0] = None
+    entry[1].pop(key, None)
+
+
+def value_digest(value: Any) -> bytes:
+    """
+    Compute the digest of a value which is not a node.
+
+    Args:
+        value (Any): The value, encoded as canonical JSON when possible and through `repr` otherwise.
+
+    Returns:
+        bytes: The digest of the value.
+    """
+    try:
+        encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+    except (TypeError, ValueError):
+        encoded = repr(value)
+    return blake2b(b"v" + encoded.encode(), digest_size=DIGEST_SIZE).digest()
+
+
+def subtree_digest(node: Any, entry: HashEntry) -> bytes:
+    """
+    Compute the digest of a subtree, reusing and filling in the cached digests.
+
+    The subtree is walked without recursion, and only nodes whose digest is not cached are visited.
+
+    Args:
+        node (Any): The root of the subtree. Values other than dictionaries are hashed as plain values.
+        entry (HashEntry): The cache entry of the subtree root.
+
+    Returns:
+        bytes: The digest of the subtree.
+    """
+    if not isinstance(node, dict):
+        return value_digest(node)
+    stack = [(node, entry, False)]
+    while stack:
+        current, current_entry, expanded = stack.pop()
+        if current_entry[0] is not None:
+            continue
+        children = current_entry[1]
+        if not expanded:
+            stack.append((current, current_entry, True))
+            for key, value in current.items():
+                if isinstance(value, dict):
+                    child_entry = children.get(key)
+                    if child_entry is None:
+                        child_entry = children[key] = empty_entry()
+                    if child_entry[0] is None:
+                        stack.append((value, child_entry, False))
+            continue
+
+        digest = blake2b(b"n", digest_size=DIGEST_SIZE)
+        for key in sorted(current, key=str):
+            value = current[key]
+            encoded_key = str(key).encode()
+            digest.update(len(encoded_key).to_bytes(4, "big"))
+            digest.update(encoded_key)
+            digest.update(children[key][0] if isinstance(value, dict) else value_digest(value))
+        current_entry[0] = digest.digest()
+    return entry[0]
+
+
+def diff_trees(old: Any, new: Any, old_entry: HashEntry, new_entry: HashEntry, path: str = "") -> List[NodeChange]:
+    """
+    List the path-level differences between two subtrees.
+
+    Subtrees with equal digests are skipped without being walked. An added or removed subtree is reported once at
+    its root, and a value replaced by a value of another kind (a node by a plain value, for example) is reported as
+    changed.
+
+    Args:
+        old (Any): The old subtree.
+        new (Any): The new subtree.
+        old_entry (HashEntry): The cache entry of the old subtree.
+        new_entry (HashEntry): The cache entry of the new subtree.
+        path (str): The dotted path of both subtrees, prefixed to the reported paths.
+
+    Returns:
+        List[NodeChange]: The differences, ordered by path.
+    """
+    changes: List[NodeChange] = []
+    stack = [(path, old, new, old_entry, new_entry)]
+    while stack:
+        current_path, old_node, new_node, old_current, new_current = stack.pop()
+        if not (isinstance(old_node, dict) and isinstance(new_node, dict)):
+            if type(old_node) is not type(new_node) or old_node != new_node:
+                changes.append(NodeChange("changed", current_path, old_node, new_node))
+            continue
+        if subtree_digest(old_node, old_current) == subtree_digest(new_node, new_current):
+            continue
+
+        prefix = f"{current_path}." if current_path else ""
+        nested = []
+        for key in sorted(old_node.keys() | new_node.keys(), key=str):
+            child_path = f"{prefix}{key}"
+            if key not in new_node:
+                changes.append(NodeChange("removed", child_path, old_node[key], None))
+            elif key not in old_node:
+                changes.append(NodeChange("added", child_path, None, new_node[key]))
+            else:
+                old_value, new_value = old_node[key], new_node[key]
+                if isinstance(old_value, dict) and isinstance(new_value, dict):
+                    nested.append((child_path, old_value, new_value, old_current[1][key], new_current[1][key]))
+                elif type(old_value) is not type(new_value) or old_value != new_value:
+                    changes.append(NodeChange("changed", child_path, old_value, new_value))
+        stack.extend(nested)
+    changes.sort(key=lambda change: change.path.split("."))
+    return changes
@@ -0,0 +1,134 @@
+"""
+Parallel search of the ADH across processes.
+
+`CommonBaseModel.search_nodes` and `CommonBaseModel.iter_nodes` walk the ADH in a single thread, which the GIL
+bounds for exhaustive scans. `parallel_matches` splits the ADH into the subtrees found at a given depth and searches
+them in a pool of worker processes.
+
+The workers are forked from the searching process and inherit the ADH, the predicate and the partitions, handed to
+them as the arguments of the pool initializer, so none of them is pickled and concurrent searches from several
+threads each give their workers their own: a task only holds the indexes of the partitions to search, and a worker
+returns the paths of the matching nodes, which the parent resolves to its own nodes. The results are merged in the
+order of a serial search. Where processes can't be forked, the search runs serially.
+"""
+
+import multiprocessing
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from .query import Predicate
+
+# The predicate and partitions searched by a worker process, set by `_start_worker`
+_search: Optional[Tuple[Predicate, List[Tuple[str, Dict[str, Any]]]]] = None
+
+# The number of tasks per worker process, which balances partitions of uneven sizes
+_TASKS_PER_PROCESS = 4
+
+
+def _walk(path: str, node: Dict[str, Any], predicate: Predicate) -> List[Tuple[str, Dict[str, Any]]]:
+    """Return the nodes of a subtree that match a predicate, depth first and in insertion order."""
+    matches = []
+    stack = [(path, node)]
+    while stack:
+        path, node = stack.pop()
+        if predicate.matches(path, node):
+            matches.append((path, node))
+        prefix = f"{path}." if path else ""
+        stack.extend(reversed([(prefix + key, value) for key, value in node.items() if isinstance(value, dict)]))
+    return matches
+
+
+def _start_worker(predicate: Predicate, partitions: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Record the search of a worker process, which inherits it from the process that forked it."""
+    global _search
+    _search = (predicate, partitions)
+
+
+def _search_partitions(indexes: List[int]) -> List[List[str]]:
+    """Search some partitions of the search of a worker process, returning the matching paths."""
+    predicate, partitions = _search
+    return [[path for path, _ in _walk(*partitions[index], predicate)] for index in indexes]
+
+
+def _plan(root: Dict[str, Any], predicate: Predicate, depth: int) -> Tuple[List[Any], List[Tuple[str, Dict[str, Any]]]]:
+    """
+    Split the ADH into the subtrees at a depth, keeping the order of a serial search.
+
+    Returns:
+        Tuple[List[Any], List[Tuple[str, Dict[str, Any]]]]: The search plan, holding in order either the
+        ``(path, node)`` of a node above the depth which matches the predicate, or the index of a partition; and
+        the path and root node of each partition.
+    """
+    plan: List[Any] = []
+    partitions: List[Tuple[str, Dict[str, Any]]] = []
+    stack = [("", root, 0)]
+    while stack:
+        path, node, level = stack.pop()
+        if level == depth:
+            plan.append(len(partitions))
+            partitions.append((path, node))
+            continue
+        if predicate.matches(path, node):
+            plan.append((path, node))
+        prefix = f"{path}." if path else ""
+        children = [(prefix + key, value, level + 1) for key, value in node.items() if isinstance(value, dict)]
+        stack.extend(reversed(children))
+    return plan, partitions
+
+
+def _resolve(path: str, partition_path: str, node: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the node at a path below the root of a partition."""
+    if path != partition_path:
+        for key in path[len(partition_path) + 1 if partition_path else 0:].split("."):
+            node = node[key]
+    return node
+
+
+def parallel_matches(root: Dict[str, Any], predicate: Predicate, processes: Optional[int] = None,
+                     depth: int = 2) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Find the nodes of an ADH matching a predicate, searching its subtrees in parallel processes.
+
+    The ADH must not be changed while it is searched, and its keys must not contain dots.
+
+    Args:
+        root (Dict[str, Any]): The root of the ADH.
+        predicate (Predicate): The predicate the nodes must satisfy.
+        processes (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+        depth (int): The depth of the subtrees searched by the workers, the children of the root being at depth 1.
+            The nodes above it are searched by the calling process.
+
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: The dotted path of each matching node and the node itself, in the order
+        of a serial depth-first search.
+
+    Raises:
+        ValueError: If ``depth`` is lower than 1 or ``processes`` lower than 1.
+    """
+    if depth < 1:
+        raise ValueError("The partition depth must be at least 1.")
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1:
+        raise ValueError("The number of processes must be at least 1.")
+    plan, partitions = _plan(root, predicate, depth)
+    if processes == 1 or len(partitions) < 2 or "fork" not in multiprocessing.get_all_start_methods():
+        found = [_walk(path, node, predicate) for path, node in partitions]
+    else:
+        tasks = min(len(partitions), processes * _TASKS_PER_PROCESS)
+        groups = [list(range(start, len(partitions), tasks)) for start in range(tasks)]
+        found = [[] for _ in partitions]
+        context = multiprocessing.get_context("fork")
+        with context.Pool(min(processes, tasks), initializer=_start_worker, initargs=(predicate, partitions)) as pool:
+            for indexes, paths in zip(groups, pool.map(_search_partitions, groups)):
+                for index, partition_paths in zip(indexes, paths):
+                    partition_path, node = partitions[index]
+                    found[index] = [(path, _resolve(path, partition_path, node)) for path in partition_paths]
+
+    matches = []
+    for entry in plan:
+        if isinstance(entry, tuple):
+            matches.append(entry)
+        else:
+            matches.extend(found[entry])
+    return matches
@@ -0,0 +1,86 @@
+"""
+Immutable, structurally shared nodes for the ADH.
+
+A persistent ADH is made of `PersistentNode` dictionaries which are never modified once built. Changing a node
+builds a new copy of it and of each of its ancestors up to the root (path copying), while every other subtree is
+shared between the old and the new root. Copies and snapshots of a persistent ADH therefore cost nothing until they
+are changed, and each change allocates one node per level of the changed path.
+"""
+
+from typing import Any, Dict, NoReturn
+
+
+class PersistentNode(dict):
+    """
+    A dictionary which cannot be modified after it has been built.
+
+    Reading works as for any dictionary. Every method that would modify the node raises a TypeError; use `dict(node)`
+    to obtain a mutable copy, or change the ADH through the node methods of `CommonBaseModel`.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("Persistent ADH nodes cannot be modified in place; use the node methods of the model instead.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return PersistentNode, (dict(self),)
+
+    def __copy__(self) -> "PersistentNode":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "PersistentNode":
+        return self
+
+
+def freeze_node(value: Any) -> Any:
+    """
+    Convert a dictionary and all of its dictionary descendants into persistent nodes.
+
+    Subtrees which are already persistent are reused as they are, so freezing a persistent node is free.
+
+    Args:
+        value (Any): The value to freeze. Values other than dictionaries are returned unchanged.
+
+    Returns:
+        Any: The frozen value.
+    """
+    if not isinstance(value, dict) or isinstance(value, PersistentNode):
+        return value
+    root = PersistentNode(value)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for key, child in node.items():
+            if isinstance(child, dict) and not isinstance(child, PersistentNode):
+                frozen = PersistentNode(child)
+                dict.__setitem__(node, key, frozen)
+                stack.append(frozen)
+    return root
+
+
+def thaw_node(value: Any) -> Any:
+    """
+    Convert a persistent node and all of its dictionary descendants back into plain dictionaries.
+
+    Args:
+        value (Any): The value to thaw. Values other than dictionaries are returned unchanged.
+
+    Returns:
+        Any: A mutable copy of the value.
+    """
+    if not isinstance(value, dict):
+        return value
+    root = dict(value)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for key, child in node.items():
+            if isinstance(child, dict):
+                node[key] = dict(child)
+                stack.append(node[key])
+    return root
+
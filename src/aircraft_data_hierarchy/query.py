@@ -0,0 +1,532 @@
+"""
+Query language for searching the ADH.
+
+A query is a boolean expression over the keys of a node, for example::
+
+    type == "surface" and span >= 10 and material in ("Al", "Ti") and @path like "airframe.*.wing"
+
+Supported forms:
+
+* Comparisons: ``key == value``, ``!=``, ``<``, ``<=``, ``>``, ``>=``. A comparison with a missing key, or between
+  values that cannot be ordered, is false.
+* Membership: ``key in (value, ...)`` and ``key not in (value, ...)``.
+* Patterns: ``key like "W*"`` matches a shell-style glob and ``key matches "^W[0-9]+"`` searches a regular
+  expression; both only match string values.
+* Existence: ``exists(key)``.
+* The node path: ``@path`` can be used in place of a key. In ``@path like "..."`` a ``*`` matches exactly one path
+  component and ``**`` matches any number of components, so ``@path like "airframe.*.wing"`` scopes a search to
+  wings one level below the airframe.
+* ``and``, ``or``, ``not`` and parentheses. Values are numbers, quoted strings, ``true``, ``false`` and ``null``.
+  Keys that clash with a keyword can be written between backticks, for example ```in` == 1``.
+
+Queries are compiled once into a tree of predicates and cached by their text. When the query is searched through
+`CommonBaseModel.iter_nodes` or `CommonBaseModel.search_nodes`, equality and membership tests on keys indexed with
+`CommonBaseModel.add_search_index` are answered from the index, and a literal leading part of a path pattern
+restricts the walk to that subtree.
+"""
+
+import ast
+import fnmatch
+import operator
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Candidate sets handed between predicates: the nodes that may match, by path
+Candidates = Dict[str, Dict[str, Any]]
+AttributeIndexes = Dict[str, Dict[Any, Candidates]]
+
+PATH_FIELD = "@path"
+
+_MISSING = object()
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<name>@?[A-Za-z_][A-Za-z0-9_\-]*|`[^`]+`)
+      | (?P<operator>==|!=|<=|>=|<|>)
+      | (?P<punctuation>[(),\[\]])
+    )
+    """,
+    re.VERBOSE,
+)
+
+_KEYWORDS = {"and", "or", "not", "in", "like", "matches", "exists", "true", "false", "null"}
+_CONSTANTS = {"true": True, "false": False, "null": None}
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class QueryError(ValueError):
+    """Exception raised when a query cannot be parsed."""
+    pass
+
+
+class Predicate(ABC):
+    """
+    A compiled test applied to each node of a search.
+
+    Subclasses implement `matches`, and may narrow a search with `candidates` and `scope`.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        """
+        Check whether a node satisfies the predicate.
+
+        Args:
+            path (str): The dotted path of the node.
+            node (Dict[str, Any]): The node to test.
+
+        Returns:
+            bool: True if the node satisfies the predicate.
+        """
+
+    def candidates(self, attribute_indexes: AttributeIndexes) -> Optional[Candidates]:
+        """
+        Look up the nodes that may satisfy the predicate in the secondary indexes.
+
+        Args:
+            attribute_indexes (AttributeIndexes): The secondary indexes of the model being searched.
+
+        Returns:
+            Optional[Candidates]: A superset of the matching nodes by path, or None if the indexes cannot tell.
+        """
+        return None
+
+    def scope(self) -> Optional[str]:
+        """
+        Return a path that every matching node lies at or below.
+
+        Returns:
+            Optional[str]: The dotted path bounding the search, or None if the whole ADH must be searched.
+        """
+        return None
+
+
+def _field_value(field: str, path: str, node: Dict[str, Any]) -> Any:
+    """Return the value a predicate field refers to, or the missing marker."""
+    if field == PATH_FIELD:
+        return path
+    return node.get(field, _MISSING)
+
+
+def _lookup_index(attribute_indexes: AttributeIndexes, key: str, value: Any) -> Optional[Candidates]:
+    """Return the nodes holding a value in the index on a key, or None if the key is not indexed."""
+    index = attribute_indexes.get(key)
+    if index is None:
+        return None
+    try:
+        return index.get(value, {})
+    except TypeError:
+        return None
+
+
+class Comparison(Predicate):
+    """A comparison of a node value with a constant."""
+
+    __slots__ = ("field", "symbol", "value", "compare")
+
+    def __init__(self, field: str, symbol: str, value: Any) -> None:
+        self.field = field
+        self.symbol = symbol
+        self.value = value
+        self.compare = _COMPARISONS[symbol]
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        value = _field_value(self.field, path, node)
+        if value is _MISSING:
+            return False
+        try:
+            return bool(self.compare(value, self.value))
+        except TypeError:
+            return False
+
+    def candidates(self, attribute_indexes: AttributeIndexes) -> Optional[Candidates]:
+        if self.symbol != "==" or self.field == PATH_FIELD:
+            return None
+        return _lookup_index(attribute_indexes, self.field, self.value)
+
+    def scope(self) -> Optional[str]:
+        if self.symbol == "==" and self.field == PATH_FIELD and isinstance(self.value, str):
+            return self.value
+        return None
+
+
+class Membership(Predicate):
+    """A test of whether a node value is one of a set of constants."""
+
+    __slots__ = ("field", "values", "negated")
+
+    def __init__(self, field: str, values: Tuple[Any, ...], negated: bool = False) -> None:
+        self.field = field
+        self.values = values
+        self.negated = negated
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        value = _field_value(self.field, path, node)
+        if value is _MISSING:
+            return False
+        return (value in self.values) != self.negated
+
+    def candidates(self, attribute_indexes: AttributeIndexes) -> Optional[Candidates]:
+        if self.negated or self.field == PATH_FIELD:
+            return None
+        found: Candidates = {}
+        for value in self.values:
+            holders = _lookup_index(attribute_indexes, self.field, value)
+            if holders is None:
+                return None
+            found.update(holders)
+        return found
+
+
+class Pattern(Predicate):
+    """A glob or regular expression test on a string value, or on the node path."""
+
+    __slots__ = ("field", "text", "search", "prefix")
+
+    def __init__(self, field: str, text: str, glob: bool) -> None:
+        self.field = field
+        self.text = text
+        self.prefix = None
+        try:
+            if not glob:
+                regex = re.compile(text)
+            elif field == PATH_FIELD:
+                regex, self.prefix = _compile_path_glob(text)
+            else:
+                regex = re.compile(fnmatch.translate(text))
+        except re.error as error:
+            raise QueryError(f"Invalid pattern {text!r}: {error}") from None
+        self.search = regex.fullmatch if glob else regex.search
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        value = _field_value(self.field, path, node)
+        return isinstance(value, str) and self.search(value) is not None
+
+    def scope(self) -> Optional[str]:
+        return self.prefix
+
+
+class Exists(Predicate):
+    """A test of whether a node holds a key."""
+
+    __slots__ = ("field",)
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        return self.field == PATH_FIELD or self.field in node
+
+
+class Not(Predicate):
+    """The negation of a predicate."""
+
+    __slots__ = ("operand",)
+
+    def __init__(self, operand: Predicate) -> None:
+        self.operand = operand
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        return not self.operand.matches(path, node)
+
+
+class And(Predicate):
+    """The conjunction of several predicates."""
+
+    __slots__ = ("operands",)
+
+    def __init__(self, operands: List[Predicate]) -> None:
+        self.operands = operands
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        for operand in self.operands:
+            if not operand.matches(path, node):
+                return False
+        return True
+
+    def candidates(self, attribute_indexes: AttributeIndexes) -> Optional[Candidates]:
+        found = None
+        for operand in self.operands:
+            holders = operand.candidates(attribute_indexes)
+            if holders is None:
+                continue
+            if found is None:
+                found = holders
+            elif len(holders) < len(found):
+                found = {path: node for path, node in holders.items() if path in found}
+            else:
+                found = {path: node for path, node in found.items() if path in holders}
+            if not found:
+                break
+        return found
+
+    def scope(self) -> Optional[str]:
+        scopes = [scope for scope in (operand.scope() for operand in self.operands) if scope is not None]
+        return max(scopes, key=len) if scopes else None
+
+
+class Or(Predicate):
+    """The disjunction of several predicates."""
+
+    __slots__ = ("operands",)
+
+    def __init__(self, operands: List[Predicate]) -> None:
+        self.operands = operands
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        for operand in self.operands:
+            if operand.matches(path, node):
+                return True
+        return False
+
+    def candidates(self, attribute_indexes: AttributeIndexes) -> Optional[Candidates]:
+        found: Candidates = {}
+        for operand in self.operands:
+            holders = operand.candidates(attribute_indexes)
+            if holders is None:
+                return None
+            found.update(holders)
+        return found
+
+
+class Criteria(Predicate):
+    """
+    The dictionary criteria accepted by `CommonBaseModel.search_nodes`.
+
+    A node matches when ``node.get(key) == value`` for every pair, so a ``None`` value also matches nodes that
+    lack the key.
+    """
+
+    __slots__ = ("items", "indexable")
+
+    def __init__(self, criteria: Dict[str, Any]) -> None:
+        self.items = tuple(criteria.items())
+        self.indexable = And([Comparison(key, "==", value) for key, value in self.items if value is not None])
+
+    def matches(self, path: str, node: Dict[str, Any]) -> bool:
+        for key, value in self.items:
+            if node.get(key) != value:
+                return False
+        return True
+
+    def candidates(self, attribute_indexes: AttributeIndexes) -> Optional[Candidates]:
+        if not attribute_indexes:
+            return None
+        return self.indexable.candidates(attribute_indexes)
+
+
+def _compile_path_glob(pattern: str) -> Tuple["re.Pattern[str]", Optional[str]]:
+    """
+    Translate a path glob into a regular expression and its literal leading components.
+
+    Args:
+        pattern (str): The dotted path pattern. Within a component ``*`` matches any characters and ``?`` a single
+            one, and a ``**`` component matches any number of components.
+
+    Returns:
+        Tuple[re.Pattern[str], Optional[str]]: The compiled expression and the literal prefix, if any.
+    """
+    components = pattern.split(".")
+    regex = ""
+    literal = []
+    in_prefix = True
+    separator_pending = False
+    for position, component in enumerate(components):
+        if component == "**":
+            in_prefix = False
+            if position == 0:
+                regex += r"(?:[^.]+\.)*" if len(components) > 1 else ".*"
+                separator_pending = False
+                continue
+            regex += r"(?:\.[^.]+)*"
+            separator_pending = True
+            continue
+        if in_prefix and "*" not in component and "?" not in component:
+            literal.append(component)
+        else:
+            in_prefix = False
+        if separator_pending:
+            regex += r"\."
+        regex += "".join("[^.]*" if character == "*" else "[^.]" if character == "?" else re.escape(character) for character in component)
+        separator_pending = True
+    return re.compile(regex), ".".join(literal) or None
+
+
+class _Parser:
+    """Recursive descent parser turning query text into a predicate tree."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.position = 0
+
+    @staticmethod
+    def _tokenize(text: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        stripped_length = len(text.rstrip())
+        while position < stripped_length:
+            match = _TOKEN_PATTERN.match(text, position)
+            if match is None or match.end() == position:
+                raise QueryError(f"Unexpected character at position {position} in query: {text!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            position = match.end()
+        return tokens
+
+    def _peek(self) -> Tuple[Optional[str], Optional[str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _next(self) -> Tuple[Optional[str], Optional[str]]:
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _accept(self, word: str) -> bool:
+        kind, value = self._peek()
+        if value == word and kind in ("name", "punctuation"):
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, word: str) -> None:
+        if not self._accept(word):
+            raise QueryError(f"Expected {word!r} in query: {self.text!r}")
+
+    def parse(self) -> Predicate:
+        if not self.tokens:
+            raise QueryError("The query is empty.")
+        predicate = self._or()
+        if self.position != len(self.tokens):
+            raise QueryError(f"Unexpected {self._peek()[1]!r} in query: {self.text!r}")
+        return predicate
+
+    def _or(self) -> Predicate:
+        operands = [self._and()]
+        while self._accept("or"):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else Or(operands)
+
+    def _and(self) -> Predicate:
+        operands = [self._not()]
+        while self._accept("and"):
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else And(operands)
+
+    def _not(self) -> Predicate:
+        if self._accept("not"):
+            return Not(self._not())
+        if self._accept("("):
+            predicate = self._or()
+            self._expect(")")
+            return predicate
+        if self._accept("exists"):
+            self._expect("(")
+            field = self._field()
+            self._expect(")")
+            return Exists(field)
+        return self._comparison()
+
+    def _field(self) -> str:
+        kind, value = self._next()
+        if kind != "name" or value in _KEYWORDS:
+            raise QueryError(f"Expected a key but found {value!r} in query: {self.text!r}")
+        return value[1:-1] if value.startswith("`") else value
+
+    def _comparison(self) -> Predicate:
+        field = self._field()
+        kind, value = self._peek()
+        if kind == "operator":
+            self.position += 1
+            return Comparison(field, value, self._value())
+        if self._accept("in"):
+            return Membership(field, self._values())
+        if self._accept("not"):
+            self._expect("in")
+            return Membership(field, self._values(), negated=True)
+        if self._accept("like"):
+            return Pattern(field, self._string(), glob=True)
+        if self._accept("matches"):
+            return Pattern(field, self._string(), glob=False)
+        raise QueryError(f"Expected a comparison after {field!r} in query: {self.text!r}")
+
+    def _value(self) -> Any:
+        kind, value = self._next()
+        if kind == "number":
+            return float(value) if any(character in value for character in ".eE") else int(value)
+        if kind == "string":
+            return ast.literal_eval(value)
+        if kind == "name" and value in _CONSTANTS:
+            return _CONSTANTS[value]
+        raise QueryError(f"Expected a value but found {value!r} in query: {self.text!r}")
+
+    def _string(self) -> str:
+        value = self._value()
+        if not isinstance(value, str):
+            raise QueryError(f"Expected a quoted pattern in query: {self.text!r}")
+        return value
+
+    def _values(self) -> Tuple[Any, ...]:
+        closing = {"(": ")", "[": "]"}
+        kind, opening = self._next()
+        if opening not in closing:
+            raise QueryError(f"Expected a list of values in query: {self.text!r}")
+        values = []
+        if not self._accept(closing[opening]):
+            values.append(self._value())
+            while self._accept(","):
+                values.append(self._value())
+            self._expect(closing[opening])
+        return tuple(values)
+
+
+@lru_cache(maxsize=512)
+def compile_query(text: str) -> Predicate:
+    """
+    Compile query text into a predicate tree, reusing the result for repeated queries.
+
+    Args:
+        text (str): The query text.
+
+    Returns:
+        Predicate: The compiled query.
+
+    Raises:
+        QueryError: If the text is not a valid query.
+    """
+    return _Parser(text).parse()
+
+
+def as_predicate(criteria: Union[None, str, Dict[str, Any], Predicate]) -> Predicate:
+    """
+    Turn any form of search criteria accepted by the node API into a predicate.
+
+    Args:
+        criteria (Union[None, str, Dict[str, Any], Predicate]): Query text, a compiled query, or dictionary
+            criteria. None matches every node.
+
+    Returns:
+        Predicate: The predicate to apply to each node.
+
+    Raises:
+        QueryError: If the criteria are query text that cannot be parsed.
+    """
+    if isinstance(criteria, Predicate):
+        return criteria
+    if isinstance(criteria, str):
+        return compile_query(criteria)
+    return Criteria(criteria or {})
@@ -0,0 +1,547 @@
+"""
+Disk-backed storage for the ADH.
+
+`DiskNodeStore` keeps the nodes of an ADH in a SQLite database, one row per node keyed by its dotted path, so that
+a model can work on a hierarchy larger than the memory of the process. Attached to a model with
+`CommonBaseModel.attach_store`, it serves the node methods of the model in place of ``adh_root``: subtrees are read
+from the database when requested and kept in a bounded least-recently-used cache, and every change is written to the
+database immediately.
+
+Each row holds the plain values of a node as JSON and the keys of its child nodes, so these values must be JSON
+serializable.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .common_base_model import NodeNotFoundError, PathAlreadyExistsError
+from .merge import MergeConflict, MergeConflictError, MergePolicy, merge_into
+from .query import Predicate, as_predicate
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS adh_nodes (
+    path TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    children TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+Row = Tuple[str, str, str]
+
+# Rows fetched at a time by iter_nodes, each batch under the lock of the store
+_SCAN_BATCH_ROWS = 1000
+
+
+def _descendant_bounds(path: str) -> Tuple[str, str]:
+    """Return the range of paths strictly below a path: they start with ``path + "."``, and "/" follows "."."""
+    return f"{path}.", f"{path}/"
+
+
+def _overlaps(first: str, second: str) -> bool:
+    """Return whether one of two dotted paths is the other or one of its ancestors."""
+    if not first or not second or first == second:
+        return True
+    shorter, longer = sorted((first, second), key=len)
+    return longer.startswith(shorter) and longer[len(shorter)] == "."
+
+
+def _rows(path: str, node: Dict[str, Any]) -> List[Row]:
+    """
+    Flatten a node and its dictionary descendants into database rows.
+
+    Args:
+        path (str): The dotted path of the node.
+        node (Dict[str, Any]): The node to store.
+
+    Returns:
+        List[Row]: The path, plain values and child keys of each node.
+    """
+    rows = []
+    stack = [(path, node)]
+    while stack:
+        current_path, current = stack.pop()
+        values, children = {}, []
+        for key, value in current.items():
+            if isinstance(value, dict):
+                children.append(key)
+                stack.append((f"{current_path}.{key}" if current_path else key, value))
+            else:
+                values[key] = value
+        rows.append((current_path, json.dumps(values), json.dumps(children)))
+    return rows
+
+
+class DiskNodeStore:
+    """
+    An ADH stored in a SQLite database, with a bounded cache of resident subtrees.
+
+    The methods mirror the node methods of `CommonBaseModel` and raise the same exceptions. Nodes returned by
+    `get_node` are resident copies shared with the cache: change them through the node methods, which write to the
+    database, rather than in place.
+
+    Attributes:
+        max_resident_nodes (int): The number of nodes the cache may hold across all resident subtrees.
+    """
+
+    def __init__(self, database: str = ":memory:", max_resident_nodes: int = 100_000) -> None:
+        """
+        Open or create a store.
+
+        Args:
+            database (str): The path of the SQLite database file, created if needed, or ``":memory:"``.
+            max_resident_nodes (int): The number of nodes the cache of resident subtrees may hold.
+        """
+        self.max_resident_nodes = max_resident_nodes
+        self._connection = sqlite3.connect(database, isolation_level=None, check_same_thread=False)
+        if database != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.execute("INSERT OR IGNORE INTO adh_nodes VALUES ('', '{}', '[]')")
+        self._lock = threading.RLock()
+        self._resident: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._resident_nodes = 0
+        self._savepoints = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    # Transactions
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Apply the changes made in the block atomically.
+
+        Transactions may be nested; a failing inner transaction only undoes its own changes. The cache of resident
+        subtrees is dropped on rollback.
+        """
+        with self._lock:
+            name = f"adh_{self._savepoints}"
+            self._savepoints += 1
+            self._connection.execute(f"SAVEPOINT {name}")
+            try:
+                yield
+            except BaseException:
+                self._connection.execute(f"ROLLBACK TO {name}")
+                self._connection.execute(f"RELEASE {name}")
+                self._clear_resident()
+                raise
+            else:
+                self._connection.execute(f"RELEASE {name}")
+            finally:
+                self._savepoints -= 1
+
+    # Cache of resident subtrees
+
+    def _clear_resident(self) -> None:
+        self._resident.clear()
+        self._resident_nodes = 0
+
+    def _forget(self, path: str) -> None:
+        """Drop the resident subtrees which contain or lie below a changed path."""
+        for resident_path in [resident for resident in self._resident if _overlaps(resident, path)]:
+            self._resident_nodes -= self._resident.pop(resident_path)[1]
+
+    def _remember(self, path: str, node: Any, size: int) -> None:
+        if size > self.max_resident_nodes:
+            return
+        self._resident[path] = (node, size)
+        self._resident_nodes += size
+        while self._resident_nodes > self.max_resident_nodes:
+            self._resident_nodes -= self._resident.popitem(last=False)[1][1]
+
+    def _resident_node(self, path: str) -> Tuple[bool, Any]:
+        """Look a path up in the resident subtrees, from the path itself up to its ancestors."""
+        ancestor, remainder = path, []
+        while True:
+            entry = self._resident.get(ancestor)
+            if entry is not None:
+                self._resident.move_to_end(ancestor)
+                node = entry[0]
+                for component in reversed(remainder):
+                    if not isinstance(node, dict) or component not in node:
+                        return True, None
+                    node = node[component]
+                return True, node
+            if not ancestor:
+                return False, None
+            ancestor, _, component = ancestor.rpartition(".")
+            remainder.append(component)
+
+    # Reading
+
+    def _row(self, path: str) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+        row = self._connection.execute("SELECT data, children FROM adh_nodes WHERE path = ?", (path,)).fetchone()
+        return None if row is None else (json.loads(row[0]), json.loads(row[1]))
+
+    def _load(self, path: str) -> Tuple[Dict[str, Any], int]:
+        """Read the subtree rooted at an existing node row from the database."""
+        if path:
+            low, high = _descendant_bounds(path)
+            rows = self._connection.execute(
+                "SELECT path, data FROM adh_nodes WHERE path = ? OR (path > ? AND path < ?) ORDER BY path", (path, low, high))
+        else:
+            rows = self._connection.execute("SELECT path, data FROM adh_nodes ORDER BY path")
+        nodes: Dict[str, Dict[str, Any]] = {}
+        for row_path, data in rows:
+            node = nodes[row_path] = json.loads(data)
+            if row_path != path:
+                parent_path, _, key = row_path.rpartition(".")
+                nodes[parent_path][key] = node
+        return nodes[path], len(nodes)
+
+    def get_node(self, path: str) -> Optional[Any]:
+        """
+        Retrieve the value at a path, reading its subtree from the database unless it is resident.
+
+        Args:
+            path (str): The path of the node, or an empty string for the whole ADH.
+
+        Returns:
+            Optional[Any]: The node or plain value at the path, or None if the path doesn't exist.
+        """
+        with self._lock:
+            found, node = self._resident_node(path)
+            if found:
+                return node
+            if self._row(path) is None:
+                parent_path, _, key = path.rpartition(".")
+                parent = self._row(parent_path) if path else None
+                return None if parent is None else parent[0].get(key)
+            node, size = self._load(path)
+            self._remember(path, node, size)
+            return node
+
+    def _exists(self, path: str) -> Tuple[bool, bool]:
+        """Return whether a path exists, and whether it holds a node rather than a plain value."""
+        if self._row(path) is not None:
+            return True, True
+        parent_path, _, key = path.rpartition(".")
+        parent = self._row(parent_path)
+        return parent is not None and parent[0].get(key) is not None, False
+
+    def iter_nodes(self, criteria: Union[None, str, Dict[str, Any], Predicate] = None, limit: Optional[int] = None, under: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Lazily iterate over the stored nodes that match the provided criteria, in path order.
+
+        The rows are streamed from the database and the criteria are tested against the plain values of each node,
+        where child nodes appear as empty dictionaries. The subtree of a matching node is assembled from the rows
+        that follow it in the same scan, and the node is yielded once its subtree is complete. The resident cache is
+        neither used nor filled.
+
+        The store holds no aliases: the aliases of a model served by the store are not followed, and each node is
+        only reported under its stored path.
+
+        Args:
+            criteria (Union[None, str, Dict[str, Any], Predicate]): The dictionary criteria, query text or compiled
+                query a node must satisfy. Every node matches if omitted.
+            limit (Optional[int]): The maximum number of nodes to yield.
+            under (Optional[str]): Restrict the iteration to the subtree at this path, including the node itself.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: The dotted path of each matching node and the node itself.
+
+        Raises:
+            NodeNotFoundError: If the ``under`` path doesn't hold a node.
+        """
+        predicate = as_predicate(criteria)
+        if limit is not None and limit <= 0:
+            return
+        under = under or ""
+        with self._lock:
+            if under and self._row(under) is None:
+                raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {under}")
+            scope = predicate.scope()
+            if scope and _overlaps(scope, under) and len(scope) > len(under):
+                under = scope
+            elif scope and not _overlaps(scope, under):
+                return
+
+            if under:
+                low, high = _descendant_bounds(under)
+                rows = self._connection.execute(
+                    "SELECT path, data, children FROM adh_nodes WHERE path = ? OR (path > ? AND path < ?) ORDER BY path", (under, low, high))
+            else:
+                rows = self._connection.execute("SELECT path, data, children FROM adh_nodes ORDER BY path")
+
+        count = 0
+        # The matching nodes whose subtree is still being read, in path order, and the nodes read for those subtrees
+        pending: "deque[Tuple[str, Dict[str, Any]]]" = deque()
+        nodes: Dict[str, Dict[str, Any]] = {}
+        while True:
+            # Other threads may use the connection between two batches of rows, but not while one is fetched
+            with self._lock:
+                batch = rows.fetchmany(_SCAN_BATCH_ROWS)
+            if not batch:
+                break
+            for path, data, children in batch:
+                # The subtree of a pending node is complete once a row sorts after all its descendants, and the
+                # subtree of the root once all the rows are read
+                while pending and pending[0][0] and path >= _descendant_bounds(pending[0][0])[1]:
+                    yield pending.popleft()
+                    count += 1
+                    if count == limit:
+                        return
+                if not pending:
+                    nodes.clear()
+                node = json.loads(data)
+                for key in json.loads(children):
+                    node[key] = {}
+                parent = nodes.get(path.rpartition(".")[0]) if path else None
+                if parent is not None:
+                    parent[path.rpartition(".")[2]] = node
+                if predicate.matches(path, node):
+                    pending.append((path, node))
+                if pending:
+                    nodes[path] = node
+        while pending:
+            yield pending.popleft()
+            count += 1
+            if count == limit:
+                return
+
+    def search_nodes(self, filter_criteria: Union[str, Dict[str, Any], Predicate]) -> List[Dict[str, Any]]:
+        """
+        Search for stored nodes that match the provided filter criteria, as `iter_nodes` does.
+
+        Args:
+            filter_criteria (Union[str, Dict[str, Any], Predicate]): The dictionary criteria, query text or compiled
+                query to search for.
+
+        Returns:
+            List[Dict[str, Any]]: The matching nodes, each with its path under the ``_path`` key.
+        """
+        return [{**node, "_path": f".{path}" if path else path} for path, node in self.iter_nodes(filter_criteria)]
+
+    # Writing
+
+    def _set_children(self, path: str, add: Optional[str] = None, remove: Optional[str] = None, value_removed: Optional[str] = None) -> None:
+        """Update the child keys, and drop a plain value, of a node row."""
+        data, children = self._row(path)
+        if add is not None and add not in children:
+            children.append(add)
+        if remove is not None and remove in children:
+            children.remove(remove)
+        if value_removed is not None:
+            data.pop(value_removed, None)
+        self._connection.execute("UPDATE adh_nodes SET data = ?, children = ? WHERE path = ?", (json.dumps(data), json.dumps(children), path))
+
+    def _ensure_parents(self, path: str) -> None:
+        """Create the missing ancestors of a path as empty nodes."""
+        components = path.split(".")[:-1]
+        parent_path = ""
+        for component in components:
+            current = f"{parent_path}.{component}" if parent_path else component
+            if self._row(current) is None:
+                self._connection.execute("INSERT INTO adh_nodes VALUES (?, '{}', '[]')", (current,))
+                self._set_children(parent_path, add=component, value_removed=component)
+            parent_path = current
+
+    def _insert(self, path: str, node: Dict[str, Any]) -> None:
+        """Store a node at a path whose parent exists and which holds nothing."""
+        self._connection.executemany("INSERT INTO adh_nodes VALUES (?, ?, ?)", _rows(path, node))
+        parent_path, _, key = path.rpartition(".")
+        self._set_children(parent_path, add=key, value_removed=key)
+
+    def _remove(self, path: str, is_node: bool) -> None:
+        """Remove the node or plain value at an existing path."""
+        parent_path, _, key = path.rpartition(".")
+        if is_node:
+            low, high = _descendant_bounds(path)
+            self._connection.execute("DELETE FROM adh_nodes WHERE path = ? OR (path > ? AND path < ?)", (path, low, high))
+            self._set_children(parent_path, remove=key)
+        else:
+            self._set_children(parent_path, value_removed=key)
+
+    def create_node(self, path: str, data: Dict[str, Any]) -> None:
+        """
+        Store a new node, creating the missing intermediate nodes.
+
+        Args:
+            path (str): The path of the new node.
+            data (Dict[str, Any]): The data of the node.
+
+        Raises:
+            PathAlreadyExistsError: If the specified path already exists.
+            TypeError: If the provided data is not a dictionary.
+        """
+        if not isinstance(data, dict):
+            raise TypeError("The provided data must be a dictionary.")
+        with self.transaction():
+            if self._exists(path)[0]:
+                raise PathAlreadyExistsError(f"A node already exists at the specified path: {path}")
+            self._ensure_parents(path)
+            self._insert(path, data)
+            self._forget(path)
+
+    def update_node(self, path: str, data: Dict[str, Any]) -> None:
+        """
+        Replace the value at an existing path with a node.
+
+        Args:
+            path (str): The path to update.
+            data (Dict[str, Any]): The new data of the node.
+
+        Raises:
+            NodeNotFoundError: If the specified path doesn't exist.
+            TypeError: If the provided data is not a dictionary.
+        """
+        if not isinstance(data, dict):
+            raise TypeError("The provided data must be a dictionary.")
+        with self.transaction():
+            parent_path, _, key = path.rpartition(".")
+            parent = self._row(parent_path)
+            is_node = self._row(path) is not None
+            if parent is None or not (is_node or key in parent[0]):
+                raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
+            self._remove(path, is_node)
+            self._insert(path, data)
+            self._forget(path)
+
+    def delete_node(self, path: str) -> None:
+        """
+        Delete the node or value at a path.
+
+        Args:
+            path (str): The path to delete.
+
+        Raises:
+            NodeNotFoundError: If the specified path doesn't exist.
+        """
+        with self.transaction():
+            parent_path, _, key = path.rpartition(".")
+            parent = self._row(parent_path)
+            is_node = self._row(path) is not None
+            if not path or parent is None or not (is_node or key in parent[0]):
+                raise NodeNotFoundError(f"The specified path doesn't exist in the ADH: {path}")
+            self._remove(path, is_node)
+            self._forget(path)
+
+    def move_node(self, source_path: str, target_path: str) -> None:
+        """
+        Move a node, renaming the rows of its subtree in the database.
+
+        Args:
+            source_path (str): The path of the node to move.
+            target_path (str): The new path of the node.
+
+        Raises:
+            NodeNotFoundError: If the source path doesn't exist.
+            PathAlreadyExistsError: If the target path already exists.
+        """
+        with self.transaction():
+            exists, is_node = self._exists(source_path)
+            if not exists:
+                raise NodeNotFoundError(f"The source path doesn't exist in the ADH: {source_path}")
+            if self._exists(target_path)[0]:
+                raise PathAlreadyExistsError(f"A node already exists at the specified path: {target_path}")
+            self._ensure_parents(target_path)
+            if not is_node:
+                value = self.get_node(source_path)
+                self._remove(source_path, False)
+                parent_path, _, key = target_path.rpartition(".")
+                data, children = self._row(parent_path)
+                data[key] = value
+                self._connection.execute("UPDATE adh_nodes SET data = ? WHERE path = ?", (json.dumps(data), parent_path))
+            else:
+                low, high = _descendant_bounds(source_path)
+                self._connection.execute(
+                    "UPDATE adh_nodes SET path = ? || substr(path, ?) WHERE path = ? OR (path > ? AND path < ?)",
+                    (target_path, len(source_path) + 1, source_path, low, high))
+                source_parent, _, source_key = source_path.rpartition(".")
+                self._set_children(source_parent, remove=source_key)
+                target_parent, _, target_key = target_path.rpartition(".")
+                self._set_children(target_parent, add=target_key)
+            self._forget(source_path)
+            self._forget(target_path)
+
+    def copy_node(self, source_path: str, target_path: str) -> None:
+        """
+        Copy a node, duplicating the rows of its subtree within the database.
+
+        Args:
+            source_path (str): The path of the node to copy.
+            target_path (str): The path of the copy.
+
+        Raises:
+            NodeNotFoundError: If the source path doesn't hold a node.
+            PathAlreadyExistsError: If the target path already exists.
+        """
+        with self.transaction():
+            if self._row(source_path) is None:
+                raise NodeNotFoundError(f"The source path doesn't exist in the ADH: {source_path}")
+            if self._exists(target_path)[0]:
+                raise PathAlreadyExistsError(f"The target path already exists in the ADH: {target_path}")
+            self._ensure_parents(target_path)
+            low, high = _descendant_bounds(source_path)
+            self._connection.execute(
+                "INSERT INTO adh_nodes SELECT ? || substr(path, ?), data, children FROM adh_nodes WHERE path = ? OR (path > ? AND path < ?)",
+                (target_path, len(source_path) + 1, source_path, low, high))
+            target_parent, _, target_key = target_path.rpartition(".")
+            self._set_children(target_parent, add=target_key, value_removed=target_key)
+            self._forget(target_path)
+
+    def merge_nodes(self, source_path: Union[str, Sequence[str]], target_path: str, policy: Union[MergePolicy, str] = MergePolicy.KEEP_SOURCE, list_key: Optional[str] = None) -> List[MergeConflict]:
+        """
+        Merge one or more stored nodes into another, as `CommonBaseModel.merge_nodes` does.
+
+        Args:
+            source_path (Union[str, Sequence[str]]): The path of the source node, or several paths.
+            target_path (str): The path of the target node.
+            policy (Union[MergePolicy, str]): How to resolve conflicting values.
+            list_key (Optional[str]): The key identifying list items, required by ``list-by-key``.
+
+        Returns:
+            List[MergeConflict]: The conflicting values found.
+
+        Raises:
+            NodeNotFoundError: If a source or the target path doesn't hold a node.
+            MergeConflictError: If the policy is ``error`` and conflicting values were found.
+            ValueError: If the policy is unknown, or ``list-by-key`` is used without a ``list_key``.
+        """
+        policy = MergePolicy(policy)
+        if policy is MergePolicy.LIST_BY_KEY and list_key is None:
+            raise ValueError("The list-by-key merge policy requires a list_key.")
+        with self.transaction():
+            sources = []
+            for path in [source_path] if isinstance(source_path, str) else source_path:
+                if self._row(path) is None:
+                    raise NodeNotFoundError(f"The source path doesn't exist in the ADH: {path}")
+                sources.append((path, self._load(path)[0]))
+            if self._row(target_path) is None:
+                raise NodeNotFoundError(f"The target path doesn't exist in the ADH: {target_path}")
+            merged, conflicts = merge_into(self._load(target_path)[0], sources, policy, list_key, path=target_path)
+            if conflicts and policy is MergePolicy.ERROR:
+                raise MergeConflictError(conflicts)
+            self._remove(target_path, True)
+            self._insert(target_path, merged)
+            self._forget(target_path)
+        return conflicts
+
+    def import_tree(self, root: Dict[str, Any]) -> None:
+        """
+        Store the top-level nodes of an in-memory ADH, for example the ``adh_root`` of a model.
+
+        Args:
+            root (Dict[str, Any]): The ADH to import. Its top-level keys must not exist in the store yet.
+
+        Raises:
+            PathAlreadyExistsError: If a top-level key already exists in the store.
+        """
+        with self.transaction():
+            for key, node in root.items():
+                if self._exists(key)[0]:
+                    raise PathAlreadyExistsError(f"A node already exists at the specified path: {key}")
+                if isinstance(node, dict):
+                    self._insert(key, node)
+                else:
+                    data, _ = self._row("")
+                    data[key] = node
+                    self._connection.execute("UPDATE adh_nodes SET data = ? WHERE path = ''", (json.dumps(data),))
+            self._clear_resident()
@@ -0,0 +1,264 @@
+"""
+Trusted loading of models written by the package.
+
+Validating a model read from a file runs its whole validator stack again: the `CommonBaseModel.strip_strings`
+validator on every field, the validators of each class, and the type checks of every nested model and point. For a
+model the package wrote itself from a valid instance, none of this can fail or change anything.
+
+`dump_trusted` writes a model as JSON preceded by a header line holding a checksum of the JSON and the name of the
+model class. `load_trusted` reads such a file back without validation when the checksum matches, building the
+nested models as ``model_construct`` does, field by field from their annotations; it validates the file fully
+otherwise, so that files edited since they were written, or written by other tools, are still checked.
+
+The checksum detects accidental changes and files written for another model class. Pass a secret key to both
+functions to also detect deliberate ones: the checksum is then a keyed BLAKE2b digest, which cannot be recomputed
+without the key.
+
+Validators with side effects beyond the values of the model, such as registering instances, are not run by a trusted
+load.
+"""
+
+import enum
+import gc
+import hashlib
+import inspect
+import json
+import types
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
+from pydantic_core import from_json
+from typing_extensions import Annotated, get_args, get_origin
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+_FORMAT = "adh-trusted"
+_VERSION = 1
+_HEADER_START = b'{"format":"adh-trusted"'
+
+# Types whose JSON values are already the values of a validated model
+_PLAIN_TYPES = (Any, object, str, int, float, bool, type(None))
+
+# The origins of union annotations: ``X | Y`` unions only exist from Python 3.10
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+# The function building each model class from trusted data
+_builders: Dict[type, Callable[[Dict[str, Any]], Any]] = {}
+
+# Marker of a field missing from the data
+_MISSING = object()
+
+# Setters of the attributes pydantic keeps in the slots of a model, faster than object.__setattr__
+_set_attribute = object.__setattr__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+class _PrivateDefaults(BaseModel):
+    """A model with a private attribute, to find the post-init hook pydantic gives such models."""
+
+    _probe: None = PrivateAttr(default=None)
+
+
+# The post-init hook pydantic gives the models whose only hook is setting the defaults of their private attributes
+_PRIVATE_DEFAULTS_HOOK = _PrivateDefaults.model_post_init
+
+
+def _model_name(model_class: type) -> str:
+    """Return the qualified name of a model class, as recorded in the header."""
+    return f"{model_class.__module__}.{model_class.__qualname__}"
+
+
+def _digest(model_name: str, body: bytes, key: Optional[bytes]) -> str:
+    """Return the checksum of the JSON of a model."""
+    digest = hashlib.blake2b(key=key or b"", digest_size=32)
+    digest.update(model_name.encode())
+    digest.update(b"\n")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the function building the value of a field from its JSON value, without validation.
+
+    Returns:
+        Optional[Callable[[Any], Any]]: The function, or None if the JSON value is the field value itself. Types
+        without a direct construction are validated with a `TypeAdapter`, for that field only.
+    """
+    if annotation in _PLAIN_TYPES:
+        return None
+    origin = get_origin(annotation)
+    arguments = get_args(annotation)
+    if origin is Annotated:
+        return _converter(arguments[0])
+    if origin in _UNION_TYPES:
+        options = [argument for argument in arguments if argument is not type(None)]
+        if len(options) == 1:
+            convert = _converter(options[0])
+            return None if convert is None else lambda value: None if value is None else convert(value)
+    elif inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return _builder(annotation)
+    elif inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+        return annotation
+    elif origin is list and arguments:
+        convert = _converter(arguments[0])
+        return None if convert is None else lambda value: list(map(convert, value))
+    elif origin is dict and len(arguments) == 2 and arguments[0] is str:
+        convert = _converter(arguments[1])
+        return None if convert is None else lambda value: {key: convert(item) for key, item in value.items()}
+    elif annotation in (list, dict):
+        return None
+    return TypeAdapter(annotation).validate_python
+
+
+def _builder(model_class: Type[ModelType]) -> Callable[[Dict[str, Any]], ModelType]:
+    """Return the function building a model from trusted data, creating it on first use."""
+    builder = _builders.get(model_class)
+    if builder is not None:
+        return builder
+
+    # Models nested in themselves get a stand-in until the builder is ready
+    _builders[model_class] = lambda data: _builders[model_class](data)
+    try:
+        fields = [(name, field.alias if field.alias != name else None, _converter(field.annotation), field)
+                  for name, field in model_class.model_fields.items()]
+    except Exception:
+        del _builders[model_class]
+        raise
+    names = frozenset(name for name, _, _, _ in fields)
+    private_attributes = list(model_class.__private_attributes__.items())
+    conversions = [(name, convert) for name, _, convert, _ in fields if convert is not None]
+    new = model_class.__new__
+
+    def construct(data: Dict[str, Any]) -> ModelType:
+        values = dict(data)  # Keeps the extra fields
+        for name, alias, convert, _ in fields:
+            value = values.pop(name, _MISSING)
+            if value is _MISSING and alias is not None:
+                value = values.pop(alias, _MISSING)
+            if value is not _MISSING:
+                values[name] = value if convert is None or value is None else convert(value)
+        return model_class.model_construct(**values)
+
+    def build(data: Dict[str, Any]) -> ModelType:
+        if data.keys() == names:
+            # All the fields are set, as in most dumped models: the data becomes the fields of the model
+            values = data
+            for name, convert in conversions:
+                value = values[name]
+                if value is not None:
+                    values[name] = convert(value)
+            fields_set = set(names)
+        else:
+            values = {}
+            fields_set = set()
+            for name, alias, convert, field in fields:
+                value = data.get(name, _MISSING)
+                if value is _MISSING and alias is not None:
+                    value = data.get(alias, _MISSING)
+                if value is _MISSING:
+                    values[name] = field.get_default(call_default_factory=True)
+                    continue
+                fields_set.add(name)
+                values[name] = value if convert is None or value is None else convert(value)
+        model = new(model_class)
+        _set_attribute(model, "__dict__", values)
+        _set_fields_set(model, fields_set)
+        _set_extra(model, None)
+        _set_private(model, {name: attribute.get_default() for name, attribute in private_attributes} or None)
+        return model
+
+    # Models with extra fields or a post-init hook of their own are left to model_construct. Pydantic gives the
+    # models with private attributes a hook setting their defaults, which the builder does itself
+    simple = (model_class.model_config.get("extra") != "allow"
+              and model_class.model_post_init in (BaseModel.model_post_init, _PRIVATE_DEFAULTS_HOOK))
+    builder = _builders[model_class] = build if simple else construct
+    return builder
+
+
+def construct_trusted(model_class: Type[ModelType], data: Dict[str, Any]) -> ModelType:
+    """
+    Build a model and its nested models from trusted data, without validation.
+
+    The data must be what a valid instance of the model class dumps in JSON mode. Fields holding nested models,
+    lists and dictionaries of models, enumerations and optional values of these types are built directly; other
+    types that JSON can't represent, such as dates, are validated for their field only.
+
+    The dictionaries of the data are reused by the models, and must not be used afterwards.
+
+    Args:
+        model_class (Type[ModelType]): The model class.
+        data (Dict[str, Any]): The fields of the model, by name or alias.
+
+    Returns:
+        ModelType: The model.
+    """
+    return _builder(model_class)(data)
+
+
+def dump_trusted(model: BaseModel, path: str, key: Optional[bytes] = None) -> int:
+    """
+    Save a model as JSON, with the checksum that lets `load_trusted` skip its validation.
+
+    The model must be valid: write models that were validated, or only changed through validated assignments and the
+    node methods.
+
+    Args:
+        model (BaseModel): The model to save.
+        path (str): The path of the file.
+        key (Optional[bytes]): A secret key of up to 64 bytes keying the checksum.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    body = model.model_dump_json(by_alias=True).encode()
+    model_name = _model_name(type(model))
+    header = json.dumps({"format": _FORMAT, "version": _VERSION, "model": model_name,
+                         "blake2b": _digest(model_name, body, key)}, separators=(",", ":")).encode()
+    with open(path, "wb") as file:
+        file.write(header + b"\n")
+        file.write(body)
+    return len(header) + 1 + len(body)
+
+
+def load_trusted(path: str, model_class: Type[ModelType], key: Optional[bytes] = None) -> ModelType:
+    """
+    Load a model saved as JSON, skipping its validation if it was saved by `dump_trusted`.
+
+    The model is built without validation when the file starts with a header whose checksum matches the JSON and
+    whose model class is ``model_class``. Any other file, including a plain JSON model file, is validated as
+    ``model_validate_json`` does.
+
+    Args:
+        path (str): The path of the file.
+        model_class (Type[ModelType]): The model class.
+        key (Optional[bytes]): The secret key the file was saved with, if any.
+
+    Returns:
+        ModelType: The model.
+
+    Raises:
+        pydantic.ValidationError: If the file is validated and is not valid for the model.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if data.startswith(_HEADER_START):
+        header, _, data = data.partition(b"\n")
+        try:
+            header = json.loads(header)
+        except ValueError:
+            header = {}
+        model_name = _model_name(model_class)
+        if (header.get("version") == _VERSION and header.get("model") == model_name
+                and header.get("blake2b") == _digest(model_name, data, key)):
+            # The models and data built hold no reference cycles, so collecting them would only waste time
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                return construct_trusted(model_class, from_json(data))
+            finally:
+                if collecting:
+                    gc.enable()
+    return model_class.model_validate_json(data)
@@ -1,5 +1,25 @@
-from .airframe import *
-from .propulsion import *
-from .systems import *
-from .equipment import *
-from .work_breakdown_structure import *
+from typing import TYPE_CHECKING
+from ..lazy_import import lazy_exports, subpackage_names
+
+if TYPE_CHECKING:
+    from .airframe import *
+    from .propulsion import *
+    from .systems import *
+    from .equipment import *
+    from .work_breakdown_structure import *
+
+# The modules formerly star-imported, in order, and the names exported, by the module defining them, including those
+# of the subpackages
+_SUBMODULES = ["airframe", "propulsion", "systems", "equipment", "work_breakdown_structure"]
+_EXPORTS, _LEGACY = subpackage_names(__name__, ["airframe", "propulsion", "systems"])
+_EXPORTS.update({
+    "equipment": ("Equipment",),
+    "work_breakdown_structure": ("AircraftSystem", "WbsElement"),
+})
+# The other names the former star imports provided, by the module they are read from
+_LEGACY.update({
+    "equipment": ("Any", "BaseModel", "Behavior", "Discipline", "Metadata", "Requirement", "annotations"),
+    "work_breakdown_structure": ("CommonBaseModel", "Dict", "Field", "List", "Optional", "field_validator"),
+})
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _SUBMODULES, _EXPORTS, _LEGACY)
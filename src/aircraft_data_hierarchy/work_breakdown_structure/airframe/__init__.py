@@ -1,3 +1,38 @@
-from .airframe_parameters import *
-from .airframe_geometry import *
-from .airframe import *
+from typing import TYPE_CHECKING
+from ...lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .airframe_parameters import *
+    from .airframe_geometry import *
+    from .airframe import *
+
+# The modules formerly star-imported, in order, and the names exported, by the module defining them
+_SUBMODULES = ["airframe_parameters", "airframe_geometry", "airframe"]
+_EXPORTS = {
+    "airframe": ("Component",),
+    "airframe_geometry": (
+        "Airfoil", "Body", "Boolean", "CrossSection", "Float", "Geometry", "Integer", "LiftingSurface", "Loft",
+        "Mesh", "Point", "Polyline", "ReferenceAxis", "Spline", "String"
+    ),
+    "airframe_parameters": (
+        "AerodynamicsData", "AsymmetricControl", "BlowingType", "BodyShape", "ConfigurationLayout", "ControlType",
+        "EngineType", "FlapType", "FlightConditions", "GroundEffectsDefinition", "HypersonicFlapControl",
+        "JetEngineType", "JetPowerProperties", "LowAspectRatioWingBody", "NoseType", "Parameters", "PlanformType",
+        "PropellerPowerProperties", "ReferenceData", "SymmetricFlap", "TailShape", "TransverseJetControl",
+        "TwinVerticalTail"
+    ),
+}
+
+# The other names the former star imports provided, by the module they are read from
+_LEGACY = {
+    "airframe": (
+        "Any", "BaseModel", "Behavior", "CommonBaseModel", "Dict", "Discipline", "Field", "List", "Metadata",
+        "Optional", "Requirement", "annotations", "field_validator"
+    ),
+    "airframe_geometry": (
+        "AnyUrl", "EmailStr", "Enum", "Tuple", "constr", "date", "datetime", "math_isfinite", "model_validator",
+        "sqrt"
+    ),
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _SUBMODULES, _EXPORTS, _LEGACY)
@@ -1,3 +1,20 @@
-from .propulsion_cycle import PropulsionCycle
-from .propulsion_geometry import PropulsionGeometry
-from .propulsion import Propulsion
+from typing import TYPE_CHECKING
+from ...lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .propulsion_cycle import PropulsionCycle
+    from .propulsion_geometry import PropulsionGeometry
+    from .propulsion import Propulsion
+
+# The modules formerly star-imported, in order, and the names exported, by the module defining them
+_SUBMODULES = ["propulsion_cycle", "propulsion_geometry", "propulsion"]
+_EXPORTS = {
+    "propulsion": ("Propulsion",),
+    "propulsion_cycle": ("PropulsionCycle",),
+    "propulsion_geometry": ("PropulsionGeometry",),
+}
+
+# The other names the former star imports provided, by the module they are read from
+_LEGACY = {}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _SUBMODULES, _EXPORTS, _LEGACY)
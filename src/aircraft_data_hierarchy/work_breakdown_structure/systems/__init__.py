@@ -1,3 +1,29 @@
-from .systems_parameters import *
-from .systems_diagrams import *
-from .systems import *
+from typing import TYPE_CHECKING
+from ...lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .systems_parameters import *
+    from .systems_diagrams import *
+    from .systems import *
+
+# The modules formerly star-imported, in order, and the names exported, by the module defining them
+_SUBMODULES = ["systems_parameters", "systems_diagrams", "systems"]
+_EXPORTS = {
+    "systems": ("System",),
+    "systems_diagrams": ("create_system_attribute_tables", "create_system_diagram", "display_system_info"),
+    "systems_parameters": (
+        "CoolingRequirements", "DataSignal", "FluidFlowCharacteristics", "FunctionalBlock", "PhysicalCharacteristics",
+        "PowerRequirements", "SignalDirection", "SignalType", "SystemAttributes"
+    ),
+}
+
+# The other names the former star imports provided, by the module they are read from
+_LEGACY = {
+    "systems": (
+        "Any", "BaseModel", "Behavior", "CommonBaseModel", "Dict", "Discipline", "Field", "List", "Metadata",
+        "Optional", "Requirement", "annotations", "field_validator"
+    ),
+    "systems_parameters": ("Enum", "Literal", "Tuple"),
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _SUBMODULES, _EXPORTS, _LEGACY)
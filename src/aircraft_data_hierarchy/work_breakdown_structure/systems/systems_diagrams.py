@@ -1,10 +1,14 @@
-import graphviz
-from tabulate import tabulate
-from typing import List, Optional
-from IPython.display import display, Image, HTML
+from typing import TYPE_CHECKING, List, Optional
 from .systems import System
 
-def create_system_diagram(system: System) -> graphviz.Digraph:
+# graphviz, tabulate and IPython are only imported by the functions drawing diagrams and tables, so that importing
+# the package doesn't load them
+if TYPE_CHECKING:
+    import graphviz
+
+def create_system_diagram(system: System) -> "graphviz.Digraph":
+    import graphviz
+
     dot = graphviz.Digraph(comment=f'Functional Block Diagram - {system.name}')
     dot.attr(rankdir='LR', size='14,10', ratio='fill')
 
@@ -17,6 +21,8 @@ def create_system_diagram(system: System) -> graphviz.Digraph:
     return dot
 
 def create_system_attribute_tables(system: System) -> List[str]:
+    from tabulate import tabulate
+
     tables = []
 
     # Physical Characteristics
@@ -72,6 +78,8 @@ def create_system_attribute_tables(system: System) -> List[str]:
     return [(title, tabulate(data, headers="firstrow", tablefmt="html")) for title, data in tables]
 
 def display_system_info(system: System):
+    from IPython.display import display, Image, HTML
+
     # Create and display the system diagram
     diagram = create_system_diagram(system)
     diagram.render("system_diagram", format="png", cleanup=True)
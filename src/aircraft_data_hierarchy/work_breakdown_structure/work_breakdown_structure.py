@@ -1,5 +1,8 @@
-from pydantic import BaseModel, Field, field_validator, Extra
-from typing import Optional
+import importlib
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+from pydantic import ConfigDict, Field, field_validator
 
 # ToDo: 
 # 1. Get airframe working for the Nacelle demo
@@ -19,8 +22,7 @@ from typing import Optional
 # 15. Create PINs from part locations and WBS structure
 # 16. Demonstrate traversing branches to create part based cost buildup
 
-from ..common_base_model import CommonBaseModel, Metadata
-from .airframe.airframe import Component
+from ..common_base_model import CommonBaseModel
 #from .propulsion.propulsion import propulsion
 #from .systems.systems import system
 #from .equipment import * # Currently a local file
@@ -33,3864 +35,410 @@ Work Breakdown Structure Reference
 
 """
 
-class AircraftSystem(CommonBaseModel):
-    wbs_no: Optional[str] = Field('1.0')
-
-    @field_validator('wbs_no')
-    def validate_wbs_no(cls, value: str) -> str:
-        if not value.startswith('1.') or len(value) < 3:
-            raise ValueError(f"Invalid WBS number: {value}")
-        return value
-
-    class Config:
-        validate_assignment = True
-        extra = 'allow'
-
-    class AircraftSystemIntegrationAssemblyTestAndCheckout(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.1')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-    class AirVehicle(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.2')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class AirVehicleIntegrationAssemblyTestAndCheckout(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class Airframe(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AirframeIntegrationAssemblyTestAndCheckout(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.2.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Fuselage(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.2.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-                class BasicStructure(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.2.1')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                    class Skins(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.1')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Stringers(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.2')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Frames(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.3')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Clips(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.4')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Beams(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.5')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Floors(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.6')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Bulkheads(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.7')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Longerons(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.8')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Supports(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.1.9')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                class SecondaryStructure(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.2.2')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                    class Enclosures(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.1')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Flooring(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.2')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Partitions(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.3')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Windows(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.4')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Doors(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.5')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Ramps(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.6')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Panels(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.7')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Misc(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.2.2.8')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-            class Wing(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.2.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-                class BasicStructure(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.1')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                    class CenterSection(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.3.1.1')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                        class Skins(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.1.1')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Spars(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.1.2')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Ribs(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.1.3')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Stringers(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.1.4')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Clips(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.1.5')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                    class IntermediatePanel(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.3.1.2')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                        class Skins(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.2.1')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Spars(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.2.2')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Ribs(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.2.3')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Stringers(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.2.4')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Clips(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.2.5')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                    class OuterPanel(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.3.1.3')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                        class Skins(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.3.1')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Spars(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.3.2')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Ribs(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.3.3')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Stringers(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.3.4')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                        class Clips(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.3.1.3.5')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                class SecondaryStructure(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.2')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                    class AccessPanels(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.3.2.1')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                class Ailerons(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.3')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Elevons(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.4')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Spoilers(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.5')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class TrailingEdgeFlaps(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.6')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class LeadingEdgeFlaps(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.7')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Slats(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.3.8')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-            class Empennage(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.2.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-                class Stabilizer(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.4.1')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                    class BasicStructure(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.4.1.1')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                        class CenterSection(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.4.1.1.1')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                            class Skins(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.1.1')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Spars(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.1.2')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Ribs(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.1.3')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Stringers(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.1.4')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Clips(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.1.5')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                        class IntermediatePanel(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.4.1.1.2')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                            class Skins(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.2.1')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Spars(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.2.2')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Ribs(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.2.3')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Stringers(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.2.4')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Clips(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.2.5')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                        class OuterPanel(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.4.1.1.3')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                            class Skins(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.3.1')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Spars(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.3.2')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Ribs(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.3.3')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Stringers(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.3.4')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                            class Clips(CommonBaseModel):
-                                wbs_no: Optional[str] = Field('1.2.2.4.1.1.3.5')
-
-                                @field_validator('wbs_no')
-                                def validate_wbs_no(cls, value: str) -> str:
-                                    if not value.startswith('1.'):
-                                        raise ValueError(f'Invalid WBS number: {value}')
-                                    return value
-
-                                class Config:
-                                    validate_assignment = True
-                                    extra = 'allow'
-
-                    class SecondaryStructure(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.4.2')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                        class AccessPanels(CommonBaseModel):
-                            wbs_no: Optional[str] = Field('1.2.2.4.2.1')
-
-                            @field_validator('wbs_no')
-                            def validate_wbs_no(cls, value: str) -> str:
-                                if not value.startswith('1.'):
-                                    raise ValueError(f'Invalid WBS number: {value}')
-                                return value
-
-                            class Config:
-                                validate_assignment = True
-                                extra = 'allow'
-
-                class Ailerons(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.4.3')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Elevons(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.4.4')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Spoilers(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.4.5')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class TrailingEdgeFlaps(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.4.6')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class LeadingEdgeFlaps(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.4.7')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
+# The MIL-STD-881F hierarchy, one element per line: its WBS number, the name of its class, and the base class of
+# the element when it is more than a plain WbsElement. Each element is indented by four spaces under its parent.
+_HIERARCHY = """
+1.0 AircraftSystem
+    1.1 AircraftSystemIntegrationAssemblyTestAndCheckout
+    1.2 AirVehicle
+        1.2.1 AirVehicleIntegrationAssemblyTestAndCheckout
+        1.2.2 Airframe
+            1.2.2.1 AirframeIntegrationAssemblyTestAndCheckout
+            1.2.2.2 Fuselage
+                1.2.2.2.1 BasicStructure
+                    1.2.2.2.1.1 Skins
+                    1.2.2.2.1.2 Stringers
+                    1.2.2.2.1.3 Frames
+                    1.2.2.2.1.4 Clips
+                    1.2.2.2.1.5 Beams
+                    1.2.2.2.1.6 Floors
+                    1.2.2.2.1.7 Bulkheads
+                    1.2.2.2.1.8 Longerons
+                    1.2.2.2.1.9 Supports
+                1.2.2.2.2 SecondaryStructure
+                    1.2.2.2.2.1 Enclosures
+                    1.2.2.2.2.2 Flooring
+                    1.2.2.2.2.3 Partitions
+                    1.2.2.2.2.4 Windows
+                    1.2.2.2.2.5 Doors
+                    1.2.2.2.2.6 Ramps
+                    1.2.2.2.2.7 Panels
+                    1.2.2.2.2.8 Misc
+            1.2.2.3 Wing
+                1.2.2.3.1 BasicStructure
+                    1.2.2.3.1.1 CenterSection
+                        1.2.2.3.1.1.1 Skins
+                        1.2.2.3.1.1.2 Spars
+                        1.2.2.3.1.1.3 Ribs
+                        1.2.2.3.1.1.4 Stringers
+                        1.2.2.3.1.1.5 Clips
+                    1.2.2.3.1.2 IntermediatePanel
+                        1.2.2.3.1.2.1 Skins
+                        1.2.2.3.1.2.2 Spars
+                        1.2.2.3.1.2.3 Ribs
+                        1.2.2.3.1.2.4 Stringers
+                        1.2.2.3.1.2.5 Clips
+                    1.2.2.3.1.3 OuterPanel
+                        1.2.2.3.1.3.1 Skins
+                        1.2.2.3.1.3.2 Spars
+                        1.2.2.3.1.3.3 Ribs
+                        1.2.2.3.1.3.4 Stringers
+                        1.2.2.3.1.3.5 Clips
+                1.2.2.3.2 SecondaryStructure
+                    1.2.2.3.2.1 AccessPanels
+                1.2.2.3.3 Ailerons
+                1.2.2.3.4 Elevons
+                1.2.2.3.5 Spoilers
+                1.2.2.3.6 TrailingEdgeFlaps
+                1.2.2.3.7 LeadingEdgeFlaps
+                1.2.2.3.8 Slats
+            1.2.2.4 Empennage
+                1.2.2.4.1 Stabilizer
+                    1.2.2.4.1.1 BasicStructure
+                        1.2.2.4.1.1.1 CenterSection
+                            1.2.2.4.1.1.1.1 Skins
+                            1.2.2.4.1.1.1.2 Spars
+                            1.2.2.4.1.1.1.3 Ribs
+                            1.2.2.4.1.1.1.4 Stringers
+                            1.2.2.4.1.1.1.5 Clips
+                        1.2.2.4.1.1.2 IntermediatePanel
+                            1.2.2.4.1.1.2.1 Skins
+                            1.2.2.4.1.1.2.2 Spars
+                            1.2.2.4.1.1.2.3 Ribs
+                            1.2.2.4.1.1.2.4 Stringers
+                            1.2.2.4.1.1.2.5 Clips
+                        1.2.2.4.1.1.3 OuterPanel
+                            1.2.2.4.1.1.3.1 Skins
+                            1.2.2.4.1.1.3.2 Spars
+                            1.2.2.4.1.1.3.3 Ribs
+                            1.2.2.4.1.1.3.4 Stringers
+                            1.2.2.4.1.1.3.5 Clips
+                    1.2.2.4.2 SecondaryStructure
+                        1.2.2.4.2.1 AccessPanels
+                1.2.2.4.3 Ailerons
+                1.2.2.4.4 Elevons
+                1.2.2.4.5 Spoilers
+                1.2.2.4.6 TrailingEdgeFlaps
+                1.2.2.4.7 LeadingEdgeFlaps
+                1.2.2.4.8 Slats
+            1.2.2.5 Nacelle Component
+                1.2.2.5.1 BasicStructure
+                    1.2.2.5.1.1 Skins
+                    1.2.2.5.1.2 Stringers
+                    1.2.2.5.1.3 Frames
+                    1.2.2.5.1.4 Clips
+                    1.2.2.5.1.5 Beams
+                    1.2.2.5.1.6 Floors
+                    1.2.2.5.1.7 Bulkheads
+                    1.2.2.5.1.8 Longerons
+                    1.2.2.5.1.9 Supports
+                1.2.2.5.2 SecondaryStructure
+                    1.2.2.5.2.1 Enclosures
+                    1.2.2.5.2.2 Flooring
+                    1.2.2.5.2.3 Partitions
+                    1.2.2.5.2.4 Windows
+                    1.2.2.5.2.5 Doors
+                    1.2.2.5.2.6 Ramps
+                    1.2.2.5.2.7 Panels
+                    1.2.2.5.2.8 Misc
+        1.2.3 Propulsion
+            1.2.3.1 Engine
+            1.2.3.2 EngineInstallation
+            1.2.3.3 AccessoryGearBoxesAndDrive
+            1.2.3.4 ExhaustSystem
+            1.2.3.5 EngineCooling
+            1.2.3.6 WaterInjection
+            1.2.3.7 EngineControls
+            1.2.3.8 StartingSystem
+            1.2.3.9 PropellerOrFanInstallation
+            1.2.3.10 LubricatingSystem
+            1.2.3.11 FuelSystem
+                1.2.3.11.1 ProtectedTanks
+                1.2.3.11.2 UnprotectedTanks
+                1.2.3.11.3 Plumbing
+                1.2.3.11.4 Etc
+            1.2.3.12 DriveSystem
+                1.2.3.12.1 GearBoxes
+                1.2.3.12.2 LubSys
+                1.2.3.12.3 RtrBrk
+                1.2.3.12.4 TransmissionDrive
+                1.2.3.12.5 RotorShaft
+                1.2.3.12.6 GasDrive
+        1.2.4 VehicleSubsystems
+            1.2.4.1 VehicleSubsystemIntegrationAssemblyTestAndCheckout
+            1.2.4.2 FlightControlSubsystem
+                1.2.4.2.1 CockpitControls
+                1.2.4.2.2 AutomaticFlightControlSystem
+                1.2.4.2.3 SystemControls
+            1.2.4.3 AuxiliaryPowerSubsystem
+            1.2.4.4 HydraulicSubsystem
+            1.2.4.5 ElectricalAntiIcingSystem
+            1.2.4.6 CrewStationSubsystem
+            1.2.4.7 EnvironmentalControlSubsystem
+            1.2.4.8 FuelSubsystem
+            1.2.4.9 Instruments
+            1.2.4.10 PneumaticSubsystem
+            1.2.4.11 AntiIcingSubsystem
+            1.2.4.12 VehicleSubsystemSoftware
+            1.2.4.13 OtherSubsystems
+        1.2.5 Avionics
+            1.2.5.1 AvionicsIntegrationAssemblyTestAndCheckout
+            1.2.5.2 CommunicationIdentification
+            1.2.5.3 NavigationGuidance
+            1.2.5.4 MissionComputerProcessing
+            1.2.5.5 FireControl
+            1.2.5.6 DataDisplayAndControls
+            1.2.5.7 Survivability
+            1.2.5.8 Reconnaissance
+            1.2.5.9 ElectronicWarfare
+            1.2.5.10 AutomaticFlightControl
+            1.2.5.11 HealthMonitoringSystem
+            1.2.5.12 StoresManagement
+            1.2.5.13 AvionicsSoftwareRelease
+            1.2.5.14 OtherAvionicsSubsystems
+            1.2.5.15 Installation
+        1.2.6 ArmamentWeaponsDelivery
+        1.2.7 AuxiliaryEquipment
+        1.2.8 FurnishingsAndEquipment
+            1.2.8.1 AccommodationForPersonnel
+            1.2.8.2 MiscellaneousEquipment
+            1.2.8.3 Furnishings
+            1.2.8.4 EmergencyEquipment
+        1.2.9 AirVehicleSoftwareRelease
+        1.2.10 LoadAndHandlingSystem
+            1.2.10.1 AircraftHandling
+            1.2.10.2 LoadHandling
+        1.2.11 BallastGroup
+        1.2.12 ManufacturingVariation
+        1.2.13 Contingency
+        1.2.14 OperatingItems
+            1.2.14.1 Crew
+            1.2.14.2 UnusableFuel
+            1.2.14.3 TrappedOil
+            1.2.14.4 EngineOil
+            1.2.14.5 AuxFuelTanks
+            1.2.14.6 InternalFuelTanks
+            1.2.14.7 ExternalFuelTanks
+            1.2.14.8 WaterInjectionFluid
+            1.2.14.9 Baggage
+            1.2.14.10 GunInstallations
+                1.2.14.10.1 Guns
+                1.2.14.10.2 Supports
+            1.2.14.11 WeaponsProvisions
+            1.2.14.12 Chaff
+            1.2.14.13 Flares
+            1.2.14.14 SurvivalKits
+            1.2.14.15 LifeRafts
+            1.2.14.16 Oxygen
+        1.2.15 Passengers
+        1.2.16 Troops
+        1.2.17 Cargo
+        1.2.18 Ammunition
+        1.2.19 Weapons
+        1.2.20 InternalUsableFuel
+        1.2.21 ExternalUsableFuel
+        1.2.22 OtherAirVehicle
+    1.3 PayloadMissionSystem
+        1.3.1 PayloadIntegrationAssemblyTestAndCheckout
+        1.3.2 SurvivabilityPayload
+        1.3.3 ReconnaissancePayload
+        1.3.4 ElectronicWarfarePayload
+        1.3.5 ArmamentWeaponsDeliveryPayload
+        1.3.6 PayloadSoftwareRelease
+        1.3.7 OtherPayload
+    1.4 GroundHostSegment
+        1.4.1 GroundSegmentIntegrationAssemblyTestAndCheckout
+        1.4.2 GroundControlSystems
+        1.4.3 CommandAndControlSubsystem
+        1.4.4 LaunchEquipment
+        1.4.5 RecoveryEquipment
+        1.4.6 TransportVehicles
+        1.4.7 GroundSegmentSoftwareRelease
+        1.4.8 OtherGroundHostSegment
+    1.5 AircraftSystemSoftwareRelease
+    1.6 SystemsEngineering
+        1.6.1 SoftwareSystemsEngineering
+        1.6.2 IntegratedLogisticsSupportSystemsEngineering
+        1.6.3 CybersecuritySystemsEngineering
+        1.6.4 CoreSystemsEngineering
+        1.6.5 OtherSystemsEngineering
+    1.7 ProgramManagement
+        1.7.1 SoftwareProgramManagement
+        1.7.2 IntegratedLogisticsSupportProgramManagement
+        1.7.3 CybersecurityManagement
+        1.7.4 CoreProgramManagement
+        1.7.5 OtherProgramManagement
+    1.8 SystemTestAndEvaluation
+        1.8.1 DevelopmentalTestAndEvaluation
+            1.8.1.1 SystemAcceptanceTest
+            1.8.1.2 WindTunnelTests
+            1.8.1.3 StructuralTests
+            1.8.1.4 FlightTests
+            1.8.1.5 GroundTests
+            1.8.1.6 CybersecurityTestAndEvaluation
+            1.8.1.7 OtherDTEtests
+        1.8.2 OperationalTestAndEvaluation
+            1.8.2.1 LimitedUserEvaluation
+            1.8.2.2 InteroperabilityTesting
+            1.8.2.3 FlightTests
+            1.8.2.4 GroundTests
+            1.8.2.5 CybersecurityTestAndEvaluation
+            1.8.2.6 OtherOTEtests
+        1.8.3 LiveFireTestAndEvaluation
+        1.8.4 MockupsSystemIntegrationLabs
+        1.8.5 TestAndEvaluationSupport
+        1.8.6 TestFacilities
+    1.9 Training
+        1.9.1 Equipment
+            1.9.1.1 OperatorInstructionalEquipment
+            1.9.1.2 MaintainerInstructionalEquipment
+        1.9.2 Services
+            1.9.2.1 OperatorInstructionalServices
+            1.9.2.2 MaintainerInstructionalServices
+        1.9.3 Facilities
+        1.9.4 TrainingSoftware
+    1.10 Data
+        1.10.1 DataDeliverables
+        1.10.2 DataRepository
+        1.10.3 DataRights
+    1.11 PeculiarSupportEquipment
+        1.11.1 TestAndMeasurementEquipment
+            1.11.1.1 AirframeHullVehicle
+            1.11.1.2 Propulsion
+            1.11.1.3 ElectronicsAvionics
+            1.11.1.4 OtherMajorSubsystems
+        1.11.2 SupportAndHandlingEquipment
+            1.11.2.1 AirframeHullVehicle
+            1.11.2.2 Propulsion
+            1.11.2.3 ElectronicsAvionics
+            1.11.2.4 OtherMajorSubsystems
+    1.12 CommonSupportEquipment
+        1.12.1 TestAndMeasurementEquipment
+            1.12.1.1 AirframeHullVehicle
+            1.12.1.2 Propulsion
+            1.12.1.3 ElectronicsAvionics
+            1.12.1.4 OtherMajorSubsystems
+        1.12.2 SupportAndHandlingEquipment
+            1.12.2.1 AirframeHullVehicle
+            1.12.2.2 Propulsion
+            1.12.2.3 ElectronicsAvionics
+            1.12.2.4 OtherMajorSubsystems
+    1.13 OperationalSiteActivation
+        1.13.1 SystemAssemblyInstallationAndCheckoutOnSite
+        1.13.2 ContractorTechnicalSupport
+        1.13.3 SiteConstruction
+        1.13.4 SiteShipVehicleConversion
+        1.13.5 InterimContractorSupport
+    1.14 ContractorLogisticsSupport
+    1.15 IndustrialFacilities
+        1.15.1 ConstructionConversionExpansion
+        1.15.2 EquipmentAcquisitionOrModernization
+        1.15.3 IndustrialFacilitiesMaintenance
+    1.16 InitialSparesAndRepairParts
+"""
 
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
+# Base classes named in _HIERARCHY, with the module defining them, imported when an element using them is generated
+_BASES = {"Component": (".airframe.airframe", "Component")}
 
-                class Slats(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.4.8')
+# The configuration of every element; the schema of a generated class is only built when it first validates data
+_ELEMENT_CONFIG = ConfigDict(validate_assignment=True, extra="allow", defer_build=True)
 
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
 
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
+class _Element(NamedTuple):
+    wbs_no: str
+    base: Optional[str]
+    children: List[str]
 
-            class Nacelle(Component):
-                wbs_no: Optional[str] = Field('1.2.2.5')
 
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
+def _parse(hierarchy: str) -> Dict[str, _Element]:
+    """Read the elements of a hierarchy table, by the qualified name of their class."""
+    elements: Dict[str, _Element] = {}
+    path: List[str] = []
+    for line in hierarchy.strip("\n").splitlines():
+        wbs_no, name, *base = line.split()
+        del path[(len(line) - len(line.lstrip())) // 4:]
+        if path:
+            elements[".".join(path)].children.append(name)
+        path.append(name)
+        elements[".".join(path)] = _Element(wbs_no, base[0] if base else None, [])
+    return elements
 
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
 
-                class BasicStructure(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.5.1')
+_ELEMENTS = _parse(_HIERARCHY)
+# Serializes the generation of classes, so that concurrent first reads of an element get the same class
+_lock = threading.RLock()
 
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
 
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
+class _LazyElement:
+    """Class attribute generating the class of a child element the first time it is read, then replaced by it."""
 
-                    class Skins(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.1')
+    __slots__ = ("parent", "name")
 
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
+    def __init__(self, parent: type, name: str):
+        self.parent = parent
+        self.name = name
 
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
+    def __get__(self, instance: object, owner: Optional[type] = None) -> type:
+        with _lock:
+            value = vars(self.parent)[self.name]
+            if value is self:
+                value = _element_class(f"{self.parent.__qualname__}.{self.name}")
+                setattr(self.parent, self.name, value)
+        return value
 
-                    class Stringers(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.2')
 
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
+def _add_children(element_class: type) -> None:
+    for name in _ELEMENTS[element_class.__qualname__].children:
+        setattr(element_class, name, _LazyElement(element_class, name))
 
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
 
-                    class Frames(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.3')
+def _element_class(qualname: str) -> type:
+    """Generate the class of the element with the given qualified name, as it would be written nested in its parent."""
+    element = _ELEMENTS[qualname]
+    bases: tuple = (WbsElement,)
+    if element.base is not None:
+        module, name = _BASES[element.base]
+        bases += (getattr(importlib.import_module(module, __package__), name),)
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": qualname,
+        "__annotations__": {"wbs_no": Optional[str]},
+        "wbs_no": Field(element.wbs_no),
+        # Set again here so that it is not overridden by the configuration of another base
+        "model_config": _ELEMENT_CONFIG,
+    }
+    element_class = type(WbsElement)(qualname.rpartition(".")[2], bases, namespace)
+    _add_children(element_class)
+    return element_class
 
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
 
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
+class WbsElement(CommonBaseModel):
+    """
+    Base class of the elements of the work breakdown structure.
 
-                    class Clips(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.4')
+    The classes of the elements below AircraftSystem are described by _HIERARCHY rather than written out: each is
+    generated the first time it is read from the class of its parent, as in ``AircraftSystem.AirVehicle.Airframe``,
+    and builds its pydantic schema the first time it validates data.
+    """
+    wbs_no: Optional[str] = None
 
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
+    model_config = _ELEMENT_CONFIG
 
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
+    @field_validator('wbs_no')
+    def validate_wbs_no(cls, value: str) -> str:
+        if not value.startswith('1.'):
+            raise ValueError(f'Invalid WBS number: {value}')
+        return value
 
-                    class Beams(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.5')
 
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
+class AircraftSystem(WbsElement):
+    wbs_no: Optional[str] = Field(_ELEMENTS['AircraftSystem'].wbs_no)
 
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Floors(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.6')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Bulkheads(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.7')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Longerons(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.8')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Supports(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.1.9')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                class SecondaryStructure(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.2.5.2')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                    class Enclosures(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.1')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Flooring(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.2')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Partitions(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.3')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Windows(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.4')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Doors(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.5')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Ramps(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.6')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Panels(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.7')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-                    class Misc(CommonBaseModel):
-                        wbs_no: Optional[str] = Field('1.2.2.5.2.8')
-
-                        @field_validator('wbs_no')
-                        def validate_wbs_no(cls, value: str) -> str:
-                            if not value.startswith('1.'):
-                                raise ValueError(f'Invalid WBS number: {value}')
-                            return value
-
-                        class Config:
-                            validate_assignment = True
-                            extra = 'allow'
-
-        class Propulsion(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class Engine(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class EngineInstallation(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class AccessoryGearBoxesAndDrive(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ExhaustSystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class EngineCooling(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.5')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class WaterInjection(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.6')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class EngineControls(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.7')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class StartingSystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.8')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class PropellerOrFanInstallation(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.9')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class LubricatingSystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.10')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class FuelSystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.11')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-                class ProtectedTanks(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.11.1')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class UnprotectedTanks(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.11.2')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Plumbing(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.11.3')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Etc(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.11.4')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-            class DriveSystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.3.12')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-                class GearBoxes(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.12.1')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class LubSys(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.12.2')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class RtrBrk(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.12.3')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class TransmissionDrive(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.12.4')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class RotorShaft(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.12.5')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class GasDrive(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.3.12.6')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-        class VehicleSubsystems(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class VehicleSubsystemIntegrationAssemblyTestAndCheckout(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class FlightControlSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-                class CockpitControls(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.4.2.1')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class AutomaticFlightControlSystem(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.4.2.2')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class SystemControls(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.4.2.3')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-            class AuxiliaryPowerSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class HydraulicSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ElectricalAntiIcingSystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.5')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class CrewStationSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.6')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class EnvironmentalControlSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.7')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class FuelSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.8')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Instruments(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.9')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class PneumaticSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.10')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class AntiIcingSubsystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.11')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class VehicleSubsystemSoftware(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.12')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherSubsystems(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.4.13')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class Avionics(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.5')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AvionicsIntegrationAssemblyTestAndCheckout(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class CommunicationIdentification(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class NavigationGuidance(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class MissionComputerProcessing(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class FireControl(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.5')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class DataDisplayAndControls(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.6')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Survivability(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.7')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Reconnaissance(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.8')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ElectronicWarfare(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.9')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class AutomaticFlightControl(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.10')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class HealthMonitoringSystem(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.11')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class StoresManagement(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.12')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class AvionicsSoftwareRelease(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.13')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherAvionicsSubsystems(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.14')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Installation(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.5.15')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class ArmamentWeaponsDelivery(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.6')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class AuxiliaryEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.7')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class FurnishingsAndEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.8')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AccommodationForPersonnel(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.8.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class MiscellaneousEquipment(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.8.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Furnishings(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.8.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class EmergencyEquipment(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.8.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class AirVehicleSoftwareRelease(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.9')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class LoadAndHandlingSystem(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.10')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AircraftHandling(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.10.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class LoadHandling(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.10.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class BallastGroup(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.11')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class ManufacturingVariation(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.12')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class Contingency(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.13')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class OperatingItems(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.14')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class Crew(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class UnusableFuel(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class TrappedOil(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class EngineOil(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class AuxFuelTanks(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.5')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class InternalFuelTanks(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.6')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ExternalFuelTanks(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.7')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class WaterInjectionFluid(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.8')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Baggage(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.9')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class GunInstallations(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.10')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-                class Guns(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.14.10.1')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-                class Supports(CommonBaseModel):
-                    wbs_no: Optional[str] = Field('1.2.14.10.2')
-
-                    @field_validator('wbs_no')
-                    def validate_wbs_no(cls, value: str) -> str:
-                        if not value.startswith('1.'):
-                            raise ValueError(f'Invalid WBS number: {value}')
-                        return value
-
-                    class Config:
-                        validate_assignment = True
-                        extra = 'allow'
-
-            class WeaponsProvisions(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.11')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Chaff(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.12')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Flares(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.13')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class SurvivalKits(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.14')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class LifeRafts(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.15')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Oxygen(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.2.14.16')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class Passengers(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.15')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class Troops(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.16')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class Cargo(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.17')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class Ammunition(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.18')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class Weapons(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.19')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class InternalUsableFuel(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.20')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class ExternalUsableFuel(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.21')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class OtherAirVehicle(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.2.22')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class PayloadMissionSystem(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.3')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class PayloadIntegrationAssemblyTestAndCheckout(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.3.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class SurvivabilityPayload(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.3.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class ReconnaissancePayload(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.3.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class ElectronicWarfarePayload(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.3.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class ArmamentWeaponsDeliveryPayload(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.3.5')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class PayloadSoftwareRelease(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.3.6')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class OtherPayload(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.3.7')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class GroundHostSegment(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.4')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class GroundSegmentIntegrationAssemblyTestAndCheckout(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class GroundControlSystems(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class CommandAndControlSubsystem(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class LaunchEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class RecoveryEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.5')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class TransportVehicles(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.6')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class GroundSegmentSoftwareRelease(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.7')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class OtherGroundHostSegment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.4.8')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class AircraftSystemSoftwareRelease(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.5')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-    class SystemsEngineering(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.6')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class SoftwareSystemsEngineering(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.6.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class IntegratedLogisticsSupportSystemsEngineering(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.6.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class CybersecuritySystemsEngineering(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.6.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class CoreSystemsEngineering(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.6.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class OtherSystemsEngineering(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.6.5')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class ProgramManagement(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.7')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class SoftwareProgramManagement(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.7.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class IntegratedLogisticsSupportProgramManagement(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.7.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class CybersecurityManagement(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.7.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class CoreProgramManagement(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.7.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class OtherProgramManagement(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.7.5')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class SystemTestAndEvaluation(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.8')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class DevelopmentalTestAndEvaluation(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.8.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class SystemAcceptanceTest(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.1.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class WindTunnelTests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.1.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class StructuralTests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.1.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class FlightTests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.1.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class GroundTests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.1.5')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class CybersecurityTestAndEvaluation(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.1.6')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherDTEtests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.1.7')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class OperationalTestAndEvaluation(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.8.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class LimitedUserEvaluation(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.2.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class InteroperabilityTesting(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.2.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class FlightTests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.2.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class GroundTests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.2.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class CybersecurityTestAndEvaluation(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.2.5')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherOTEtests(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.8.2.6')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class LiveFireTestAndEvaluation(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.8.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class MockupsSystemIntegrationLabs(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.8.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class TestAndEvaluationSupport(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.8.5')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class TestFacilities(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.8.6')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class Training(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.9')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class Equipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.9.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class OperatorInstructionalEquipment(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.9.1.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class MaintainerInstructionalEquipment(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.9.1.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class Services(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.9.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class OperatorInstructionalServices(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.9.2.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class MaintainerInstructionalServices(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.9.2.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class Facilities(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.9.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class TrainingSoftware(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.9.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class Data(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.10')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class DataDeliverables(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.10.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class DataRepository(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.10.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class DataRights(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.10.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class PeculiarSupportEquipment(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.11')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class TestAndMeasurementEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.11.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AirframeHullVehicle(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.1.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Propulsion(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.1.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ElectronicsAvionics(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.1.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherMajorSubsystems(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.1.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class SupportAndHandlingEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.11.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AirframeHullVehicle(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.2.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Propulsion(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.2.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ElectronicsAvionics(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.2.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherMajorSubsystems(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.11.2.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-    class CommonSupportEquipment(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.12')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class TestAndMeasurementEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.12.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AirframeHullVehicle(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.1.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Propulsion(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.1.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ElectronicsAvionics(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.1.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherMajorSubsystems(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.1.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-        class SupportAndHandlingEquipment(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.12.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-            class AirframeHullVehicle(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.2.1')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class Propulsion(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.2.2')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class ElectronicsAvionics(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.2.3')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-            class OtherMajorSubsystems(CommonBaseModel):
-                wbs_no: Optional[str] = Field('1.12.2.4')
-
-                @field_validator('wbs_no')
-                def validate_wbs_no(cls, value: str) -> str:
-                    if not value.startswith('1.'):
-                        raise ValueError(f'Invalid WBS number: {value}')
-                    return value
-
-                class Config:
-                    validate_assignment = True
-                    extra = 'allow'
-
-    class OperationalSiteActivation(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.13')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class SystemAssemblyInstallationAndCheckoutOnSite(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.13.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class ContractorTechnicalSupport(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.13.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class SiteConstruction(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.13.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class SiteShipVehicleConversion(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.13.4')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class InterimContractorSupport(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.13.5')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class ContractorLogisticsSupport(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.14')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-    class IndustrialFacilities(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.15')
-
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
-
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
-
-        class ConstructionConversionExpansion(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.15.1')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class EquipmentAcquisitionOrModernization(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.15.2')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-        class IndustrialFacilitiesMaintenance(CommonBaseModel):
-            wbs_no: Optional[str] = Field('1.15.3')
-
-            @field_validator('wbs_no')
-            def validate_wbs_no(cls, value: str) -> str:
-                if not value.startswith('1.'):
-                    raise ValueError(f'Invalid WBS number: {value}')
-                return value
-
-            class Config:
-                validate_assignment = True
-                extra = 'allow'
-
-    class InitialSparesAndRepairParts(CommonBaseModel):
-        wbs_no: Optional[str] = Field('1.16')
+    @field_validator('wbs_no')
+    def validate_wbs_no(cls, value: str) -> str:
+        if not value.startswith('1.') or len(value) < 3:
+            raise ValueError(f"Invalid WBS number: {value}")
+        return value
 
-        @field_validator('wbs_no')
-        def validate_wbs_no(cls, value: str) -> str:
-            if not value.startswith('1.'):
-                raise ValueError(f'Invalid WBS number: {value}')
-            return value
 
-        class Config:
-            validate_assignment = True
-            extra = 'allow'
+_add_children(AircraftSystem)
@@ -0,0 +1,417 @@
+"""
+Incremental saving of models as JSON.
+
+Saving a model with ``model_dump_json`` encodes all of it, however little has changed. `ModelWriter` keeps the
+encoded JSON of the parts of a model that have not changed since they were last saved and only encodes the others:
+
+* the ADH is split into nodes down to a cache depth. The nodes at that depth, and plain values above it, keep their
+  encoded bytes, and the node methods of the model mark the path to each change as dirty;
+* the other fields keep their encoded bytes until they are assigned again, which is detected on assignment;
+* nested models are saved the same way, with their own cache.
+
+In segment mode, the first save writes the whole model, and each later save appends one line holding only the
+changed fields and ADH subtrees to a segment file next to it, so that the time taken by a save follows the size of
+the change. `load_saved` reads the model back and replays the segments, and `ModelWriter.compact` folds them into a
+new base file.
+
+Changes made by editing the dictionaries of the ADH or the values of fields in place are not detected; call
+`ModelWriter.invalidate` after such edits.
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, PydanticUserError, TypeAdapter
+from pydantic_core import to_json
+from typing_extensions import Annotated
+
+from .lazy_validation import PENDING_KEY, validate_all
+from .loader import LazyNode, load_lazy
+
+if TYPE_CHECKING:
+    from .common_base_model import CommonBaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# The state of an encoded node, followed by the entries of its children by key. The state is None for a dirty
+# node, the encoded bytes of a node at the cache depth or of a plain value, the encoded pieces of a clean node above
+# the cache depth, or one of the markers below.
+SerialEntry = List[Any]
+
+_CLEAN = object()  # A node above the cache depth whose children are clean but whose pieces must be gathered again
+_PENDING = object()  # A value of a `LazyNode` still unparsed, copied from the file it was loaded from
+_REPLACED = object()  # A value which was set or removed since the last save
+
+SEGMENTS_SUFFIX = ".segments"
+
+# Pieces are joined in groups before writing, which is much faster than writing them one by one
+_PIECES_PER_WRITE = 1 << 16
+
+# The serializers of the fields, by model class and field name, or None for the fields serialized by the model
+_field_adapters: Dict[Tuple[type, str], Optional[TypeAdapter]] = {}
+
+
+def mark_dirty(entry: Optional[SerialEntry], parent_path: str, key: str) -> None:
+    """
+    Record that a key of an ADH node was set or removed.
+
+    Args:
+        entry (Optional[SerialEntry]): The entry of the ADH root, if the ADH has been saved.
+        parent_path (str): The dotted path of the changed node, or an empty string for the root.
+        key (str): The key that was set or removed.
+    """
+    if entry is None:
+        return
+    for component in parent_path.split(".") if parent_path else ():
+        entry[0] = None
+        child = entry[1].get(component)
+        if child is None or child[0] is _REPLACED:
+            return  # Encoded as a whole at the next save
+        entry = child
+    entry[0] = None
+    entry[1][key] = [_REPLACED, {}]
+
+
+def _encode(node: Any, entry: SerialEntry, depth: int, cache_depth: int) -> List[bytes]:
+    """
+    Encode an ADH node, reusing the bytes of its clean descendants and caching those of the others.
+
+    A node above the cache depth keeps the list of the pieces making up its encoding, which refer to the bytes of
+    its descendants rather than copying them, so that a clean node is written as it is and a dirty one is put back
+    together from the pieces of its clean children.
+
+    Args:
+        node (Any): The node or value to encode.
+        entry (SerialEntry): The entry of the node, updated in place.
+        depth (int): The depth of the node, the ADH root being at depth 0.
+        cache_depth (int): The depth of the nodes whose bytes are cached.
+
+    Returns:
+        List[bytes]: The pieces of the encoded node, to be joined or written in order.
+    """
+    state = entry[0]
+    if type(state) is list:
+        return state
+    if type(state) is bytes:
+        return [state]
+    if not isinstance(node, dict) or depth >= cache_depth:
+        entry[0], entry[1] = to_json(node), {}
+        return [entry[0]]
+
+    children = entry[1] if state is None or state is _CLEAN else {}
+    encoded_children = {}
+    lazy = isinstance(node, LazyNode)
+    pending = False
+    parts = [b"{"]
+    for index, key in enumerate(list(dict.keys(node))):
+        parts.append(b"," + to_json(key) + b":" if index else to_json(key) + b":")
+        raw = node.raw(key) if lazy else None
+        if raw is not None:
+            # Unparsed values are copied from the file at each save rather than kept in memory
+            encoded_children[key] = [_PENDING, {}]
+            parts.append(raw)
+            pending = True
+            continue
+        child_entry = children.get(key)
+        if child_entry is None or child_entry[0] is _PENDING or child_entry[0] is _REPLACED:
+            child_entry = [None, {}]
+        encoded_children[key] = child_entry
+        child_state = child_entry[0]
+        if type(child_state) is bytes:
+            parts.append(child_state)
+        else:
+            parts.extend(_encode(dict.__getitem__(node, key), child_entry, depth + 1, cache_depth))
+    parts.append(b"}")
+    entry[0], entry[1] = _CLEAN if pending else parts, encoded_children
+    return parts
+
+
+def _encoded(node: Any, entry: SerialEntry, depth: int, cache_depth: int) -> bytes:
+    return b"".join(_encode(node, entry, depth, cache_depth))
+
+
+def _changes(node: Dict[str, Any], entry: SerialEntry, path: str, depth: int, cache_depth: int,
+             updated: List[Tuple[str, bytes]], removed: List[str]) -> None:
+    """
+    Collect the ADH subtrees changed since the last save, and encode them so that they become clean.
+
+    Args:
+        node (Dict[str, Any]): A node above the cache depth.
+        entry (SerialEntry): The entry of the node, updated in place.
+        path (str): The dotted path of the node.
+        depth (int): The depth of the node.
+        cache_depth (int): The depth of the nodes whose bytes are cached.
+        updated (List[Tuple[str, bytes]]): Receives the path and encoded value of each set subtree.
+        removed (List[str]): Receives the path of each removed subtree.
+    """
+    stack = [(node, entry, path, depth)]
+    while stack:
+        node, entry, path, depth = stack.pop()
+        if entry[0] is not None:
+            continue
+        prefix = f"{path}." if path else ""
+        if not isinstance(node, dict) or depth >= cache_depth:
+            updated.append((path, _encoded(node, entry, depth, cache_depth)))
+            continue
+        children = entry[1]
+        for key in [key for key in children if not dict.__contains__(node, key)]:
+            del children[key]
+            removed.append(prefix + key)
+        for key in list(dict.keys(node)):
+            child_entry = children.get(key)
+            if child_entry is None or child_entry[0] is _REPLACED:
+                child_entry = children[key] = [None, {}]
+                updated.append((prefix + key, _encoded(node[key], child_entry, depth + 1, cache_depth)))
+            elif child_entry[0] is None:
+                stack.append((dict.__getitem__(node, key), child_entry, prefix + key, depth + 1))
+        entry[0] = _CLEAN
+
+
+def _field_names(model: BaseModel) -> List[str]:
+    return list(type(model).model_fields) + list(model.__pydantic_extra__ or ())
+
+
+def _node_state_of(model: BaseModel) -> Any:
+    """Return the node state of a model, kept in its private attributes, or None if it has none."""
+    private = getattr(model, "__pydantic_private__", None)
+    return private.get("_adh_state") if private else None
+
+
+def _field_adapter(model_class: type, name: str) -> Optional[TypeAdapter]:
+    """
+    Return the serializer of a field, built from its annotation and the configuration of its model on first use.
+
+    Returns:
+        Optional[TypeAdapter]: The serializer, or None if the field is not declared or has a serializer method on the
+        model, which only the model can call.
+    """
+    key = (model_class, name)
+    if key in _field_adapters:
+        return _field_adapters[key]
+    adapter = None
+    field = model_class.model_fields.get(name)
+    serializers = model_class.__pydantic_decorators__.field_serializers.values()
+    if field is not None and not any(name in serializer.info.fields or "*" in serializer.info.fields
+                                     for serializer in serializers):
+        annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+        try:
+            adapter = TypeAdapter(annotation, config=model_class.model_config)
+        except PydanticUserError:
+            # Models and other types with a configuration of their own
+            adapter = TypeAdapter(annotation)
+    _field_adapters[key] = adapter
+    return adapter
+
+
+def _dump_field(model: BaseModel, name: str) -> bytes:
+    """Encode the value of one field as ``model_dump_json`` does, with its serializers."""
+    extra = model.__pydantic_extra__
+    if extra and name in extra:
+        return to_json(extra[name])
+    adapter = _field_adapter(type(model), name)
+    if adapter is None:
+        return to_json(model.model_dump(mode="json", include={name})[name])
+    return adapter.dump_json(getattr(model, name))
+
+
+def _holds_models(value: Any) -> bool:
+    """Return whether a value is a model or a container with models, whose bytes could go stale unnoticed."""
+    if isinstance(value, BaseModel):
+        return True
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple, set, frozenset)):
+        return False
+    return any(isinstance(item, BaseModel) for item in value)
+
+
+class ModelWriter:
+    """
+    Saves a model to a JSON file, encoding only what changed since the previous save.
+
+    Attributes:
+        model (CommonBaseModel): The model to save.
+        path (str): The path of the JSON file.
+        segments (bool): Whether later saves append the changes to the segment file instead of rewriting the file.
+        cache_depth (int): The depth of the ADH nodes whose encoded bytes are cached, the children of the root being
+            at depth 1. Deeper levels save smaller changes at the cost of more cache entries.
+    """
+
+    def __init__(self, model: "CommonBaseModel", path: str, segments: bool = False, cache_depth: int = 2) -> None:
+        """
+        Prepare the writer. Nothing is written until `save` is called.
+
+        Args:
+            model (CommonBaseModel): The model to save.
+            path (str): The path of the JSON file.
+            segments (bool): Append the changes to a segment file after the first save.
+            cache_depth (int): The depth of the ADH nodes whose encoded bytes are cached, at least 1.
+
+        Raises:
+            ValueError: If the cache depth is lower than 1.
+        """
+        if cache_depth < 1:
+            raise ValueError("The cache depth must be at least 1.")
+        self.model = model
+        self.path = path
+        self.segments = segments
+        self.cache_depth = cache_depth
+        self._base_written = False
+
+    @property
+    def segments_path(self) -> str:
+        """str: The path of the segment file."""
+        return self.path + SEGMENTS_SUFFIX
+
+    def invalidate(self) -> None:
+        """Drop the encoded bytes kept for the model and its nested models, so that the next save encodes them again."""
+        stack = [self.model]
+        while stack:
+            model = stack.pop()
+            state = _node_state_of(model)
+            if state is not None:
+                state.serial_root = state.serial_fields = None
+            stack.extend(value for name in _field_names(model) if isinstance(value := getattr(model, name), BaseModel))
+
+    def save(self) -> int:
+        """
+        Save the model, in full or, in segment mode after the first save, as a segment holding the changes.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        if self.segments and self._base_written:
+            return self._append_segment()
+        return self.compact()
+
+    def compact(self) -> int:
+        """
+        Write the whole model to the JSON file, replacing it atomically, and remove the segment file.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        parts: List[bytes] = []
+        self._write_model(self.model, parts)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "wb") as file:
+            for start in range(0, len(parts), _PIECES_PER_WRITE):
+                file.write(b"".join(parts[start:start + _PIECES_PER_WRITE]))
+            size = file.tell()
+        os.replace(temporary_path, self.path)
+        if os.path.exists(self.segments_path):
+            os.remove(self.segments_path)
+        self._base_written = True
+        return size
+
+    def _write_model(self, model: BaseModel, parts: List[bytes]) -> None:
+        """Encode a model into a list of pieces, reusing the bytes of its clean fields."""
+        if PENDING_KEY in model.__dict__:
+            # The models held by the fields are encoded by their field serializer, which does not validate them
+            validate_all(model)
+        state = model._ensure_node_state() if hasattr(model, "_ensure_node_state") else None
+        if state is not None and state.serial_fields is None:
+            state.serial_fields = {}
+        parts.append(b"{")
+        for index, name in enumerate(_field_names(model)):
+            parts.append(b"," + to_json(name) + b":" if index else to_json(name) + b":")
+            parts.extend(self._field_parts(model, state, name))
+        parts.append(b"}")
+
+    def _field_parts(self, model: BaseModel, state: Any, name: str) -> List[bytes]:
+        """Return the encoded value of a field, from the cache when it is clean."""
+        value = getattr(model, name)
+        if isinstance(value, BaseModel):
+            parts: List[bytes] = []
+            self._write_model(value, parts)
+            if state is not None:
+                state.serial_fields[name] = _CLEAN
+            return parts
+        if state is None:
+            return [_dump_field(model, name)]
+        if name == "adh_root" and isinstance(value, dict):
+            if state.serial_root is None:
+                state.serial_root = [None, {}]
+            state.serial_fields[name] = _CLEAN
+            return _encode(value, state.serial_root, 0, self.cache_depth)
+        cached = state.serial_fields.get(name)
+        if isinstance(cached, bytes):
+            return [cached]
+        encoded = _dump_field(model, name)
+        if not _holds_models(value):
+            state.serial_fields[name] = encoded
+        return [encoded]
+
+    def _dirty(self, model: BaseModel) -> bool:
+        """Return whether a nested model changed since it was last saved."""
+        state = _node_state_of(model)
+        if state is None or state.serial_fields is None or state.serial_root is None or state.serial_root[0] is None:
+            return True
+        for name in _field_names(model):
+            value = getattr(model, name)
+            if name not in state.serial_fields or (isinstance(value, BaseModel) and self._dirty(value)):
+                return True
+        return False
+
+    def _append_segment(self) -> int:
+        """Append the changes since the previous save to the segment file."""
+        model = self.model
+        state = model._ensure_node_state()
+        fields: List[Tuple[str, bytes]] = []
+        updated: List[Tuple[str, bytes]] = []
+        removed: List[str] = []
+        for name in _field_names(model):
+            value = getattr(model, name)
+            if name == "adh_root" and isinstance(value, dict) and name in state.serial_fields and state.serial_root is not None:
+                _changes(value, state.serial_root, "", 0, self.cache_depth, updated, removed)
+            elif name not in state.serial_fields or (isinstance(value, BaseModel) and self._dirty(value)):
+                fields.append((name, b"".join(self._field_parts(model, state, name))))
+        if not (fields or updated or removed):
+            return 0
+
+        segment = b"".join((
+            b'{"fields":{', b",".join(to_json(name) + b":" + encoded for name, encoded in fields),
+            b'},"set":{', b",".join(to_json(path) + b":" + encoded for path, encoded in updated),
+            b'},"unset":', to_json(removed), b"}\n",
+        ))
+        with open(self.segments_path, "ab") as file:
+            file.write(segment)
+        return len(segment)
+
+
+def load_saved(path: str, model_class: Type[ModelType]) -> ModelType:
+    """
+    Load a model saved by `ModelWriter`, replaying its segments if any.
+
+    The base file is opened with `load_lazy`, so only the ADH subtrees changed by the segments are parsed.
+
+    Args:
+        path (str): The path of the JSON file.
+        model_class (Type[ModelType]): The model class to validate the file against.
+
+    Returns:
+        ModelType: The model as of the last save.
+    """
+    model = load_lazy(path, model_class)
+    if not os.path.exists(path + SEGMENTS_SUFFIX):
+        return model
+    with open(path + SEGMENTS_SUFFIX, "rb") as file:
+        for line in file:
+            segment = json.loads(line)
+            for name, value in segment["fields"].items():
+                setattr(model, name, value)
+            root = model.adh_root
+            for dotted_path, value in segment["set"].items():
+                *parents, key = dotted_path.split(".")
+                node = root
+                for component in parents:
+                    node = node.setdefault(component, {})
+                node[key] = value
+            for dotted_path in segment["unset"]:
+                *parents, key = dotted_path.split(".")
+                node = root
+                for component in parents:
+                    node = node[component]
+                node.pop(key)
+    return model
@@ -0,0 +1,78 @@
+import datetime
+import unittest
+from typing import List, Optional
+from aircraft_data_hierarchy.binary import BinaryFormatError, dump_binary, load_binary, read_binary_path
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe_geometry import Point
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe_parameters import AerodynamicsData, FlightConditions
+
+class Section(CommonBaseModel):
+    points: List[Point] = []
+    thickness: List[Optional[float]] = []
+
+class Record(CommonBaseModel):
+    created: datetime.datetime
+    metadata: List[Metadata] = []
+
+class TestBinaryFormat(unittest.TestCase):
+
+    def test_plain_values_round_trip(self):
+        value = {
+            'none': None, 'flags': [True, False], 'small': 3, 'negative': -300, 'large': 2 ** 70,
+            'ratio': 0.25, 'text': 'wing', 'empty': {}, 'nothing': [],
+            'floats': [1.0, -2.5, float('inf')], 'optional': [None, 1.5, None],
+            'mixed': [1, 'two', 3.0, {'four': [4]}],
+        }
+        self.assertEqual(load_binary(dump_binary(value)), value)
+
+    def test_models_round_trip(self):
+        model = Record(created=datetime.datetime(2024, 5, 1, 12, 30), metadata=[Metadata(key='units', value='SI')],
+                       adh_root={'airframe': {'wing': {'span': 30.5, 'loads': [1.0, 2.0]}}})
+        loaded = load_binary(dump_binary(model), Record)
+        self.assertEqual(loaded.model_dump(), model.model_dump())
+        self.assertEqual(loaded.created, model.created)
+
+    def test_numeric_arrays_are_packed(self):
+        section = Section(points=[Point(x=i, y=0, z=1) for i in range(3)], thickness=[0.1, None, 0.3])
+        self.assertEqual(load_binary(dump_binary(section), Section), section)
+
+        coefficients = [0.01 * i for i in range(1000)]
+        data = dump_binary(AerodynamicsData(CLW=coefficients, CDW=coefficients[:-1] + [None]), exclude_unset=True)
+        self.assertLess(len(data), 2 * 8 * 1000 + 4096)
+        loaded = load_binary(data, AerodynamicsData)
+        self.assertEqual(loaded.CLW, coefficients)
+        self.assertIsNone(loaded.CDW[-1])
+
+        conditions = FlightConditions(machs=[0.3, 0.5, 0.8], alphas=[0.0, 2.0, 4.0], altitudes=[0.0, None, 10000.0])
+        self.assertEqual(load_binary(dump_binary(conditions, exclude_unset=True), FlightConditions), conditions)
+
+    def test_keys_and_strings_are_interned(self):
+        nodes = {f'node{i}': {'material': 'aluminum', 'units': 'kg'} for i in range(100)}
+        data = dump_binary(nodes)
+        self.assertEqual(data.count(b'aluminum'), 1)
+        self.assertEqual(data.count(b'material'), 1)
+
+    def test_read_path_skips_other_subtrees(self):
+        outline = [{'x': 1.0, 'y': 2.0}, {'x': 3.0, 'y': 4.0}]
+        model = CommonBaseModel(adh_root={'airframe': {'outline': outline, 'loads': [1.0, None], 'wing': {'span': 30.0},
+                                                       'tail': {'span': 8.0}}, 'systems': {}})
+        data = dump_binary(model)
+        self.assertEqual(read_binary_path(data, 'adh_root.airframe.tail'), {'span': 8.0})
+        self.assertEqual(read_binary_path(data, 'adh_root.airframe.wing.span'), 30.0)
+        self.assertEqual(read_binary_path(data, 'adh_root.airframe.outline'), outline)
+        self.assertIsNone(read_binary_path(data, 'adh_root.airframe.fuselage'))
+        self.assertIsNone(read_binary_path(data, 'adh_root.airframe.wing.span.value'))
+
+    def test_invalid_documents(self):
+        data = dump_binary({'a': [1, 2, 3]})
+        with self.assertRaises(BinaryFormatError):
+            load_binary(b'{"a": 1}')
+        with self.assertRaises(BinaryFormatError):
+            load_binary(data[:4] + b'\x63' + data[5:])
+        with self.assertRaises(BinaryFormatError):
+            load_binary(data[:-2])
+        with self.assertRaises(BinaryFormatError):
+            load_binary(b'ADH')
+
+if __name__ == '__main__':
+    unittest.main()
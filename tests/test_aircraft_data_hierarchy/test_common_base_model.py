@@ -1,7 +1,8 @@
+import sys
 import unittest
 from typing import Any, Dict, Optional
 from pydantic import ValidationError
-from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata, NodeNotFoundError, PathAlreadyExistsError  # Replace 'your_module' with the actual module name
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata, NodeNotFoundError, PathAlreadyExistsError, AliasCycleError  # Replace 'your_module' with the actual module name
 
 class TestCommonBaseModel(unittest.TestCase):
 
@@ -132,6 +133,361 @@ class TestCommonBaseModel(unittest.TestCase):
         self.assertEqual(results[0]['key'], 'value1')
 
 
+class TestPathIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('root.node1', {'key': 'value', 'child': {'leaf': 1}})
+        self.model.enable_path_index()
+
+    def index(self):
+        return self.model.__pydantic_private__['_adh_state'].path_index
+
+    def test_enable_indexes_existing_nodes(self):
+        self.assertEqual(set(self.index()), {'root', 'root.node1', 'root.node1.child'})
+        self.assertEqual(self.model.get_node('root.node1.child.leaf'), 1)
+        self.assertIsNone(self.model.get_node('root.missing.node'))
+
+    def test_create_and_delete_keep_index_current(self):
+        self.model.create_node('other.deep.node', {'sub': {'key': 'value'}})
+        self.assertIs(self.index()['other.deep.node.sub'], self.model.get_node('other.deep.node.sub'))
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.create_node('other.deep.node', {'key': 'value'})
+        self.model.delete_node('other.deep')
+        self.assertNotIn('other.deep.node.sub', self.index())
+        self.assertIsNone(self.model.get_node('other.deep.node'))
+
+    def test_update_move_copy_merge_keep_index_current(self):
+        self.model.update_node('root.node1', {'fresh': {'key': 'value'}})
+        self.assertNotIn('root.node1.child', self.index())
+        self.model.move_node('root.node1', 'root.node2')
+        self.assertEqual(self.model.get_node('root.node2.fresh'), {'key': 'value'})
+        self.assertNotIn('root.node1.fresh', self.index())
+        self.model.copy_node('root.node2', 'root.node3')
+        self.assertIsNot(self.model.get_node('root.node3.fresh'), self.model.get_node('root.node2.fresh'))
+        self.model.create_node('root.node4', {'extra': {'key': 'other'}})
+        self.model.merge_nodes('root.node4', 'root.node3')
+        self.assertEqual(self.model.get_node('root.node3.extra.key'), 'other')
+        self.assertIn('root.node3.extra', self.index())
+
+    def test_reassigned_root_is_reindexed(self):
+        self.model.adh_root = {'new': {'node': {'key': 'value'}}}
+        self.assertEqual(self.model.get_node('new.node'), {'key': 'value'})
+        self.assertIsNone(self.model.get_node('root.node1'))
+
+    def test_disable_path_index(self):
+        self.model.disable_path_index()
+        self.assertIsNone(self.index())
+        self.assertEqual(self.model.get_node('root.node1.key'), 'value')
+
+    def test_copies_build_their_own_state(self):
+        copy = self.model.model_copy()
+        self.assertIsNone(copy.__pydantic_private__['_adh_state'])
+        self.assertEqual(copy, self.model)
+        copy.adh_root = {'other': {'key': 'value'}}
+        self.assertEqual(copy.get_node('other.key'), 'value')
+        self.assertIsNone(self.model.get_node('other'))
+        self.assertEqual(set(self.index()), {'root', 'root.node1', 'root.node1.child'})
+
+
+class TestAliasResolution(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('config.wing', {'span': 10})
+        self.model.create_node('baseline.wing', {'span': 30, 'flap': {'type': 'fowler'}})
+        self.model.link_nodes('config.wing', 'baseline.wing')
+
+    def test_get_node_follows_alias(self):
+        self.assertEqual(self.model.get_node('config.wing'), self.model.get_node('baseline.wing'))
+        self.assertEqual(self.model.get_node('config.wing.flap.type'), 'fowler')
+
+    def test_alias_of_intermediate_prefix(self):
+        self.model.create_node('variant', {'key': 'value'})
+        self.model.link_nodes('variant', 'baseline')
+        self.assertEqual(self.model.get_node('variant.wing.span'), 30)
+
+    def test_update_node_follows_alias(self):
+        self.model.update_node('config.wing.flap', {'type': 'slotted'})
+        self.assertEqual(self.model.get_node('baseline.wing.flap'), {'type': 'slotted'})
+
+    def test_create_and_delete_node_follow_alias(self):
+        self.model.create_node('config.wing.slat', {'type': 'leading-edge'})
+        self.assertEqual(self.model.get_node('config.wing.slat'), {'type': 'leading-edge'})
+        self.assertEqual(self.model.get_node('baseline.wing.slat'), {'type': 'leading-edge'})
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.create_node('config.wing', {'span': 12})
+        self.model.delete_node('config.wing.slat')
+        self.assertIsNone(self.model.get_node('baseline.wing.slat'))
+        self.model.delete_node('config.wing')
+        self.assertEqual(self.model.aliases, {})
+        self.assertIsNone(self.model.get_node('config.wing'))
+        self.assertEqual(self.model.get_node('baseline.wing.span'), 30)
+
+    def test_direct_edits_to_aliases_are_followed(self):
+        self.assertEqual(self.model.get_node('config.wing.span'), 30)
+        self.model.create_node('reference.wing', {'span': 20})
+        self.model.aliases['config.wing'] = 'reference.wing'
+        self.assertEqual(self.model.get_node('config.wing.span'), 20)
+        del self.model.aliases['config.wing']
+        self.assertEqual(self.model.get_node('config.wing.span'), 10)
+        model = CommonBaseModel.model_construct(adh_root={'a': {'x': 1}, 'b': {'x': 2}}, aliases={'a': 'b'})
+        self.assertEqual(model.get_node('a.x'), 2)
+        model.aliases.clear()
+        self.assertEqual(model.get_node('a.x'), 1)
+
+    def test_search_nodes_reports_aliased_paths(self):
+        paths = sorted(result['_path'] for result in self.model.search_nodes({'type': 'fowler'}))
+        self.assertEqual(paths, ['.baseline.wing.flap', '.config.wing.flap'])
+
+    def test_unlink_invalidates_resolution(self):
+        self.assertEqual(self.model.get_node('config.wing.span'), 30)
+        self.model.unlink_nodes('config.wing')
+        self.assertEqual(self.model.get_node('config.wing.span'), 10)
+
+    def test_move_and_delete_relink_aliases(self):
+        self.model.move_node('baseline', 'reference')
+        self.assertEqual(self.model.aliases, {'config.wing': 'reference.wing'})
+        self.assertEqual(self.model.get_node('config.wing.span'), 30)
+        self.model.delete_node('reference.wing')
+        self.assertEqual(self.model.aliases, {})
+        self.assertEqual(self.model.get_node('config.wing.span'), 10)
+
+    def test_alias_cycle_is_rejected(self):
+        with self.assertRaises(AliasCycleError):
+            self.model.link_nodes('baseline.wing', 'config.wing')
+        self.assertEqual(self.model.aliases, {'config.wing': 'baseline.wing'})
+        self.model.aliases['baseline.wing'] = 'config.wing'
+        with self.assertRaises(AliasCycleError):
+            self.model.get_node('config.wing')
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.wing', {'type': 'surface', 'material': 'Al'})
+        self.model.create_node('airframe.htail', {'type': 'surface', 'material': 'CFRP'})
+        self.model.create_node('airframe.fuselage', {'type': 'body', 'material': 'Al'})
+        self.model.add_search_index('type', 'material')
+
+    def indexed_paths(self, key, value):
+        return set(self.model.__pydantic_private__['_adh_state'].attribute_indexes[key].get(value, {}))
+
+    def test_search_uses_index(self):
+        results = self.model.search_nodes({'type': 'surface', 'material': 'Al'})
+        self.assertEqual([result['_path'] for result in results], ['.airframe.wing'])
+        self.assertEqual(len(self.model.search_nodes({'material': 'Al'})), 2)
+
+    def test_index_matches_scan(self):
+        scan = CommonBaseModel(adh_root=self.model.adh_root)
+        for criteria in ({'type': 'surface'}, {'type': 'body', 'material': 'Al'}, {'type': 'missing'}):
+            expected = sorted(scan.search_nodes(criteria), key=lambda result: result['_path'])
+            self.assertEqual(self.model.search_nodes(criteria), expected)
+
+    def test_index_follows_mutations(self):
+        self.model.update_node('airframe.wing', {'type': 'body'})
+        self.assertEqual(self.indexed_paths('type', 'surface'), {'airframe.htail'})
+        self.model.move_node('airframe.htail', 'empennage.htail')
+        self.assertEqual(self.indexed_paths('material', 'CFRP'), {'empennage.htail'})
+        self.model.delete_node('airframe')
+        self.assertEqual(self.indexed_paths('type', 'body'), set())
+        self.model.create_node('empennage.vtail', {'type': 'surface'})
+        self.model.merge_nodes('empennage.vtail', 'empennage.htail')
+        self.assertEqual(len(self.model.search_nodes({'type': 'surface'})), 2)
+
+    def test_leaf_values_of_parent_are_reindexed(self):
+        self.model.update_node('airframe.wing.type', {'detail': 'value'})
+        self.assertNotIn('airframe.wing', self.indexed_paths('type', 'surface'))
+
+    def test_drop_search_index(self):
+        self.model.drop_search_index('type')
+        self.assertNotIn('type', self.model.__pydantic_private__['_adh_state'].attribute_indexes)
+        self.assertEqual(len(self.model.search_nodes({'type': 'surface'})), 2)
+
+
+class TestIterNodes(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.wing', {'type': 'surface', 'flap': {'type': 'surface'}})
+        self.model.create_node('airframe.fuselage', {'type': 'body'})
+        self.model.create_node('systems.wing_deicing', {'type': 'surface'})
+
+    def test_yields_paths_and_nodes_without_copying(self):
+        results = list(self.model.iter_nodes({'type': 'surface'}))
+        self.assertEqual([path for path, _ in results], ['airframe.wing', 'airframe.wing.flap', 'systems.wing_deicing'])
+        self.assertIs(results[0][1], self.model.get_node('airframe.wing'))
+
+    def test_limit_and_early_termination(self):
+        self.assertEqual(len(list(self.model.iter_nodes({'type': 'surface'}, limit=1))), 1)
+        iterator = self.model.iter_nodes({'type': 'surface'})
+        self.assertEqual(next(iterator)[0], 'airframe.wing')
+
+    def test_under_scopes_the_walk(self):
+        paths = [path for path, _ in self.model.iter_nodes({'type': 'surface'}, under='airframe.wing')]
+        self.assertEqual(paths, ['airframe.wing', 'airframe.wing.flap'])
+        with self.assertRaises(NodeNotFoundError):
+            list(self.model.iter_nodes(under='airframe.missing'))
+
+    def test_under_with_index(self):
+        self.model.add_search_index('type')
+        paths = [path for path, _ in self.model.iter_nodes({'type': 'surface'}, under='airframe')]
+        self.assertEqual(paths, ['airframe.wing', 'airframe.wing.flap'])
+
+    def test_deep_tree_does_not_recurse(self):
+        path = '.'.join(f'level{i}' for i in range(sys.getrecursionlimit() + 100))
+        self.model.create_node(path, {'type': 'leaf'})
+        self.assertEqual([found for found, _ in self.model.iter_nodes({'type': 'leaf'})], [path])
+        self.assertEqual(len(self.model.search_nodes({'type': 'leaf'})), 1)
+
+
+class TestPersistentTree(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.wing', {'type': 'surface', 'flap': {'type': 'surface'}})
+        self.model.create_node('airframe.fuselage', {'type': 'body'})
+        self.model.enable_persistent_tree()
+
+    def test_nodes_are_immutable(self):
+        with self.assertRaises(TypeError):
+            self.model.get_node('airframe.wing')['type'] = 'body'
+
+    def test_changes_copy_only_the_changed_path(self):
+        root = self.model.adh_root
+        fuselage = self.model.get_node('airframe.fuselage')
+        self.model.update_node('airframe.wing.flap', {'type': 'slat'})
+        self.assertIsNot(self.model.adh_root, root)
+        self.assertIs(self.model.get_node('airframe.fuselage'), fuselage)
+        self.assertEqual(root['airframe']['wing']['flap'], {'type': 'surface'})
+        self.assertEqual(self.model.get_node('airframe.wing.flap'), {'type': 'slat'})
+
+    def test_copy_node_shares_the_subtree(self):
+        self.model.copy_node('airframe.wing', 'airframe.left_wing')
+        self.assertIs(self.model.get_node('airframe.left_wing'), self.model.get_node('airframe.wing'))
+        self.model.update_node('airframe.left_wing.flap', {'type': 'slat'})
+        self.assertEqual(self.model.get_node('airframe.wing.flap'), {'type': 'surface'})
+
+    def test_snapshot_is_independent(self):
+        snapshot = self.model.snapshot()
+        self.assertIs(snapshot.adh_root, self.model.adh_root)
+        self.model.delete_node('airframe.wing')
+        self.model.create_node('systems.hydraulics', {'pressure': 3000})
+        self.model.merge_nodes('systems', 'airframe')
+        self.assertEqual(snapshot.get_node('airframe'), {'wing': {'type': 'surface', 'flap': {'type': 'surface'}}, 'fuselage': {'type': 'body'}})
+        self.assertEqual(self.model.get_node('airframe.hydraulics'), {'pressure': 3000})
+
+    def test_indexes_follow_path_copies(self):
+        self.model.enable_path_index()
+        self.model.add_search_index('type')
+        self.model.create_node('airframe.wing.slat', {'type': 'surface'})
+        self.model.move_node('airframe.fuselage', 'body.fuselage')
+        self.assertIs(self.model.get_node('airframe.wing'), self.model.adh_root['airframe']['wing'])
+        paths = [node['_path'] for node in self.model.search_nodes({'type': 'surface'})]
+        self.assertEqual(paths, ['.airframe.wing', '.airframe.wing.flap', '.airframe.wing.slat'])
+        self.assertEqual(self.model.search_nodes({'type': 'body'})[0]['_path'], '.body.fuselage')
+
+    def test_disable_persistent_tree(self):
+        self.model.disable_persistent_tree()
+        self.model.get_node('airframe.wing')['type'] = 'body'
+        self.assertEqual(self.model.get_node('airframe.wing.type'), 'body')
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.wing', {'type': 'surface', 'flap': {'type': 'surface'}})
+        self.model.create_node('airframe.fuselage', {'type': 'body'})
+        self.model.create_node('alias', {})
+        self.model.link_nodes('alias', 'airframe.wing')
+
+    def snapshot(self):
+        return repr(self.model.adh_root), dict(self.model.aliases)
+
+    def test_apply_ops(self):
+        self.model.apply_ops([
+            ('create', 'systems.hydraulics.pump1', {'pressure': 3000}),
+            ('create', 'systems.hydraulics.pump2', {'pressure': 3000}),
+            ('update', 'alias.flap', {'type': 'slat'}),
+            ('move', 'airframe.fuselage', 'body.fuselage'),
+            ('merge', 'body', 'systems'),
+            ('delete', 'body'),
+        ])
+        self.assertEqual(self.model.get_node('systems.hydraulics'), {'pump1': {'pressure': 3000}, 'pump2': {'pressure': 3000}})
+        self.assertEqual(self.model.get_node('airframe.wing.flap'), {'type': 'slat'})
+        self.assertEqual(self.model.get_node('systems.fuselage'), {'type': 'body'})
+        self.assertIsNone(self.model.get_node('body'))
+
+    def test_apply_ops_follows_aliases(self):
+        self.model.apply_ops([
+            ('create', 'alias.slat', {'type': 'surface'}),
+            ('create', 'alias.tab.trim', {'type': 'surface'}),
+            ('update', 'alias.slat', {'type': 'slat'}),
+        ])
+        self.assertEqual(self.model.get_node('airframe.wing.slat'), {'type': 'slat'})
+        self.assertEqual(self.model.get_node('airframe.wing.tab.trim'), {'type': 'surface'})
+        self.assertEqual(self.model.adh_root['alias'], {})
+
+    def test_apply_ops_is_atomic(self):
+        before = self.snapshot()
+        for failing, error in ((('create', 'wing', {}), PathAlreadyExistsError),
+                               (('update', 'airframe.missing.part', {}), NodeNotFoundError),
+                               (('move', 'airframe.missing', 'elsewhere'), NodeNotFoundError),
+                               (('create', 'x', 'not a dict'), TypeError),
+                               (('rename', 'x', 'y'), ValueError)):
+            with self.subTest(failing=failing):
+                with self.assertRaises(error):
+                    self.model.apply_ops([
+                        ('create', 'systems.hydraulics', {'pressure': 3000}),
+                        ('update', 'airframe.wing.flap', {'type': 'slat'}),
+                        ('merge', 'systems', 'airframe'),
+                        ('move', 'airframe.wing', 'wing'),
+                        failing,
+                    ])
+                self.assertEqual(self.snapshot(), before)
+
+    def test_nested_batch_rolls_back_to_savepoint(self):
+        with self.model.batch():
+            self.model.create_node('systems.hydraulics', {'pressure': 3000})
+            with self.assertRaises(NodeNotFoundError):
+                with self.model.batch():
+                    self.model.delete_node('airframe.wing')
+                    self.model.delete_node('airframe.wing')
+            self.assertEqual(self.model.get_node('airframe.wing.type'), 'surface')
+        self.assertEqual(self.model.get_node('systems.hydraulics'), {'pressure': 3000})
+
+    def test_rollback_restores_lists_merged_by_key(self):
+        self.model.create_node('parts', {'items': [{'id': 1, 'v': 'a', 'spec': {'grade': 1}}]})
+        self.model.create_node('incoming', {'items': [{'id': 1, 'v': 'b', 'spec': {'grade': 2}}, {'id': 2}]})
+        with self.assertRaises(NodeNotFoundError):
+            with self.model.batch():
+                self.model.merge_nodes('incoming', 'parts', policy='list-by-key', list_key='id')
+                self.assertEqual(self.model.get_node('parts.items'),
+                                 [{'id': 1, 'v': 'b', 'spec': {'grade': 2}}, {'id': 2}])
+                self.model.delete_node('missing')
+        self.assertEqual(self.model.get_node('parts'), {'items': [{'id': 1, 'v': 'a', 'spec': {'grade': 1}}]})
+
+    def test_rollback_keeps_indexes_current(self):
+        for persistent in (False, True):
+            with self.subTest(persistent=persistent):
+                self.setUp()
+                if persistent:
+                    self.model.enable_persistent_tree()
+                self.model.enable_path_index()
+                self.model.add_search_index('type')
+                with self.assertRaises(PathAlreadyExistsError):
+                    with self.model.batch():
+                        self.model.create_node('systems.pump', {'type': 'surface'})
+                        self.model.delete_node('airframe.fuselage')
+                        self.model.merge_nodes('systems', 'airframe.wing')
+                        self.model.create_node('airframe.wing', {})
+                self.assertEqual([node['_path'] for node in self.model.search_nodes({'type': 'surface'})], ['.airframe.wing', '.airframe.wing.flap', '.alias', '.alias.flap'])
+                self.assertEqual(self.model.get_node('airframe.fuselage'), {'type': 'body'})
+                self.assertIs(self.model.get_node('airframe.wing'), self.model.adh_root['airframe']['wing'])
+
+
 class TestMetadata(unittest.TestCase):
 
     def test_metadata_creation(self):
@@ -0,0 +1,169 @@
+import copy
+import pickle
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.concurrency import LockUpgradeError, PathLockManager
+
+class TestPathLockManager(unittest.TestCase):
+
+    def setUp(self):
+        self.locks = PathLockManager()
+
+    def run_in_thread(self, paths):
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with self.locks.hold(paths):
+                acquired.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        return thread, acquired, release
+
+    def assert_blocks(self, held, requested, blocked):
+        thread, acquired, release = self.run_in_thread(held)
+        self.assertTrue(acquired.wait(5))
+        other, other_acquired, other_release = self.run_in_thread(requested)
+        self.assertEqual(other_acquired.wait(0.1), not blocked)
+        release.set()
+        self.assertTrue(other_acquired.wait(5))
+        other_release.set()
+        thread.join()
+        other.join()
+
+    def test_compatibility(self):
+        self.assert_blocks([('airframe', False)], [('airframe.wing', False)], blocked=False)
+        self.assert_blocks([('airframe', True)], [('systems', True)], blocked=False)
+        self.assert_blocks([('airframe.wing', True)], [('airframe.fuselage', False)], blocked=False)
+        self.assert_blocks([('airframe', True)], [('airframe.wing', False)], blocked=True)
+        self.assert_blocks([('airframe.wing', True)], [('airframe', False)], blocked=True)
+        self.assert_blocks([('airframe', False)], [('', True)], blocked=True)
+
+    def test_reentrant_and_upgrade(self):
+        with self.locks.hold([('airframe', True)]):
+            with self.locks.hold([('airframe.wing', False), ('airframe.tail', True)]):
+                pass
+        with self.locks.hold([('airframe', False)]):
+            with self.assertRaises(LockUpgradeError):
+                with self.locks.hold([('airframe.wing', True)]):
+                    pass
+        self.assertEqual(self.locks._counts, {})
+
+
+class TestConcurrentAccess(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.wing', {'type': 'surface'})
+        self.model.create_node('systems.pump', {'type': 'pump'})
+        self.model.enable_concurrent_access()
+
+    def test_writer_only_blocks_its_subtree(self):
+        writing = threading.Event()
+        release = threading.Event()
+
+        def write():
+            with self.model.write_lock('airframe'):
+                writing.set()
+                release.wait(5)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        self.assertTrue(writing.wait(5))
+        with ThreadPoolExecutor(2) as pool:
+            self.assertEqual(pool.submit(self.model.get_node, 'systems.pump').result(5), {'type': 'pump'})
+            blocked = pool.submit(self.model.get_node, 'airframe.wing')
+            with self.assertRaises(TimeoutError):
+                blocked.result(0.1)
+            release.set()
+            self.assertEqual(blocked.result(5), {'type': 'surface'})
+        writer.join()
+
+    def test_writers_of_disjoint_subtrees_run_together(self):
+        self.model.enable_path_index()
+        both_writing = threading.Barrier(2, timeout=5)
+
+        def write(path):
+            with self.model.write_lock(path):
+                self.model.create_node(f'{path}.node', {'type': 'part'})
+                both_writing.wait()
+                self.model.update_node(f'{path}.node', {'type': 'spare'})
+
+        with ThreadPoolExecutor(2) as pool:
+            for future in [pool.submit(write, 'airframe'), pool.submit(write, 'systems')]:
+                future.result(5)
+        self.assertEqual(self.model.get_node('airframe.node'), {'type': 'spare'})
+        self.assertEqual(self.model.get_node('systems.node'), {'type': 'spare'})
+
+    def test_parallel_writers_keep_indexes_consistent(self):
+        self.model.enable_path_index()
+        self.model.add_search_index('type')
+
+        def work(worker):
+            for index in range(200):
+                self.model.create_node(f'branch{worker}.node{index}', {'type': 'part'})
+                self.model.get_node(f'branch{worker}.node{index}')
+                if index % 2:
+                    self.model.delete_node(f'branch{worker}.node{index}')
+            return len(self.model.search_nodes({'type': 'part'}))
+
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(work, range(4)))
+        self.assertEqual(len(self.model.search_nodes({'type': 'part'})), 400)
+        self.assertEqual(self.model.__pydantic_private__['_adh_state'].locks._counts, {})
+
+    def test_scoped_readers_and_writers_share_caches(self):
+        self.model.add_search_index('type')
+        for index in range(2000):
+            self.model.create_node(f'readers.node{index}', {'type': 'part'})
+
+        def write(worker):
+            for index in range(300):
+                self.model.create_node(f'writers{worker}.node{index}', {'type': 'part'})
+                self.model.delete_node(f'writers{worker}.node{index}')
+
+        def read(worker):
+            for index in range(20):
+                self.assertEqual(len(list(self.model.iter_nodes({'type': 'part'}, under='readers'))), 2000)
+                self.model.subtree_hash(f'readers.node{index}')
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        try:
+            with ThreadPoolExecutor(4) as pool:
+                futures = [pool.submit(write, 0), pool.submit(write, 1), pool.submit(read, 0), pool.submit(read, 1)]
+                for future in futures:
+                    future.result()
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_deep_copies_and_pickles_leave_the_locks_behind(self):
+        self.model.enable_path_index()
+        duplicates = [self.model.model_copy(deep=True), copy.deepcopy(self.model), pickle.loads(pickle.dumps(self.model))]
+        for duplicate in duplicates:
+            self.assertEqual(duplicate, self.model)
+            self.assertIsNone(duplicate.__pydantic_private__['_adh_state'])
+            duplicate.create_node('airframe.tail', {'type': 'surface'})
+            self.assertEqual(duplicate.get_node('airframe.tail'), {'type': 'surface'})
+            self.assertIsNone(self.model.get_node('airframe.tail'))
+
+    def test_write_under_own_read_lock_raises(self):
+        with self.model.read_lock('airframe'):
+            self.assertEqual(self.model.get_node('airframe.wing'), {'type': 'surface'})
+            with self.assertRaises(LockUpgradeError):
+                self.model.create_node('airframe.tail', {})
+
+    def test_batch_and_iteration(self):
+        self.model.link_nodes('systems.pump', 'airframe.wing')
+        self.model.apply_ops([('create', 'systems.valve', {'type': 'valve'}), ('delete', 'airframe.wing')])
+        self.assertEqual([path for path, _ in self.model.iter_nodes(under='systems')], ['systems', 'systems.pump', 'systems.valve'])
+        self.assertEqual(self.model.aliases, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
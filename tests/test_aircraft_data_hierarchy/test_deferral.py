@@ -0,0 +1,137 @@
+import unittest
+from pydantic import ValidationError, field_validator, model_validator
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.deferral import deferred_validation
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe_parameters import Body, ConfigurationLayout
+
+LISTS = ['stations', 'cross_sectional_areas', 'cross_sectional_perimeters', 'max_halfbredth', 'crown_line', 'keel_line']
+
+class Counted(CommonBaseModel):
+    low: float = 0.0
+    high: float = 1.0
+
+    @model_validator(mode='after')
+    def check_order(self):
+        Counted.checks_run += 1
+        if self.low > self.high:
+            raise ValueError('low must not exceed high')
+        return self
+
+Counted.checks_run = 0
+
+class Derived(CommonBaseModel):
+    low: float = 0.0
+    high: float = 1.0
+    width: float = 1.0
+
+    @model_validator(mode='after')
+    def derive_width(self):
+        self.__dict__['width'] = self.high - self.low
+        return self
+
+class Ranged(CommonBaseModel):
+    low: float = 0.0
+    high: float = 1.0
+    label: str = ''
+    material: str = ''
+
+    @field_validator('low', 'high', 'label', 'material')
+    @classmethod
+    def count_checks(cls, value, info):
+        Ranged.checked.append(info.field_name)
+        if info.field_name == 'high' and value < info.data.get('low', 0.0):
+            raise ValueError('high must not be below low')
+        return value
+
+Ranged.checked = []
+
+class TestDeferredValidation(unittest.TestCase):
+
+    def test_assignments_are_validated_once_on_exit(self):
+        model = Counted()
+        Counted.checks_run = 0
+        with model.deferred_validation():
+            model.low = '5'
+            model.high = '10'
+            self.assertEqual(model.low, '5')
+            self.assertEqual(Counted.checks_run, 0)
+        self.assertEqual(Counted.checks_run, 1)
+        self.assertEqual((model.low, model.high), (5.0, 10.0))
+        self.assertEqual(model.model_fields_set, {'low', 'high'})
+        self.assertNotIn('_adh_deferred', model.__dict__)
+
+        model.low = 6
+        self.assertEqual(Counted.checks_run, 2)
+        with self.assertRaises(ValidationError):
+            model.low = 20
+
+    def test_dependent_fields_can_be_updated_in_any_order(self):
+        body = Body(qty_cross_sections=2, **{name: [1.0, 2.0] for name in LISTS})
+        with self.assertRaises(ValidationError):
+            body.qty_cross_sections = 3
+        with body.deferred_validation():
+            body.qty_cross_sections = 3
+            for name in LISTS:
+                setattr(body, name, [1, 2, 3])
+        self.assertEqual(body.stations, [1.0, 2.0, 3.0])
+
+    def test_invalid_models_undo_every_assignment(self):
+        layout = ConfigurationLayout(model_scale=1.0)
+        bounds = Counted()
+        with self.assertRaises(ValidationError) as raised:
+            with deferred_validation(layout, bounds):
+                layout.model_scale = 2.0
+                layout.wing_apex_station = 10.0
+                bounds.low = 2.0
+        self.assertEqual(raised.exception.title, 'Counted')
+        self.assertEqual(layout.model_scale, 1.0)
+        self.assertIsNone(layout.wing_apex_station)
+        self.assertEqual(layout.model_fields_set, {'model_scale'})
+        self.assertEqual(bounds.low, 0.0)
+
+        with self.assertRaises(KeyError):
+            with layout.deferred_validation(bounds):
+                layout.model_scale = 3.0
+                raise KeyError('stop')
+        self.assertEqual(layout.model_scale, 1.0)
+
+    def test_changes_made_by_model_validators_are_kept(self):
+        model = Derived(adh_root={'wing': {'span': 30}})
+        root = model.adh_root
+        with model.deferred_validation():
+            model.low = 2.0
+            model.high = 5.0
+        self.assertEqual(model.width, 3.0)
+        self.assertIn('width', model.model_fields_set)
+        self.assertIs(model.adh_root, root)
+
+    def test_only_assigned_fields_are_validated_without_model_validators(self):
+        model = Ranged(low=5.0, high=6.0, label='wing', material='CFRP')
+        Ranged.checked = []
+        with model.deferred_validation():
+            model.high = '10'
+        self.assertEqual(Ranged.checked, ['high'])
+        self.assertEqual(model.high, 10.0)
+
+        with self.assertRaises(ValidationError):
+            with model.deferred_validation():
+                model.high = 1.0
+        self.assertEqual(model.high, 10.0)
+
+        Ranged.checked = []
+        with model.deferred_validation():
+            model.label = 'tail'
+            model.high = '12'
+        self.assertEqual(sorted(Ranged.checked), ['high', 'label', 'low', 'material'])
+        self.assertEqual((model.label, model.high), ('tail', 12.0))
+
+    def test_nested_blocks_validate_on_outer_exit(self):
+        model = Counted()
+        with model.deferred_validation():
+            with model.deferred_validation():
+                model.low = 3.0
+            model.high = 4.0
+        self.assertEqual((model.low, model.high), (3.0, 4.0))
+
+if __name__ == '__main__':
+    unittest.main()
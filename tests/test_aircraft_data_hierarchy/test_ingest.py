@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, PathAlreadyExistsError
+from aircraft_data_hierarchy.ingest import chunked, csv_rows
+from aircraft_data_hierarchy.storage import DiskNodeStore
+
+class TestIngestNodes(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel(adh_root={'airframe': {'wing': {'span': 30}}})
+
+    def test_rows_are_created_in_path_order(self):
+        rows = [
+            ('systems.hydraulics.pump', {'pressure': 3000}),
+            ('airframe.wing.rib2', {'mass': 2}),
+            ('airframe.wing.rib1', {'mass': 1}),
+            ('systems.hydraulics', {'fluid': 'skydrol'}),
+            ('airframe.wing.rib1.bolt', {'count': 12}),
+            ('top', {}),
+        ]
+        self.assertEqual(self.model.ingest_nodes(iter(rows), chunk_size=4), 6)
+        self.assertEqual(self.model.get_node('airframe.wing'),
+                         {'span': 30, 'rib1': {'mass': 1, 'bolt': {'count': 12}}, 'rib2': {'mass': 2}})
+        self.assertEqual(self.model.get_node('systems.hydraulics'), {'fluid': 'skydrol', 'pump': {'pressure': 3000}})
+        self.assertEqual(self.model.get_node('top'), {})
+
+    def test_indexes_and_journal_follow_ingestion(self):
+        self.model.enable_path_index()
+        self.model.add_search_index('type')
+        journal = self.model.enable_journal()
+        self.model.ingest_nodes([('fleet.a1', {'type': 'jet'}), ('fleet.a2', {'type': 'jet'})])
+        self.assertEqual(len(self.model.search_nodes({'type': 'jet'})), 2)
+        self.assertEqual(self.model.get_node('fleet.a2.type'), 'jet')
+        self.assertEqual([(record.op, record.path) for record in journal.since(0)],
+                         [('create', 'fleet.a1'), ('create', 'fleet.a2')])
+
+    def test_rows_follow_aliases(self):
+        self.model.create_node('shortcut', {})
+        self.model.link_nodes('shortcut', 'airframe.wing')
+        journal = self.model.enable_journal()
+        self.model.ingest_nodes([('shortcut.rib1', {'mass': 1}), ('shortcut.rib1.bolt', {'count': 12}),
+                                 ('shortcut.tip.light', {})])
+        self.assertEqual(self.model.get_node('airframe.wing'),
+                         {'span': 30, 'rib1': {'mass': 1, 'bolt': {'count': 12}}, 'tip': {'light': {}}})
+        self.assertEqual(self.model.adh_root['shortcut'], {})
+        self.assertEqual([record.path for record in journal.since(0)],
+                         ['airframe.wing.rib1', 'airframe.wing.rib1.bolt', 'airframe.wing.tip.light'])
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.ingest_nodes([('shortcut.rib2', {}), ('shortcut.rib1', {})])
+        self.assertNotIn('rib2', self.model.get_node('airframe.wing'))
+
+    def test_failed_ingestion_is_undone(self):
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.ingest_nodes([('airframe.tail', {}), ('fleet.a1', {}), ('airframe.wing', {})], chunk_size=2)
+        self.assertEqual(self.model.adh_root, {'airframe': {'wing': {'span': 30}}})
+        with self.assertRaises(TypeError):
+            self.model.ingest_nodes([('airframe.wing.span.unit', {})])
+        with self.assertRaises(TypeError):
+            self.model.ingest_nodes([('airframe.tail', ['not', 'a', 'node'])])
+        with self.assertRaises(ValueError):
+            self.model.ingest_nodes([], chunk_size=0)
+
+    def test_persistent_and_stored_trees(self):
+        self.model.enable_persistent_tree()
+        self.model.ingest_nodes([('airframe.tail.fin', {'height': 5}), ('airframe.tail', {'span': 8})])
+        self.assertEqual(self.model.get_node('airframe.tail'), {'span': 8, 'fin': {'height': 5}})
+
+        store = DiskNodeStore()
+        model = CommonBaseModel()
+        model.attach_store(store)
+        model.ingest_nodes([('b.c', {'x': 1}), ('a', {'y': 2})])
+        self.assertEqual(model.get_node('b'), {'c': {'x': 1}})
+        self.assertEqual(model.get_node('a'), {'y': 2})
+        store.close()
+
+    def test_chunks_are_sorted(self):
+        self.assertEqual([[path for path, _ in chunk] for chunk in chunked([('b', {}), ('a', {}), ('c', {})], 2)],
+                         [['a', 'b'], ['c']])
+
+class TestIngestCsv(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', newline='') as file:
+            file.write(text)
+        return path
+
+    def test_csv_and_tsv_files(self):
+        model = CommonBaseModel()
+        csv_path = self.write('parts.csv', 'part_no,path,mass\nP1,airframe.wing.rib1,1.5\nP2,airframe.wing.rib2,\n\n')
+        self.assertEqual(model.ingest_csv(csv_path, converters={'mass': float}), 2)
+        self.assertEqual(model.get_node('airframe.wing'), {'rib1': {'part_no': 'P1', 'mass': 1.5}, 'rib2': {'part_no': 'P2'}})
+
+        tsv_path = self.write('loads.tsv', 'node\tcase\tvalue\nloads.wing.c1\tgust\t"1,200"\n')
+        self.assertEqual(model.ingest_csv(tsv_path, path_column='node'), 1)
+        self.assertEqual(model.get_node('loads.wing.c1'), {'case': 'gust', 'value': '1,200'})
+
+    def test_invalid_files(self):
+        with self.assertRaises(ValueError):
+            list(csv_rows(self.write('a.csv', 'name,mass\nP1,1\n')))
+        with self.assertRaises(ValueError):
+            list(csv_rows(self.write('b.csv', 'path,mass\n,1\n')))
+        model = CommonBaseModel()
+        with self.assertRaises(ValueError):
+            model.ingest_csv(self.write('c.csv', 'path,mass\na,1\nb,heavy\n'), converters={'mass': float})
+        self.assertEqual(model.adh_root, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, NodeNotFoundError
+from aircraft_data_hierarchy.instrumentation import LatencyHistogram, OperationMetrics
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_buckets_and_quantiles(self):
+        histogram = LatencyHistogram((0.001, 0.01, 0.1))
+        for seconds in (0.0005, 0.001, 0.005, 0.005, 0.5):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.counts, [2, 2, 0, 1])
+        self.assertEqual(histogram.cumulative(), [(0.001, 2), (0.01, 4), (0.1, 4), (float('inf'), 5)])
+        self.assertAlmostEqual(histogram.total, 0.5115)
+        self.assertAlmostEqual(histogram.quantile(0.2), 0.0005)
+        self.assertAlmostEqual(histogram.quantile(0.6), 0.0055)
+        self.assertEqual(histogram.quantile(1), 0.1)
+        self.assertEqual(LatencyHistogram().quantile(0.5), 0.0)
+        with self.assertRaises(ValueError):
+            histogram.quantile(2)
+
+class TestOperationMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel(adh_root={'airframe': {'wing': {'span': 30, 'type': 'surface'}}, 'systems': {}})
+        self.metrics = self.model.enable_instrumentation()
+
+    def test_calls_are_recorded_by_operation_and_prefix(self):
+        self.model.get_node('airframe.wing')
+        self.model.get_node('airframe.wing.span')
+        self.model.create_node('systems.hydraulics', {'pressure': 3000})
+        self.model.update_node(path='systems.hydraulics', data={'pressure': 5000})
+        self.model.search_nodes({'type': 'surface'})
+        with self.assertRaises(NodeNotFoundError):
+            self.model.delete_node('cabin')
+        self.assertEqual({key: histogram.count for key, histogram in self.metrics.histograms.items()}, {
+            ('get_node', 'airframe'): 2,
+            ('create_node', 'systems'): 1,
+            ('update_node', 'systems'): 1,
+            ('search_nodes', ''): 1,
+            ('iter_nodes', ''): 1,
+            ('delete_node', 'cabin'): 1,
+        })
+        self.assertIs(self.model.enable_instrumentation(prefix_depth=3), self.metrics)
+        operations = self.metrics.operations()
+        self.assertEqual(operations['get_node'].count, 2)
+        self.assertGreaterEqual(operations['search_nodes'].total, operations['iter_nodes'].total)
+        self.assertEqual([entry[:2] for entry in self.metrics.hot_spots(limit=None)
+                          if entry[0] == 'get_node'], [('get_node', 'airframe')])
+
+    def test_prefix_depth(self):
+        metrics = OperationMetrics(prefix_depth=2)
+        self.assertEqual(metrics.prefix('airframe.wing.rib1'), 'airframe.wing')
+        self.assertEqual(metrics.prefix('airframe'), 'airframe')
+        self.assertEqual(metrics.prefix(None), '')
+        self.assertEqual(OperationMetrics(prefix_depth=0).prefix('airframe.wing'), '')
+        with self.assertRaises(ValueError):
+            OperationMetrics(prefix_depth=-1)
+        with self.assertRaises(ValueError):
+            OperationMetrics(bounds=(0.1, 0.01))
+
+    def test_iteration_is_recorded_when_closed(self):
+        iterator = self.model.iter_nodes(under='airframe')
+        next(iterator)
+        self.assertNotIn(('iter_nodes', 'airframe'), self.metrics.histograms)
+        iterator.close()
+        self.assertEqual(self.metrics.histograms[('iter_nodes', 'airframe')].count, 1)
+        self.assertEqual(len(list(self.model.iter_nodes())), 4)
+        self.assertEqual(self.metrics.histograms[('iter_nodes', '')].count, 1)
+
+    def test_disabled_instrumentation(self):
+        self.model.disable_instrumentation()
+        self.model.get_node('airframe')
+        self.assertEqual(self.metrics.histograms, {})
+        CommonBaseModel().disable_instrumentation()
+
+    def test_node_methods_are_only_guarded_once_enabled(self):
+        # A fresh interpreter, since the other tests have already enabled instrumentation
+        script = ('from aircraft_data_hierarchy.common_base_model import CommonBaseModel\n'
+                  'before = hasattr(CommonBaseModel.get_node, "__wrapped__")\n'
+                  'CommonBaseModel().enable_instrumentation()\n'
+                  'print(before, hasattr(CommonBaseModel.get_node, "__wrapped__"))')
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False', 'True'])
+
+    def test_concurrent_recording(self):
+        self.model.enable_concurrent_access()
+        threads = [threading.Thread(target=lambda: [self.model.get_node('airframe.wing') for _ in range(200)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.metrics.histograms[('get_node', 'airframe')].count, 800)
+
+    def test_exports(self):
+        self.model.get_node('airframe.wing')
+        self.model.apply_ops([('create', 'systems.fuel', {'capacity': 100}), ('delete', 'systems.fuel')])
+        metrics = self.metrics.as_dict()
+        self.assertEqual(set(metrics), {'get_node', 'apply_ops', 'delete_node'})
+        self.assertEqual(metrics['get_node']['count'], 1)
+        self.assertEqual(metrics['get_node']['buckets'][float('inf')], 1)
+        self.assertEqual(list(metrics['get_node']['prefixes']), ['airframe'])
+        self.assertEqual(metrics['apply_ops']['prefixes']['']['count'], 1)
+
+        text = self.metrics.to_prometheus()
+        self.assertIn('# TYPE adh_operation_duration_seconds histogram', text)
+        self.assertIn('adh_operation_duration_seconds_bucket{operation="get_node",prefix="airframe",le="+Inf"} 1', text)
+        self.assertIn('adh_operation_duration_seconds_count{operation="get_node",prefix="airframe"} 1', text)
+        self.assertIn('adh_operation_duration_seconds_sum{operation="apply_ops",prefix=""} ', text)
+
+        path = os.path.join(tempfile.mkdtemp(), 'adh.prom')
+        self.metrics.write_prometheus(path, name='pipeline_adh_seconds')
+        with open(path) as file:
+            self.assertIn('pipeline_adh_seconds_count{operation="delete_node",prefix="systems"} 1', file.read())
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.as_dict(), {})
+
+if __name__ == '__main__':
+    unittest.main()
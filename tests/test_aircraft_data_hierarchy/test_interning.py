@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import unittest
+from typing import List, Optional
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata
+from aircraft_data_hierarchy.interning import InternTable
+from aircraft_data_hierarchy.loader import load_lazy
+
+def parsed(value):
+    # Parsing each value separately gives distinct string objects, as loading or importing nodes does
+    return json.loads(json.dumps(value))
+
+class Part(CommonBaseModel):
+    units: str = 'ft'
+    metadata: Optional[Metadata] = None
+    tags: List[Metadata] = []
+
+class TestInterning(unittest.TestCase):
+
+    def test_existing_tree_is_interned(self):
+        model = CommonBaseModel(adh_root={f'part{i}': parsed({'units': 'ft', 'status': 'released'}) for i in range(10)})
+        first, second = model.get_node('part0'), model.get_node('part1')
+        self.assertIsNot(first['units'], second['units'])
+
+        table = model.enable_interning()
+        self.assertIs(first['units'], second['units'])
+        self.assertIs(next(iter(first)), next(iter(second)))
+        self.assertEqual(table.replaced, 9 * 4)
+        self.assertGreater(table.bytes_saved, 0)
+        self.assertIs(model.enable_interning(), table)
+
+    def test_created_nodes_are_interned(self):
+        model = CommonBaseModel()
+        model.enable_interning()
+        model.create_node('wing', parsed({'units': 'ft', 'loads': [{'units': 'ft'}]}))
+        model.create_node('tail', parsed({'units': 'ft'}))
+        model.update_node('tail', parsed({'units': 'ft', 'spar': {'units': 'ft'}}))
+        units = model.get_node('wing.units')
+        self.assertIs(model.get_node('wing.loads')[0]['units'], units)
+        self.assertIs(model.get_node('tail.units'), units)
+        self.assertIs(model.get_node('tail.spar.units'), units)
+
+        model.disable_interning()
+        model.create_node('fin', parsed({'units': 'ft'}))
+        self.assertIsNot(model.get_node('fin.units'), units)
+
+    def test_equal_metadata_is_shared(self):
+        parts = Part(metadata=Metadata(key='owner', value='airframe'),
+                     tags=[Metadata(key='owner', value='airframe'), Metadata(key='owner', value='systems'),
+                           Metadata(key='owner', value=['airframe']), Metadata(key='owner', value='airframe')])
+        table = parts.enable_interning()
+        self.assertIs(parts.tags[0], parts.metadata)
+        self.assertIs(parts.tags[3], parts.metadata)
+        self.assertIsNot(parts.tags[1], parts.metadata)
+        self.assertIs(parts.tags[1].key, parts.metadata.key)
+        self.assertEqual(parts.tags[2].value, ['airframe'])
+        self.assertEqual(table.replaced, 2)
+
+    def test_shared_models_require_equal_values_and_types(self):
+        table = InternTable((Metadata,))
+        one = Metadata(key='count', value=1)
+        self.assertIs(table.intern_model(Metadata(key='count', value=1)), table.intern_model(one))
+        self.assertIsNot(table.intern_model(Metadata(key='count', value=1.0)), one)
+        self.assertIsNot(table.intern_model(Metadata(key='count', value=True)), one)
+
+    def test_lazy_subtrees_are_interned_when_parsed(self):
+        source = CommonBaseModel(adh_root={f'part{i}': {'units': 'ft'} for i in range(3)})
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as file:
+            file.write(source.model_dump_json())
+        try:
+            model = load_lazy(path, CommonBaseModel)
+            model.get_node('part0')
+            model.enable_interning()
+            self.assertEqual(model.adh_root.pending, 2)
+            self.assertIs(model.get_node('part2.units'), model.get_node('part0.units'))
+            self.assertIs(model.get_node('part1.units'), model.get_node('part0.units'))
+        finally:
+            os.remove(path)
+
+    def test_persistent_tree_is_interned(self):
+        model = CommonBaseModel(adh_root={f'part{i}': parsed({'units': 'ft'}) for i in range(3)})
+        model.enable_persistent_tree()
+        model.enable_interning()
+        model.create_node('part3', parsed({'units': 'ft'}))
+        self.assertIs(model.get_node('part3.units'), model.get_node('part0.units'))
+        self.assertIs(model.get_node('part1.units'), model.get_node('part0.units'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, PathAlreadyExistsError
+from aircraft_data_hierarchy.journal import ChangeJournal
+
+class TestChangeJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.wing', {'type': 'surface'})
+        self.journal = self.model.enable_journal()
+
+    def test_records_node_operations(self):
+        wing = self.model.get_node('airframe.wing')
+        self.model.update_node('airframe.wing', {'type': 'lifting'})
+        self.model.copy_node('airframe.wing', 'airframe.tail')
+        self.model.move_node('airframe.tail', 'empennage.tail')
+        self.model.merge_nodes('empennage', 'airframe')
+        self.model.link_nodes('airframe.tail', 'airframe.wing')
+        self.model.unlink_nodes('airframe.tail')
+        self.model.delete_node('empennage')
+        records = self.journal.since(0)
+        self.assertEqual([(record.seq, record.op, record.path, record.source) for record in records], [
+            (1, 'update', 'airframe.wing', None),
+            (2, 'copy', 'airframe.tail', 'airframe.wing'),
+            (3, 'move', 'empennage.tail', 'airframe.tail'),
+            (4, 'merge', 'airframe', 'empennage'),
+            (5, 'link', 'airframe.tail', None),
+            (6, 'unlink', 'airframe.tail', None),
+            (7, 'delete', 'empennage', None),
+        ])
+        self.assertIs(records[0].old, wing)
+        self.assertIs(records[0].new, self.model.get_node('airframe.wing'))
+        self.assertEqual(records[4].new, 'airframe.wing')
+        self.assertEqual([record.seq for record in self.journal.since(5)], [6, 7])
+
+    def test_maxlen_keeps_recent_records(self):
+        journal = ChangeJournal(maxlen=2)
+        for index in range(5):
+            journal.append('create', f'node{index}')
+        self.assertEqual([record.seq for record in journal.since(0)], [4, 5])
+        self.assertEqual(journal.last_seq, 5)
+
+    def test_prefix_subscribers(self):
+        received = []
+        subscription = self.journal.subscribe('airframe.wing', received.append)
+        self.model.create_node('airframe.wing.flap', {'type': 'surface'})
+        self.model.create_node('systems.pump', {'type': 'pump'})
+        self.model.move_node('airframe', 'fuselage')
+        self.journal.unsubscribe(subscription)
+        self.model.delete_node('fuselage')
+        self.assertEqual([(record.op, record.path) for record in received], [('create', 'airframe.wing.flap'), ('move', 'fuselage')])
+
+    def test_batches_publish_on_commit_only(self):
+        received = []
+        self.journal.subscribe('', received.append)
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.apply_ops([('create', 'systems.pump', {}), ('create', 'airframe.wing', {})])
+        self.assertEqual(received, [])
+        with self.model.batch():
+            self.model.create_node('systems.pump', {})
+            self.assertEqual(received, [])
+        self.assertEqual([(record.seq, record.op) for record in received], [(1, 'create')])
+
+    def test_asyncio_queue(self):
+        async def consume():
+            queue = self.journal.subscribe_queue('systems')
+            self.model.create_node('systems.pump', {'type': 'pump'})
+            self.model.create_node('airframe.tail', {'type': 'surface'})
+            record = await asyncio.wait_for(queue.get(), 1)
+            self.assertTrue(queue.empty())
+            return record
+        record = asyncio.run(consume())
+        self.assertEqual((record.op, record.path), ('create', 'systems.pump'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import importlib
+import inspect
+import pkgutil
+import subprocess
+import sys
+import unittest
+import aircraft_data_hierarchy
+
+PACKAGES = ['aircraft_data_hierarchy', 'aircraft_data_hierarchy.work_breakdown_structure',
+            'aircraft_data_hierarchy.work_breakdown_structure.airframe',
+            'aircraft_data_hierarchy.work_breakdown_structure.systems',
+            'aircraft_data_hierarchy.work_breakdown_structure.propulsion']
+
+def loaded_after(statement, *modules):
+    """Return the modules among ``modules`` that a fresh interpreter has loaded after running a statement."""
+    script = f'{statement}\nimport sys\nprint(" ".join(name for name in {modules!r} if name in sys.modules))'
+    return subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout.split()
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_modules_are_loaded_on_first_use(self):
+        heavy = ('graphviz', 'tabulate', 'IPython', 'numpy', 'asyncio', 'aircraft_data_hierarchy.common_base_model',
+                 'aircraft_data_hierarchy.behavior', 'aircraft_data_hierarchy.work_breakdown_structure.work_breakdown_structure')
+        self.assertEqual(loaded_after('import aircraft_data_hierarchy', *heavy), [])
+        self.assertEqual(loaded_after('import aircraft_data_hierarchy\nhasattr(aircraft_data_hierarchy, "NoSuchModel")', *heavy), [])
+        # Building a model may load some of them for pydantic itself, as asyncio on Python 3.8
+        pydantic_only = loaded_after('from pydantic import BaseModel\nclass Model(BaseModel):\n    x: int = 0', *heavy)
+        self.assertEqual(loaded_after('from aircraft_data_hierarchy import CommonBaseModel', *heavy),
+                         [name for name in heavy if name in pydantic_only or name.endswith('common_base_model')])
+        self.assertEqual(loaded_after('from aircraft_data_hierarchy.work_breakdown_structure.systems import System',
+                                      'graphviz', 'tabulate', 'IPython'), [])
+
+    def test_exports_match_the_defining_modules(self):
+        for package_name in PACKAGES:
+            package = importlib.import_module(package_name)
+            for name in package.__all__:
+                owner = package._EXPORTS
+                module = next(module for module, names in owner.items() if name in names)
+                self.assertIs(getattr(package, name), getattr(importlib.import_module(f'{package_name}.{module}'), name))
+
+    def test_every_public_class_and_function_is_exported(self):
+        # Generic names, such as the predicate classes of the query module, are only reachable from the package
+        exported = set(aircraft_data_hierarchy.__all__) | {name for names in aircraft_data_hierarchy._LEGACY.values() for name in names}
+        package_path = aircraft_data_hierarchy.__path__
+        for info in pkgutil.walk_packages(package_path, 'aircraft_data_hierarchy.'):
+            module = importlib.import_module(info.name)
+            if info.ispkg or info.name.endswith('lazy_import'):
+                continue
+            for name, value in vars(module).items():
+                if (not name.startswith('_') and (inspect.isclass(value) or inspect.isfunction(value))
+                        and value.__module__ == info.name):
+                    self.assertIn(name, exported, info.name)
+
+    def test_other_names_and_submodules_stay_reachable(self):
+        from aircraft_data_hierarchy import Optional
+        from typing import Optional as typing_optional
+        self.assertIs(Optional, typing_optional)
+        from aircraft_data_hierarchy import And
+        from aircraft_data_hierarchy.query import And as query_and
+        self.assertIs(And, query_and)
+        self.assertNotIn('And', aircraft_data_hierarchy.__all__)
+        self.assertNotIn('And', dir(aircraft_data_hierarchy.work_breakdown_structure))
+        self.assertEqual(aircraft_data_hierarchy.binary.__name__, 'aircraft_data_hierarchy.binary')
+        self.assertIn('CommonBaseModel', dir(aircraft_data_hierarchy))
+        with self.assertRaises(AttributeError):
+            aircraft_data_hierarchy.NoSuchModel
+        with self.assertRaises(ImportError):
+            from aircraft_data_hierarchy import NoSuchModel
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import pickle
+import unittest
+from typing import List, Optional
+from pydantic import ValidationError, model_validator
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata
+from aircraft_data_hierarchy.lazy_validation import PENDING_KEY
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe import Component
+
+REQUIREMENT = {'name': 'strength', 'description': 'Carry the design loads', 'priority': 'high',
+               'verification_method': 'test', 'status': 'open', 'acceptance_criteria': 'No yield at limit load'}
+
+class Checked(CommonBaseModel):
+    parts: Optional[List[Metadata]] = None
+
+    @model_validator(mode='after')
+    def check(self):
+        return self
+
+def component_data():
+    return {'name': 'wing', 'description': 'Main wing', 'metadata': {'key': 'source', 'value': 'CAD'},
+            'requirements': [REQUIREMENT],
+            'subcomponents': [{'name': 'spar', 'requirements': [REQUIREMENT],
+                               'subcomponents': [{'name': 'web', 'performance': [{'name': 'structures'}]}]},
+                              {'name': 'rib'}]}
+
+class TestLazyValidation(unittest.TestCase):
+
+    def test_nested_fields_are_validated_on_access(self):
+        component = Component.model_validate_lazy(component_data())
+        self.assertEqual(component.name, 'wing')
+        self.assertIn('subcomponents', component.__dict__[PENDING_KEY])
+        self.assertNotIn('subcomponents', component.__dict__)
+        self.assertIn('subcomponents', component.model_fields_set)
+
+        spar = component.subcomponents[0]
+        self.assertIsInstance(spar, Component)
+        self.assertEqual(spar.name, 'spar')
+        self.assertIn('requirements', spar.__dict__[PENDING_KEY])
+        self.assertIn('requirements', component.__dict__[PENDING_KEY])
+        self.assertNotIn('subcomponents', component.__dict__[PENDING_KEY])
+        self.assertEqual(component.metadata.key, 'source')
+        self.assertIsNone(component.geometry)
+
+    def test_validate_all_matches_eager_validation(self):
+        component = Component.model_validate_lazy(component_data())
+        self.assertEqual(component.validate_all(), 6)
+        self.assertNotIn(PENDING_KEY, component.subcomponents[0].__dict__)
+        self.assertEqual(component.validate_all(), 0)
+        self.assertEqual(component, Component.model_validate(component_data()))
+
+        lazy = Component.model_validate_lazy(component_data())
+        eager = Component.model_validate(component_data())
+        self.assertEqual(lazy.model_dump(), eager.model_dump())
+        self.assertEqual(Component.model_validate_lazy(component_data()).model_dump_json(), eager.model_dump_json())
+        self.assertEqual(pickle.loads(pickle.dumps(Component.model_validate_lazy(component_data()))), eager)
+
+    def test_errors_are_raised_on_access(self):
+        data = component_data()
+        data['subcomponents'][1]['description'] = '   '
+        data['requirements'] = [{'name': 'incomplete'}]
+        component = Component.model_validate_lazy(data)
+        self.assertEqual(component.name, 'wing')
+        with self.assertRaises(ValidationError) as raised:
+            component.subcomponents
+        self.assertEqual(raised.exception.errors()[0]['loc'], ('subcomponents', 1, 'description'))
+        with self.assertRaises(ValidationError):
+            component.requirements
+        with self.assertRaises(ValidationError):
+            component.validate_all()
+        with self.assertRaises(ValidationError):
+            Component.model_validate_lazy({'name': '  '})
+
+    def test_assigned_fields_are_not_validated_again(self):
+        component = Component.model_validate_lazy(component_data())
+        component.subcomponents = [{'name': 'rib'}]
+        self.assertEqual(component.validate_all(), 2)
+        self.assertEqual([part.name for part in component.subcomponents], ['rib'])
+
+    def test_models_without_pending_fields_are_unaffected(self):
+        Component.model_validate_lazy(component_data()).subcomponents
+        self.assertNotIn('subcomponents', Component.__dict__)
+        with self.assertRaises(AttributeError):
+            Component.subcomponents
+        component = Component(name='wing', subcomponents=[Component(name='spar')])
+        self.assertNotIn(PENDING_KEY, component.__dict__)
+        with self.assertRaises(AttributeError):
+            component.missing
+        self.assertEqual(component.subcomponents[0].name, 'spar')
+        component.subcomponents = [{'name': 'rib'}]
+        self.assertIsInstance(component.subcomponents[0], Component)
+        self.assertIsNone(Component.model_fields['subcomponents'].default)
+
+        class Part(Component):
+            pass
+        self.assertIsNone(Part(name='rib').subcomponents)
+
+    def test_classes_with_model_validators_are_validated_at_once(self):
+        model = Checked.model_validate_lazy({'parts': [{'key': 'k', 'value': 'v'}]})
+        self.assertIsInstance(model.__dict__['parts'][0], Metadata)
+
+if __name__ == '__main__':
+    unittest.main()
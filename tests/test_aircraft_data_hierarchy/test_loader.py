@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.lazy_validation import PENDING_KEY
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe import Component
+from aircraft_data_hierarchy import loader
+from aircraft_data_hierarchy.loader import LazyNode, Unparsed, load_lazy
+
+class TestLoadLazy(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel(adh_root={
+            'airframe': {'wing': {'span': 30.5, 'name': 'main {wing} "A"', 'ribs': [1, [2, {'x': None}]]}},
+            'systems': {'hydraulics': {'pressure': 3000, 'active': True}},
+            'revision': 'B\\u00e9 \\"}',
+            'empty': {},
+        }, aliases={'wing': 'airframe.wing'})
+        handle, self.path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as file:
+            file.write(self.model.model_dump_json(indent=2))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_subtrees_are_parsed_on_first_access(self):
+        model = load_lazy(self.path, CommonBaseModel)
+        self.assertIsInstance(model.adh_root, LazyNode)
+        self.assertEqual(model.aliases, {'wing': 'airframe.wing'})
+        self.assertEqual(model.adh_root.pending, 4)
+        self.assertIsInstance(dict.get(model.adh_root, 'airframe'), Unparsed)
+        self.assertEqual(model.get_node('airframe.wing.span'), 30.5)
+        self.assertEqual(model.adh_root.pending, 3)
+        self.assertIsInstance(dict.get(model.adh_root, 'systems'), Unparsed)
+        self.assertEqual(model.get_node('wing.name'), 'main {wing} "A"')
+        self.assertEqual(json.loads(model.adh_root.raw('systems')), {'hydraulics': {'pressure': 3000, 'active': True}})
+
+    def test_lazy_model_behaves_like_the_original(self):
+        model = load_lazy(self.path, CommonBaseModel)
+        self.assertEqual(model.adh_root, self.model.adh_root)
+        self.assertEqual(model.model_dump(), self.model.model_dump())
+        model = load_lazy(self.path, CommonBaseModel)
+        self.assertEqual(json.loads(model.model_dump_json()), json.loads(self.model.model_dump_json()))
+        model = load_lazy(self.path, CommonBaseModel)
+        self.assertEqual([node['_path'] for node in model.search_nodes({'active': True})], ['.systems.hydraulics'])
+        model.create_node('airframe.tail', {'span': 8})
+        model.delete_node('systems')
+        self.assertEqual(set(model.adh_root), {'airframe', 'revision', 'empty'})
+        self.assertEqual(dict(model.adh_root)['airframe']['tail'], {'span': 8})
+
+    def test_nested_models_are_validated_on_first_access(self):
+        component = Component(name='wing', metadata={'key': 'source', 'value': 'CAD'}, adh_root={'span': 30},
+                              subcomponents=[Component(name='spar', subcomponents=[Component(name='web')])])
+        with open(self.path, 'w') as file:
+            file.write(component.model_dump_json())
+        model = load_lazy(self.path, Component)
+        self.assertIsInstance(model.adh_root, LazyNode)
+        self.assertLessEqual({'metadata', 'subcomponents'}, set(model.__dict__[PENDING_KEY]))
+        self.assertEqual(model.subcomponents[0].name, 'spar')
+        self.assertIn('subcomponents', model.subcomponents[0].__dict__[PENDING_KEY])
+        self.assertEqual(model, component)
+        self.assertEqual(load_lazy(self.path, Component).model_dump(), component.model_dump())
+
+    def test_scan_across_chunks(self):
+        with mock.patch.object(loader, '_CHUNK_SIZE', 7):
+            model = load_lazy(self.path, CommonBaseModel)
+        self.assertEqual(set(model.adh_root), set(self.model.adh_root))
+        self.assertEqual(model.adh_root, self.model.adh_root)
+
+    def test_invalid_files(self):
+        for content in ('', '[1, 2]', '{"adh_root": {"a": 1'):
+            with self.subTest(content=content):
+                with open(self.path, 'w') as file:
+                    file.write(content)
+                with self.assertRaises(ValueError):
+                    load_lazy(self.path, CommonBaseModel)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import unittest
+from typing import List
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata
+from aircraft_data_hierarchy.loader import load_lazy
+from aircraft_data_hierarchy.memory import subtree_sizes
+
+class Record(CommonBaseModel):
+    metadata: List[Metadata] = []
+
+class TestSubtreeSizes(unittest.TestCase):
+
+    def test_sizes_add_up_by_subtree(self):
+        wing = {'span': 30.5, 'stations': [0.0, 1.5, 3.0]}
+        value = {'airframe': {'wing': wing}}
+        sizes = subtree_sizes(value, depth=2)
+        self.assertEqual(list(sizes), ['', 'airframe', 'airframe.wing'])
+        expected = sum(sys.getsizeof(item) for item in (wing, 'span', 30.5, 'stations', wing['stations'], 0.0, 1.5, 3.0))
+        self.assertEqual(sizes['airframe.wing'], expected)
+        self.assertEqual(sizes['airframe'], expected + sys.getsizeof(value['airframe']) + sys.getsizeof('wing'))
+        self.assertEqual(sizes[''], sizes['airframe'] + sys.getsizeof(value) + sys.getsizeof('airframe'))
+        self.assertEqual(subtree_sizes(value, depth=0), {'': sizes['']})
+        with self.assertRaises(ValueError):
+            subtree_sizes(value, depth=-1)
+
+    def test_shared_objects_are_counted_once(self):
+        table = list(range(1000, 2000))
+        value = {'a': {'table': table}, 'b': {'table': table}}
+        sizes = subtree_sizes(value, depth=1)
+        self.assertGreater(sizes['a'], sys.getsizeof(table))
+        self.assertEqual(sizes['b'], sys.getsizeof(value['b']))
+
+    def test_list_items_are_not_reported(self):
+        sizes = subtree_sizes({'cases': [{'mach': 0.8}, {'mach': 0.85}]}, depth=3)
+        self.assertEqual(list(sizes), ['', 'cases'])
+
+class TestMemoryReport(unittest.TestCase):
+
+    def test_fields_branches_and_nested_models(self):
+        model = Record(adh_root={'geometry': {'mesh': [float(index) for index in range(10000)]}, 'mass': {'total': 5e4}},
+                       metadata=[Metadata(key='source', value='x' * 1000)])
+        model.enable_path_index()
+        report = model.memory_report()
+        self.assertEqual(set(report), {'', 'adh_data', 'adh_root', 'aliases', 'metadata', '_adh_state',
+                                       'adh_root.geometry', 'adh_root.mass'})
+        self.assertGreater(report['adh_root.geometry'], 10000 * sys.getsizeof(0.0))
+        self.assertGreater(report['metadata'], 1000)
+        self.assertEqual(report['adh_root'], sys.getsizeof(model.adh_root) + sys.getsizeof('geometry') + sys.getsizeof('mass')
+                         + report['adh_root.geometry'] + report['adh_root.mass'])
+        self.assertEqual(max((path for path in report if path.count('.') == 1), key=report.get), 'adh_root.geometry')
+        self.assertEqual(set(model.memory_report(depth=1)), {'', 'adh_data', 'adh_root', 'aliases', 'metadata', '_adh_state'})
+
+    def test_lazy_nodes_are_not_parsed(self):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as file:
+            file.write(CommonBaseModel(adh_root={'airframe': {'wing': {'span': 30}}, 'systems': {}}).model_dump_json())
+        try:
+            model = load_lazy(path, CommonBaseModel)
+            report = model.memory_report()
+            self.assertIn('adh_root.airframe', report)
+            self.assertEqual(model.adh_root.pending, 2)
+        finally:
+            del model
+            os.remove(path)
+
+if __name__ == '__main__':
+    unittest.main()
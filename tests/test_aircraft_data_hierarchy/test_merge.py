@@ -0,0 +1,96 @@
+import sys
+import unittest
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, NodeNotFoundError
+from aircraft_data_hierarchy.merge import MergeConflict, MergeConflictError, MergePolicy, merge_into
+from aircraft_data_hierarchy.persistent import freeze_node
+
+class TestMergeNodes(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('aircraft', {'mass': 1000, 'loads': [1, 2], 'parts': [{'id': 'A', 'mass': 1}]})
+        self.model.create_node('aero', {'mass': 1100, 'cl': 0.5, 'loads': [3], 'parts': [{'id': 'A', 'cd': 0.1}, {'id': 'B'}]})
+        self.model.create_node('structures', {'mass': 1200, 'wing': {'spar': 'Al'}})
+
+    def test_merges_several_sources_in_order(self):
+        conflicts = self.model.merge_nodes(['aero', 'structures'], 'aircraft')
+        node = self.model.get_node('aircraft')
+        self.assertEqual(node['mass'], 1200)
+        self.assertEqual(node['cl'], 0.5)
+        self.assertEqual(node['wing'], {'spar': 'Al'})
+        self.assertIsNot(node['wing'], self.model.get_node('structures.wing'))
+        self.assertEqual(conflicts, [
+            MergeConflict('aircraft.mass', 1000, 1100, 'aero'),
+            MergeConflict('aircraft.loads', [1, 2], [3], 'aero'),
+            MergeConflict('aircraft.parts', [{'id': 'A', 'mass': 1}], [{'id': 'A', 'cd': 0.1}, {'id': 'B'}], 'aero'),
+            MergeConflict('aircraft.mass', 1100, 1200, 'structures'),
+        ])
+
+    def test_keep_target(self):
+        self.model.merge_nodes(['aero', 'structures'], 'aircraft', policy='keep-target')
+        self.assertEqual(self.model.get_node('aircraft.mass'), 1000)
+        self.assertEqual(self.model.get_node('aircraft.cl'), 0.5)
+
+    def test_error_policy_reports_all_conflicts_and_changes_nothing(self):
+        for persistent in (False, True):
+            with self.subTest(persistent=persistent):
+                if persistent:
+                    self.model.enable_persistent_tree()
+                with self.assertRaises(MergeConflictError) as context:
+                    self.model.merge_nodes(['aero', 'structures'], 'aircraft', policy=MergePolicy.ERROR)
+                self.assertEqual(len(context.exception.conflicts), 4)
+                self.assertEqual(self.model.get_node('aircraft'), {'mass': 1000, 'loads': [1, 2], 'parts': [{'id': 'A', 'mass': 1}]})
+
+    def test_list_policies(self):
+        self.model.merge_nodes('aero', 'aircraft', policy='list-concat')
+        self.assertEqual(self.model.get_node('aircraft.loads'), [1, 2, 3])
+        self.setUp()
+        conflicts = self.model.merge_nodes('aero', 'aircraft', policy='list-by-key', list_key='id')
+        self.assertEqual(self.model.get_node('aircraft.parts'), [{'id': 'A', 'mass': 1, 'cd': 0.1}, {'id': 'B'}])
+        self.assertEqual(self.model.get_node('aircraft.loads'), [1, 2, 3])
+        self.assertEqual([conflict.path for conflict in conflicts], ['aircraft.mass'])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.model.merge_nodes('aero', 'aircraft', policy='newest')
+        with self.assertRaises(ValueError):
+            self.model.merge_nodes('aero', 'aircraft', policy='list-by-key')
+        with self.assertRaises(NodeNotFoundError):
+            self.model.merge_nodes(['aero', 'missing'], 'aircraft')
+
+    def test_persistent_merge_does_not_touch_snapshots(self):
+        snapshot = self.model.snapshot()
+        self.model.merge_nodes(['aero', 'structures'], 'aircraft', policy='list-by-key', list_key='id')
+        self.assertIs(self.model.get_node('aircraft.wing'), self.model.get_node('structures.wing'))
+        self.assertEqual(snapshot.get_node('aircraft.parts'), [{'id': 'A', 'mass': 1}])
+        self.assertEqual(self.model.get_node('aircraft.parts'), [{'id': 'A', 'mass': 1, 'cd': 0.1}, {'id': 'B'}])
+
+
+class TestMergeInto(unittest.TestCase):
+
+    def test_copy_on_write_leaves_target_untouched(self):
+        target = {'wing': {'span': 30, 'flap': {'type': 'plain'}}, 'tail': {'span': 8}}
+        merged, conflicts = merge_into(target, [('source', {'wing': {'flap': {'type': 'slotted'}}})], in_place=False)
+        self.assertEqual(target['wing']['flap'], {'type': 'plain'})
+        self.assertEqual(merged['wing']['flap'], {'type': 'slotted'})
+        self.assertIs(merged['tail'], target['tail'])
+        self.assertEqual(conflicts, [MergeConflict('wing.flap.type', 'plain', 'slotted', 'source')])
+
+    def test_share_keeps_persistent_subtrees(self):
+        source = freeze_node({'tail': {'span': 8}})
+        merged, _ = merge_into(freeze_node({'wing': {}}), [('source', source)], in_place=False, share=True)
+        self.assertIs(merged['tail'], source['tail'])
+
+    def test_deep_sources_do_not_recurse(self):
+        source, target = {}, {}
+        deep_source, deep_target = source, target
+        for _ in range(sys.getrecursionlimit() + 100):
+            deep_source['child'], deep_target['child'] = {}, {}
+            deep_source, deep_target = deep_source['child'], deep_target['child']
+        deep_source['value'] = 1
+        merge_into(target, [('source', source)])
+        self.assertEqual(deep_target, {'value': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, NodeNotFoundError
+from aircraft_data_hierarchy.merkle import NodeChange, empty_entry, subtree_digest
+
+class TestSubtreeHash(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.wing', {'type': 'surface', 'span': 30, 'flap': {'type': 'surface'}})
+        self.model.create_node('airframe.fuselage', {'type': 'body', 'length': 40.0})
+
+    def test_hash_depends_on_content_only(self):
+        other = CommonBaseModel()
+        other.create_node('airframe.fuselage', {'length': 40.0, 'type': 'body'})
+        other.create_node('airframe.wing', {'flap': {'type': 'surface'}, 'span': 30, 'type': 'surface'})
+        self.assertEqual(self.model.subtree_hash(), other.subtree_hash())
+        other.update_node('airframe.fuselage', {'length': 40, 'type': 'body'})
+        self.assertNotEqual(self.model.subtree_hash(), other.subtree_hash())
+        self.assertEqual(self.model.subtree_hash('airframe.wing'), other.subtree_hash('airframe.wing'))
+        self.assertEqual(len(self.model.subtree_hash()), 32)
+
+    def test_changes_only_invalidate_their_path(self):
+        before = self.model.subtree_hash()
+        cache = self.model.__pydantic_private__['_adh_state'].hash_cache
+        fuselage_entry = cache[1]['airframe'][1]['fuselage']
+        self.model.create_node('airframe.wing.slat', {'type': 'surface'})
+        self.assertIsNone(cache[0])
+        self.assertIsNotNone(fuselage_entry[0])
+        self.assertNotEqual(self.model.subtree_hash(), before)
+        self.model.delete_node('airframe.wing.slat')
+        self.assertEqual(self.model.subtree_hash(), before)
+
+    def test_hash_follows_rollback_and_persistent_tree(self):
+        before = self.model.subtree_hash()
+        self.model.enable_persistent_tree()
+        self.assertEqual(self.model.subtree_hash(), before)
+        with self.assertRaises(NodeNotFoundError):
+            with self.model.batch():
+                self.model.merge_nodes('airframe.fuselage', 'airframe.wing')
+                self.assertNotEqual(self.model.subtree_hash(), before)
+                self.model.delete_node('airframe.missing')
+        self.assertEqual(self.model.subtree_hash(), before)
+
+    def test_direct_edits_need_clear_hash_cache(self):
+        before = self.model.subtree_hash()
+        self.model.adh_root['airframe']['wing']['span'] = 31
+        self.assertEqual(self.model.subtree_hash(), before)
+        self.model.clear_hash_cache()
+        self.assertNotEqual(self.model.subtree_hash(), before)
+
+    def test_missing_path(self):
+        with self.assertRaises(NodeNotFoundError):
+            self.model.subtree_hash('airframe.tail')
+
+    def test_deep_tree(self):
+        node = {'leaf': 1}
+        for _ in range(5000):
+            node = {'child': node}
+        self.assertEqual(len(subtree_digest(node, empty_entry())), 16)
+
+
+class TestDiff(unittest.TestCase):
+
+    def test_diff_reports_minimal_changes(self):
+        old = CommonBaseModel()
+        old.create_node('airframe.wing', {'type': 'surface', 'span': 30, 'flap': {'type': 'surface'}})
+        old.create_node('airframe.fuselage', {'type': 'body'})
+        old.create_node('systems.pump', {'pressure': 3000})
+        new = old.snapshot()
+        new.update_node('airframe.wing.flap', {'type': 'slat'})
+        new.delete_node('systems.pump')
+        new.create_node('systems.valve', {'size': 2})
+        new.create_node('airframe.tail', {'type': 'surface'})
+        self.assertEqual(old.diff(new), [
+            NodeChange('added', 'airframe.tail', None, {'type': 'surface'}),
+            NodeChange('changed', 'airframe.wing.flap.type', 'surface', 'slat'),
+            NodeChange('removed', 'systems.pump', {'pressure': 3000}, None),
+            NodeChange('added', 'systems.valve', None, {'size': 2}),
+        ])
+        self.assertEqual(old.diff(new, 'airframe.wing'), [NodeChange('changed', 'airframe.wing.flap.type', 'surface', 'slat')])
+        self.assertEqual(old.diff(old.snapshot()), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
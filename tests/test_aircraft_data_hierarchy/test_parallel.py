@@ -0,0 +1,55 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.parallel import parallel_matches
+from aircraft_data_hierarchy.query import as_predicate
+
+class TestParallelSearch(unittest.TestCase):
+
+    def setUp(self):
+        root = {'type': 'part'}
+        for section in range(4):
+            root[f'section{section}'] = {'type': 'section', 'size': section}
+            for frame in range(5):
+                root[f'section{section}'][f'frame{frame}'] = {
+                    'type': 'part', 'size': frame, 'clip': {'type': 'part', 'size': section * frame}}
+        root['section2']['empty'] = {}
+        root['note'] = 'not a node'
+        self.model = CommonBaseModel(adh_root=root)
+
+    def test_results_match_the_serial_search(self):
+        for criteria in ({'type': 'part'}, 'size >= 2', 'type == "section" or size == 0', {'type': 'missing'}):
+            for depth in (1, 2, 3, 6):
+                with self.subTest(criteria=criteria, depth=depth):
+                    self.assertEqual(self.model.parallel_search_nodes(criteria, processes=3, partition_depth=depth),
+                                     self.model.search_nodes(criteria))
+
+    def test_matching_nodes_are_the_nodes_of_the_tree(self):
+        matches = parallel_matches(self.model.adh_root, as_predicate('size == 12'), processes=2)
+        self.assertEqual([path for path, _ in matches], ['section3.frame4.clip'])
+        self.assertIs(matches[0][1], self.model.get_node('section3.frame4.clip'))
+
+    def test_concurrent_searches_keep_their_own_predicate(self):
+        criteria = [{'type': 'part'}, {'type': 'section'}, 'size == 3', 'size == 4']
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(lambda query: self.model.parallel_search_nodes(query, processes=2), criteria * 2))
+        self.assertEqual(results, [self.model.search_nodes(query) for query in criteria * 2])
+
+    def test_serial_fallbacks(self):
+        self.model.create_node('first', {})
+        self.model.link_nodes('first', 'section0')
+        self.assertEqual(self.model.parallel_search_nodes({'size': 0}, processes=2), self.model.search_nodes({'size': 0}))
+        self.model.unlink_nodes('first')
+        self.model.add_search_index('type')
+        self.assertEqual(self.model.parallel_search_nodes({'type': 'section'}, processes=2),
+                         self.model.search_nodes({'type': 'section'}))
+        self.assertEqual(parallel_matches({}, as_predicate({}), processes=1), [('', {})])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.model.parallel_search_nodes({'type': 'part'}, partition_depth=0)
+        with self.assertRaises(ValueError):
+            self.model.parallel_search_nodes({'type': 'part'}, processes=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import copy
+import pickle
+import unittest
+from aircraft_data_hierarchy.persistent import PersistentNode, freeze_node, thaw_node
+
+class TestPersistentNode(unittest.TestCase):
+
+    def setUp(self):
+        self.node = freeze_node({'wing': {'type': 'surface'}, 'span': 30})
+
+    def test_freeze_converts_nested_dictionaries(self):
+        self.assertIsInstance(self.node, PersistentNode)
+        self.assertIsInstance(self.node['wing'], PersistentNode)
+        self.assertIs(freeze_node(self.node), self.node)
+        self.assertEqual(freeze_node(5), 5)
+
+    def test_mutation_raises(self):
+        for mutate in (lambda: self.node.__setitem__('span', 1), lambda: self.node.pop('span'),
+                       lambda: self.node.update(span=1), lambda: self.node.clear(), lambda: self.node.setdefault('x', 1)):
+            with self.assertRaises(TypeError):
+                mutate()
+        with self.assertRaises(TypeError):
+            del self.node['span']
+
+    def test_thaw_returns_mutable_copy(self):
+        thawed = thaw_node(self.node)
+        thawed['wing']['type'] = 'body'
+        self.assertEqual(type(thawed['wing']), dict)
+        self.assertEqual(self.node['wing']['type'], 'surface')
+
+    def test_copy_and_pickle(self):
+        self.assertIs(copy.deepcopy(self.node), self.node)
+        restored = pickle.loads(pickle.dumps(self.node))
+        self.assertEqual(restored, self.node)
+        self.assertIsInstance(restored, PersistentNode)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.query import Predicate, QueryError, compile_query
+
+class TestCompileQuery(unittest.TestCase):
+
+    def test_comparisons(self):
+        node = {'span': 12, 'type': 'surface'}
+        self.assertTrue(compile_query('span >= 10 and type == "surface"').matches('wing', node))
+        self.assertFalse(compile_query('span < 10').matches('wing', node))
+        self.assertTrue(compile_query('span != 10').matches('wing', node))
+
+    def test_missing_key_and_unorderable_values_do_not_match(self):
+        self.assertFalse(compile_query('span > 1').matches('wing', {}))
+        self.assertFalse(compile_query('span > 1').matches('wing', {'span': 'long'}))
+
+    def test_membership(self):
+        query = compile_query("material in ('Al', 'Ti')")
+        self.assertTrue(query.matches('wing', {'material': 'Ti'}))
+        self.assertFalse(query.matches('wing', {'material': 'CFRP'}))
+        self.assertTrue(compile_query('material not in ["Al"]').matches('wing', {'material': 'CFRP'}))
+
+    def test_patterns(self):
+        self.assertTrue(compile_query('name like "W*"').matches('wing', {'name': 'Wing'}))
+        self.assertTrue(compile_query('name matches "^W[0-9]+"').matches('wing', {'name': 'W12'}))
+        self.assertFalse(compile_query('name like "W*"').matches('wing', {'name': 7}))
+
+    def test_exists_not_or_and_constants(self):
+        query = compile_query('not exists(flap) or (active == true and note == null)')
+        self.assertTrue(query.matches('wing', {}))
+        self.assertTrue(query.matches('wing', {'flap': {}, 'active': True, 'note': None}))
+        self.assertFalse(query.matches('wing', {'flap': {}, 'active': False}))
+
+    def test_backtick_keys(self):
+        self.assertTrue(compile_query('`in` == 1').matches('wing', {'in': 1}))
+
+    def test_path_glob(self):
+        query = compile_query('@path like "airframe.*.wing"')
+        self.assertTrue(query.matches('airframe.main.wing', {}))
+        self.assertFalse(query.matches('airframe.main.box.wing', {}))
+        self.assertEqual(query.scope(), 'airframe')
+        deep = compile_query('@path like "airframe.**.wing"')
+        self.assertTrue(deep.matches('airframe.wing', {}))
+        self.assertTrue(deep.matches('airframe.main.box.wing', {}))
+
+    def test_compiled_queries_are_cached(self):
+        self.assertIs(compile_query('span > 1'), compile_query('span > 1'))
+
+    def test_invalid_queries(self):
+        for text in ('', 'span >', 'span = 1', '(span > 1', 'and == 1', 'name like 3', 'name matches "("'):
+            with self.subTest(text=text):
+                with self.assertRaises(QueryError):
+                    compile_query(text)
+
+    def test_predicates_must_implement_matches(self):
+        class Incomplete(Predicate):
+            pass
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class TestQuerySearch(unittest.TestCase):
+
+    def setUp(self):
+        self.model = CommonBaseModel()
+        self.model.create_node('airframe.main.wing', {'type': 'surface', 'span': 30, 'material': 'Al'})
+        self.model.create_node('airframe.main.wing.flap', {'type': 'surface', 'span': 4, 'material': 'CFRP'})
+        self.model.create_node('airframe.tail.wing', {'type': 'surface', 'span': 8, 'material': 'Ti'})
+        self.model.create_node('systems.wing_deicing', {'type': 'system'})
+
+    def paths(self, criteria, **kwargs):
+        return [path for path, _ in self.model.iter_nodes(criteria, **kwargs)]
+
+    def test_search_nodes_accepts_query_text(self):
+        results = self.model.search_nodes('type == "surface" and span >= 8')
+        self.assertEqual([node['_path'] for node in results], ['.airframe.main.wing', '.airframe.tail.wing'])
+
+    def test_path_scope(self):
+        self.assertEqual(self.paths('@path like "airframe.*.wing"'), ['airframe.main.wing', 'airframe.tail.wing'])
+        self.assertEqual(self.paths('@path like "missing.*"'), [])
+        self.assertEqual(self.paths('@path like "airframe.*.wing"', under='systems'), [])
+        self.assertEqual(self.paths('@path like "airframe.**"', under='airframe.tail'), ['airframe.tail', 'airframe.tail.wing'])
+
+    def test_indexed_results_match_scan(self):
+        queries = [
+            {'type': 'surface'},
+            'type == "surface" and span < 10',
+            "material in ('Al', 'Ti')",
+            'type == "system" or material == "CFRP"',
+            'not type == "surface"',
+        ]
+        expected = {str(query): sorted(self.paths(query)) for query in queries}
+        self.model.add_search_index('type', 'material')
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(self.paths(query), expected[str(query)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, NodeNotFoundError, PathAlreadyExistsError
+from aircraft_data_hierarchy.merge import MergeConflictError
+from aircraft_data_hierarchy.storage import DiskNodeStore
+
+class TestDiskNodeStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = DiskNodeStore()
+        self.model = CommonBaseModel()
+        self.model.attach_store(self.store)
+        self.model.create_node('airframe.wing', {'type': 'surface', 'span': 30, 'flap': {'type': 'surface', 'span': 5}})
+        self.model.create_node('airframe.tail', {'type': 'surface', 'span': 8})
+        self.model.create_node('systems.hydraulics', {'type': 'system'})
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_nodes_are_served_from_the_store(self):
+        self.assertEqual(self.model.adh_root, {})
+        self.assertEqual(self.model.get_node('airframe.wing.flap'), {'type': 'surface', 'span': 5})
+        self.assertEqual(self.model.get_node('airframe.wing.span'), 30)
+        self.assertEqual(set(self.model.get_node('airframe')), {'wing', 'tail'})
+        self.assertIsNone(self.model.get_node('airframe.fuselage'))
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.create_node('airframe.wing', {})
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.create_node('airframe.wing.span', {})
+
+    def test_search_and_iterate(self):
+        results = self.model.search_nodes({'type': 'surface'})
+        self.assertEqual([node['_path'] for node in results], ['.airframe.tail', '.airframe.wing', '.airframe.wing.flap'])
+        self.assertEqual(results[1]['flap'], {'type': 'surface', 'span': 5})
+        self.assertEqual([path for path, _ in self.model.iter_nodes('span > 6', under='airframe')], ['airframe.tail', 'airframe.wing'])
+        self.assertEqual([path for path, _ in self.model.iter_nodes('exists(flap)')], ['airframe.wing'])
+        self.assertEqual(len(list(self.model.iter_nodes({'type': 'surface'}, limit=2))), 2)
+        with self.assertRaises(NodeNotFoundError):
+            list(self.model.iter_nodes(under='engines'))
+
+    def test_matches_are_streamed_with_their_subtrees(self):
+        tree = {'a': {'type': 'x', 'b': {'type': 'x', 'c': {'type': 'y'}}, 'b-x': {'type': 'x', 'd': {}}, 'b0': {'type': 'y'}},
+                'a-b': {'type': 'x'}}
+        memory = CommonBaseModel(adh_root=tree)
+        store = DiskNodeStore()
+        store.import_tree(tree)
+        store.get_node = None  # Matches must not be read back one by one
+        for criteria in ({'type': 'x'}, 'type == "y"', None):
+            with self.subTest(criteria=criteria):
+                expected = sorted(memory.iter_nodes(criteria))
+                self.assertEqual(list(store.iter_nodes(criteria)), expected)
+                self.assertEqual(list(store.iter_nodes(criteria, limit=2)), expected[:2])
+                self.assertEqual(list(store.iter_nodes(criteria, under='a')), sorted(memory.iter_nodes(criteria, under='a')))
+        store.close()
+
+    def test_mutations_are_written_back(self):
+        self.model.get_node('airframe.wing')  # Make the subtree resident before changing it
+        self.model.update_node('airframe.wing.flap', {'type': 'surface', 'span': 6})
+        self.assertEqual(self.model.get_node('airframe.wing')['flap']['span'], 6)
+        self.model.move_node('airframe.wing', 'airframe.main_wing')
+        self.assertIsNone(self.model.get_node('airframe.wing'))
+        self.assertEqual(self.model.get_node('airframe.main_wing.flap.span'), 6)
+        self.model.copy_node('airframe.main_wing', 'spares.wing')
+        self.assertEqual(self.model.get_node('spares.wing'), self.model.get_node('airframe.main_wing'))
+        self.model.delete_node('airframe.main_wing.flap')
+        self.assertNotIn('flap', self.model.get_node('airframe.main_wing'))
+        self.assertIn('flap', self.model.get_node('spares.wing'))
+        with self.assertRaises(NodeNotFoundError):
+            self.model.delete_node('airframe.main_wing.flap')
+
+    def test_merge_nodes(self):
+        self.model.create_node('aero', {'span': 31, 'cl': 0.5, 'flap': {'cd': 0.1}})
+        conflicts = self.model.merge_nodes('aero', 'airframe.wing')
+        self.assertEqual([conflict.path for conflict in conflicts], ['airframe.wing.span'])
+        self.assertEqual(self.model.get_node('airframe.wing.flap'), {'type': 'surface', 'span': 5, 'cd': 0.1})
+        with self.assertRaises(MergeConflictError):
+            self.model.merge_nodes('airframe.tail', 'airframe.wing', policy='error')
+        self.assertEqual(self.model.get_node('airframe.wing.span'), 31)
+
+    def test_batch_is_a_transaction(self):
+        with self.assertRaises(PathAlreadyExistsError):
+            self.model.apply_ops([
+                ('create', 'engines.left', {'thrust': 100}),
+                ('update', 'airframe.tail', {'type': 'surface', 'span': 9}),
+                ('create', 'airframe.wing', {}),
+            ])
+        self.assertIsNone(self.model.get_node('engines'))
+        self.assertEqual(self.model.get_node('airframe.tail.span'), 8)
+        self.model.apply_ops([('create', 'engines.left', {'thrust': 100}), ('delete', 'systems')])
+        self.assertEqual(self.model.get_node('engines.left.thrust'), 100)
+        self.assertIsNone(self.model.get_node('systems'))
+
+    def test_aliases_and_journal(self):
+        journal = self.model.enable_journal()
+        self.model.create_node('wing', {})
+        self.model.link_nodes('wing', 'airframe.wing')
+        self.assertEqual(self.model.get_node('wing.flap.span'), 5)
+        self.model.update_node('wing.flap', {'span': 7})
+        self.assertEqual(self.model.get_node('airframe.wing.flap'), {'span': 7})
+        self.assertEqual([(record.op, record.path) for record in journal.since(0)], [('create', 'wing'), ('link', 'wing'), ('update', 'airframe.wing.flap')])
+
+    def test_resident_subtrees_are_bounded(self):
+        self.store.max_resident_nodes = 3
+        self.model.get_node('airframe')
+        self.model.get_node('systems')
+        self.assertEqual(list(self.store._resident), ['systems'])
+        self.model.get_node('airframe.tail')
+        self.model.get_node('airframe.wing')
+        self.assertEqual(list(self.store._resident), ['airframe.tail', 'airframe.wing'])
+        self.assertLessEqual(self.store._resident_nodes, 3)
+
+    def test_reopen_and_import(self):
+        directory = tempfile.mkdtemp()
+        database = os.path.join(directory, 'adh.sqlite')
+        model = CommonBaseModel(adh_root={'airframe': {'wing': {'span': 30}}, 'revision': 'A'})
+        store = DiskNodeStore(database)
+        model.attach_store(store, import_root=True)
+        self.assertEqual(model.adh_root, {})
+        model.create_node('airframe.tail', {'span': 8})
+        store.close()
+
+        reopened = CommonBaseModel()
+        store = DiskNodeStore(database)
+        reopened.attach_store(store)
+        self.assertEqual(reopened.get_node('airframe'), {'wing': {'span': 30}, 'tail': {'span': 8}})
+        self.assertEqual(reopened.get_node('revision'), 'A')
+        reopened.detach_store()
+        self.assertIsNone(reopened.get_node('airframe'))
+        store.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
+from unittest import mock
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel, Metadata
+from aircraft_data_hierarchy.trusted import construct_trusted, dump_trusted, load_trusted
+
+class Status(Enum):
+    DRAFT = 'draft'
+    RELEASED = 'released'
+
+class Point(BaseModel):
+    x: float
+    y: float
+
+class Note(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    label: str
+    _cache: Dict[str, float] = PrivateAttr(default_factory=dict)
+
+class Record(CommonBaseModel):
+    created: datetime
+    status: Status = Status.DRAFT
+    outline: List[Point] = []
+    metadata: Optional[List[Metadata]] = None
+    by_key: Dict[str, Metadata] = {}
+    notes: List[Optional[Note]] = []
+    revision_code: str = Field('A', alias='revision')
+
+class TestTrustedLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.record = Record(
+            created=datetime(2024, 5, 1, 12, 30), status=Status.RELEASED,
+            outline=[Point(x=0, y=0), Point(x=1.5, y=2)],
+            metadata=[Metadata(key='source', value='CAD')], by_key={'mass': Metadata(key='unit', value='kg')},
+            notes=[Note(label='check', owner='stress'), None], revision='B',
+            adh_root={'airframe': {'wing': {'span': 30.5}}})
+        handle, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_trusted_round_trip_skips_validation(self):
+        self.assertGreater(dump_trusted(self.record, self.path), 0)
+        with mock.patch.object(Record, 'model_validate_json') as validate:
+            loaded = load_trusted(self.path, Record)
+        validate.assert_not_called()
+        self.assertEqual(loaded, self.record)
+        self.assertIsInstance(loaded.created, datetime)
+        self.assertIs(loaded.status, Status.RELEASED)
+        self.assertIsInstance(loaded.outline[1], Point)
+        self.assertIsInstance(loaded.by_key['mass'], Metadata)
+        self.assertEqual(loaded.notes[0].owner, 'stress')
+        self.assertEqual(loaded.notes[0]._cache, {})
+        validated = Record.model_validate_json(self.record.model_dump_json(by_alias=True))
+        self.assertEqual(loaded.model_fields_set, validated.model_fields_set)
+        self.assertEqual(loaded.notes[0].model_fields_set, {'label'})
+        self.assertEqual(loaded.get_node('airframe.wing.span'), 30.5)
+        loaded.status = 'draft'
+        self.assertIs(loaded.status, Status.DRAFT)
+
+    def test_changed_files_are_validated(self):
+        dump_trusted(self.record, self.path)
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        with open(self.path, 'wb') as file:
+            file.write(data.replace(b'"label":"check"', b'"label":"recheck"'))
+        with mock.patch.object(Record, 'model_validate_json', wraps=Record.model_validate_json) as validate:
+            self.assertEqual(load_trusted(self.path, Record).notes[0].label, 'recheck')
+        validate.assert_called_once()
+
+        with open(self.path, 'wb') as file:
+            file.write(data.replace(b'"key":"source"', b'"key":"   "'))
+        with self.assertRaises(ValidationError):
+            load_trusted(self.path, Record)
+
+    def test_keys_classes_and_plain_files(self):
+        dump_trusted(self.record, self.path, key=b'secret')
+        with mock.patch.object(Record, 'model_validate_json', wraps=Record.model_validate_json) as validate:
+            self.assertEqual(load_trusted(self.path, Record, key=b'secret'), self.record)
+            validate.assert_not_called()
+            self.assertEqual(load_trusted(self.path, Record), self.record)
+            validate.assert_called_once()
+
+        class Other(Record):
+            pass
+        with mock.patch.object(Other, 'model_validate_json', wraps=Other.model_validate_json) as validate:
+            load_trusted(self.path, Other, key=b'secret')
+        validate.assert_called_once()
+
+        with open(self.path, 'w') as file:
+            file.write(self.record.model_dump_json(by_alias=True))
+        self.assertEqual(load_trusted(self.path, Record), self.record)
+
+    def test_construct_trusted_fills_defaults(self):
+        record = construct_trusted(Record, {'created': '2024-05-01T12:30:00', 'outline': [{'x': 1.0, 'y': 2.0}]})
+        self.assertEqual(record.model_fields_set, {'created', 'outline'})
+        self.assertEqual(record.status, Status.DRAFT)
+        self.assertEqual(record.revision_code, 'A')
+        self.assertEqual(record.adh_root, {})
+        self.assertEqual(record.__pydantic_private__, {'_adh_state': None})
+        self.assertIsNot(record.adh_root, construct_trusted(Record, {'created': '2024-05-01T12:30:00'}).adh_root)
+
+if __name__ == '__main__':
+    unittest.main()
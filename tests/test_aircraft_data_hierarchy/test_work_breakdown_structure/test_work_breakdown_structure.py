@@ -1,6 +1,77 @@
-import pydantic
+import pickle
+import subprocess
+import sys
+import threading
+import unittest
+from pydantic import ValidationError
+from aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe import Component
+from aircraft_data_hierarchy.work_breakdown_structure.work_breakdown_structure import _ELEMENTS, AircraftSystem, WbsElement
 
-class WorkBreakdownStructure:
-    @staticmethod
-    def hello_world():
-        print(f"{__name__} {__class__} hello world")
\ No newline at end of file
+def resolve(qualname):
+    element_class = AircraftSystem
+    for name in qualname.split('.')[1:]:
+        element_class = getattr(element_class, name)
+    return element_class
+
+class TestWorkBreakdownStructure(unittest.TestCase):
+
+    def test_every_element_resolves_to_its_class(self):
+        self.assertEqual(len(_ELEMENTS), 297)
+        for qualname, element in _ELEMENTS.items():
+            element_class = resolve(qualname)
+            self.assertEqual(element_class.__qualname__, qualname)
+            self.assertEqual(element_class().wbs_no, element.wbs_no)
+            self.assertTrue(issubclass(element_class, WbsElement))
+        self.assertEqual(AircraftSystem.AirVehicle.Airframe.Empennage.Stabilizer.SecondaryStructure.AccessPanels().wbs_no,
+                         '1.2.2.4.2.1')
+
+    def test_classes_are_generated_on_first_access(self):
+        script = ('from aircraft_data_hierarchy.work_breakdown_structure.work_breakdown_structure import AircraftSystem\n'
+                  'import sys\n'
+                  'print(type(vars(AircraftSystem)["AirVehicle"]).__name__, '
+                  '"aircraft_data_hierarchy.work_breakdown_structure.airframe.airframe" in sys.modules)\n'
+                  'airframe = AircraftSystem.AirVehicle.Airframe\n'
+                  'print(vars(AircraftSystem)["AirVehicle"] is AircraftSystem.AirVehicle, airframe.__pydantic_complete__)\n'
+                  'airframe()\n'
+                  'print(airframe.__pydantic_complete__)')
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['_LazyElement', 'False', 'True', 'False', 'True'])
+
+    def test_each_element_has_a_single_class(self):
+        class Aircraft(AircraftSystem):
+            pass
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(AircraftSystem.Training.Equipment.OperatorInstructionalEquipment))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(results)), 1)
+        self.assertIs(Aircraft.AirVehicle, AircraftSystem.AirVehicle)
+        self.assertIs(AircraftSystem().AirVehicle, AircraftSystem.AirVehicle)
+        self.assertIsNot(AircraftSystem.AirVehicle.Airframe.Wing.BasicStructure,
+                         AircraftSystem.AirVehicle.Airframe.Fuselage.BasicStructure)
+
+    def test_wbs_number_is_validated(self):
+        fuselage = AircraftSystem.AirVehicle.Airframe.Fuselage(length=12.0)
+        self.assertEqual(fuselage.length, 12.0)
+        fuselage.wbs_no = '1.'
+        with self.assertRaises(ValidationError):
+            fuselage.wbs_no = '2.1'
+        with self.assertRaises(ValidationError):
+            AircraftSystem(wbs_no='1.')
+        with self.assertRaises(ValidationError):
+            AircraftSystem.AirVehicle(wbs_no='0.2')
+
+    def test_generated_classes_behave_as_nested_classes(self):
+        nacelle_class = AircraftSystem.AirVehicle.Airframe.Nacelle
+        self.assertTrue(issubclass(nacelle_class, Component))
+        self.assertEqual(nacelle_class.model_config['extra'], 'allow')
+        self.assertEqual(list(nacelle_class.model_fields)[-1], 'wbs_no')
+        self.assertIn('Airframe', dir(AircraftSystem.AirVehicle))
+        element = AircraftSystem.AirVehicle.Airframe.Wing.BasicStructure.CenterSection.Skins(wbs_no='1.2.2.3.1.1.1')
+        self.assertEqual(pickle.loads(pickle.dumps(element)), element)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from typing import List, Optional
+from pydantic import ConfigDict, PlainSerializer, field_serializer
+from typing_extensions import Annotated
+from aircraft_data_hierarchy.common_base_model import CommonBaseModel
+from aircraft_data_hierarchy.loader import load_lazy
+from aircraft_data_hierarchy.writer import ModelWriter, load_saved
+
+class Wing(CommonBaseModel):
+    span: float = 30.0
+
+class Aircraft(CommonBaseModel):
+    name: str = 'demo'
+    wing: Optional[Wing] = None
+
+class Flight(CommonBaseModel):
+    model_config = ConfigDict(ser_json_timedelta='float')
+    duration: timedelta = timedelta(hours=2)
+    legs: List[Annotated[str, PlainSerializer(str.upper)]] = ['tls', 'cdg']
+    crew: List[str] = ['pilot']
+    wings: List[Wing] = [Wing()]
+
+    @field_serializer('crew')
+    def serialize_crew(self, crew):
+        return ', '.join(crew)
+
+class TestModelWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'model.json')
+        self.model = Aircraft(wing=Wing())
+        self.model.create_node('airframe.wing', {'span': 30, 'flap': {'span': 5}})
+        self.model.create_node('airframe.tail', {'span': 8})
+        self.model.create_node('systems.hydraulics', {'pressure': 3000})
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def assertSaved(self, path=None):
+        with open(path or self.path) as file:
+            self.assertEqual(json.load(file), json.loads(self.model.model_dump_json()))
+
+    def test_full_saves_reuse_clean_subtrees(self):
+        writer = ModelWriter(self.model, self.path)
+        writer.save()
+        self.assertSaved()
+        state = self.model._node_state()
+        tail = state.serial_root[1]['airframe'][1]['tail'][0]
+        self.model.update_node('airframe.wing.flap', {'span': 6})
+        self.model.name = 'renamed'
+        self.model.wing.span = 31.0
+        self.assertIsNone(state.serial_root[1]['airframe'][0])
+        self.assertNotIn('name', state.serial_fields)
+        writer.save()
+        self.assertSaved()
+        self.assertIs(state.serial_root[1]['airframe'][1]['tail'][0], tail)
+
+    def test_segments_hold_only_the_changes(self):
+        writer = ModelWriter(self.model, self.path, segments=True)
+        writer.save()
+        self.assertEqual(writer.save(), 0)
+        self.model.update_node('airframe.wing.flap', {'span': 6})
+        self.model.delete_node('systems.hydraulics')
+        self.model.create_node('engines.left', {'thrust': 100})
+        writer.save()
+        with open(writer.segments_path) as file:
+            segment = json.loads(file.readline())
+        self.assertEqual(segment, {
+            'fields': {},
+            'set': {'airframe.wing': {'span': 30, 'flap': {'span': 6}}, 'engines': {'left': {'thrust': 100}}},
+            'unset': ['systems.hydraulics'],
+        })
+        self.model.wing.span = 32.0
+        self.model.name = 'renamed'
+        writer.save()
+        loaded = load_saved(self.path, Aircraft)
+        self.assertEqual(loaded.model_dump(), self.model.model_dump())
+
+        writer.compact()
+        self.assertFalse(os.path.exists(writer.segments_path))
+        self.assertSaved()
+
+    def test_lazy_subtrees_are_copied_unparsed(self):
+        ModelWriter(self.model, self.path).save()
+        model = load_lazy(self.path, Aircraft)
+        model.update_node('systems.hydraulics', {'pressure': 3100})
+        copy_path = os.path.join(self.directory, 'copy.json')
+        writer = ModelWriter(model, copy_path)
+        writer.save()
+        self.assertEqual(model.adh_root.pending, 1)
+        self.model.update_node('systems.hydraulics', {'pressure': 3100})
+        self.assertSaved(copy_path)
+
+    def test_fields_are_encoded_with_their_serializers(self):
+        self.model = Flight()
+        ModelWriter(self.model, self.path).save()
+        self.assertSaved()
+        with open(self.path) as file:
+            self.assertEqual(json.load(file)['legs'], ['TLS', 'CDG'])
+
+    def test_invalidate_after_direct_edits(self):
+        writer = ModelWriter(self.model, self.path)
+        writer.save()
+        self.model.adh_root['airframe']['tail']['span'] = 9
+        writer.invalidate()
+        writer.save()
+        self.assertSaved()
+
+if __name__ == "__main__":
+    unittest.main()